@@ -0,0 +1,145 @@
+"""Cleaning-stage benchmark: per-call regex strings vs precompiled and process-pool cleaners.
+
+Run from ``module_5``::
+
+    python benchmarks/bench_clean.py --records 1000000 --workers 8
+"""
+
+# Approach: clean the same synthetic payloads with a copy of the old clean_data() loop, with
+# iter_clean_data(), and with clean_data() on a process pool, check the outputs match, and
+# report records/sec plus the peak traced memory of cleaning a stream without keeping it.
+import argparse
+import gc
+import json
+import os
+import re
+import sys
+import time
+import tracemalloc
+from functools import partial
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / 'src'))
+
+from applicant_record import ApplicantRecord  # noqa: E402
+from bench_records import raw_fields  # noqa: E402
+from clean import CLEAN_CHUNK_SIZE, clean_data, iter_clean_data  # noqa: E402
+
+
+def legacy_clean_data(raw_data):
+    """Clean records the way ``clean_data`` did before precompiled patterns.
+
+    Pattern strings are passed to ``re`` on every call and whitespace is
+    stripped with ``re.sub`` per field, into a fully materialized list.
+
+    :param raw_data: Raw application payloads.
+    :type raw_data: collections.abc.Iterable[applicant_record.ApplicantRecord]
+    :returns: Cleaned records in original order.
+    :rtype: list[applicant_record.ApplicantRecord]
+    """
+    cleaned_data = []
+    for payload in raw_data:
+        matches = re.findall(r'[^\n]+', payload['term'])
+        term = [m for m in matches if 'fall' in m.lower() or 'spring' in m.lower()][0]
+        for key, value in payload.items():
+            payload[key] = re.sub('[\n\t]', '', value)
+        payload['term'] = term
+        payload['application status date'] = re.sub(
+            '[^0-9/]', '', payload['application status date'])
+        if len(payload['comments']) == 0:
+            payload['comments'] = None
+        for key, blank in (('GPA', '0.00'), ('GRE', '0'), ('GRE V', '0'), ('GRE AW', '0.00')):
+            if payload[key] == blank:
+                payload[key] = None
+        cleaned_data.append(payload)
+    return cleaned_data
+
+
+def synthetic_payloads(count):
+    """Yield raw payload records as the scraper would emit them.
+
+    :param count: Number of records.
+    :type count: int
+    :returns: Iterator of raw records.
+    :rtype: collections.abc.Iterator[applicant_record.ApplicantRecord]
+    """
+    for index in range(count):
+        yield ApplicantRecord(raw_fields(index))
+
+
+def timed(clean, count):
+    """Clean ``count`` generated payloads and time only the cleaning.
+
+    :param clean: Cleaning stage taking an iterable and returning an iterable.
+    :type clean: collections.abc.Callable
+    :param count: Number of records.
+    :type count: int
+    :returns: Seconds spent cleaning.
+    :rtype: float
+    """
+    raw = list(synthetic_payloads(count))
+    gc.collect()
+    started = time.perf_counter()
+    for _ in clean(raw):
+        pass
+    return time.perf_counter() - started
+
+
+def streamed_peak(clean, count):
+    """Clean a generated stream and report the peak traced memory.
+
+    :param clean: Cleaning stage taking an iterable and returning an iterable.
+    :type clean: collections.abc.Callable
+    :param count: Number of records.
+    :type count: int
+    :returns: Peak traced bytes while cleaning.
+    :rtype: int
+    """
+    gc.collect()
+    tracemalloc.start()
+    for _ in clean(synthetic_payloads(count)):
+        pass
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak
+
+
+def main():
+    """Print cleaning throughput and streamed peak memory for both cleaners.
+
+    :returns: ``None``.
+    :rtype: None
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--records', type=int, default=1_000_000)
+    parser.add_argument('--memory-records', type=int, default=100_000,
+                        help='records streamed under tracemalloc (slower than the timing run)')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1)
+    parser.add_argument('--chunk-size', type=int, default=CLEAN_CHUNK_SIZE)
+    args = parser.parse_args()
+
+    sample = 1000
+    expected = [r.to_dict() for r in legacy_clean_data(synthetic_payloads(sample))]
+    assert [r.to_dict() for r in iter_clean_data(synthetic_payloads(sample))] == expected
+    pooled = partial(clean_data, workers=max(args.workers, 2), chunk_size=args.chunk_size)
+    serial_bytes = json.dumps(clean_data(list(synthetic_payloads(args.records))), default=dict)
+    assert json.dumps(pooled(list(synthetic_payloads(args.records))),
+                      default=dict) == serial_bytes
+    del serial_bytes
+
+    variants = {
+        'legacy clean_data': legacy_clean_data,
+        'iter_clean_data': iter_clean_data,
+        f'clean_data x{max(args.workers, 2)}': pooled,
+    }
+    print(f"{'variant':<20} {'records':>9} {'seconds':>8} {'rec/s':>10} {'stream peak KiB':>16}")
+    for name, clean in variants.items():
+        seconds = timed(clean, args.records)
+        # The pool path needs a list up front, so it has no streamed peak to report.
+        peak = '-' if clean is pooled else f'{streamed_peak(clean, args.memory_records) / 2**10:.0f}'
+        print(f"{name:<20} {args.records:>9} {seconds:>8.2f} {args.records / seconds:>10.0f} "
+              f"{peak:>16}")
+
+
+if __name__ == '__main__':
+    main()
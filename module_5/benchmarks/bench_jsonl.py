@@ -0,0 +1,125 @@
+"""Save/load benchmark for applicant_data: whole-list JSON array vs streaming JSONL.
+
+Run from ``module_5``::
+
+    python benchmarks/bench_jsonl.py --records 1000000
+"""
+
+# Approach: save the same cleaned records with the old json.dump(list) and with write_jsonl()
+# on each backend, read each file back, and report seconds plus the peak traced memory of
+# saving a generated stream and of iterating over the saved file without keeping records.
+# Save times include generating and cleaning the records, which costs every variant alike.
+import argparse
+import gc
+import json
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / 'src'))
+
+from applicant_record import ApplicantRecord  # noqa: E402
+from bench_records import raw_fields  # noqa: E402
+from clean import iter_clean_data  # noqa: E402
+from jsonl_io import HAS_ORJSON, iter_jsonl, write_jsonl  # noqa: E402
+
+
+def cleaned_records(count):
+    """Yield cleaned records as ``clean.iter_clean_data`` would emit them.
+
+    :param count: Number of records.
+    :type count: int
+    :returns: Iterator of cleaned records.
+    :rtype: collections.abc.Iterator[applicant_record.ApplicantRecord]
+    """
+    return iter_clean_data(ApplicantRecord(raw_fields(index)) for index in range(count))
+
+
+def legacy_save(records, path):
+    """Save records the way ``save_data`` did: one ``json.dump`` of a list.
+
+    :param records: Records to save (materialized first, as ``clean_data`` returned them).
+    :type records: collections.abc.Iterable[applicant_record.ApplicantRecord]
+    :param path: Output path.
+    :type path: pathlib.Path
+    :returns: ``None``.
+    :rtype: None
+    """
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(list(records), f, default=dict)
+
+
+def legacy_load(path):
+    """Load records the way ``load_data`` did: one ``json.load`` of the file.
+
+    :param path: Input path.
+    :type path: pathlib.Path
+    :returns: Iterator over the loaded list.
+    :rtype: collections.abc.Iterator[dict]
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        return iter(json.load(f))
+
+
+def measure(action):
+    """Run ``action`` twice: once timed, once under tracemalloc.
+
+    :param action: Zero-argument callable; any iterator it returns is drained.
+    :type action: collections.abc.Callable[[], object]
+    :returns: Seconds of the untraced run and peak traced bytes of the traced run.
+    :rtype: tuple[float, int]
+    """
+    def drained():
+        result = action()
+        if hasattr(result, '__next__'):
+            for _ in result:
+                pass
+
+    gc.collect()
+    started = time.perf_counter()
+    drained()
+    seconds = time.perf_counter() - started
+    gc.collect()
+    tracemalloc.start()
+    drained()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return seconds, peak
+
+
+def main():
+    """Print save/load seconds and peak memory for each format and backend.
+
+    :returns: ``None``.
+    :rtype: None
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--records', type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    variants = {'legacy json.dump': (legacy_save, legacy_load)}
+    for backend in ['json'] + (['orjson'] if HAS_ORJSON else []):
+        variants[f'jsonl {backend}'] = (
+            lambda records, path, backend=backend: write_jsonl(records, path, backend=backend),
+            lambda path, backend=backend: iter_jsonl(path, backend=backend),
+        )
+
+    with tempfile.TemporaryDirectory() as tmp:
+        expected = [dict(record) for record in cleaned_records(1000)]
+        print(f"{'variant':<18} {'records':>9} {'save s':>7} {'save peak MiB':>14} "
+              f"{'load s':>7} {'load peak MiB':>14} {'file MiB':>9}")
+        for name, (save, load) in variants.items():
+            path = Path(tmp) / name.replace(' ', '_')
+            save(cleaned_records(1000), path)
+            assert list(load(path)) == expected
+            save_s, save_peak = measure(lambda: save(cleaned_records(args.records), path))
+            load_s, load_peak = measure(lambda: load(path))
+            print(f"{name:<18} {args.records:>9} {save_s:>7.2f} {save_peak / 2**20:>14.1f} "
+                  f"{load_s:>7.2f} {load_peak / 2**20:>14.1f} "
+                  f"{path.stat().st_size / 2**20:>9.1f}")
+
+
+if __name__ == '__main__':
+    main()
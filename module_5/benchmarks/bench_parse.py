@@ -0,0 +1,70 @@
+"""Parse-time benchmark for the scraper's HTML parser backends.
+
+Run from ``module_5``::
+
+    python benchmarks/bench_parse.py --iterations 200
+"""
+
+# Approach: parse the saved parity fixtures repeatedly with each backend, no network involved.
+import argparse
+import sys
+import time
+from pathlib import Path
+
+MODULE_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(MODULE_ROOT / 'src'))
+
+import page_parsers  # noqa: E402
+
+FIXTURES = MODULE_ROOT / 'tests' / 'fixtures'
+
+
+def _time_backend(backend, survey_html, result_html, iterations):
+    """Return mean milliseconds per survey and per result page for one backend.
+
+    :param backend: Parser backend name.
+    :type backend: str
+    :param survey_html: Saved ``/survey`` page bytes.
+    :type survey_html: bytes
+    :param result_html: Saved ``/result`` page bytes.
+    :type result_html: bytes
+    :param iterations: Number of parses per page type.
+    :type iterations: int
+    :returns: ``(survey_ms, result_ms)``.
+    :rtype: tuple[float, float]
+    """
+    t1 = time.perf_counter()
+    for _ in range(iterations):
+        page_parsers.parse_table_html(survey_html, backend)
+    t2 = time.perf_counter()
+    for _ in range(iterations):
+        page_parsers.parse_result_html(result_html, 'u', {}, backend)
+    t3 = time.perf_counter()
+    return (t2 - t1) * 1000 / iterations, (t3 - t2) * 1000 / iterations
+
+
+def main():
+    """Print a per-backend parse-time table.
+
+    :returns: ``None``.
+    :rtype: None
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--iterations', type=int, default=200)
+    args = parser.parse_args()
+
+    survey_html = (FIXTURES / 'survey_page.html').read_bytes()
+    result_html = (FIXTURES / 'result_page.html').read_bytes()
+    backends = ['full', 'strained'] + (['lxml'] if page_parsers.HAS_LXML else [])
+
+    baseline = None
+    print(f"{'backend':<10} {'survey ms':>10} {'result ms':>10} {'speedup':>8}")
+    for backend in backends:
+        survey_ms, result_ms = _time_backend(backend, survey_html, result_html, args.iterations)
+        total = survey_ms + result_ms
+        baseline = baseline or total
+        print(f'{backend:<10} {survey_ms:>10.3f} {result_ms:>10.3f} {baseline / total:>7.2f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,137 @@
+"""Memory benchmark for scraped payload records (plain dicts vs ``ApplicantRecord``).
+
+Run from ``module_5``::
+
+    python benchmarks/bench_records.py --records 200000
+"""
+
+# Approach: tracemalloc measures the same synthetic scrape+clean stage twice, once with the
+# legacy dict payloads and copy-per-record cleaning and once with slotted in-place records.
+import argparse
+import gc
+import re
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / 'src'))
+
+from applicant_record import FIELD_SLOTS, ApplicantRecord  # noqa: E402
+from clean import _remove_whitespace, clean_data  # noqa: E402
+
+
+def raw_fields(index):
+    """Return one raw payload's field values as the scraper would emit them.
+
+    :param index: Record number, used to keep values distinct.
+    :type index: int
+    :returns: Values keyed by raw field name.
+    :rtype: dict[str, str]
+    """
+    return {
+        'university': f'University {index % 500}',
+        'program': 'Computer Science',
+        'degree': 'PhD',
+        'term': '\n\t\tFall 2026\n\t\tInternational\n',
+        'date added': 'March 3, 2026',
+        'url': f'https://www.thegradcafe.com/result/{900000 + index}',
+        'application status': 'Accepted',
+        'application status date': f'on {index % 28 + 1:02d}/03/2026 via E-mail',
+        'comments': f'Synthetic note {index}',
+        'US/International': 'International',
+        'GPA': '3.85',
+        'GRE': '0',
+        'GRE V': '160',
+        'GRE AW': '4.50',
+    }
+
+
+def legacy_clean(raw_data):
+    """Clean dict payloads the way ``clean_data`` did before records: one new dict each.
+
+    :param raw_data: Raw dict payloads.
+    :type raw_data: list[dict]
+    :returns: New cleaned dicts.
+    :rtype: list[dict]
+    """
+    cleaned = []
+    for payload in raw_data:
+        matches = re.findall(r'[^\n]+', payload['term'])
+        term = [m for m in matches if 'fall' in m.lower() or 'spring' in m.lower()][0]
+        new_payload = {k: _remove_whitespace(v) for k, v in payload.items()}
+        new_payload['term'] = term
+        new_payload['application status date'] = re.sub(
+            '[^0-9/]', '', new_payload['application status date'])
+        for key, blank in (('GPA', '0.00'), ('GRE', '0'), ('GRE V', '0'), ('GRE AW', '0.00')):
+            if new_payload[key] == blank:
+                new_payload[key] = None
+        cleaned.append(new_payload)
+    return cleaned
+
+
+def measure(build, clean, count):
+    """Build ``count`` raw payloads, clean them, and record memory use.
+
+    :param build: Payload factory taking the field dict.
+    :type build: collections.abc.Callable[[dict], object]
+    :param clean: Cleaning stage applied to the whole list.
+    :type clean: collections.abc.Callable[[list], list]
+    :param count: Number of records.
+    :type count: int
+    :returns: ``raw_bytes`` (payload list after scraping), ``peak_bytes`` (during
+        scrape+clean), ``kept_bytes`` (cleaned output) and ``seconds``.
+    :rtype: dict[str, float]
+    """
+    gc.collect()
+    tracemalloc.start()
+    started = time.perf_counter()
+    raw = [build(raw_fields(i)) for i in range(count)]
+    raw_bytes = tracemalloc.get_traced_memory()[0]
+    cleaned = clean(raw)
+    del raw
+    gc.collect()
+    kept_bytes, peak_bytes = tracemalloc.get_traced_memory()
+    seconds = time.perf_counter() - started
+    tracemalloc.stop()
+    del cleaned
+    return {
+        'raw_bytes': raw_bytes,
+        'peak_bytes': peak_bytes,
+        'kept_bytes': kept_bytes,
+        'seconds': seconds,
+    }
+
+
+def main():
+    """Print per-record container sizes and stage memory for both payload types.
+
+    :returns: ``None``.
+    :rtype: None
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--records', type=int, default=200_000)
+    args = parser.parse_args()
+
+    sample = raw_fields(0)
+    print(f'{len(FIELD_SLOTS)}-field payload container: '
+          f'dict {sys.getsizeof(dict(sample))} B, '
+          f'ApplicantRecord {sys.getsizeof(ApplicantRecord(sample))} B')
+
+    variants = {
+        'dict + copy clean': (dict, legacy_clean),
+        'record + in-place': (ApplicantRecord, clean_data),
+    }
+    print(f"{'variant':<20} {'records':>8} {'B/rec raw':>10} {'peak MiB':>9} "
+          f"{'kept MiB':>9} {'seconds':>8}")
+    for name, (build, clean) in variants.items():
+        stats = measure(build, clean, args.records)
+        print(
+            f"{name:<20} {args.records:>8} {stats['raw_bytes'] / args.records:>10.0f} "
+            f"{stats['peak_bytes'] / 2**20:>9.1f} {stats['kept_bytes'] / 2**20:>9.1f} "
+            f"{stats['seconds']:>8.2f}"
+        )
+
+
+if __name__ == '__main__':
+    main()
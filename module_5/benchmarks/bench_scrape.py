@@ -0,0 +1,172 @@
+"""Scraper throughput benchmark against the local mock GradCafe server.
+
+Run from ``module_5`` (entirely offline)::
+
+    python benchmarks/bench_scrape.py --pages 40 --latency 0.05 --error-rate 0.01
+"""
+
+# Approach: serve synthetic pages from this process and run each scrape engine in a fresh
+# spawned process, so its peak RSS and connection pool are measured in isolation.
+import argparse
+import contextlib
+import io
+import statistics
+import sys
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from pathlib import Path
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - Windows has no getrusage
+    resource = None
+
+MODULE_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(MODULE_ROOT / 'src'))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import scrape  # noqa: E402
+import scrape_http  # noqa: E402
+from mock_gradcafe import MockGradCafe  # noqa: E402
+
+# Benchmarked configurations: scrape_data() options, or 'stream' for iter_scrape_data().
+ENGINES = {
+    'thread': {'engine': 'thread'},
+    'thread+adaptive': {'engine': 'thread', 'adaptive': True},
+    'thread+process-parse': {'engine': 'thread', 'parse_mode': 'process'},
+    'async': {'engine': 'async'},
+    'stream': {'stream': True},
+}
+
+
+class _TimedClient:
+    """Proxy for ``scrape_http.HTTP_CLIENT`` that records the latency of each fetch."""
+
+    def __init__(self, client, latencies):
+        self._client = client
+        self._latencies = latencies
+        self._lock = threading.Lock()
+
+    def fetch(self, url, headers=None):
+        """Time one pooled fetch.
+
+        :param url: Absolute URL to request.
+        :type url: str
+        :param headers: Extra request headers.
+        :type headers: dict[str, str] | None
+        :returns: ``(status, headers, body)``.
+        :rtype: tuple[int, dict[str, str], bytes]
+        """
+        started = time.perf_counter()
+        try:
+            return self._client.fetch(url, headers)
+        finally:
+            with self._lock:
+                self._latencies.append(time.perf_counter() - started)
+
+    def __getattr__(self, name):
+        return getattr(self._client, name)
+
+
+def _peak_rss_mb():
+    """Return this process's peak resident set size in MiB.
+
+    :returns: Peak RSS, or ``None`` where ``resource`` is unavailable.
+    :rtype: float | None
+    """
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS reports bytes.
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def run_engine(base_url, pages, options):
+    """Scrape the mock site once with one configuration (runs in a child process).
+
+    :param base_url: Mock server URL.
+    :type base_url: str
+    :param pages: Survey pages to crawl.
+    :type pages: int
+    :param options: ``scrape_data()`` keyword options, or ``{'stream': True}``.
+    :type options: dict[str, object]
+    :returns: ``records``, ``seconds``, ``requests``, ``p50_ms``, ``p99_ms``
+        and ``peak_rss_mb``.
+    :rtype: dict[str, float | int | None]
+    """
+    scrape.BASE_URL = base_url
+    scrape.NUM_PAGES_OF_DATA = pages
+    latencies = []
+    scrape_http.HTTP_CLIENT = _TimedClient(scrape_http.HTTP_CLIENT, latencies)
+    untimed_async_get = scrape_http.async_http_get
+
+    async def timed_async_get(url, headers=None, timeout=10):
+        started = time.perf_counter()
+        try:
+            return await untimed_async_get(url, headers, timeout)
+        finally:
+            latencies.append(time.perf_counter() - started)
+
+    scrape_http.async_http_get = timed_async_get
+    options = dict(options)
+    stream = options.pop('stream', False)
+
+    started = time.perf_counter()
+    # The scraper's progress lines would drown the report.
+    with contextlib.redirect_stdout(io.StringIO()):
+        if stream:
+            records = sum(1 for _ in scrape.iter_scrape_data(**options))
+        else:
+            records = len(scrape.scrape_data(**options))
+    seconds = time.perf_counter() - started
+
+    cuts = statistics.quantiles(latencies, n=100) if len(latencies) > 1 else [0.0] * 99
+    return {
+        'records': records,
+        'seconds': seconds,
+        'requests': len(latencies),
+        'p50_ms': cuts[49] * 1000,
+        'p99_ms': cuts[98] * 1000,
+        'peak_rss_mb': _peak_rss_mb(),
+    }
+
+
+def main():
+    """Start the mock server, benchmark each engine, and print a results table.
+
+    :returns: ``None``.
+    :rtype: None
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--pages', type=int, default=40)
+    parser.add_argument('--per-page', type=int, default=20)
+    parser.add_argument('--latency', type=float, default=0.02)
+    parser.add_argument('--error-rate', type=float, default=0.0)
+    parser.add_argument('--engines', nargs='+', choices=sorted(ENGINES), default=list(ENGINES))
+    args = parser.parse_args()
+
+    site = MockGradCafe(args.pages, args.per_page, args.latency, args.error_rate)
+    with site:
+        print(
+            f'Mock GradCafe at {site.base_url}: {args.pages} pages x {args.per_page} records, '
+            f'{args.latency * 1000:.0f} ms latency, {args.error_rate:.1%} errors'
+        )
+        print(f"{'engine':<22} {'records':>8} {'rec/s':>8} {'requests':>9} "
+              f"{'p50 ms':>8} {'p99 ms':>8} {'peak MiB':>9}")
+        for name in args.engines:
+            # A fresh spawned process per engine keeps RSS peaks and pools independent.
+            with ProcessPoolExecutor(max_workers=1, mp_context=get_context('spawn')) as pool:
+                stats = pool.submit(run_engine, site.base_url, args.pages, ENGINES[name]).result()
+            rss = 'n/a' if stats['peak_rss_mb'] is None else f"{stats['peak_rss_mb']:.1f}"
+            print(
+                f"{name:<22} {stats['records']:>8} {stats['records'] / stats['seconds']:>8.1f} "
+                f"{stats['requests']:>9} {stats['p50_ms']:>8.1f} {stats['p99_ms']:>8.1f} "
+                f"{rss:>9}"
+            )
+        print(f"Server: {site.counters['requests']} requests, {site.counters['errors']} injected errors")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,339 @@
+"""Local stand-in for GradCafe that serves synthetic survey and result pages.
+
+Run from ``module_5`` to serve it on a fixed port::
+
+    python benchmarks/mock_gradcafe.py --port 8765 --pages 100 --latency 0.05
+"""
+
+# Approach: a ThreadingHTTPServer renders deterministic pages from the page number or result
+# id, using the same markup as tests/fixtures, with injected latency and 503 errors. Bodies are
+# gzip-encoded when the client offers it, so benchmarks see realistic wire sizes.
+import argparse
+import gzip
+import random
+import threading
+import time
+from html import escape
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib import parse
+
+SCHOOLS = (
+    'Massachusetts Institute of Technology', 'Johns Hopkins University',
+    'Stanford University', 'University of Michigan', 'Georgia Institute of Technology',
+)
+PROGRAMS = ('Computer Science', 'Electrical Engineering', 'Applied Mathematics', 'Physics')
+DEGREES = ('PhD', 'Masters')
+DECISIONS = ('Accepted', 'Rejected', 'Interview', 'Wait listed')
+TERMS = ('Fall 2026', 'Spring 2026', 'Fall 2025')
+ORIGINS = ('International', 'American')
+MONTHS = ('January', 'February', 'March', 'April')
+
+# Result ids start here; survey page 1 lists the highest ids, like the real site.
+FIRST_RESULT_ID = 900001
+
+SURVEY_ROW = '''
+          <tr>
+            <td><div class="tw-flex"><div class="tw-font-medium">{school}</div></div></td>
+            <td><div class="tw-text-gray-900"><span>{program}</span>
+              <svg viewBox="0 0 2 2"><circle cx="1" cy="1" r="1"></circle></svg>
+              <span class="tw-text-gray-500">{degree}</span></div></td>
+            <td>{added}</td>
+            <td><div class="tw-inline-flex">{decision} on {decided}</div></td>
+            <td><div class="tw-inline-flex"><a href="/result/{result_id}">See More</a>
+              <button type="button">Report</button></div></td>
+          </tr>
+          <tr class="tw-border-none">
+            <td colspan="3"><div class="tw-flex tw-gap-2">
+              <div class="tw-badge">{term}</div>
+              <div class="tw-badge">{origin}</div>
+              <div class="tw-badge">GPA {gpa}</div>
+            </div></td>
+          </tr>'''
+
+SURVEY_PAGE = '''<!DOCTYPE html>
+<html lang="en">
+<head><meta charset="utf-8"><title>Admissions Results | GradCafe</title></head>
+<body>
+  <nav class="navbar"><a href="/">GradCafe</a></nav>
+  <main>
+    <div class="table-wrapper">
+      <table class="tw-min-w-full">
+        <thead>
+          <tr><th>School</th><th>Program</th><th>Added On</th><th>Decision</th><th></th></tr>
+        </thead>
+        <tbody>{rows}
+        </tbody>
+      </table>
+    </div>
+  </main>
+  <footer><p>&copy; GradCafe</p></footer>
+</body>
+</html>
+'''
+
+RESULT_PAGE = '''<!DOCTYPE html>
+<html lang="en">
+<head><meta charset="utf-8"><title>{program} {degree}, {school} | GradCafe</title></head>
+<body>
+  <nav class="navbar"><a href="/">GradCafe</a></nav>
+  <main>
+    <h1>{program}, {school}</h1>
+    <div class="tw-overflow-hidden">
+      <dl class="tw-divide-y">
+        <div class="tw-px-4"><dt>Institution</dt><dd>{school}</dd></div>
+        <div class="tw-px-4"><dt>Program</dt><dd>{program}</dd></div>
+        <div class="tw-px-4"><dt>Degree Type</dt><dd>{degree}</dd></div>
+        <div class="tw-px-4"><dt>Degree's Country of Origin</dt><dd>{origin}</dd></div>
+        <div class="tw-px-4"><dt>Decision</dt><dd>{decision}</dd></div>
+        <div class="tw-px-4"><dt>Notification</dt><dd>on {decided} via E-mail</dd></div>
+        <div class="tw-px-4"><dt>Undergrad GPA</dt><dd>{gpa}</dd></div>
+        <div class="tw-px-4"><dt>GRE General:</dt>
+          <dd><ul class="tw-list-none">
+            <li><span class="tw-font-medium">GRE General:</span>
+              <b>{gre}</b></li>
+            <li><span class="tw-font-medium">GRE Verbal:</span>
+              <b>{gre_v}</b></li>
+            <li><span class="tw-font-medium">Analytical Writing:</span>
+              <b>{gre_aw}</b></li>
+          </ul></dd></div>
+        <div class="tw-px-4"><dt>Notes</dt><dd>{comments}</dd></div>
+      </dl>
+    </div>
+  </main>
+  <footer><p>&copy; GradCafe</p></footer>
+</body>
+</html>
+'''
+
+
+def synthetic_record(result_id):
+    """Return the deterministic field values for one synthetic result.
+
+    :param result_id: Result id.
+    :type result_id: int
+    :returns: Template fields for the survey row and result page.
+    :rtype: dict[str, str | int]
+    """
+    rng = random.Random(result_id)
+    day = rng.randint(1, 28)
+    return {
+        'result_id': result_id,
+        'school': rng.choice(SCHOOLS),
+        'program': rng.choice(PROGRAMS),
+        'degree': rng.choice(DEGREES),
+        'decision': rng.choice(DECISIONS),
+        'added': f'{rng.choice(MONTHS)} {day}, 2026',
+        'decided': f'{day:02d}/01/2026',
+        'term': rng.choice(TERMS),
+        'origin': rng.choice(ORIGINS),
+        'gpa': f'{rng.uniform(2.8, 4.0):.2f}',
+        'gre': str(rng.randint(150, 170)),
+        'gre_v': str(rng.randint(150, 170)),
+        'gre_aw': f'{rng.choice((3.5, 4.0, 4.5, 5.0)):.2f}',
+        'comments': escape(f'Synthetic record {result_id} & notes'),
+    }
+
+
+class MockGradCafe:
+    """Synthetic GradCafe server on a loopback port.
+
+    Survey page ``N`` lists ``per_page`` records, newest first; the last
+    result id is ``FIRST_RESULT_ID + pages * per_page - 1``. Pages beyond
+    ``pages`` render an empty table and unknown result ids return 404.
+    ``/robots.txt`` serves ``robots_txt`` (404 when it is ``None``).
+    """
+
+    def __init__(self, pages=50, per_page=20, latency=0.0, error_rate=0.0, seed=0,
+                 robots_txt=None):
+        """Configure the server (call :meth:`start` or use it as a context manager).
+
+        :param pages: Number of survey pages that hold records.
+        :type pages: int
+        :param per_page: Records per survey page.
+        :type per_page: int
+        :param latency: Mean seconds added to every response (uniform ±50%).
+        :type latency: float
+        :param error_rate: Probability of answering a request with HTTP 503.
+        :type error_rate: float
+        :param seed: Seed for latency and error injection.
+        :type seed: int
+        :param robots_txt: robots.txt contents to serve, or ``None``.
+        :type robots_txt: str | None
+        """
+        self.pages = pages
+        self.per_page = per_page
+        self.latency = latency
+        self.error_rate = error_rate
+        self.robots_txt = robots_txt
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self.counters = {'requests': 0, 'errors': 0}
+        self._server = None
+        self.base_url = None
+
+    @property
+    def last_result_id(self):
+        """Highest result id served.
+
+        :returns: Result id listed first on survey page 1.
+        :rtype: int
+        """
+        return FIRST_RESULT_ID + self.pages * self.per_page - 1
+
+    def next_outcome(self):
+        """Count one request and draw its delay and error outcome.
+
+        :returns: ``(delay_seconds, fail)``.
+        :rtype: tuple[float, bool]
+        """
+        with self._lock:
+            self.counters['requests'] += 1
+            delay = self.latency * self._rng.uniform(0.5, 1.5)
+            fail = self._rng.random() < self.error_rate
+            if fail:
+                self.counters['errors'] += 1
+        return delay, fail
+
+    def render(self, path):
+        """Render the page for a request path.
+
+        :param path: Request path with query string.
+        :type path: str
+        :returns: ``(status, body)``.
+        :rtype: tuple[int, bytes]
+        """
+        parts = parse.urlsplit(path)
+        if parts.path == '/robots.txt' and self.robots_txt is not None:
+            return 200, self.robots_txt.encode()
+        if parts.path.rstrip('/') == '/survey':
+            page = int(parse.parse_qs(parts.query).get('page', ['1'])[0])
+            rows = ''
+            if 1 <= page <= self.pages:
+                top = self.last_result_id - (page - 1) * self.per_page
+                ids = range(top, top - self.per_page, -1)
+                rows = ''.join(SURVEY_ROW.format(**synthetic_record(i)) for i in ids)
+            return 200, SURVEY_PAGE.format(rows=rows).encode()
+        tail = parts.path.rstrip('/').rsplit('/', 1)[-1]
+        if parts.path.startswith('/result/') and tail.isdigit():
+            result_id = int(tail)
+            if FIRST_RESULT_ID <= result_id <= self.last_result_id:
+                return 200, RESULT_PAGE.format(**synthetic_record(result_id)).encode()
+        return 404, b'<html><body>Not Found</body></html>'
+
+    def start(self):
+        """Start serving on an ephemeral loopback port.
+
+        :returns: Base URL such as ``http://127.0.0.1:54321``.
+        :rtype: str
+        """
+        return self.serve('127.0.0.1', 0)
+
+    def serve(self, host, port):
+        """Start serving in a daemon thread on ``host:port``.
+
+        :param host: Interface to bind.
+        :type host: str
+        :param port: Port to bind (``0`` picks a free one).
+        :type port: int
+        :returns: Base URL of the running server.
+        :rtype: str
+        """
+        self._server = _Server((host, port), _handler_for(self))
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        self.base_url = f'http://{host}:{self._server.server_address[1]}'
+        return self.base_url
+
+    def stop(self):
+        """Stop the server and close its socket.
+
+        :returns: ``None``.
+        :rtype: None
+        """
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        """Start the server.
+
+        :returns: This server.
+        :rtype: MockGradCafe
+        """
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        """Stop the server.
+
+        :returns: ``None``.
+        :rtype: None
+        """
+        self.stop()
+
+
+class _Server(ThreadingHTTPServer):
+    """Threaded server with a listen backlog deep enough for the async engine's bursts."""
+
+    daemon_threads = True
+    request_queue_size = 256
+
+
+def _handler_for(site):
+    """Build a keep-alive request handler bound to one :class:`MockGradCafe`.
+
+    :param site: Server configuration and page renderer.
+    :type site: MockGradCafe
+    :returns: Handler class for ``ThreadingHTTPServer``.
+    :rtype: type[http.server.BaseHTTPRequestHandler]
+    """
+
+    class Handler(BaseHTTPRequestHandler):
+        """Serve one synthetic page per GET."""
+
+        protocol_version = 'HTTP/1.1'
+
+        def do_GET(self):  # noqa: N802 (http.server naming)
+            """Answer a GET with the rendered page, after the injected delay."""
+            delay, fail = site.next_outcome()
+            time.sleep(delay)
+            status, body = (503, b'busy') if fail else site.render(self.path)
+            self.send_response(status)
+            self.send_header('Content-Type', 'text/html; charset=utf-8')
+            if 'gzip' in self.headers.get('Accept-Encoding', ''):
+                # Like the real site, compress for clients that ask for it.
+                body = gzip.compress(body, compresslevel=6)
+                self.send_header('Content-Encoding', 'gzip')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            """Keep benchmark output free of access logs."""
+
+    return Handler
+
+
+def main():
+    """Serve the mock site until interrupted.
+
+    :returns: ``None``.
+    :rtype: None
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--pages', type=int, default=50)
+    parser.add_argument('--per-page', type=int, default=20)
+    parser.add_argument('--latency', type=float, default=0.0)
+    parser.add_argument('--error-rate', type=float, default=0.0)
+    args = parser.parse_args()
+
+    site = MockGradCafe(args.pages, args.per_page, args.latency, args.error_rate)
+    print(f'Serving {args.pages} survey pages at {site.serve(args.host, args.port)}')
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        site.stop()
+
+
+if __name__ == '__main__':
+    main()
@@ -23,4 +23,22 @@ GRANT USAGE ON SCHEMA public TO grad_app;
 GRANT SELECT, INSERT, UPDATE ON TABLE public.admissions TO grad_app;
 GRANT USAGE, SELECT ON SEQUENCE public.admissions_p_id_seq TO grad_app;
 
+-- Distributed crawls (main.py --crawl-id): create the queue table as an admin once, then
+-- let workers claim, update, and clean up tasks.
+CREATE TABLE IF NOT EXISTS public.crawl_tasks (
+    crawl_id TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    task_key TEXT NOT NULL,
+    priority BIGINT NOT NULL,
+    seed JSONB,
+    payload JSONB,
+    status TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    claimed_by TEXT,
+    claimed_at TIMESTAMPTZ,
+    PRIMARY KEY (crawl_id, kind, task_key)
+);
+CREATE INDEX IF NOT EXISTS crawl_tasks_claim_idx ON public.crawl_tasks (crawl_id, status, priority DESC);
+GRANT SELECT, INSERT, UPDATE, DELETE ON TABLE public.crawl_tasks TO grad_app;
+
 -- No DROP/ALTER grants are provided.
@@ -10,12 +10,30 @@ setup(
     package_dir={"": "src"},
     packages=find_packages(where="src"),
     py_modules=[
+        "adaptive_concurrency",
+        "applicant_record",
         "clean",
+        "crawl_checkpoint",
+        "crawl_queue",
         "db_config",
+        "distributed_crawl",
+        "html_archive",
+        "http_client",
+        "jsonl_io",
         "load_data",
         "main",
+        "page_discovery",
+        "page_parsers",
+        "politeness",
         "query_data",
+        "response_cache",
+        "result_probe",
+        "retry_queue",
         "run",
         "scrape",
+        "scrape_http",
+        "scrape_metrics",
+        "scrape_services",
+        "seen_filter",
     ],
 )
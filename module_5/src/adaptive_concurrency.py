@@ -0,0 +1,145 @@
+"""Adaptive (AIMD) request concurrency for the threaded scraper."""
+
+# Approach: TCP-style additive-increase/multiplicative-decrease over a shared slot count,
+# driven by each request's outcome and a smoothed latency estimate.
+import threading
+import time
+from contextlib import contextmanager
+from urllib import error
+
+# HTTP statuses that mean "slow down" rather than "this page is broken".
+CONGESTION_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+def is_congestion_error(exc):
+    """Tell whether a failed request signals server overload.
+
+    :param exc: Exception raised by the HTTP client.
+    :type exc: BaseException
+    :returns: ``True`` for HTTP 429/5xx and timeouts.
+    :rtype: bool
+    """
+    if isinstance(exc, error.HTTPError):
+        return exc.code in CONGESTION_STATUSES
+    return isinstance(exc, TimeoutError)
+
+
+class AIMDController:
+    """Thread-safe concurrency limit tuned by request outcomes.
+
+    Every healthy response adds ``INCREASE / limit`` to the limit, so the limit
+    grows by about ``INCREASE`` per full round of requests. A congestion
+    signal (HTTP 429/5xx, a timeout, or smoothed latency above
+    ``latency_target``) multiplies the limit by ``DECREASE``. Signals from
+    requests that started before the previous cut are ignored, so one burst
+    of failures only halves the limit once.
+    """
+
+    INCREASE = 1.0
+    DECREASE = 0.5
+
+    def __init__(self, initial, minimum=1, maximum=30, latency_target=3.0):
+        """Create a controller.
+
+        :param initial: Starting concurrency level.
+        :type initial: int
+        :param minimum: Lowest level the controller will cut to.
+        :type minimum: int
+        :param maximum: Highest level the controller will grow to.
+        :type maximum: int
+        :param latency_target: Smoothed seconds-per-request considered healthy.
+        :type latency_target: float
+        """
+        self.minimum = minimum
+        self.maximum = maximum
+        self.latency_target = latency_target
+        limit = float(min(max(initial, minimum), maximum))
+        self._state = {
+            'limit': limit,
+            'in_flight': 0,
+            'latency': None,
+            'last_cut': float('-inf'),
+            'peak': int(limit),
+            'decreases': 0,
+        }
+        self._cond = threading.Condition()
+
+    @property
+    def limit(self):
+        """Current whole-number concurrency level.
+
+        :returns: Maximum requests allowed in flight right now.
+        :rtype: int
+        """
+        with self._cond:
+            return int(self._state['limit'])
+
+    @contextmanager
+    def slot(self):
+        """Hold one request slot, blocking while the limit is reached.
+
+        The request's outcome (exception or latency) is fed back into the
+        limit when the block exits; exceptions are re-raised unchanged.
+
+        :returns: Context manager wrapping one request.
+        :rtype: contextlib.AbstractContextManager[None]
+        """
+        state = self._state
+        with self._cond:
+            while state['in_flight'] >= int(state['limit']):
+                self._cond.wait()
+            state['in_flight'] += 1
+        started = time.monotonic()
+        try:
+            yield
+        except BaseException as exc:
+            self._release(started, congested=is_congestion_error(exc))
+            raise
+        self._release(started, latency=time.monotonic() - started)
+
+    def _release(self, started, latency=None, congested=False):
+        """Free a slot and apply the AIMD update for one finished request.
+
+        :param started: ``time.monotonic()`` when the request began.
+        :type started: float
+        :param latency: Seconds the request took, for successful requests.
+        :type latency: float | None
+        :param congested: Whether the request failed with a congestion signal.
+        :type congested: bool
+        :returns: ``None``.
+        :rtype: None
+        """
+        state = self._state
+        with self._cond:
+            state['in_flight'] -= 1
+            if latency is not None:
+                # Exponentially weighted average so one slow page does not trigger a cut.
+                if state['latency'] is None:
+                    state['latency'] = latency
+                else:
+                    state['latency'] = 0.8 * state['latency'] + 0.2 * latency
+                congested = state['latency'] > self.latency_target
+
+            if congested:
+                if started >= state['last_cut']:
+                    state['limit'] = max(self.minimum, state['limit'] * self.DECREASE)
+                    state['last_cut'] = time.monotonic()
+                    state['decreases'] += 1
+            elif latency is not None:
+                state['limit'] = min(self.maximum, state['limit'] + self.INCREASE / state['limit'])
+                state['peak'] = max(state['peak'], int(state['limit']))
+            self._cond.notify_all()
+
+    def stats(self):
+        """Return the current level plus peak level and number of cuts.
+
+        :returns: ``limit``, ``peak``, and ``decreases`` counters.
+        :rtype: dict[str, int]
+        """
+        with self._cond:
+            state = self._state
+            return {
+                'limit': int(state['limit']),
+                'peak': state['peak'],
+                'decreases': state['decreases'],
+            }
@@ -0,0 +1,92 @@
+"""Compact fixed-field record for scraped GradCafe applications."""
+
+# Approach: one __slots__ attribute per raw field behind a MutableMapping facade, so the
+# scraper and cleaner keep their payload['field'] code while each record drops its dict.
+from collections.abc import MutableMapping
+
+# Raw payload keys in scrape order, mapped to the slot that stores each one.
+FIELD_SLOTS = {
+    'university': 'university',
+    'program': 'program',
+    'degree': 'degree',
+    'term': 'term',
+    'date added': 'date_added',
+    'url': 'url',
+    'application status': 'application_status',
+    'application status date': 'application_status_date',
+    'comments': 'comments',
+    'US/International': 'us_international',
+    'GPA': 'gpa',
+    'GRE': 'gre',
+    'GRE V': 'gre_v',
+    'GRE AW': 'gre_aw',
+}
+
+
+class ApplicantRecord(MutableMapping):
+    """One application with exactly the raw payload fields, stored in slots.
+
+    A record reads and writes like a dict keyed by the raw field names
+    (``record['date added']``) and compares equal to a dict with the same
+    items, but takes about a third of the memory of the equivalent 14-key
+    dict. Unknown keys raise ``KeyError`` and fields cannot be deleted.
+    Convert with :meth:`to_dict` (or pass ``default=dict`` to ``json.dump``)
+    before serializing.
+    """
+
+    __slots__ = tuple(FIELD_SLOTS.values())
+
+    def __init__(self, fields=None):
+        """Create a record with blank fields, optionally filled from a mapping.
+
+        :param fields: Initial values keyed by raw field name.
+        :type fields: collections.abc.Mapping[str, str | None] | None
+        :raises KeyError: If ``fields`` holds a key that is not a raw field.
+        """
+        for slot in self.__slots__:
+            setattr(self, slot, '')
+        if fields:
+            self.update(fields)
+
+    @classmethod
+    def from_dict(cls, fields):
+        """Build a record from a decoded JSON object or payload dict.
+
+        :param fields: Values keyed by raw field name; missing ones stay blank.
+        :type fields: collections.abc.Mapping[str, str | None]
+        :returns: New record.
+        :rtype: ApplicantRecord
+        """
+        return cls(fields)
+
+    def to_dict(self):
+        """Return the fields as a plain dict in scrape order.
+
+        :returns: Payload dictionary.
+        :rtype: dict[str, str | None]
+        """
+        return {key: getattr(self, slot) for key, slot in FIELD_SLOTS.items()}
+
+    def __getitem__(self, key):
+        try:
+            return getattr(self, FIELD_SLOTS[key])
+        except KeyError:
+            raise KeyError(key) from None
+
+    def __setitem__(self, key, value):
+        try:
+            setattr(self, FIELD_SLOTS[key], value)
+        except KeyError:
+            raise KeyError(key) from None
+
+    def __delitem__(self, key):
+        raise TypeError(f'ApplicantRecord fields cannot be deleted: {key!r}')
+
+    def __iter__(self):
+        return iter(FIELD_SLOTS)
+
+    def __len__(self):
+        return len(FIELD_SLOTS)
+
+    def __repr__(self):
+        return f'ApplicantRecord({self.to_dict()!r})'
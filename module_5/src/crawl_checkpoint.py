@@ -0,0 +1,139 @@
+"""SQLite checkpoint of full-crawl progress so interrupted crawls can resume."""
+
+# Approach: persist each finished window of survey pages (with their rows) and result payloads
+# in one transaction, so a restart only re-fetches the window that was in flight.
+import json
+import sqlite3
+from pathlib import Path
+
+from applicant_record import ApplicantRecord
+
+_SCHEMA = (
+    'CREATE TABLE IF NOT EXISTS survey_rows ('
+    ' page INTEGER NOT NULL, position INTEGER NOT NULL, row_json TEXT NOT NULL,'
+    ' PRIMARY KEY (page, position))',
+    'CREATE TABLE IF NOT EXISTS survey_pages (page INTEGER PRIMARY KEY)',
+    'CREATE TABLE IF NOT EXISTS results (url TEXT PRIMARY KEY, payload_json TEXT NOT NULL)',
+)
+
+
+class CrawlCheckpoint:
+    """Completed survey pages and result payloads of one full crawl.
+
+    All access happens on the thread that drives the crawl (results are
+    handed back from the workers before they are recorded), so a single
+    connection is enough.
+    """
+
+    def __init__(self, path):
+        """Open (or create) a checkpoint database.
+
+        :param path: SQLite file path.
+        :type path: str | pathlib.Path
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.path)
+        # WAL keeps each window commit cheap; NORMAL still survives a process crash.
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        with self._conn:
+            for statement in _SCHEMA:
+                self._conn.execute(statement)
+
+    def reset(self):
+        """Discard all saved progress (used when a crawl starts from scratch).
+
+        :returns: ``None``.
+        :rtype: None
+        """
+        with self._conn:
+            for table in ('survey_rows', 'survey_pages', 'results'):
+                self._conn.execute(f'DELETE FROM {table}')
+
+    def completed_pages(self):
+        """Return survey page numbers whose rows are saved.
+
+        :returns: Completed page numbers.
+        :rtype: set[int]
+        """
+        return {page for (page,) in self._conn.execute('SELECT page FROM survey_pages')}
+
+    def saved_rows(self):
+        """Return saved survey rows in page order.
+
+        :returns: Parsed survey rows.
+        :rtype: list[list[str]]
+        """
+        cursor = self._conn.execute('SELECT row_json FROM survey_rows ORDER BY page, position')
+        return [json.loads(row_json) for (row_json,) in cursor]
+
+    def record_pages(self, keyed_rows):
+        """Save one window of survey pages in a single transaction.
+
+        Pages that produced no rows are not marked complete: an empty result
+        is indistinguishable from a failed fetch, so a resume retries them.
+
+        :param keyed_rows: ``(page_num, rows)`` pairs.
+        :type keyed_rows: list[tuple[int, list[list[str]]]]
+        :returns: ``None``.
+        :rtype: None
+        """
+        with self._conn:
+            for page, rows in keyed_rows:
+                if not rows:
+                    continue
+                self._conn.execute('INSERT OR IGNORE INTO survey_pages VALUES (?)', (page,))
+                self._conn.executemany(
+                    'INSERT OR REPLACE INTO survey_rows VALUES (?, ?, ?)',
+                    [(page, position, json.dumps(row)) for position, row in enumerate(rows)],
+                )
+
+    def completed_urls(self):
+        """Return result URLs whose payloads are saved.
+
+        :returns: Completed result URLs.
+        :rtype: set[str]
+        """
+        return {url for (url,) in self._conn.execute('SELECT url FROM results')}
+
+    def saved_payloads(self):
+        """Return saved result payloads.
+
+        :returns: Raw payload records.
+        :rtype: list[applicant_record.ApplicantRecord]
+        """
+        cursor = self._conn.execute('SELECT payload_json FROM results ORDER BY rowid')
+        return [ApplicantRecord.from_dict(json.loads(payload_json)) for (payload_json,) in cursor]
+
+    def record_results(self, payloads):
+        """Save one window of parsed result payloads in a single transaction.
+
+        :param payloads: Raw payloads, each carrying its ``'url'``.
+        :type payloads: list[applicant_record.ApplicantRecord]
+        :returns: ``None``.
+        :rtype: None
+        """
+        with self._conn:
+            self._conn.executemany(
+                'INSERT OR REPLACE INTO results VALUES (?, ?)',
+                [(payload['url'], json.dumps(payload, default=dict)) for payload in payloads],
+            )
+
+    def stats(self):
+        """Count saved survey pages and result payloads.
+
+        :returns: ``pages`` and ``results`` counts.
+        :rtype: dict[str, int]
+        """
+        pages = self._conn.execute('SELECT COUNT(*) FROM survey_pages').fetchone()[0]
+        results = self._conn.execute('SELECT COUNT(*) FROM results').fetchone()[0]
+        return {'pages': pages, 'results': results}
+
+    def close(self):
+        """Close the database connection.
+
+        :returns: ``None``.
+        :rtype: None
+        """
+        self._conn.close()
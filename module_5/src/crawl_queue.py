@@ -0,0 +1,270 @@
+"""PostgreSQL work queue that lets many worker processes share one crawl."""
+
+# Approach: every survey page and result URL is one row in crawl_tasks; workers claim batches
+# with FOR UPDATE SKIP LOCKED, so no two workers hold the same task and none wait on each other.
+import json
+
+import psycopg
+
+from applicant_record import ApplicantRecord
+from db_config import get_db_conn_info
+
+# Seconds a claim stays valid; tasks held longer (a crashed worker) are handed out again.
+LEASE_SECONDS = 300
+
+# Claims per task before it is marked 'failed' and left alone.
+MAX_ATTEMPTS = 3
+
+# Survey pages sort ahead of results; results go newest (highest id) first.
+SURVEY_PRIORITY_BASE = 2 ** 62
+
+_SCHEMA = (
+    '''
+    CREATE TABLE IF NOT EXISTS crawl_tasks (
+        crawl_id TEXT NOT NULL,
+        kind TEXT NOT NULL,
+        task_key TEXT NOT NULL,
+        priority BIGINT NOT NULL,
+        seed JSONB,
+        payload JSONB,
+        status TEXT NOT NULL DEFAULT 'pending',
+        attempts INTEGER NOT NULL DEFAULT 0,
+        claimed_by TEXT,
+        claimed_at TIMESTAMPTZ,
+        PRIMARY KEY (crawl_id, kind, task_key)
+    );
+    ''',
+    'CREATE INDEX IF NOT EXISTS crawl_tasks_claim_idx '
+    'ON crawl_tasks (crawl_id, status, priority DESC);',
+)
+
+_CLAIM = '''
+    UPDATE crawl_tasks
+    SET status = 'claimed', claimed_by = %s, claimed_at = now(), attempts = attempts + 1
+    WHERE (crawl_id, kind, task_key) IN (
+        SELECT crawl_id, kind, task_key
+        FROM crawl_tasks
+        WHERE crawl_id = %s
+          AND attempts < %s
+          AND (status = 'pending'
+               OR (status = 'claimed' AND claimed_at < now() - make_interval(secs => %s)))
+        ORDER BY priority DESC
+        LIMIT %s
+        FOR UPDATE SKIP LOCKED
+    )
+    RETURNING kind, task_key, seed;
+'''
+
+_STATS = '''
+    SELECT kind, status, COUNT(*),
+           COUNT(*) FILTER (
+               WHERE status = 'pending'
+                  OR (status = 'claimed'
+                      AND (attempts < %s OR claimed_at >= now() - make_interval(secs => %s)))
+           )
+    FROM crawl_tasks
+    WHERE crawl_id = %s
+    GROUP BY kind, status;
+'''
+
+
+class CrawlQueue:
+    """Survey-page and result-page tasks of one distributed crawl.
+
+    Each method opens a short-lived connection and commits before
+    returning, so an instance can be shared by the threads of a worker and
+    any number of instances (processes, hosts) can work on the same crawl.
+    """
+
+    def __init__(self, crawl_id, conn_info=None):
+        """Point at one crawl's tasks.
+
+        :param crawl_id: Name shared by the coordinator and its workers.
+        :type crawl_id: str
+        :param conn_info: psycopg connection info (defaults to the app database).
+        :type conn_info: str | None
+        """
+        self.crawl_id = crawl_id
+        self.conn_info = conn_info or get_db_conn_info()
+
+    def ensure_schema(self):
+        """Create the ``crawl_tasks`` table and its claim index if missing.
+
+        An existing table is left alone, so least-privilege roles without
+        ``CREATE`` on the schema can still coordinate once it is provisioned.
+
+        :returns: ``None``.
+        :rtype: None
+        """
+        with psycopg.connect(self.conn_info) as conn:
+            with conn.cursor() as cur:
+                cur.execute("SELECT to_regclass('public.crawl_tasks');")
+                row = cur.fetchone()
+                if row and row[0]:
+                    return
+                for statement in _SCHEMA:
+                    cur.execute(statement)
+            conn.commit()
+
+    def enqueue_pages(self, pages):
+        """Add survey pages; pages already queued for this crawl are kept as they are.
+
+        Re-running the coordinator therefore resumes a crawl instead of
+        repeating finished pages.
+
+        :param pages: Survey page numbers.
+        :type pages: collections.abc.Iterable[int]
+        :returns: ``None``.
+        :rtype: None
+        """
+        with psycopg.connect(self.conn_info) as conn:
+            with conn.cursor() as cur:
+                cur.executemany(
+                    'INSERT INTO crawl_tasks (crawl_id, kind, task_key, priority) '
+                    "VALUES (%s, 'survey', %s, %s) ON CONFLICT DO NOTHING;",
+                    [(self.crawl_id, str(page), SURVEY_PRIORITY_BASE - page) for page in pages],
+                )
+            conn.commit()
+
+    def claim(self, worker_id, limit):
+        """Claim up to ``limit`` open tasks, highest priority first.
+
+        Rows locked by another worker's claim are skipped rather than waited on.
+
+        :param worker_id: Label stored with the claim (for stats and debugging).
+        :type worker_id: str
+        :param limit: Maximum tasks to claim.
+        :type limit: int
+        :returns: ``(kind, key, seed)`` per task: ``key`` is the page number for
+            ``'survey'`` tasks and the URL (with its seed payload) for ``'result'`` tasks.
+        :rtype: list[tuple[str, int | str, applicant_record.ApplicantRecord | None]]
+        """
+        with psycopg.connect(self.conn_info) as conn:
+            with conn.cursor() as cur:
+                cur.execute(_CLAIM, (worker_id, self.crawl_id, MAX_ATTEMPTS, LEASE_SECONDS, limit))
+                rows = cur.fetchall()
+            conn.commit()
+        tasks = []
+        for kind, key, seed in rows:
+            if kind == 'survey':
+                tasks.append((kind, int(key), None))
+            else:
+                tasks.append((kind, key, ApplicantRecord.from_dict(seed)))
+        return tasks
+
+    def complete_page(self, page, seeds):
+        """Mark a survey page done and queue its result pages in one transaction.
+
+        :param page: Survey page number.
+        :type page: int
+        :param seeds: ``(url, seed_payload)`` pairs built from the page's rows.
+        :type seeds: list[tuple[str, applicant_record.ApplicantRecord]]
+        :returns: ``None``.
+        :rtype: None
+        """
+        with psycopg.connect(self.conn_info) as conn:
+            with conn.cursor() as cur:
+                if seeds:
+                    cur.executemany(
+                        'INSERT INTO crawl_tasks (crawl_id, kind, task_key, priority, seed) '
+                        "VALUES (%s, 'result', %s, %s, %s::jsonb) ON CONFLICT DO NOTHING;",
+                        [
+                            (self.crawl_id, url, _result_priority(url),
+                             json.dumps(seed, default=dict))
+                            for url, seed in seeds
+                        ],
+                    )
+                cur.execute(
+                    "UPDATE crawl_tasks SET status = 'done' "
+                    "WHERE crawl_id = %s AND kind = 'survey' AND task_key = %s;",
+                    (self.crawl_id, str(page)),
+                )
+            conn.commit()
+
+    def complete_results(self, payloads):
+        """Store parsed result payloads and mark their tasks done.
+
+        :param payloads: Raw payloads, each carrying its ``'url'``.
+        :type payloads: list[applicant_record.ApplicantRecord]
+        :returns: ``None``.
+        :rtype: None
+        """
+        if not payloads:
+            return
+        with psycopg.connect(self.conn_info) as conn:
+            with conn.cursor() as cur:
+                cur.executemany(
+                    "UPDATE crawl_tasks SET status = 'done', payload = %s::jsonb "
+                    "WHERE crawl_id = %s AND kind = 'result' AND task_key = %s;",
+                    [
+                        (json.dumps(payload, default=dict), self.crawl_id, payload['url'])
+                        for payload in payloads
+                    ],
+                )
+            conn.commit()
+
+    def release(self, tasks):
+        """Return failed tasks to the queue, or mark them failed after ``MAX_ATTEMPTS``.
+
+        :param tasks: ``(kind, key)`` pairs that did not complete.
+        :type tasks: list[tuple[str, int | str]]
+        :returns: ``None``.
+        :rtype: None
+        """
+        if not tasks:
+            return
+        with psycopg.connect(self.conn_info) as conn:
+            with conn.cursor() as cur:
+                cur.executemany(
+                    'UPDATE crawl_tasks SET claimed_by = NULL, claimed_at = NULL, '
+                    "status = CASE WHEN attempts >= %s THEN 'failed' ELSE 'pending' END "
+                    'WHERE crawl_id = %s AND kind = %s AND task_key = %s;',
+                    [(MAX_ATTEMPTS, self.crawl_id, kind, str(key)) for kind, key in tasks],
+                )
+            conn.commit()
+
+    def stats(self):
+        """Count this crawl's tasks by kind and status.
+
+        :returns: ``'<kind>_<status>'`` counts plus ``open``: tasks that are
+            pending, or claimed and either still leased or due for a retry.
+            Workers keep polling while ``open`` is non-zero.
+        :rtype: dict[str, int]
+        """
+        with psycopg.connect(self.conn_info) as conn:
+            with conn.cursor() as cur:
+                cur.execute(_STATS, (MAX_ATTEMPTS, LEASE_SECONDS, self.crawl_id))
+                rows = cur.fetchall()
+        counts = {'open': 0}
+        for kind, status, count, still_open in rows:
+            counts[f'{kind}_{status}'] = count
+            counts['open'] += still_open
+        return counts
+
+    def saved_payloads(self):
+        """Return every finished result payload, newest result first.
+
+        :returns: Raw payload records.
+        :rtype: list[applicant_record.ApplicantRecord]
+        """
+        with psycopg.connect(self.conn_info) as conn:
+            with conn.cursor() as cur:
+                cur.execute(
+                    "SELECT payload FROM crawl_tasks WHERE crawl_id = %s AND kind = 'result' "
+                    "AND status = 'done' ORDER BY priority DESC;",
+                    (self.crawl_id,),
+                )
+                rows = cur.fetchall()
+        return [ApplicantRecord.from_dict(payload) for (payload,) in rows]
+
+
+def _result_priority(url):
+    """Rank a result URL by its numeric id so the newest records are claimed first.
+
+    :param url: Result page URL.
+    :type url: str
+    :returns: Result id, or ``0`` when the URL has none.
+    :rtype: int
+    """
+    tail = url.rstrip('/').rsplit('/', 1)[-1]
+    return int(tail) if tail.isdigit() else 0
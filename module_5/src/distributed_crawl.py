@@ -0,0 +1,158 @@
+"""Distributed GradCafe crawls: a coordinator and workers sharing one Postgres queue."""
+
+# Approach: workers claim batches of survey/result tasks from crawl_queue and run each batch
+# through scrape.py's engines and run services, so a shared crawl fetches pages exactly like
+# a local one.
+import os
+import socket
+import time
+
+import scrape
+from crawl_queue import CrawlQueue
+from page_parsers import seed_payload
+from scrape_services import resolve_options, run_services
+
+# Tasks a distributed-crawl worker claims from the Postgres queue at a time.
+QUEUE_BATCH_SIZE = scrape.MAX_WORKERS * 2
+
+# Seconds a distributed-crawl worker waits when every open task is claimed by someone else.
+QUEUE_POLL_SECONDS = 2.0
+
+
+def distributed_scrape_data(crawl_id, worker_id=None, batch_size=None, **options):
+    """Coordinate a crawl shared with other workers through a Postgres queue.
+
+    Every survey page up to :func:`scrape.survey_page_count` is queued under
+    ``crawl_id`` (pages queued by an earlier run are kept, so re-running
+    resumes), this process then works the queue like any
+    :func:`crawl_worker`, and once no task is open the payloads from all
+    workers are returned. The page-count probe and the crawl share one set
+    of run services, so one metrics report covers the whole invocation.
+
+    :param crawl_id: Queue name; workers started with the same name join in.
+    :type crawl_id: str
+    :param worker_id: Label for this process's claims.
+    :type worker_id: str | None
+    :param batch_size: Tasks claimed at once (defaults to ``QUEUE_BATCH_SIZE``).
+    :type batch_size: int | None
+    :param options: Same keyword options as :func:`crawl_worker`.
+    :type options: dict[str, object]
+    :returns: Raw payloads from every worker, newest result first.
+    :rtype: list[applicant_record.ApplicantRecord]
+    :raises ValueError: If an option value is invalid or not supported here.
+    """
+    options = _resolve_worker_options(options)
+    queue = CrawlQueue(crawl_id)
+    # One set of run services (cache, limiter, robots, metrics) for the probe and the crawl.
+    with run_services(options, scrape.MAX_WORKERS):
+        queue.ensure_schema()
+        queue.enqueue_pages(range(1, scrape.survey_page_count() + 1))
+        _work_queue(queue, worker_id, batch_size, options['engine'])
+    raw_payloads = queue.saved_payloads()
+    print(f"Distributed crawl {crawl_id}: {len(raw_payloads)} raw payloads, {queue.stats()}")
+    return raw_payloads
+
+
+def crawl_worker(crawl_id, worker_id=None, batch_size=None, **options):
+    """Claim and process tasks of a distributed crawl until none are open.
+
+    Run any number of these, in separate processes or on separate hosts,
+    against the same database. Each claims ``batch_size`` tasks at a time
+    with ``FOR UPDATE SKIP LOCKED``, fetches them with the usual engine and
+    services, and writes rows and payloads back. Survey pages queue their
+    result pages as they finish; failed tasks return to the queue until
+    ``crawl_queue.MAX_ATTEMPTS`` claims have been spent on them.
+
+    :param crawl_id: Queue name shared with the coordinator.
+    :type crawl_id: str
+    :param worker_id: Label for this process's claims (defaults to host and pid).
+    :type worker_id: str | None
+    :param batch_size: Tasks claimed at once (defaults to ``QUEUE_BATCH_SIZE``).
+    :type batch_size: int | None
+    :param options: Same keyword options as :func:`scrape.scrape_data`, except
+        checkpoints and incremental walks.
+    :type options: dict[str, object]
+    :returns: Number of tasks this worker completed.
+    :rtype: int
+    :raises ValueError: If an option value is invalid or not supported here.
+    """
+    options = _resolve_worker_options(options)
+    with run_services(options, scrape.MAX_WORKERS):
+        return _work_queue(CrawlQueue(crawl_id), worker_id, batch_size, options['engine'])
+
+
+def _work_queue(queue, worker_id, batch_size, engine):
+    """Claim and process tasks until none are open, inside the caller's run services.
+
+    :param queue: Queue to work.
+    :type queue: crawl_queue.CrawlQueue
+    :param worker_id: Label for this process's claims (defaults to host and pid).
+    :type worker_id: str | None
+    :param batch_size: Tasks claimed at once (defaults to ``QUEUE_BATCH_SIZE``).
+    :type batch_size: int | None
+    :param engine: One of ``SCRAPE_ENGINES``.
+    :type engine: str
+    :returns: Number of tasks this worker completed.
+    :rtype: int
+    """
+    worker_id = worker_id or f'{socket.gethostname()}-{os.getpid()}'
+    t1 = time.time()
+    completed = 0
+    while True:
+        tasks = queue.claim(worker_id, batch_size or QUEUE_BATCH_SIZE)
+        if tasks:
+            completed += _run_claimed_tasks(queue, tasks, engine)
+        elif queue.stats()['open']:
+            time.sleep(QUEUE_POLL_SECONDS)
+        else:
+            break
+    print(f'Worker {worker_id} completed {completed} tasks in {time.time() - t1:.02f} secs')
+    return completed
+
+
+def _resolve_worker_options(options):
+    """Resolve scrape options for a distributed crawl.
+
+    :param options: Keyword options passed to a distributed entry point.
+    :type options: dict[str, object]
+    :returns: Complete option mapping.
+    :rtype: dict[str, object]
+    :raises ValueError: If an option is invalid, or asks for a checkpoint or survey walk.
+    """
+    options = resolve_options(options)
+    if options['checkpoint'] is not None or options['incremental']:
+        raise ValueError('crawl_worker does not use checkpoints or survey walks')
+    return options
+
+
+def _run_claimed_tasks(queue, tasks, engine):
+    """Fetch one claimed batch and report each task back to the queue.
+
+    A survey page that yields no rows counts as failed, like a checkpointed
+    crawl, because an empty table cannot be told apart from a failed fetch.
+
+    :param queue: Queue the tasks were claimed from.
+    :type queue: crawl_queue.CrawlQueue
+    :param tasks: ``(kind, key, seed)`` tuples from :meth:`CrawlQueue.claim`.
+    :type tasks: list[tuple[str, int | str, applicant_record.ApplicantRecord | None]]
+    :param engine: One of ``SCRAPE_ENGINES``.
+    :type engine: str
+    :returns: Number of tasks completed.
+    :rtype: int
+    """
+    pages = [key for kind, key, _ in tasks if kind == 'survey']
+    seeds = {key: seed for kind, key, seed in tasks if kind == 'result'}
+    finished_pages = set()
+    for page, rows in scrape.fetch_survey_pages(engine, pages):
+        if rows:
+            queue.complete_page(page, list(filter(None, (seed_payload(row, scrape.BASE_URL)
+                                                         for row in rows))))
+            finished_pages.add(page)
+    payloads = scrape.fetch_result_pages(engine, seeds)
+    queue.complete_results(payloads)
+    finished_urls = {payload['url'] for payload in payloads}
+    queue.release(
+        [('survey', page) for page in pages if page not in finished_pages]
+        + [('result', url) for url in seeds if url not in finished_urls]
+    )
+    return len(finished_pages) + len(finished_urls)
@@ -0,0 +1,277 @@
+"""Append-only compressed archive of fetched GradCafe pages, plus offline re-parsing."""
+
+# Approach: each body is zlib-compressed and appended to one blob file; a tab-separated index
+# maps (kind, key) to (offset, length), so any page can be read back with one seek.
+import threading
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from pathlib import Path
+from urllib import parse
+
+from page_parsers import DEFAULT_PARSER, parse_result_html, parse_table_html, seed_payload
+
+BODIES_FILE = 'bodies.z'
+INDEX_FILE = 'index.tsv'
+
+# Records handed to each re-parse worker per task; large enough to amortize pickling.
+REPARSE_CHUNK = 64
+
+# Parse failures that skip one archived page instead of aborting the re-parse.
+PARSE_ERRORS = (AttributeError, IndexError, TypeError, ValueError)
+
+
+def archive_key(url):
+    """Map a page URL to its archive key.
+
+    :param url: Absolute ``/survey`` or ``/result/<id>`` URL.
+    :type url: str
+    :returns: ``('survey', page)`` or ``('result', result_id)``, or ``None``
+        for URLs the archive does not keep.
+    :rtype: tuple[str, int] | None
+    """
+    parts = parse.urlsplit(url)
+    try:
+        if parts.path.startswith('/result/'):
+            return 'result', int(parts.path.rstrip('/').rsplit('/', 1)[-1])
+        if parts.path.startswith('/survey'):
+            return 'survey', int(parse.parse_qs(parts.query).get('page', ['1'])[0])
+    except ValueError:
+        return None
+    return None
+
+
+class HtmlArchive:
+    """Thread-safe append-only page archive with an offset index.
+
+    Layout under ``archive_dir``::
+
+        bodies.z    concatenated zlib-compressed page bodies
+        index.tsv   "<kind>\\t<key>\\t<offset>\\t<length>" per appended body
+
+    Re-fetched pages are appended again and the latest index entry wins;
+    ``only_new`` appends skip pages the index already holds.
+    """
+
+    def __init__(self, archive_dir):
+        """Open (or create) an archive directory.
+
+        :param archive_dir: Directory holding the blob and index files.
+        :type archive_dir: str | pathlib.Path
+        """
+        self.root = Path(archive_dir)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.bodies_path = self.root / BODIES_FILE
+        self.index_path = self.root / INDEX_FILE
+        self._lock = threading.Lock()
+        # Archived (kind, key) pairs, read from the index on the first only_new append.
+        self._keys = None
+        self._stats = {'pages': 0, 'raw_bytes': 0, 'stored_bytes': 0}
+
+    def append(self, url, body, only_new=False):
+        """Compress and append one fetched body.
+
+        :param url: Page URL, used to derive the archive key.
+        :type url: str
+        :param body: Raw response body.
+        :type body: bytes
+        :param only_new: Skip the page if the archive already holds a copy.
+        :type only_new: bool
+        :returns: ``True`` when the page was archived.
+        :rtype: bool
+        """
+        key = archive_key(url)
+        if key is None or (only_new and self._holds(key)):
+            return False
+        blob = zlib.compress(body)
+        with self._lock:
+            with self.bodies_path.open('ab') as f:
+                offset = f.tell()
+                f.write(blob)
+            # The index line is written last, so a crash never indexes a partial body.
+            with self.index_path.open('a', encoding='utf-8') as f:
+                f.write(f'{key[0]}\t{key[1]}\t{offset}\t{len(blob)}\n')
+            if self._keys is not None:
+                self._keys.add(key)
+            self._stats['pages'] += 1
+            self._stats['raw_bytes'] += len(body)
+            self._stats['stored_bytes'] += len(blob)
+        return True
+
+    def _holds(self, key):
+        """Return whether the index already has an entry for ``key``.
+
+        :param key: Archive key from :func:`archive_key`.
+        :type key: tuple[str, int]
+        :returns: ``True`` when the page is archived.
+        :rtype: bool
+        """
+        with self._lock:
+            if self._keys is None:
+                self._keys = {(kind, page) for kind, page, _, _ in self._index_lines()}
+            return key in self._keys
+
+    def _index_lines(self):
+        """Yield every complete index line as ``(kind, key, offset, length)``.
+
+        :returns: Iterator of index entries in append order.
+        :rtype: collections.abc.Iterator[tuple[str, int, int, int]]
+        """
+        try:
+            lines = self.index_path.read_text(encoding='utf-8').splitlines()
+        except FileNotFoundError:
+            return
+        for line in lines:
+            fields = line.split('\t')
+            # A line cut short by a crash has fewer fields; skip it.
+            if len(fields) == 4:
+                yield fields[0], int(fields[1]), int(fields[2]), int(fields[3])
+
+    def entries(self, kind):
+        """Return the latest ``(offset, length)`` span for every key of one kind.
+
+        :param kind: ``'survey'`` or ``'result'``.
+        :type kind: str
+        :returns: Key-to-span mapping.
+        :rtype: dict[int, tuple[int, int]]
+        """
+        return {
+            key: (offset, length)
+            for entry_kind, key, offset, length in self._index_lines()
+            if entry_kind == kind
+        }
+
+    def get(self, kind, key):
+        """Read one archived body.
+
+        :param kind: ``'survey'`` or ``'result'``.
+        :type kind: str
+        :param key: Survey page number or result id.
+        :type key: int
+        :returns: Decompressed body, or ``None`` when not archived.
+        :rtype: bytes | None
+        """
+        span = self.entries(kind).get(key)
+        if span is None:
+            return None
+        return _read_body(self.bodies_path, *span)
+
+    def stats(self):
+        """Return pages and bytes appended through this instance.
+
+        :returns: ``pages``, ``raw_bytes``, and ``stored_bytes`` counters.
+        :rtype: dict[str, int]
+        """
+        with self._lock:
+            return dict(self._stats)
+
+
+def _read_body(bodies_path, offset, length):
+    """Read and decompress one record from the blob file.
+
+    :param bodies_path: Blob file path.
+    :type bodies_path: pathlib.Path
+    :param offset: Byte offset of the compressed record.
+    :type offset: int
+    :param length: Compressed record length.
+    :type length: int
+    :returns: Decompressed body.
+    :rtype: bytes
+    """
+    with open(bodies_path, 'rb') as f:
+        f.seek(offset)
+        return zlib.decompress(f.read(length))
+
+
+def _parse_survey_chunk(bodies_path, backend, items):
+    """Parse a chunk of archived survey pages (runs in a worker process).
+
+    :param bodies_path: Blob file path.
+    :type bodies_path: pathlib.Path
+    :param backend: Parser backend name.
+    :type backend: str
+    :param items: ``(page, (offset, length))`` pairs.
+    :type items: list[tuple[int, tuple[int, int]]]
+    :returns: ``(page, rows)`` pairs.
+    :rtype: list[tuple[int, list[list[str]]]]
+    """
+    with open(bodies_path, 'rb') as f:
+        parsed = []
+        for page, (offset, length) in items:
+            f.seek(offset)
+            parsed.append((page, parse_table_html(zlib.decompress(f.read(length)), backend)))
+    return parsed
+
+
+def _parse_result_chunk(bodies_path, backend, items):
+    """Parse a chunk of archived result pages (runs in a worker process).
+
+    :param bodies_path: Blob file path.
+    :type bodies_path: pathlib.Path
+    :param backend: Parser backend name.
+    :type backend: str
+    :param items: ``(offset, length, url, seed_payload)`` tuples.
+    :type items: list[tuple[int, int, str, dict[str, str]]]
+    :returns: Non-empty payloads; pages that fail to parse are skipped.
+    :rtype: list[dict[str, str]]
+    """
+    payloads = []
+    with open(bodies_path, 'rb') as f:
+        for offset, length, url, payload in items:
+            f.seek(offset)
+            try:
+                parsed = parse_result_html(zlib.decompress(f.read(length)), url, payload, backend)
+            except PARSE_ERRORS:
+                continue
+            if parsed:
+                payloads.append(parsed)
+    return payloads
+
+
+def _chunks(items):
+    """Split a list into ``REPARSE_CHUNK``-sized slices.
+
+    :param items: Items to split.
+    :type items: list
+    :returns: Consecutive slices.
+    :rtype: list[list]
+    """
+    return [items[i:i + REPARSE_CHUNK] for i in range(0, len(items), REPARSE_CHUNK)]
+
+
+def rebuild_payloads(archive, base_url, workers=None, backend=DEFAULT_PARSER):
+    """Rebuild raw payloads from archived pages with the current extractors.
+
+    Survey pages are parsed first to seed each record (term, date added), then
+    every seeded record whose result page is archived is parsed. Both passes
+    run on a process pool; workers read records straight from the blob file.
+
+    :param archive: Archive to read.
+    :type archive: HtmlArchive
+    :param base_url: Site root used to build result URLs from survey rows.
+    :type base_url: str
+    :param workers: Worker process count (defaults to the CPU count).
+    :type workers: int | None
+    :param backend: Parser backend name.
+    :type backend: str
+    :returns: Raw payloads in survey-page order.
+    :rtype: list[dict[str, str]]
+    """
+    result_spans = archive.entries('result')
+    survey_items = sorted(archive.entries('survey').items())
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        parse_surveys = partial(_parse_survey_chunk, archive.bodies_path, backend)
+        rows = [
+            row
+            for chunk in pool.map(parse_surveys, _chunks(survey_items))
+            for _, page_rows in chunk
+            for row in page_rows
+        ]
+        seeds = dict(filter(None, (seed_payload(row, base_url) for row in rows)))
+        jobs = []
+        for url, payload in seeds.items():
+            key = archive_key(url)
+            if key is not None and key[1] in result_spans:
+                jobs.append((*result_spans[key[1]], url, payload))
+        parse_results = partial(_parse_result_chunk, archive.bodies_path, backend)
+        return [payload for chunk in pool.map(parse_results, _chunks(jobs)) for payload in chunk]
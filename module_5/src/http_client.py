@@ -0,0 +1,494 @@
+"""Low-level HTTP helpers shared by the GradCafe scraper engines."""
+
+# Approach: keep transport details here so scrape.py only deals with pages and payloads.
+import asyncio
+import importlib
+import ssl
+import threading
+import zlib
+from functools import lru_cache
+from urllib import error, parse
+
+import urllib3
+
+# Redirects followed per request by both the pooled client and async_http_fetch().
+MAX_REDIRECTS = 5
+
+# Statuses whose Location header is followed, as urllib3 and urlopen do.
+REDIRECT_STATUSES = frozenset({301, 302, 303, 307, 308})
+
+# Redirects are followed like urlopen does; a single reconnect covers keep-alive
+# sockets the server closed while idle, anything else surfaces to the caller.
+POOL_RETRIES = urllib3.Retry(total=None, connect=1, read=0, status=0, other=0,
+                             redirect=MAX_REDIRECTS)
+
+# brotli is optional; 'br' is only advertised when a decoder is installed.
+HAS_BROTLI = importlib.util.find_spec('brotli') is not None
+
+# Content codings offered on every request; responses are decoded before parsing.
+ACCEPT_ENCODING = 'gzip, deflate, br' if HAS_BROTLI else 'gzip, deflate'
+
+# Browser User-Agent sent by the scraper; robots.txt groups are matched against it too.
+BROWSER_USER_AGENT = ('Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 '
+                      '(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
+
+# Wire bytes read per step while a pooled response is streamed through its decoder.
+READ_CHUNK_BYTES = 64 * 1024
+
+
+@lru_cache(maxsize=1)
+def _ssl_context():
+    """Build (once) the TLS context reused by every async connection.
+
+    :returns: Default client-side SSL context.
+    :rtype: ssl.SSLContext
+    """
+    return ssl.create_default_context()
+
+
+class BodyDecoder:
+    """Incrementally decode one ``Content-Encoding`` as wire chunks arrive.
+
+    ``gzip`` and ``deflate`` use :mod:`zlib` (``deflate`` falls back to a raw
+    stream for servers that omit the zlib header), ``br`` uses the optional
+    ``brotli`` package, and ``identity`` or an empty coding passes bytes through.
+    """
+
+    def __init__(self, encoding):
+        """Pick the decompressor for ``encoding``.
+
+        :param encoding: ``Content-Encoding`` header value (case-insensitive).
+        :type encoding: str | None
+        :raises ValueError: If the coding is not supported.
+        """
+        self.encoding = (encoding or 'identity').strip().lower()
+        self.wire_bytes = 0
+        self.decoded_bytes = 0
+        self._pending = b''
+        if self.encoding in ('gzip', 'x-gzip'):
+            self._decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        elif self.encoding == 'deflate':
+            self._decompressor = zlib.decompressobj()
+        elif self.encoding == 'br' and HAS_BROTLI:
+            self._decompressor = importlib.import_module('brotli').Decompressor()
+        elif self.encoding == 'identity':
+            self._decompressor = None
+        else:
+            raise ValueError(f'Unsupported Content-Encoding: {encoding!r}')
+
+    def feed(self, chunk):
+        """Decode one wire chunk.
+
+        :param chunk: Bytes as read from the connection.
+        :type chunk: bytes
+        :returns: Decoded bytes available so far (may be empty).
+        :rtype: bytes
+        :raises ValueError: If the stream is corrupt.
+        """
+        self.wire_bytes += len(chunk)
+        if self._decompressor is None:
+            decoded = chunk
+        elif self.encoding == 'br':
+            decoded = self._decompressor.process(chunk)
+        else:
+            decoded = self._inflate(chunk)
+        self.decoded_bytes += len(decoded)
+        return decoded
+
+    def _inflate(self, chunk):
+        """Run one chunk through zlib, switching ``deflate`` to raw mode if needed.
+
+        :param chunk: Wire bytes.
+        :type chunk: bytes
+        :returns: Decoded bytes.
+        :rtype: bytes
+        :raises ValueError: If the stream is corrupt.
+        """
+        try:
+            decoded = self._decompressor.decompress(chunk)
+        except zlib.error as e:
+            if self.encoding != 'deflate' or self._pending is None:
+                raise ValueError(f'Corrupt {self.encoding} body: {e}') from e
+            # No zlib header: restart from the first byte as raw deflate.
+            self._decompressor = zlib.decompressobj(-zlib.MAX_WBITS)
+            chunk, self._pending = self._pending + chunk, None
+            return self._inflate(chunk)
+        if self._pending is not None:
+            # Keep the bytes seen so far until zlib has accepted a header.
+            self._pending = None if decoded else self._pending + chunk
+        return decoded
+
+    def decode(self, chunks):
+        """Decode an iterable of wire chunks into the full body.
+
+        :param chunks: Wire chunks in order.
+        :type chunks: collections.abc.Iterable[bytes]
+        :returns: Decoded body.
+        :rtype: bytes
+        :raises ValueError: If the stream is corrupt.
+        """
+        parts = [self.feed(chunk) for chunk in chunks]
+        return b''.join(parts)
+
+
+class TransferStats:
+    """Thread-safe totals of bytes on the wire vs decoded, per content coding."""
+
+    def __init__(self):
+        """Start with zeroed counters."""
+        self._lock = threading.Lock()
+        self._encodings = {}
+
+    def record(self, decoder):
+        """Add one finished response body.
+
+        :param decoder: Decoder the body went through.
+        :type decoder: BodyDecoder
+        :returns: ``None``.
+        :rtype: None
+        """
+        with self._lock:
+            counts = self._encodings.setdefault(
+                decoder.encoding, {'responses': 0, 'wire_bytes': 0, 'decoded_bytes': 0})
+            counts['responses'] += 1
+            counts['wire_bytes'] += decoder.wire_bytes
+            counts['decoded_bytes'] += decoder.decoded_bytes
+
+    def snapshot(self):
+        """Copy the per-coding counters.
+
+        :returns: Coding name to ``responses``/``wire_bytes``/``decoded_bytes``.
+        :rtype: dict[str, dict[str, int]]
+        """
+        with self._lock:
+            return {name: dict(counts) for name, counts in self._encodings.items()}
+
+    def summary(self, since=None):
+        """Summarize bandwidth saved by compression, optionally since a snapshot.
+
+        :param since: Earlier :meth:`snapshot` to subtract, or ``None``.
+        :type since: dict[str, dict[str, int]] | None
+        :returns: ``responses``, ``compressed_responses``, ``wire_bytes``,
+            ``decoded_bytes``, ``ratio`` (decoded per wire byte, ``None``
+            without traffic) and the per-coding ``encodings`` counters.
+        :rtype: dict[str, object]
+        """
+        since = since or {}
+        encodings = {}
+        for name, counts in sorted(self.snapshot().items()):
+            before = since.get(name, {})
+            delta = {key: value - before.get(key, 0) for key, value in counts.items()}
+            if delta['responses']:
+                encodings[name] = delta
+        wire = sum(counts['wire_bytes'] for counts in encodings.values())
+        decoded = sum(counts['decoded_bytes'] for counts in encodings.values())
+        return {
+            'responses': sum(counts['responses'] for counts in encodings.values()),
+            'compressed_responses': sum(
+                counts['responses'] for name, counts in encodings.items() if name != 'identity'),
+            'wire_bytes': wire,
+            'decoded_bytes': decoded,
+            'ratio': round(decoded / wire, 2) if wire else None,
+            'encodings': encodings,
+        }
+
+
+# Process-wide totals fed by both the pooled client and async_http_fetch().
+TRANSFER_STATS = TransferStats()
+
+
+def _decode_chunked(body):
+    """Decode an HTTP/1.1 ``Transfer-Encoding: chunked`` body.
+
+    :param body: Raw chunked body bytes.
+    :type body: bytes
+    :returns: De-chunked body bytes.
+    :rtype: bytes
+    :raises ValueError: If a chunk size line is malformed.
+    """
+    decoded = bytearray()
+    pos = 0
+    while True:
+        line_end = body.index(b'\r\n', pos)
+        # Chunk extensions (";name=value") are allowed after the size but unused here.
+        size = int(body[pos:line_end].split(b';')[0], 16)
+        if size == 0:
+            return bytes(decoded)
+        start = line_end + 2
+        decoded.extend(body[start:start + size])
+        pos = start + size + 2
+
+
+def _split_http_response(raw):
+    """Split a raw HTTP/1.1 response into its status line, headers and body.
+
+    :param raw: Full response bytes (status line, headers, body).
+    :type raw: bytes
+    :returns: ``(status, reason, headers, body)`` with lower-cased header names;
+        the body is still in its transfer and content encodings.
+    :rtype: tuple[int, str, dict[str, str], bytes]
+    :raises ValueError: If the status line is malformed.
+    """
+    head, _, body = raw.partition(b'\r\n\r\n')
+    lines = head.decode('latin-1').split('\r\n')
+    status_parts = lines[0].split(' ', 2)
+    if len(status_parts) < 2 or not status_parts[0].startswith('HTTP/'):
+        raise ValueError(f'Malformed HTTP status line: {lines[0]!r}')
+    reason = status_parts[2] if len(status_parts) > 2 else ''
+
+    headers = {}
+    for line in lines[1:]:
+        name, _, value = line.partition(':')
+        headers[name.strip().lower()] = value.strip()
+    return int(status_parts[1]), reason, headers, body
+
+
+def parse_http_response(raw, url):
+    """Split a raw HTTP/1.1 response into its decoded body.
+
+    Chunked framing is removed first, then any ``Content-Encoding`` is decoded
+    and counted in ``TRANSFER_STATS``. Error statuses are raised as
+    :class:`urllib.error.HTTPError` so callers can reuse the same exception
+    handling they use for ``urlopen``.
+
+    :param raw: Full response bytes read until connection close.
+    :type raw: bytes
+    :param url: Requested URL (used for error reporting).
+    :type url: str
+    :returns: Response body bytes.
+    :rtype: bytes
+    :raises urllib.error.HTTPError: For ``4xx``/``5xx`` responses.
+    :raises ValueError: If the response head is malformed or its body
+        cannot be decoded.
+    """
+    status, reason, headers, body = _split_http_response(raw)
+    if status >= 400:
+        raise error.HTTPError(url, status, reason, hdrs=None, fp=None)
+    if headers.get('transfer-encoding', '').lower() == 'chunked':
+        body = _decode_chunked(body)
+    decoder = BodyDecoder(headers.get('content-encoding'))
+    body = decoder.decode([body])
+    TRANSFER_STATS.record(decoder)
+    return body
+
+
+async def async_http_get(url, headers=None, timeout=10):
+    """Fetch a URL on the running event loop and return only the body.
+
+    See :func:`async_http_fetch`.
+
+    :param url: Absolute ``http``/``https`` URL.
+    :type url: str
+    :param headers: Extra request headers (for example ``User-Agent``).
+    :type headers: dict[str, str] | None
+    :param timeout: Seconds allowed for connect and for reading the response.
+    :type timeout: float
+    :returns: Response body bytes.
+    :rtype: bytes
+    :raises urllib.error.URLError: On connection-level failures, or after more
+        than ``MAX_REDIRECTS`` redirects.
+    :raises urllib.error.HTTPError: For ``4xx``/``5xx`` responses.
+    :raises TimeoutError: When connect or read exceeds ``timeout``.
+    :raises ValueError: If the response is malformed or cannot be decoded.
+    """
+    return (await async_http_fetch(url, headers, timeout))[2]
+
+
+async def async_http_fetch(url, headers=None, timeout=10):
+    """Fetch a URL on the running event loop using a plain HTTP/1.1 GET.
+
+    Each call opens one connection with ``Connection: close`` and reads until
+    EOF, which keeps the client tiny while still letting hundreds of requests
+    share a single loop. ``ACCEPT_ENCODING`` is offered and the body is
+    decoded before it is returned. Redirects are followed up to
+    ``MAX_REDIRECTS`` times, like the pooled client.
+
+    :param url: Absolute ``http``/``https`` URL.
+    :type url: str
+    :param headers: Extra request headers (for example ``User-Agent``).
+    :type headers: dict[str, str] | None
+    :param timeout: Seconds allowed for connect and for reading the response.
+    :type timeout: float
+    :returns: ``(status, headers, body)`` of the final response, like
+        :meth:`PooledHTTPClient.fetch`.
+    :rtype: tuple[int, dict[str, str], bytes]
+    :raises urllib.error.URLError: On connection-level failures, or after more
+        than ``MAX_REDIRECTS`` redirects.
+    :raises urllib.error.HTTPError: For ``4xx``/``5xx`` responses.
+    :raises TimeoutError: When connect or read exceeds ``timeout``.
+    :raises ValueError: If the response is malformed or cannot be decoded.
+    """
+    for _ in range(MAX_REDIRECTS + 1):
+        raw = await _async_request(url, headers, timeout)
+        status, _, response_headers, _ = _split_http_response(raw)
+        location = response_headers.get('location')
+        if status not in REDIRECT_STATUSES or not location:
+            return status, response_headers, parse_http_response(raw, url)
+        url = parse.urljoin(url, location)
+    # Match the pooled client, whose exhausted redirect budget surfaces as URLError.
+    raise error.URLError(f'too many redirects (more than {MAX_REDIRECTS})')
+
+
+async def _async_request(url, headers, timeout):
+    """Send one GET on a fresh connection and read the raw response until EOF.
+
+    :param url: Absolute ``http``/``https`` URL.
+    :type url: str
+    :param headers: Extra request headers.
+    :type headers: dict[str, str] | None
+    :param timeout: Seconds allowed for connect and for reading the response.
+    :type timeout: float
+    :returns: Raw response bytes.
+    :rtype: bytes
+    :raises urllib.error.URLError: On connection-level failures.
+    :raises TimeoutError: When connect or read exceeds ``timeout``.
+    """
+    parts = parse.urlsplit(url)
+    is_https = parts.scheme == 'https'
+    port = parts.port or (443 if is_https else 80)
+    target = parts.path or '/'
+    if parts.query:
+        target += '?' + parts.query
+
+    try:
+        reader, writer = await asyncio.wait_for(
+            asyncio.open_connection(
+                parts.hostname,
+                port,
+                ssl=_ssl_context() if is_https else None,
+            ),
+            timeout,
+        )
+    except TimeoutError:
+        raise
+    except OSError as e:
+        # Match urlopen, which wraps socket errors in URLError.
+        raise error.URLError(e) from e
+
+    request_lines = [f'GET {target} HTTP/1.1', f'Host: {parts.netloc}', 'Connection: close',
+                     f'Accept-Encoding: {ACCEPT_ENCODING}']
+    request_lines.extend(f'{name}: {value}' for name, value in (headers or {}).items())
+    try:
+        writer.write(('\r\n'.join(request_lines) + '\r\n\r\n').encode('latin-1'))
+        await writer.drain()
+        raw = await asyncio.wait_for(reader.read(), timeout)
+    except TimeoutError:
+        raise
+    except OSError as e:
+        raise error.URLError(e) from e
+    finally:
+        writer.close()
+    return raw
+
+
+class PooledHTTPClient:
+    """Thread-safe keep-alive HTTP client backed by a ``urllib3.PoolManager``.
+
+    Connections are kept open per host and handed back to the pool after each
+    response, so repeated fetches against the same site skip the TCP/TLS
+    handshake. ``block=True`` keeps the number of open sockets at ``maxsize``
+    even when more worker threads are waiting. Every request offers
+    ``ACCEPT_ENCODING`` and bodies are decoded while they are read.
+    """
+
+    def __init__(self, maxsize, headers=None, timeout=10):
+        """Create the pool.
+
+        :param maxsize: Maximum open connections per host.
+        :type maxsize: int
+        :param headers: Default headers sent with every request.
+        :type headers: dict[str, str] | None
+        :param timeout: Connect/read timeout in seconds.
+        :type timeout: float
+        """
+        self.maxsize = maxsize
+        self._manager = urllib3.PoolManager(
+            maxsize=maxsize,
+            block=True,
+            headers={'Accept-Encoding': ACCEPT_ENCODING, **(headers or {})},
+            timeout=urllib3.Timeout(connect=timeout, read=timeout),
+            retries=POOL_RETRIES,
+        )
+
+    def fetch(self, url, headers=None):
+        """Fetch a URL over a pooled connection, keeping status and headers.
+
+        Errors are translated to the ``urllib`` exception types the scraper
+        already handles for ``urlopen``. Non-error statuses such as ``304 Not
+        Modified`` are returned to the caller. The body is read in
+        ``READ_CHUNK_BYTES`` steps and each step is decoded as it arrives, so
+        the compressed copy is never held whole.
+
+        :param url: Absolute URL to request.
+        :type url: str
+        :param headers: Extra per-request headers (merged over the defaults).
+        :type headers: dict[str, str] | None
+        :returns: ``(status, headers, body)`` with lower-cased header names.
+        :rtype: tuple[int, dict[str, str], bytes]
+        :raises urllib.error.HTTPError: For ``4xx``/``5xx`` responses.
+        :raises urllib.error.URLError: On connection-level failures.
+        :raises TimeoutError: When connect or read times out.
+        :raises ValueError: If the body cannot be decoded.
+        """
+        request_headers = None
+        if headers:
+            request_headers = {**self._manager.headers, **headers}
+        try:
+            response = self._manager.request('GET', url, headers=request_headers,
+                                             preload_content=False, decode_content=False)
+            if response.status >= 400:
+                response.drain_conn()
+                raise error.HTTPError(url, response.status, response.reason, hdrs=None, fp=None)
+            response_headers = {name.lower(): value for name, value in response.headers.items()}
+            decoder = BodyDecoder(response_headers.get('content-encoding'))
+            body = decoder.decode(response.stream(READ_CHUNK_BYTES, decode_content=False))
+            response.release_conn()
+        except urllib3.exceptions.TimeoutError as e:
+            raise TimeoutError(str(e)) from e
+        except urllib3.exceptions.MaxRetryError as e:
+            # NewConnectionError subclasses ConnectTimeoutError for legacy reasons.
+            if isinstance(e.reason, urllib3.exceptions.TimeoutError) and not isinstance(
+                e.reason, urllib3.exceptions.NewConnectionError
+            ):
+                raise TimeoutError(str(e.reason)) from e
+            raise error.URLError(e.reason) from e
+        except urllib3.exceptions.HTTPError as e:
+            raise error.URLError(e) from e
+
+        TRANSFER_STATS.record(decoder)
+        return response.status, response_headers, body
+
+    def get(self, url):
+        """Fetch a URL over a pooled connection and return only the body.
+
+        :param url: Absolute URL to request.
+        :type url: str
+        :returns: Response body bytes.
+        :rtype: bytes
+        :raises urllib.error.HTTPError: For ``4xx``/``5xx`` responses.
+        :raises urllib.error.URLError: On connection-level failures.
+        :raises TimeoutError: When connect or read times out.
+        :raises ValueError: If the body cannot be decoded.
+        """
+        return self.fetch(url)[2]
+
+    def connection_stats(self):
+        """Summarize connection reuse across all host pools.
+
+        :returns: Request count, connections opened, and connections reused.
+        :rtype: dict[str, int]
+        """
+        requests = 0
+        opened = 0
+        for key in self._manager.pools.keys():
+            pool = self._manager.pools.get(key)
+            if pool is None:
+                # Pool was evicted between listing keys and reading it.
+                continue
+            requests += pool.num_requests
+            opened += pool.num_connections
+        return {
+            'requests': requests,
+            'connections_opened': opened,
+            'connections_reused': max(requests - opened, 0),
+        }
@@ -0,0 +1,167 @@
+"""Streaming JSON Lines reader and writer for applicant_data artifacts."""
+
+# Approach: one JSON object per line, written through a large write buffer and read back a
+# line at a time, so saving or loading holds one record rather than the whole dataset. The
+# reader also streams legacy single-array files by decoding one element at a time.
+import importlib
+import importlib.util
+import json
+import re
+
+# orjson is optional; it encodes and decodes lines several times faster than json.
+HAS_ORJSON = importlib.util.find_spec('orjson') is not None
+
+# JSON codecs for write_jsonl()/iter_jsonl(); 'auto' picks the fastest installed.
+JSON_BACKENDS = ('auto', 'json', 'orjson')
+DEFAULT_JSON_BACKEND = 'orjson' if HAS_ORJSON else 'json'
+
+# Output buffer size; records are flushed to disk in blocks of about this many bytes.
+WRITE_BUFFER_BYTES = 1 << 20
+
+# Characters read per refill while streaming a legacy JSON array.
+READ_CHUNK_CHARS = 1 << 16
+
+# Whitespace and commas between elements of a JSON array.
+_ARRAY_SEPARATORS = re.compile(r'[\s,]*')
+
+
+def _json_dumps(record):
+    """Encode one record as a compact UTF-8 JSON line body with the stdlib.
+
+    Separators and non-ASCII handling match orjson, so both backends write
+    the same bytes.
+
+    :param record: Record to encode.
+    :type record: applicant_record.ApplicantRecord | dict
+    :returns: Encoded JSON object.
+    :rtype: bytes
+    """
+    return json.dumps(record, default=dict, ensure_ascii=False, separators=(',', ':')).encode()
+
+
+def _codec(backend):
+    """Resolve a backend name to its encode and decode functions.
+
+    :param backend: One of ``JSON_BACKENDS``.
+    :type backend: str
+    :returns: ``(dumps, loads)``; ``dumps`` returns bytes, ``loads`` accepts bytes.
+    :rtype: tuple[collections.abc.Callable, collections.abc.Callable]
+    :raises ValueError: If the backend is unknown or not installed.
+    """
+    if backend not in JSON_BACKENDS:
+        raise ValueError(f'Unknown JSON backend: {backend!r}')
+    if backend == 'auto':
+        backend = DEFAULT_JSON_BACKEND
+    if backend == 'json':
+        return _json_dumps, json.loads
+    if not HAS_ORJSON:
+        raise ValueError("backend='orjson' requires the orjson package")
+    orjson = importlib.import_module('orjson')
+    return (lambda record: orjson.dumps(record, default=dict)), orjson.loads
+
+
+def write_jsonl(records, path, append=False, backend='auto'):
+    """Write records to a JSON Lines file, one object per line.
+
+    ``records`` may be any iterable, such as :func:`clean.iter_clean_data`.
+    Each record is encoded and handed to the write buffer before the next
+    one is pulled.
+
+    :param records: Records to write.
+    :type records: collections.abc.Iterable[applicant_record.ApplicantRecord | dict]
+    :param path: Output path.
+    :type path: str | pathlib.Path
+    :param append: Add to an existing file instead of replacing it.
+    :type append: bool
+    :param backend: One of ``JSON_BACKENDS``.
+    :type backend: str
+    :returns: Number of records written.
+    :rtype: int
+    :raises ValueError: If the backend is unknown or not installed.
+    """
+    dumps = _codec(backend)[0]
+    count = 0
+    with open(path, 'ab' if append else 'wb', buffering=WRITE_BUFFER_BYTES) as f:
+        for record in records:
+            f.write(dumps(record))
+            f.write(b'\n')
+            count += 1
+    return count
+
+
+def iter_jsonl(path, backend='auto'):
+    """Read records back from a JSON Lines file, or a legacy JSON array file.
+
+    A file whose first non-blank character is ``[`` is a legacy
+    ``json.dump`` array; its elements are decoded one at a time as well.
+    Blank lines in JSON Lines files are skipped.
+
+    :param path: Input path.
+    :type path: str | pathlib.Path
+    :param backend: One of ``JSON_BACKENDS`` (used for JSON Lines input).
+    :type backend: str
+    :returns: Iterator of decoded records in file order.
+    :rtype: collections.abc.Iterator[dict]
+    :raises ValueError: If the backend is unknown or not installed, or the file
+        is not valid JSON.
+    """
+    loads = _codec(backend)[1]
+    with open(path, 'rb') as f:
+        if _starts_with_array(f):
+            with open(path, 'r', encoding='utf-8') as text:
+                yield from _iter_json_array(text)
+            return
+        for line in f:
+            if line.strip():
+                yield loads(line)
+
+
+def _starts_with_array(handle):
+    """Report whether a binary file's first non-whitespace byte is ``[``.
+
+    :param handle: File opened in binary mode; rewound before returning.
+    :type handle: typing.BinaryIO
+    :returns: ``True`` for a legacy JSON array file.
+    :rtype: bool
+    """
+    found = False
+    while chunk := handle.read(READ_CHUNK_CHARS):
+        stripped = chunk.lstrip()
+        if stripped:
+            found = stripped.startswith(b'[')
+            break
+    handle.seek(0)
+    return found
+
+
+def _iter_json_array(handle):
+    """Decode the elements of a JSON array file one at a time.
+
+    Only the unread tail of the current chunk and the element being decoded
+    are held, however long the array (or its single line) is.
+
+    :param handle: File opened in text mode, positioned before the ``[``.
+    :type handle: typing.TextIO
+    :returns: Iterator of array elements.
+    :rtype: collections.abc.Iterator[object]
+    :raises ValueError: If the array is malformed or truncated.
+    """
+    decoder = json.JSONDecoder()
+    buffer = handle.read(READ_CHUNK_CHARS)
+    pos = buffer.index('[') + 1
+    while True:
+        start = _ARRAY_SEPARATORS.match(buffer, pos).end()
+        if buffer.startswith(']', start):
+            return
+        try:
+            element, pos = decoder.raw_decode(buffer, start)
+        except json.JSONDecodeError:
+            pos = None
+        if pos is None or pos == len(buffer):
+            # The element may run past this chunk: keep it from its start and read more.
+            more = handle.read(READ_CHUNK_CHARS)
+            if not more:
+                raise ValueError(f'Malformed or truncated JSON array in {handle.name}')
+            buffer, pos = buffer[start:] + more, 0
+            continue
+        yield element
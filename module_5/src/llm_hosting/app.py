@@ -11,7 +11,7 @@ import difflib
 from pathlib import Path
 from contextlib import nullcontext
 from functools import lru_cache
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, Iterator, List, Tuple
 
 from flask import Flask, jsonify, request
 from huggingface_hub import hf_hub_download
@@ -398,6 +398,35 @@ def _normalize_input(payload: Any) -> List[Dict[str, Any]]:
     return []
 
 
+def _iter_file_rows(path: Path) -> Iterator[Dict[str, Any]]:
+    """Yield input rows from a JSON Lines file or a whole-document JSON file.
+
+    JSONL input (one object per line, as ``clean.save_data`` writes) is read
+    a line at a time. A file that does not start with a complete JSON object
+    on its first line (a JSON array, or a pretty-printed ``{"rows": [...]}``)
+    is parsed whole, as before.
+
+    :param path: Input file path.
+    :type path: pathlib.Path
+    :returns: Iterator of row dictionaries.
+    :rtype: collections.abc.Iterator[dict[str, Any]]
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        try:
+            first = json.loads(f.readline())
+        except json.JSONDecodeError:
+            # A multi-line document (pretty-printed array or object): parse it whole.
+            f.seek(0)
+            first = json.load(f)
+        if not isinstance(first, dict) or isinstance(first.get("rows"), list):
+            yield from _normalize_input(first)
+            return
+        yield first
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
 @app.get("/")
 def health() -> Any:
     """Return service health status.
@@ -436,9 +465,9 @@ def _cli_process_file(
     append: bool,
     to_stdout: bool,
 ) -> None:
-    """Process input JSON rows and emit JSONL output incrementally.
+    """Process input JSONL (or JSON) rows and emit JSONL output incrementally.
 
-    :param in_path: Input JSON path.
+    :param in_path: Input JSONL, or legacy JSON array/``{"rows": [...]}``, path.
     :type in_path: str
     :param out_path: Destination JSONL path when not writing to stdout.
     :type out_path: str | None
@@ -450,8 +479,7 @@ def _cli_process_file(
     :rtype: None
     """
     safe_in_path = _resolve_cli_path(in_path, must_exist=True)
-    with open(safe_in_path, "r", encoding="utf-8") as f:
-        rows = _normalize_input(json.load(f))
+    rows = _iter_file_rows(safe_in_path)
 
     if to_stdout:
         sink_cm = nullcontext(sys.stdout)
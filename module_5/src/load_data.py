@@ -9,12 +9,16 @@ from datetime import datetime
 import psycopg
 from psycopg import sql
 from db_config import get_admin_conn_info, get_db_conn_info, get_db_name
+from seen_filter import FILTER_CAPACITY, FILTER_FILENAME, KnownResults, ResultIdFilter
 
 base_conn_info = get_admin_conn_info()
 DBNAME = get_db_name()
 conn_info = get_db_conn_info()
 MAX_QUERY_LIMIT = 100
 
+# Result ids pulled per round trip when the filter is rebuilt from a server-side cursor.
+RESULT_FILTER_FETCH_ROWS = 50_000
+
 
 def _clamp_limit(limit, minimum=1, maximum=MAX_QUERY_LIMIT):
     """Clamp a requested row limit to a safe bounded range.
@@ -113,6 +117,114 @@ def get_existing_urls():
         return set()
 
 
+def find_existing_urls(urls):
+    """Return which of ``urls`` are already stored, in one query.
+
+    Used to confirm Bloom-filter hits, so an unreachable database counts every
+    candidate as new (the insert's ``ON CONFLICT`` still drops duplicates).
+
+    :param urls: Candidate result URLs.
+    :type urls: list[str]
+    :returns: The subset of ``urls`` present in ``admissions``.
+    :rtype: set[str]
+    """
+    try:
+        with psycopg.connect(conn_info) as conn:
+            with conn.cursor() as cur:
+                cur.execute('SELECT url FROM admissions WHERE url = ANY(%s);', (list(urls),))
+                return {row[0] for row in cur.fetchall()}
+    except (psycopg.Error, RuntimeError):
+        return set()
+
+
+def _build_result_filter():
+    """Build a result-id filter from every stored ``result_page``.
+
+    Ids stream from a named (server-side) cursor ``RESULT_FILTER_FETCH_ROWS``
+    at a time, so the table is read in a handful of round trips without
+    either side holding every id at once.
+
+    :returns: Filter covering every stored row, or ``None`` on database error.
+    :rtype: seen_filter.ResultIdFilter | None
+    """
+    try:
+        with psycopg.connect(conn_info) as conn:
+            with conn.cursor() as cur:
+                cur.execute('SELECT COUNT(*) FROM admissions;')
+                total = cur.fetchone()[0]
+            # Leave room to grow before the false-positive rate degrades.
+            bloom = ResultIdFilter(capacity=max(FILTER_CAPACITY, 2 * total))
+            with conn.cursor(name='result_filter_ids') as ids:
+                ids.itersize = RESULT_FILTER_FETCH_ROWS
+                ids.execute('SELECT result_page FROM admissions;')
+                for (result_page,) in ids:
+                    bloom.add(result_page)
+            # Record the table size so load_known_results() can detect later drift.
+            bloom.count = total
+            return bloom
+    except (psycopg.Error, RuntimeError):
+        return None
+
+
+def _count_admissions():
+    """Count stored admissions rows.
+
+    :returns: Row count, or ``None`` on database error.
+    :rtype: int | None
+    """
+    try:
+        with psycopg.connect(conn_info) as conn:
+            with conn.cursor() as cur:
+                cur.execute('SELECT COUNT(*) FROM admissions;')
+                return cur.fetchone()[0]
+    except (psycopg.Error, RuntimeError):
+        return None
+
+
+def load_known_results(filter_path):
+    """Load the persisted result-id filter, rebuilding it when it is stale.
+
+    The filter is trusted when its row count matches ``COUNT(*)`` of
+    ``admissions`` and it is not over capacity; otherwise it is rebuilt from
+    the database and saved. This replaces pulling every URL into a set
+    (:func:`get_existing_urls`) before incremental scrapes.
+
+    :param filter_path: Filter file kept next to the datasets.
+    :type filter_path: str | pathlib.Path
+    :returns: ``existing_urls`` check for the scraper (empty if the database
+        cannot be read).
+    :rtype: seen_filter.KnownResults
+    """
+    bloom = ResultIdFilter.load(filter_path)
+    if bloom is None or bloom.saturated or bloom.count != _count_admissions():
+        bloom = _build_result_filter()
+        if bloom is None:
+            return KnownResults(ResultIdFilter(capacity=1), find_existing_urls)
+        bloom.save(filter_path)
+    return KnownResults(bloom, find_existing_urls)
+
+
+def _update_result_filter(filter_path, inserted_ids):
+    """Add newly inserted result ids to an existing filter file.
+
+    A missing or unreadable filter is left alone; the next
+    :func:`load_known_results` rebuilds it from the database.
+
+    :param filter_path: Filter file.
+    :type filter_path: pathlib.Path
+    :param inserted_ids: Result ids of the rows this load inserted.
+    :type inserted_ids: list[str]
+    :returns: ``None``.
+    :rtype: None
+    """
+    bloom = ResultIdFilter.load(filter_path)
+    if bloom is None:
+        return
+    for result_page in inserted_ids:
+        bloom.add(result_page)
+    bloom.save(filter_path)
+
+
 def format_date(date_str):
     """Convert date text to a ``date`` object compatible with PostgreSQL.
 
@@ -204,7 +316,9 @@ def stream_jsonl_to_postgres(filepath):
 
     The function ensures the admissions schema exists (using admin credentials
     only when missing), inserts rows with ``ON CONFLICT (url) DO NOTHING``, and
-    commits once all valid records are processed.
+    commits once all valid records are processed. After the commit, the ids of
+    inserted rows are added to the result-id filter next to ``filepath``
+    (``seen_filter.FILTER_FILENAME``) if one exists.
 
     :param filepath: Path to line-delimited JSON records.
     :type filepath: str
@@ -214,6 +328,7 @@ def stream_jsonl_to_postgres(filepath):
     """
     create_db_if_not_exists()
 
+    inserted_ids = []
     with psycopg.connect(conn_info) as conn:
         with conn.cursor() as cur:
             if not _admissions_table_exists(cur):
@@ -231,6 +346,7 @@ def stream_jsonl_to_postgres(filepath):
                         continue
 
                     # Map JSON keys to the Database columns
+                    result_page = record.get('url').split('/')[-1]
                     cur.execute("""
                         INSERT INTO admissions (
                             university, program, comments, date_added, url,
@@ -257,11 +373,15 @@ def stream_jsonl_to_postgres(filepath):
                         record.get('llm-generated-program'), # From LLM step
                         record.get('llm-generated-university'), # From LLM step
                         # Store numeric suffix once so incremental scraping can resume quickly.
-                        record.get('url').split('/')[-1]
+                        result_page
                     ))
+                    # rowcount is 0 when ON CONFLICT skipped an already-stored URL.
+                    if cur.rowcount == 1:
+                        inserted_ids.append(result_page)
 
 
             conn.commit()
+    _update_result_filter(Path(filepath).with_name(FILTER_FILENAME), inserted_ids)
     print('SUCCESS: Database populated')
 
 if __name__ == '__main__':
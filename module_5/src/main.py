@@ -1,22 +1,32 @@
 """Orchestration workflow for scrape, clean, normalize, and load operations."""
 
 # Supports both full initial ingestion (`main`) and incremental refresh (`update_new_records`).
-import json
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 import subprocess
 from pathlib import Path
 
-from scrape import scrape_data
+from scrape import iter_scrape_data, probe_new_results, scrape_data
+from distributed_crawl import crawl_worker, distributed_scrape_data
 from clean import clean_data, save_data
-from load_data import stream_jsonl_to_postgres, get_existing_urls, get_max_result_page
+from load_data import stream_jsonl_to_postgres, load_known_results, get_max_result_page
+from seen_filter import FILTER_FILENAME
+
+# Full-crawl progress is committed here so `python main.py --resume` survives a crash.
+CHECKPOINT_PATH = 'crawl_checkpoint.sqlite3'
+
+# A pull cleans, normalizes, and loads records this many at a time, newest first.
+INGEST_BATCH_SIZE = 100
 
 
 def _run_llm_pipeline(input_json_path, output_jsonl_path):
-    """Run the local LLM normalization script over a JSON input file.
+    """Run the local LLM normalization script over a JSONL input file.
 
     The function invokes ``llm_hosting/app.py`` as a subprocess and writes
     line-delimited JSON output incrementally to the requested file.
 
-    :param input_json_path: Path to JSON input payload.
+    :param input_json_path: Path to the JSONL (or legacy JSON array) input payload.
     :type input_json_path: str
     :param output_jsonl_path: Path where normalized JSONL should be written.
     :type output_jsonl_path: str
@@ -55,60 +65,54 @@ def _run_llm_pipeline(input_json_path, output_jsonl_path):
 
 
 
-def main():
+def main(resume=False, metrics_report=None, live_progress=False, crawl_id=None):
     """Execute the full initial ingestion pipeline.
 
-    This function scrapes fresh data, cleans it, saves canonical JSON, and runs
-    the LLM normalization stage to produce JSONL output.
-
+    This function scrapes fresh data, cleans it, saves canonical JSONL, and runs
+    the LLM normalization stage to produce JSONL output. Crawl progress is
+    checkpointed to ``CHECKPOINT_PATH`` until the cleaned JSONL is saved, or
+    kept in the Postgres crawl queue when ``crawl_id`` is given.
+
+    :param resume: Continue an interrupted crawl from its checkpoint instead
+        of starting over.
+    :type resume: bool
+    :param metrics_report: Path for the crawl's JSON run report, or ``None``.
+    :type metrics_report: str | None
+    :param live_progress: Print periodic crawl progress lines.
+    :type live_progress: bool
+    :param crawl_id: Coordinate a distributed crawl under this queue name;
+        ``python main.py --crawl-id NAME --worker`` processes join it.
+    :type crawl_id: str | None
     :returns: ``None``.
     :rtype: None
     """
 
     # Collect raw data in JSON format from TheGradCafe
-    raw_data = scrape_data()
+    if crawl_id is not None:
+        raw_data = distributed_scrape_data(crawl_id, metrics_report=metrics_report,
+                                           live_progress=live_progress)
+    else:
+        raw_data = scrape_data(checkpoint=CHECKPOINT_PATH, resume=resume,
+                               metrics_report=metrics_report, live_progress=live_progress)
 
-    # Clean data to obtain clear, consistent formatting
+    # Clean data to obtain clear, consistent formatting. Serial on purpose: bench_clean.py
+    # shows the process pool no faster here, as pickling records costs more than cleaning.
     cleaned_data = clean_data(raw_data)
 
-    # Write cleaned JSON entries to applicant_data.json
-    save_data(cleaned_data, 'applicant_data.json')
+    # Stream cleaned entries to applicant_data.jsonl
+    save_data(cleaned_data, 'applicant_data.jsonl')
+
+    # The crawl output is safely on disk, so the next full run starts from scratch.
+    Path(CHECKPOINT_PATH).unlink(missing_ok=True)
 
     # Trigger local LLM to standardize program/university fields and write
     # output to llm_extended_applicant_data.jsonl
     _run_llm_pipeline(
-        'applicant_data.json',
+        'applicant_data.jsonl',
         'llm_extend_applicant_data.jsonl',
     )
 
 
-def _append_json_records(records, path):
-    """Append new records to an existing JSON array file.
-
-    If the destination file exists but is not a JSON list, it is treated as an
-    empty list before appending.
-
-    :param records: Records to append.
-    :type records: list[dict]
-    :param path: Target JSON file path.
-    :type path: str | pathlib.Path
-    :returns: ``None``.
-    :rtype: None
-    """
-    path_obj = Path(path)
-    if path_obj.exists():
-        with open(path_obj, 'r', encoding='utf-8') as f:
-            existing = json.load(f)
-        # Recover gracefully if an unexpected JSON object/string is present.
-        if not isinstance(existing, list):
-            existing = []
-    else:
-        existing = []
-    existing.extend(records)
-    with open(path_obj, 'w', encoding='utf-8') as f:
-        json.dump(existing, f)
-
-
 def _append_jsonl_records(source_jsonl_path, target_jsonl_path):
     """Append non-empty JSONL lines from one file to another.
 
@@ -127,43 +131,136 @@ def _append_jsonl_records(source_jsonl_path, target_jsonl_path):
                 target_file.write(line)
 
 
+def _batched(items, size):
+    """Group an iterable into lists of at most ``size`` items.
+
+    :param items: Items to group (consumed lazily).
+    :type items: collections.abc.Iterable
+    :param size: Maximum batch length.
+    :type size: int
+    :returns: Iterator of non-empty batches.
+    :rtype: collections.abc.Iterator[list]
+    """
+    iterator = iter(items)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+def _ingest_batch(raw_batch, src_dir):
+    """Clean, normalize, append, and load one batch of new raw payloads.
+
+    The ``_new`` delta files hold the most recent batch; the cumulative
+    cleaned and LLM JSONL datasets and PostgreSQL receive every batch.
+
+    :param raw_batch: Raw payloads scraped for this batch.
+    :type raw_batch: list[applicant_record.ApplicantRecord]
+    :param src_dir: Directory holding the datasets.
+    :type src_dir: pathlib.Path
+    :returns: Number of cleaned records loaded.
+    :rtype: int
+    """
+    cleaned_data = clean_data(raw_batch)
+    new_json_path = src_dir / 'applicant_data_new.jsonl'
+    new_jsonl_path = src_dir / 'llm_extend_applicant_data_new.jsonl'
+
+    # Persist both delta artifacts and cumulative datasets for reproducibility.
+    save_data(cleaned_data, str(new_json_path))
+    _run_llm_pipeline(str(new_json_path), str(new_jsonl_path))
+    save_data(cleaned_data, str(src_dir / 'applicant_data.jsonl'), append=True)
+    _append_jsonl_records(
+        str(new_jsonl_path), str(src_dir / 'llm_extend_applicant_data.jsonl')
+    )
+    stream_jsonl_to_postgres(str(new_jsonl_path))
+    return len(cleaned_data)
+
+
 def update_new_records():
     """Scrape and ingest only records that are newer than current database data.
 
-    Existing URLs and maximum result page are used to reduce duplicate work.
-    New records are cleaned, normalized with the LLM pipeline, appended to
-    cumulative JSON/JSONL datasets, and inserted into PostgreSQL.
+    When the database knows its highest result id, ids above it are probed
+    directly; otherwise survey pages are streamed newest-first. Duplicates are
+    skipped either way using the persisted result-id Bloom filter in ``src/``,
+    with filter hits confirmed in batched database lookups instead of loading
+    every stored URL. New records are handed downstream in batches of
+    ``INGEST_BATCH_SIZE``: each is cleaned, normalized with the LLM pipeline,
+    appended to the cumulative cleaned and LLM JSONL datasets, and inserted into
+    PostgreSQL while the crawl keeps fetching the next batch.
 
     :returns: Status dictionary describing whether records were added.
     :rtype: dict[str, str | int]
     """
-    existing_urls = get_existing_urls()
+    src_dir = Path(__file__).resolve().parent
+    existing_urls = load_known_results(src_dir / FILTER_FILENAME)
     max_result_page = get_max_result_page()
-    # Start scraping from the first unseen result number when DB state is known.
-    min_result_num = max_result_page + 1 if max_result_page is not None else None
-
-    raw_data = scrape_data(min_result_num=min_result_num, existing_urls=existing_urls)
-    if not raw_data:
+    if max_result_page is not None:
+        # New records have higher ids, so fetch those directly instead of reading the survey.
+        raw_data = probe_new_results(max_result_page + 1, existing_urls=existing_urls)
+    else:
+        # Newest-first stream; a full first pull starts landing rows after one batch.
+        raw_data = iter_scrape_data(existing_urls=existing_urls, incremental=True)
+
+    added = 0
+    pending = None
+    with ThreadPoolExecutor(max_workers=1) as loader:
+        for batch in _batched(raw_data, INGEST_BATCH_SIZE):
+            # Keep at most one batch loading while the crawl fetches the next one.
+            if pending is not None:
+                added += pending.result()
+            pending = loader.submit(_ingest_batch, batch, src_dir)
+        if pending is not None:
+            added += pending.result()
+
+    if not added:
         # Keep response minimal for UI/API callers that only need status.
         return {'status': 'no_new'}
+    return {'status': 'updated', 'records': added}
 
-    cleaned_data = clean_data(raw_data)
-    src_dir = Path(__file__).resolve().parent
-    new_json_path = src_dir / 'applicant_data_new.json'
-    new_jsonl_path = src_dir / 'llm_extend_applicant_data_new.jsonl'
-    full_json_path = src_dir / 'applicant_data.json'
-    full_jsonl_path = src_dir / 'llm_extend_applicant_data.jsonl'
 
-    # Persist both delta artifacts and cumulative datasets for reproducibility.
-    save_data(cleaned_data, str(new_json_path))
-    _run_llm_pipeline(str(new_json_path), str(new_jsonl_path))
-    _append_json_records(cleaned_data, str(full_json_path))
-    _append_jsonl_records(
-        str(new_jsonl_path), str(full_jsonl_path)
+def _parse_args(argv=None):
+    """Parse command-line options for the full ingestion pipeline.
+
+    :param argv: Argument list (defaults to ``sys.argv[1:]``).
+    :type argv: list[str] | None
+    :returns: Parsed options.
+    :rtype: argparse.Namespace
+    """
+    parser = argparse.ArgumentParser(description='Scrape, clean, and normalize GradCafe data.')
+    parser.add_argument(
+        '--resume',
+        action='store_true',
+        help=f'continue an interrupted crawl from {CHECKPOINT_PATH}',
     )
-    stream_jsonl_to_postgres(str(new_jsonl_path))
-    return {'status': 'updated', 'records': len(cleaned_data)}
+    parser.add_argument(
+        '--metrics-report',
+        metavar='PATH',
+        help='write a JSON report of request latency, bytes, statuses, and timing',
+    )
+    parser.add_argument(
+        '--progress',
+        action='store_true',
+        help='print crawl progress lines while scraping',
+    )
+    parser.add_argument(
+        '--crawl-id',
+        metavar='NAME',
+        help='share the crawl with other workers through the Postgres crawl queue NAME',
+    )
+    parser.add_argument(
+        '--worker',
+        action='store_true',
+        help='only work the queue given by --crawl-id, then exit without cleaning',
+    )
+    args = parser.parse_args(argv)
+    if args.worker and args.crawl_id is None:
+        parser.error('--worker requires --crawl-id')
+    return args
 
 
 if __name__ == '__main__':
-    main()
+    _args = _parse_args()
+    if _args.worker:
+        crawl_worker(_args.crawl_id, metrics_report=_args.metrics_report,
+                     live_progress=_args.progress)
+    else:
+        main(resume=_args.resume, metrics_report=_args.metrics_report,
+             live_progress=_args.progress, crawl_id=_args.crawl_id)
@@ -0,0 +1,123 @@
+"""Survey page-count discovery for full GradCafe crawls."""
+
+# Approach: survey pages are filled from page 1 up, so "page N has rows" is monotonic; probe
+# pages 1, 2, 4, 8, ... until one is empty (or the cap is hit), then bisect between the last
+# full and first empty page. N pages cost about 2*log2(N) requests instead of a fixed guess.
+import time
+from urllib import error
+
+from page_parsers import parse_table_html
+from scrape_http import http_get
+from scrape_services import RUN_STATE
+
+
+def page_cap(default_cap):
+    """Return the run's hard survey-page cap.
+
+    :param default_cap: Cap used when the run sets no ``max_pages`` option.
+    :type default_cap: int
+    :returns: The ``max_pages`` option, else ``default_cap``.
+    :rtype: int
+    """
+    return RUN_STATE['max_pages'] or default_cap
+
+
+def count_survey_pages(base_url, default_cap, is_restricted, fetch_errors):
+    """Return how many survey pages a full crawl should fetch.
+
+    With ``discover_pages`` on, :func:`find_last_page` probes for the real
+    last page under the cap; if a probe fails the whole cap is crawled rather
+    than risk cutting the crawl short. The page count and the probes it cost
+    are printed.
+
+    :param base_url: Site root the survey pages live under.
+    :type base_url: str
+    :param default_cap: Cap used when the run sets no ``max_pages`` option.
+    :type default_cap: int
+    :param is_restricted: Callable reporting whether robots rules disallow a URL.
+    :type is_restricted: collections.abc.Callable[[str], bool]
+    :param fetch_errors: Exception classes that mean a probe failed.
+    :type fetch_errors: tuple[type[BaseException], ...]
+    :returns: Number of survey pages, starting at page 1.
+    :rtype: int
+    """
+    cap = page_cap(default_cap)
+    if not RUN_STATE['discover_pages']:
+        return cap
+
+    def has_rows(page_num):
+        return _survey_page_has_rows(f"{base_url}/survey/?page={page_num}", is_restricted)
+
+    t1 = time.time()
+    try:
+        last_page, probes = find_last_page(has_rows, cap)
+    except fetch_errors as e:
+        print(f"Survey page discovery failed ({e}); crawling up to the cap of {cap} pages")
+        return cap
+    print(
+        f"Discovered {last_page} survey pages (cap {cap}) with {probes} probe requests "
+        f"in {time.time() - t1:.02f} secs"
+    )
+    return last_page
+
+
+def _survey_page_has_rows(url, is_restricted):
+    """Fetch one survey page for discovery and report whether its table has rows.
+
+    Unlike the crawl's page fetches, errors propagate, so a failed request is
+    never mistaken for the end of the survey. HTTP 404 counts as empty.
+
+    :param url: Survey page URL to request.
+    :type url: str
+    :param is_restricted: Callable reporting whether robots rules disallow a URL.
+    :type is_restricted: collections.abc.Callable[[str], bool]
+    :returns: ``True`` when the page lists at least one record.
+    :rtype: bool
+    """
+    if is_restricted(url):
+        return False
+    try:
+        body = http_get(url)
+    except error.HTTPError as e:
+        if e.code == 404:
+            return False
+        raise
+    return any(parse_table_html(body, RUN_STATE['parser']))
+
+
+def find_last_page(has_rows, max_pages):
+    """Find the last survey page that holds rows.
+
+    :param has_rows: Callable returning whether a page number holds any rows.
+    :type has_rows: collections.abc.Callable[[int], bool]
+    :param max_pages: Hard cap; pages above it are never probed.
+    :type max_pages: int
+    :returns: Last non-empty page (``0`` when page 1 is empty, ``max_pages``
+        when the cap itself holds rows) and the number of pages probed.
+    :rtype: tuple[int, int]
+    """
+    probed = []
+
+    def probe(page):
+        probed.append(page)
+        return has_rows(page)
+
+    if max_pages < 1 or not probe(1):
+        return 0, len(probed)
+    # Invariant: page ``full`` has rows; page ``empty`` (once known) does not.
+    full, empty = 1, None
+    while empty is None:
+        if full == max_pages:
+            return full, len(probed)
+        page = min(full * 2, max_pages)
+        if probe(page):
+            full = page
+        else:
+            empty = page
+    while empty - full > 1:
+        page = (full + empty) // 2
+        if probe(page):
+            full = page
+        else:
+            empty = page
+    return full, len(probed)
@@ -0,0 +1,210 @@
+"""HTML extractors for GradCafe survey tables and result pages."""
+
+# Approach: pure bytes-in/rows-out functions so they can run in-thread or on a process pool.
+import importlib.util
+
+from bs4 import BeautifulSoup, SoupStrainer
+
+from applicant_record import ApplicantRecord
+
+# lxml is optional; BeautifulSoup imports it itself when the 'lxml' backend is used.
+HAS_LXML = importlib.util.find_spec('lxml') is not None
+
+# Backend used when scrape_data() is called with parser='auto'. lxml is opt-in only: it
+# folds CRLF to LF inside cells and closes unclosed <td> tags differently from html.parser.
+DEFAULT_PARSER = 'strained'
+
+RESULT_FIELD_MAP = {
+    0: 'university',
+    1: 'program',
+    2: 'degree',
+    3: 'US/International',
+    4: 'application status',
+    5: 'application status date',
+    6: 'GPA',
+    8: 'comments',
+}
+
+
+def extract_result_num(url):
+    """Extract integer result id from a result URL.
+
+    :param url: URL containing a trailing result identifier segment.
+    :type url: str
+    :returns: Parsed result id or ``None`` when invalid.
+    :rtype: int | None
+    """
+    try:
+        return int(url.rstrip('/').split('/')[-1])
+    except (ValueError, AttributeError):
+        return None
+
+
+def newest_first(rows):
+    """Order survey rows by result id, highest (newest) first.
+
+    Every engine serves tasks in the order they are given, so this ordering is
+    what makes the freshest records finish first. Rows without an id go last.
+
+    :param rows: Non-empty survey rows.
+    :type rows: collections.abc.Iterable[list[str]]
+    :returns: Rows sorted newest first.
+    :rtype: list[list[str]]
+    """
+    return sorted(rows, key=lambda row: extract_result_num(row[0]) or 0, reverse=True)
+
+
+def make_soup(content, tag, backend):
+    """Parse HTML with the requested backend.
+
+    Strained backends only build the subtree rooted at ``tag``, which is all
+    the extractors read, so ``soup.find(tag)`` returns the same element as a
+    full parse.
+
+    :param content: Raw page HTML.
+    :type content: bytes | str
+    :param tag: Tag name the extractor needs (``'table'`` or ``'dl'``).
+    :type tag: str
+    :param backend: One of ``'full'``, ``'strained'`` or ``'lxml'``.
+    :type backend: str
+    :returns: Parsed document.
+    :rtype: bs4.BeautifulSoup
+    """
+    if backend == 'full':
+        return BeautifulSoup(content, 'html.parser')
+    features = 'lxml' if backend == 'lxml' else 'html.parser'
+    return BeautifulSoup(content, features, parse_only=SoupStrainer(tag))
+
+
+def parse_table_html(content, backend='full'):
+    """Parse survey-table HTML into rows grouped by record.
+
+    :param content: Raw ``/survey`` page HTML.
+    :type content: bytes | str
+    :param backend: Parser backend passed to :func:`make_soup`.
+    :type backend: str
+    :returns: Parsed rows from the table, grouped by record.
+    :rtype: list[list[str]]
+    """
+    soup = make_soup(content, 'table', backend)
+    table = soup.find('table')
+
+    # If nothing is found, return
+    if not table:
+        return []
+
+    # Get all rows after skipping the header row
+    rows = table.find_all('tr')[1:]
+
+    # Parse rows and combine the data from rows that are part of the same record
+    parsed_data = []
+    tmp_row = []
+    for row in rows:
+        # A <tr> tag with no attrs indicates the first row of a new record
+        if len(row.attrs) == 0:
+            # If tmp_row contains data, store it in parsed_data then clear it
+            # It is empty here when the very first row is being processed
+            if tmp_row:
+                parsed_data.append(tmp_row)
+
+            tmp_row = []
+
+        # Extract the information from the columns in each row
+        cells = [col.get_text() for col in row.find_all('td')]
+
+        # Find the link to the corresponding /result/{result_number} path
+        # And insert it at index 0
+        link = row.find('a')
+        if link:
+            link = link.attrs['href']
+            tmp_row.insert(0, link)
+
+        # Add all gathered information in this row to tmp_row
+        tmp_row.extend(cells)
+
+    # Make sure the very last row of data is added to parsed_data
+    if tmp_row:
+        parsed_data.append(tmp_row)
+
+    return parsed_data
+
+
+def parse_result_html(content, url, payload, backend='full'):
+    """Parse result-page HTML into a payload dictionary.
+
+    :param content: Raw ``/result/<id>`` page HTML.
+    :type content: bytes | str
+    :param url: Absolute result page URL.
+    :type url: str
+    :param payload: Existing payload map seeded from survey-table fields.
+    :type payload: dict[str, str]
+    :param backend: Parser backend passed to :func:`make_soup`.
+    :type backend: str
+    :returns: Updated payload, or empty dict when the page has no entries.
+    :rtype: dict[str, str]
+    """
+    soup = make_soup(content, 'dl', backend)
+
+    # Get all the data fields on the page
+    entries = soup.find('dl').find_all('div')
+
+    # Return if nothing found
+    if not entries:
+        return {}
+
+    # Parse the entries and store raw data in the payload dict, then return
+    payload['url'] = url
+    for i, entry in enumerate(entries):
+        field_name = RESULT_FIELD_MAP.get(i)
+        if field_name is not None:
+            # Check that the field has text content to avoid errors.
+            field_contents = entry.find('dd')
+            if field_contents:
+                payload[field_name] = field_contents.get_text()
+            continue
+
+        if i == 7: # The GRE scores have a slightly different format
+            field_contents = list(entry.find_all('li'))
+            # Quant/Verbal/AW values are nested under `<li><span>..</span><b>..</b>`.
+            spans = [e.find('span').next_sibling.next_sibling for e in field_contents]
+            field_contents = [s.get_text() for s in spans]
+            payload['GRE'] = field_contents[0]
+            payload['GRE V'] = field_contents[1]
+            payload['GRE AW'] = field_contents[2]
+
+    return payload
+
+
+def empty_payload():
+    """Return a raw payload with every field present and blank.
+
+    :returns: Blank slotted record keyed by every raw field name.
+    :rtype: applicant_record.ApplicantRecord
+    """
+    return ApplicantRecord()
+
+
+def seed_payload(row, base_url):
+    """Build the initial payload for a survey row.
+
+    :param row: Parsed survey row whose first element is the result path.
+    :type row: list[str]
+    :param base_url: Site root prepended to the result path.
+    :type base_url: str
+    :returns: ``(url, payload)`` seeded with survey-only fields, or ``None``
+        when the row is malformed.
+    :rtype: tuple[str, applicant_record.ApplicantRecord] | None
+    """
+    payload = empty_payload()
+
+    try:
+        # These are the only three entries needed from the table on /survey/
+        # The rest of the fields are easier to parse from /result/ pages
+        url = base_url + row[0]
+        payload['url'] = url
+        payload['date added'] = row[3]
+        payload['term'] = row[6]
+    except (IndexError, TypeError):
+        # Skip any malformed records
+        return None
+    return url, payload
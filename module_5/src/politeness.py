@@ -0,0 +1,243 @@
+"""Robots.txt rules and per-host request pacing for the GradCafe scraper."""
+
+# Approach: robots.txt is parsed once into compiled Allow/Disallow matchers (longest match
+# wins), and each host gets a token bucket refilled at the allowed rate; every request
+# reserves a token first and sleeps only for its own reservation, never while holding a lock.
+import asyncio
+import re
+import threading
+import time
+from pathlib import Path
+from urllib import error, parse, request
+
+# Seconds a fetched or read robots policy is reused before it is loaded again.
+ROBOTS_CACHE_SECONDS = 24 * 60 * 60
+
+_POLICY_CACHE = {}
+_POLICY_CACHE_LOCK = threading.Lock()
+
+
+def _compile_rule(pattern):
+    """Compile one robots path pattern.
+
+    Plain patterns become prefix strings (checked with ``str.startswith``);
+    patterns using ``*`` or a trailing ``$`` become regular expressions.
+
+    :param pattern: Path pattern from an ``Allow``/``Disallow`` line.
+    :type pattern: str
+    :returns: Prefix string or compiled regex.
+    :rtype: str | re.Pattern[str]
+    """
+    if '*' not in pattern and not pattern.endswith('$'):
+        return pattern
+    anchored = pattern.endswith('$')
+    body = re.escape(pattern.rstrip('$')).replace(r'\*', '.*')
+    return re.compile(body + ('$' if anchored else ''))
+
+
+class RobotsPolicy:
+    """Compiled ``Allow``/``Disallow`` rules and crawl delay for one user agent.
+
+    Matching follows RFC 9309: the longest matching pattern decides, and
+    ``Allow`` wins a tie. URLs no rule matches are allowed.
+    """
+
+    def __init__(self, rules=(), crawl_delay=None):
+        """Compile rules.
+
+        :param rules: ``(allow, pattern)`` pairs.
+        :type rules: collections.abc.Iterable[tuple[bool, str]]
+        :param crawl_delay: Seconds to wait between requests to one host, or ``None``.
+        :type crawl_delay: float | None
+        """
+        ordered = sorted(
+            ((len(pattern), allow, pattern) for allow, pattern in rules if pattern),
+            key=lambda rule: (-rule[0], not rule[1]),
+        )
+        self._rules = [(allow, _compile_rule(pattern)) for _, allow, pattern in ordered]
+        self.crawl_delay = crawl_delay
+
+    @classmethod
+    def parse(cls, text, user_agent='*'):
+        """Parse robots.txt text for one user agent.
+
+        The group whose ``User-agent`` token appears in ``user_agent`` is
+        used; otherwise the ``*`` group; otherwise no rules apply.
+
+        :param text: robots.txt contents.
+        :type text: str
+        :param user_agent: Full ``User-Agent`` string the scraper sends.
+        :type user_agent: str
+        :returns: Parsed policy.
+        :rtype: RobotsPolicy
+        """
+        groups = []
+        # Rules before the first User-agent line belong to no group and are dropped.
+        current, in_rules = {'agents': [], 'rules': [], 'delay': None}, True
+        for raw_line in text.splitlines():
+            line = raw_line.split('#', 1)[0].strip()
+            field, _, value = line.partition(':')
+            field, value = field.strip().lower(), value.strip()
+            if field == 'user-agent':
+                if in_rules:
+                    current, in_rules = {'agents': [], 'rules': [], 'delay': None}, False
+                    groups.append(current)
+                current['agents'].append(value.lower())
+            elif field in ('allow', 'disallow'):
+                in_rules = True
+                current['rules'].append((field == 'allow', value))
+            elif field == 'crawl-delay':
+                in_rules = True
+                try:
+                    current['delay'] = float(value)
+                except ValueError:
+                    continue
+        agent = user_agent.lower()
+        named = [group for group in groups
+                 if any(name != '*' and name in agent for name in group['agents'])]
+        fallback = [group for group in groups if '*' in group['agents']]
+        chosen = (named or fallback or [{'rules': [], 'delay': None}])[0]
+        return cls(chosen['rules'], chosen['delay'])
+
+    def allows(self, url):
+        """Return whether ``url`` may be fetched.
+
+        :param url: Absolute URL (or path) to check.
+        :type url: str
+        :returns: ``True`` unless the longest matching rule disallows it.
+        :rtype: bool
+        """
+        parts = parse.urlsplit(url)
+        path = (parts.path or '/') + (f'?{parts.query}' if parts.query else '')
+        for allow, matcher in self._rules:
+            if path.startswith(matcher) if isinstance(matcher, str) else matcher.match(path):
+                return allow
+        return True
+
+
+def load_robots_policy(source, user_agent='*'):
+    """Load a robots policy from a URL or a local file, reusing a cached copy.
+
+    A robots.txt URL answering 4xx means no restrictions, as RFC 9309 asks.
+
+    :param source: ``http(s)://.../robots.txt`` URL or a local file path.
+    :type source: str | pathlib.Path
+    :param user_agent: ``User-Agent`` sent when fetching and matched against groups.
+    :type user_agent: str
+    :returns: Parsed policy.
+    :rtype: RobotsPolicy
+    :raises urllib.error.URLError: If the URL cannot be fetched (other than 4xx).
+    :raises OSError: If the file cannot be read.
+    """
+    key = (str(source), user_agent)
+    with _POLICY_CACHE_LOCK:
+        cached = _POLICY_CACHE.get(key)
+    if cached is not None and time.monotonic() - cached[0] < ROBOTS_CACHE_SECONDS:
+        return cached[1]
+    if str(source).startswith(('http://', 'https://')):
+        text = _fetch_robots(str(source), user_agent)
+    else:
+        text = Path(source).read_text(encoding='utf-8')
+    policy = RobotsPolicy.parse(text, user_agent)
+    with _POLICY_CACHE_LOCK:
+        _POLICY_CACHE[key] = (time.monotonic(), policy)
+    return policy
+
+
+def _fetch_robots(url, user_agent):
+    """Download robots.txt text.
+
+    :param url: robots.txt URL.
+    :type url: str
+    :param user_agent: ``User-Agent`` header value.
+    :type user_agent: str
+    :returns: File contents, or ``''`` when the server answers 4xx.
+    :rtype: str
+    :raises urllib.error.URLError: On other failures.
+    """
+    try:
+        with request.urlopen(request.Request(url, headers={'User-Agent': user_agent}),
+                             timeout=10) as response:
+            return response.read().decode('utf-8', errors='replace')
+    except error.HTTPError as e:
+        if 400 <= e.code < 500:
+            return ''
+        raise
+
+
+class HostRateLimiter:
+    """Per-host token buckets shared by every worker of a run.
+
+    A caller that finds its host's bucket empty takes a token anyway (the
+    balance goes negative) and is told how long to wait, so waiters are
+    served in arrival order and the lock is never held while sleeping.
+    """
+
+    def __init__(self, rate, capacity=1.0):
+        """Configure the per-host rate.
+
+        :param rate: Requests per second allowed to each host.
+        :type rate: float
+        :param capacity: Largest burst per host after an idle period.
+        :type capacity: float
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self._buckets = {}
+        self._lock = threading.Lock()
+        self._stats = {'requests': 0, 'throttled': 0, 'wait_seconds': 0.0}
+
+    def _reserve(self, url):
+        """Take a token from the bucket of ``url``'s host and count the wait.
+
+        :param url: Requested URL.
+        :type url: str
+        :returns: Seconds to wait.
+        :rtype: float
+        """
+        host = parse.urlsplit(url).netloc
+        with self._lock:
+            now = time.monotonic()
+            tokens, updated = self._buckets.get(host, (self.capacity, now))
+            tokens = min(self.capacity, tokens + (now - updated) * self.rate) - 1
+            self._buckets[host] = (tokens, now)
+            delay = max(0.0, -tokens / self.rate)
+            self._stats['requests'] += 1
+            if delay:
+                self._stats['throttled'] += 1
+                self._stats['wait_seconds'] += delay
+        return delay
+
+    def acquire(self, url):
+        """Block the calling thread until a request to ``url``'s host is allowed.
+
+        :param url: Requested URL.
+        :type url: str
+        :returns: ``None``.
+        :rtype: None
+        """
+        delay = self._reserve(url)
+        if delay:
+            time.sleep(delay)
+
+    async def acquire_async(self, url):
+        """Async counterpart of :meth:`acquire` that yields to the event loop.
+
+        :param url: Requested URL.
+        :type url: str
+        :returns: ``None``.
+        :rtype: None
+        """
+        delay = self._reserve(url)
+        if delay:
+            await asyncio.sleep(delay)
+
+    def stats(self):
+        """Summarize pacing so far.
+
+        :returns: ``requests`` paced, how many were ``throttled``, and total
+            ``wait_seconds``.
+        :rtype: dict[str, float]
+        """
+        with self._lock:
+            return {**self._stats, 'wait_seconds': round(self._stats['wait_seconds'], 3)}
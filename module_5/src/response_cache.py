@@ -0,0 +1,251 @@
+"""On-disk, content-addressed cache of fetched GradCafe pages."""
+
+# Approach: URL entries point at body blobs named by their SHA-256, so identical pages share
+# storage; ETag/Last-Modified are kept so stale entries can be revalidated with a 304.
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+from urllib import parse
+
+# Seconds an entry is served without contacting the server, by URL path prefix.
+# Survey pages shift as new results are posted; result pages rarely change, and a week
+# bounds how long a bad copy of one can be served. ``None`` means "never expires";
+# paths not listed are always revalidated.
+DEFAULT_TTL_POLICY = (
+    ('/survey/', 3600),
+    ('/result/', 7 * 24 * 3600),
+)
+
+
+def _sha256(data):
+    """Return the hex SHA-256 digest of ``data``.
+
+    :param data: Bytes to hash.
+    :type data: bytes
+    :returns: Hex digest.
+    :rtype: str
+    """
+    return hashlib.sha256(data).hexdigest()
+
+
+def _atomic_write(path, data):
+    """Write bytes to ``path`` via a temp file and rename.
+
+    Readers in other threads/processes never observe a partial file.
+
+    :param path: Destination path.
+    :type path: pathlib.Path
+    :param data: Bytes to write.
+    :type data: bytes
+    :returns: ``None``.
+    :rtype: None
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix='.tmp-')
+    with os.fdopen(fd, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_name, path)
+
+
+class ResponseCache:
+    """Thread-safe on-disk HTTP response cache with TTL and revalidation.
+
+    Layout under ``cache_dir``::
+
+        urls/<sha256(url)>.json     metadata: url, body hash, validators, fetched_at
+        objects/<sha256(body)>      raw response body
+    """
+
+    def __init__(self, cache_dir, ttl_policy=DEFAULT_TTL_POLICY):
+        """Open (or create) a cache directory.
+
+        :param cache_dir: Root directory for cache files.
+        :type cache_dir: str | pathlib.Path
+        :param ttl_policy: ``(path_prefix, seconds_or_None)`` pairs checked in order.
+        :type ttl_policy: tuple[tuple[str, int | None], ...]
+        """
+        self.root = Path(cache_dir)
+        self.ttl_policy = ttl_policy
+        self._lock = threading.Lock()
+        self._stats = {'hits': 0, 'misses': 0, 'revalidated': 0}
+
+    def _meta_path(self, url):
+        """Return the metadata file path for ``url``.
+
+        :param url: Absolute URL.
+        :type url: str
+        :returns: Metadata path.
+        :rtype: pathlib.Path
+        """
+        return self.root / 'urls' / f'{_sha256(url.encode("utf-8"))}.json'
+
+    def _object_path(self, digest):
+        """Return the body blob path for a content digest.
+
+        :param digest: Hex SHA-256 of the body.
+        :type digest: str
+        :returns: Blob path.
+        :rtype: pathlib.Path
+        """
+        return self.root / 'objects' / digest
+
+    def _count(self, key):
+        """Increment one statistics counter.
+
+        :param key: Counter name.
+        :type key: str
+        :returns: ``None``.
+        :rtype: None
+        """
+        with self._lock:
+            self._stats[key] += 1
+
+    def ttl_for(self, url):
+        """Return the freshness lifetime for ``url`` from the TTL policy.
+
+        :param url: Absolute URL.
+        :type url: str
+        :returns: Seconds, ``None`` for never-expiring, or ``0`` when unlisted.
+        :rtype: int | None
+        """
+        path = parse.urlsplit(url).path
+        for prefix, ttl in self.ttl_policy:
+            if path.startswith(prefix):
+                return ttl
+        return 0
+
+    def _load(self, url):
+        """Load metadata and body for ``url``.
+
+        :param url: Absolute URL.
+        :type url: str
+        :returns: ``(meta, body)`` or ``None`` when absent or unreadable.
+        :rtype: tuple[dict, bytes] | None
+        """
+        try:
+            meta = json.loads(self._meta_path(url).read_text(encoding='utf-8'))
+            body = self._object_path(meta['sha256']).read_bytes()
+        except (OSError, ValueError, KeyError):
+            return None
+        return meta, body
+
+    def get_fresh(self, url):
+        """Return the cached body when it is still within its TTL.
+
+        :param url: Absolute URL.
+        :type url: str
+        :returns: Cached body, or ``None`` when missing or stale.
+        :rtype: bytes | None
+        """
+        loaded = self._load(url)
+        if loaded is None:
+            return None
+        meta, body = loaded
+        ttl = self.ttl_for(url)
+        if ttl is None or time.time() - meta['fetched_at'] < ttl:
+            self._count('hits')
+            return body
+        return None
+
+    def conditional_headers(self, url):
+        """Build ``If-None-Match``/``If-Modified-Since`` headers for ``url``.
+
+        :param url: Absolute URL.
+        :type url: str
+        :returns: Validator headers (empty when nothing is cached).
+        :rtype: dict[str, str]
+        """
+        loaded = self._load(url)
+        if loaded is None:
+            return {}
+        meta = loaded[0]
+        headers = {}
+        if meta.get('etag'):
+            headers['If-None-Match'] = meta['etag']
+        if meta.get('last_modified'):
+            headers['If-Modified-Since'] = meta['last_modified']
+        return headers
+
+    def store(self, url, body, headers=None):
+        """Record a freshly downloaded body (a cache miss).
+
+        :param url: Absolute URL.
+        :type url: str
+        :param body: Response body.
+        :type body: bytes
+        :param headers: Lower-cased response headers (for validators).
+        :type headers: dict[str, str] | None
+        :returns: ``None``.
+        :rtype: None
+        """
+        headers = headers or {}
+        digest = _sha256(body)
+        object_path = self._object_path(digest)
+        if not object_path.exists():
+            _atomic_write(object_path, body)
+        meta = {
+            'url': url,
+            'sha256': digest,
+            'etag': headers.get('etag'),
+            'last_modified': headers.get('last-modified'),
+            'fetched_at': time.time(),
+        }
+        _atomic_write(self._meta_path(url), json.dumps(meta).encode('utf-8'))
+        self._count('misses')
+
+    def revalidated(self, url):
+        """Handle a ``304 Not Modified`` reply: refresh the entry and return its body.
+
+        :param url: Absolute URL.
+        :type url: str
+        :returns: Cached body, or ``None`` if the entry vanished meanwhile.
+        :rtype: bytes | None
+        """
+        loaded = self._load(url)
+        if loaded is None:
+            return None
+        meta, body = loaded
+        meta['fetched_at'] = time.time()
+        _atomic_write(self._meta_path(url), json.dumps(meta).encode('utf-8'))
+        self._count('revalidated')
+        return body
+
+    def fetch(self, url, fetcher):
+        """Serve ``url`` from cache, revalidating or downloading as needed.
+
+        Only non-empty ``200`` bodies are stored; anything else is returned
+        to the caller without replacing the cached entry.
+
+        :param url: Absolute URL.
+        :type url: str
+        :param fetcher: ``fetcher(url, headers) -> (status, headers, body)``.
+        :type fetcher: collections.abc.Callable
+        :returns: Response body.
+        :rtype: bytes
+        """
+        body = self.get_fresh(url)
+        if body is not None:
+            return body
+        status, headers, body = fetcher(url, self.conditional_headers(url))
+        if status == 304:
+            cached = self.revalidated(url)
+            if cached is not None:
+                return cached
+            # Entry was removed after the conditional request was built; fetch it again.
+            status, headers, body = fetcher(url, {})
+        if status == 200 and body:
+            self.store(url, body, headers)
+        return body
+
+    def stats(self):
+        """Return a snapshot of hit/miss/revalidation counters.
+
+        :returns: Counter values.
+        :rtype: dict[str, int]
+        """
+        with self._lock:
+            return dict(self._stats)
@@ -0,0 +1,95 @@
+"""Direct ``/result/<id>`` probing for incremental GradCafe updates."""
+
+# Approach: new records get ever-higher result ids, so probe ids above the stored maximum in
+# batches until a run of consecutive misses, then read survey pages newest-first, only until
+# every probed id is matched, for the two fields result pages lack (term and date added).
+from page_parsers import seed_payload
+
+# Consecutive missing ids that end a probe; gaps come from deleted or private posts.
+PROBE_MISS_LIMIT = 20
+
+# Survey-only fields copied from a matching survey row onto a probed payload.
+SURVEY_FIELDS = ('term', 'date added')
+
+
+def result_id(url):
+    """Extract the integer result id from a ``/result/<id>`` URL or path.
+
+    :param url: Result URL or path.
+    :type url: str
+    :returns: Result id, or ``None`` when the last segment is not an integer.
+    :rtype: int | None
+    """
+    try:
+        return int(url.rstrip('/').rsplit('/', 1)[-1])
+    except ValueError:
+        return None
+
+
+def probe_ids(start_id, fetch_batch, miss_limit=PROBE_MISS_LIMIT):
+    """Probe result ids upward from ``start_id`` until ``miss_limit`` misses in a row.
+
+    Ids are fetched ``miss_limit`` at a time, so each batch can run fully
+    concurrently and the probe overshoots the newest record by at most one
+    batch.
+
+    :param start_id: First result id to try.
+    :type start_id: int
+    :param fetch_batch: Callable taking a list of ids and returning the parsed
+        payloads (each with its ``'url'``) for the ids that exist.
+    :type fetch_batch: collections.abc.Callable[[list[int]], list[dict[str, str]]]
+    :param miss_limit: Consecutive missing ids that end the probe.
+    :type miss_limit: int
+    :returns: Payloads keyed by result id (ascending) and the number of ids probed.
+    :rtype: tuple[dict[int, dict[str, str]], int]
+    """
+    found = {}
+    misses = 0
+    next_id = start_id
+    while misses < miss_limit:
+        batch = list(range(next_id, next_id + miss_limit))
+        hits = {result_id(payload['url']): payload for payload in fetch_batch(batch)}
+        for probe_id in batch:
+            if probe_id in hits:
+                found[probe_id] = hits[probe_id]
+                misses = 0
+            else:
+                misses += 1
+        next_id += miss_limit
+    return found, next_id - start_id
+
+
+def fill_survey_fields(found, fetch_page, max_pages):
+    """Copy term and date added from the newest survey pages onto probed payloads.
+
+    Pages are read newest-first and the walk stops as soon as every probed id
+    is matched, a page is empty, the page cap is reached, or a page holds
+    nothing as new as the oldest unmatched id (so no later page can match it).
+    Payloads still unmatched are then removed: without a term and date added
+    they can be neither cleaned nor loaded.
+
+    :param found: Probed payloads keyed by result id (updated in place).
+    :type found: dict[int, dict[str, str]]
+    :param fetch_page: Callable returning the parsed rows of one survey page.
+    :type fetch_page: collections.abc.Callable[[int], list[list[str]]]
+    :param max_pages: Maximum survey pages to read (the run's page cap).
+    :type max_pages: int
+    :returns: Number of survey pages read, and number of payloads removed.
+    :rtype: tuple[int, int]
+    """
+    missing = set(found)
+    pages_read = 0
+    while missing and pages_read < max_pages:
+        pages_read += 1
+        rows = [row for row in fetch_page(pages_read) if row]
+        ids = [result_id(row[0]) for row in rows]
+        for row, row_id in zip(rows, ids):
+            seeded = seed_payload(row, '') if row_id in missing else None
+            if seeded is not None:
+                found[row_id].update((field, seeded[1][field]) for field in SURVEY_FIELDS)
+                missing.discard(row_id)
+        if not rows or (missing and max(filter(None, ids), default=0) < min(missing)):
+            break
+    for row_id in missing:
+        del found[row_id]
+    return pages_read, len(missing)
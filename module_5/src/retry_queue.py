@@ -0,0 +1,260 @@
+"""Retry policies with jittered backoff and a journal of tasks that still failed."""
+
+# Approach: classify each failure, retry only transient classes with full-jitter exponential
+# backoff, and append tasks that exhaust their budget to a JSONL file for a later replay.
+import asyncio
+import json
+import random
+import threading
+import time
+from pathlib import Path
+from urllib import error
+
+# (max attempts, base delay seconds, max delay seconds) per transient failure class.
+# Throttling gets the longest budget; refused connections rarely heal within a run.
+DEFAULT_RETRY_POLICIES = {
+    'throttled': (6, 2.0, 60.0),
+    'server_error': (4, 1.0, 30.0),
+    'timeout': (4, 1.0, 20.0),
+    'connection': (3, 0.5, 10.0),
+}
+
+# Exceptions the retry loop inspects; anything else propagates on the first try.
+RETRYABLE_ERRORS = (error.URLError, TimeoutError)
+
+
+def classify_failure(exc):
+    """Map a fetch exception to its retry policy class.
+
+    :param exc: Exception raised by an HTTP fetch.
+    :type exc: BaseException
+    :returns: Key into ``DEFAULT_RETRY_POLICIES``, or ``None`` for permanent
+        failures such as HTTP 404 or parse errors.
+    :rtype: str | None
+    """
+    if isinstance(exc, error.HTTPError):
+        if exc.code == 429:
+            return 'throttled'
+        if exc.code >= 500:
+            return 'server_error'
+        return None
+    if isinstance(exc, TimeoutError):
+        return 'timeout'
+    if isinstance(exc, error.URLError):
+        return 'connection'
+    return None
+
+
+def backoff_delay(attempt, base_delay, max_delay):
+    """Return a "full jitter" delay for a zero-based retry attempt.
+
+    The delay is drawn uniformly from ``[0, min(max_delay, base_delay * 2**attempt)]``,
+    which spreads retries from many workers instead of synchronizing them.
+
+    :param attempt: Number of retries already made for this task.
+    :type attempt: int
+    :param base_delay: Delay ceiling for the first retry, in seconds.
+    :type base_delay: float
+    :param max_delay: Upper bound on the delay ceiling, in seconds.
+    :type max_delay: float
+    :returns: Seconds to sleep before the next attempt.
+    :rtype: float
+    """
+    return random.uniform(0, min(max_delay, base_delay * 2 ** attempt))
+
+
+class Retrier:
+    """Run callables with per-failure-class retry budgets and shared counters."""
+
+    def __init__(self, policies=None):
+        """Create a retrier.
+
+        :param policies: Policy table shaped like ``DEFAULT_RETRY_POLICIES``.
+        :type policies: dict[str, tuple[int, float, float]] | None
+        """
+        self.policies = policies or DEFAULT_RETRY_POLICIES
+        self._lock = threading.Lock()
+        self._stats = {'retries': 0, 'recovered': 0, 'exhausted': 0}
+
+    def _count(self, key):
+        """Increment one statistics counter.
+
+        :param key: Counter name.
+        :type key: str
+        :returns: ``None``.
+        :rtype: None
+        """
+        with self._lock:
+            self._stats[key] += 1
+
+    def _next_delay(self, exc, attempt):
+        """Decide whether to retry after ``exc`` and for how long to wait.
+
+        :param exc: Exception raised by the latest attempt.
+        :type exc: BaseException
+        :param attempt: Number of retries already made for this task.
+        :type attempt: int
+        :returns: Backoff delay in seconds, or ``None`` to give up.
+        :rtype: float | None
+        """
+        kind = classify_failure(exc)
+        if kind is None:
+            return None
+        max_attempts, base_delay, max_delay = self.policies[kind]
+        if attempt + 1 >= max_attempts:
+            self._count('exhausted')
+            return None
+        self._count('retries')
+        return backoff_delay(attempt, base_delay, max_delay)
+
+    def call(self, func, *args):
+        """Call ``func(*args)``, sleeping and retrying on transient failures.
+
+        :param func: Callable performing one attempt.
+        :type func: collections.abc.Callable
+        :param args: Arguments forwarded to ``func``.
+        :returns: ``func`` result from the first successful attempt.
+        :rtype: object
+        :raises Exception: The last failure once its policy is exhausted, or
+            any non-transient failure immediately.
+        """
+        attempt = 0
+        while True:
+            try:
+                result = func(*args)
+            except RETRYABLE_ERRORS as exc:
+                delay = self._next_delay(exc, attempt)
+                if delay is None:
+                    raise
+                time.sleep(delay)
+                attempt += 1
+                continue
+            if attempt:
+                self._count('recovered')
+            return result
+
+    async def call_async(self, func, *args):
+        """Async counterpart of :meth:`call` that backs off with ``asyncio.sleep``.
+
+        :param func: Coroutine function performing one attempt.
+        :type func: collections.abc.Callable
+        :param args: Arguments forwarded to ``func``.
+        :returns: Result from the first successful attempt.
+        :rtype: object
+        :raises Exception: Same as :meth:`call`.
+        """
+        attempt = 0
+        while True:
+            try:
+                result = await func(*args)
+            except RETRYABLE_ERRORS as exc:
+                delay = self._next_delay(exc, attempt)
+                if delay is None:
+                    raise
+                await asyncio.sleep(delay)
+                attempt += 1
+                continue
+            if attempt:
+                self._count('recovered')
+            return result
+
+    def stats(self):
+        """Return a snapshot of retry counters.
+
+        :returns: ``retries`` made, tasks ``recovered`` by a retry, and tasks
+            whose budget was ``exhausted``.
+        :rtype: dict[str, int]
+        """
+        with self._lock:
+            return dict(self._stats)
+
+
+class FailedTaskJournal:
+    """Thread-safe JSONL log of scrape tasks that failed after all retries.
+
+    Each line is one task, e.g. ``{"kind": "survey", "page": 12, ...}`` or
+    ``{"kind": "result", "url": ..., "payload": {...}, ...}``, plus the error
+    text and a ``failed_at`` timestamp.
+    """
+
+    def __init__(self, path):
+        """Bind the journal to a file (created on the first failure).
+
+        :param path: JSONL file path.
+        :type path: str | pathlib.Path
+        """
+        self.path = Path(path)
+        self.recorded = 0
+        self._lock = threading.Lock()
+
+    def record(self, task, exc):
+        """Append one failed task.
+
+        :param task: JSON-serializable task description.
+        :type task: dict[str, object]
+        :param exc: Final exception for the task.
+        :type exc: BaseException
+        :returns: ``None``.
+        :rtype: None
+        """
+        # default=dict serializes ApplicantRecord payloads carried by result tasks.
+        line = json.dumps({**task, 'error': str(exc), 'failed_at': time.time()}, default=dict)
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with self.path.open('a', encoding='utf-8') as f:
+                f.write(line + '\n')
+            self.recorded += 1
+
+    @property
+    def replay_path(self):
+        """Where journaled tasks wait while a replay run re-fetches them.
+
+        :rtype: pathlib.Path
+        """
+        return self.path.with_name(self.path.name + '.replaying')
+
+    def take(self):
+        """Move every journaled task aside for a replay run and return them.
+
+        The journal is renamed to :attr:`replay_path` instead of being deleted,
+        and :meth:`finish_replay` removes it once the replay is over. A replay
+        that crashes leaves the file behind, and the next ``take()`` merges it
+        with anything journaled since, so no task is lost. A task present in
+        both is returned once. Unreadable lines (for example a line cut short
+        by a crash) are skipped.
+
+        :returns: Journaled tasks in the order they first failed.
+        :rtype: list[dict[str, object]]
+        """
+        with self._lock:
+            if self.path.exists():
+                if self.replay_path.exists():
+                    # The leading newline ends a line a crash may have cut short.
+                    with self.replay_path.open('a', encoding='utf-8') as f:
+                        f.write('\n' + self.path.read_text(encoding='utf-8'))
+                    self.path.unlink()
+                else:
+                    self.path.replace(self.replay_path)
+            try:
+                lines = self.replay_path.read_text(encoding='utf-8').splitlines()
+            except FileNotFoundError:
+                return []
+        tasks = {}
+        for line in lines:
+            try:
+                task = json.loads(line)
+            except ValueError:
+                continue
+            tasks[task.get('kind'), task.get('page'), task.get('url')] = task
+        return list(tasks.values())
+
+    def finish_replay(self):
+        """Drop the tasks handed out by :meth:`take` once their replay has run.
+
+        Tasks that failed again during the replay were journaled afresh.
+
+        :returns: ``None``.
+        :rtype: None
+        """
+        with self._lock:
+            self.replay_path.unlink(missing_ok=True)
@@ -1,57 +1,141 @@
 """GradCafe scraping helpers for survey and result-page extraction."""
 
 # Approach: collect table rows first, then hydrate each row with detailed result-page fields.
-from concurrent.futures import ThreadPoolExecutor
+import asyncio
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from contextlib import nullcontext
+from functools import partial
 import time
-from urllib import error, request
-from urllib.request import urlopen
-
-from bs4 import BeautifulSoup
-
+from urllib import error
+
+from applicant_record import ApplicantRecord
+from html_archive import HtmlArchive, rebuild_payloads
+from http_client import TRANSFER_STATS
+from page_discovery import count_survey_pages, page_cap
+from page_parsers import (
+    empty_payload, extract_result_num, newest_first, parse_result_html, parse_table_html,
+    seed_payload,
+)
+from politeness import RobotsPolicy
+from result_probe import PROBE_MISS_LIMIT, fill_survey_fields, probe_ids
+from retry_queue import classify_failure
+from scrape_http import async_get, connection_stats, http_get
+from scrape_services import RUN_STATE, resolve_options, run_services, use_parser_backend
+from seen_filter import KnownResults
 
 BASE_URL = 'https://www.thegradcafe.com'
 
-# 21 records per page should provide ~40k results
+# Hard cap on survey pages (the max_pages option overrides it per run). Full crawls probe for
+# the real last page below it unless discover_pages=False.
 NUM_PAGES_OF_DATA = 2000
 
 # MAX_WORKERS = 10 is a safe "polite" starting point.
 # Increase to 20 or 30 if the server handles it well.
 MAX_WORKERS = 10
 
-# Anything restricted by robots.txt
+# Survey pages / result pages fetched between checkpoint commits on checkpointed crawls.
+CHECKPOINT_WINDOW = 250
+
+# Completed tasks between progress lines while adaptive concurrency is active.
+PROGRESS_INTERVAL = 100
+
+# The asyncio engine keeps many more requests in flight on a single event loop.
+ASYNC_CONCURRENCY = 100
+
+# Upper bound on submitted-but-unfinished tasks; bounds live futures/payloads at full-crawl scale.
+MAX_IN_FLIGHT = MAX_WORKERS * 4
+
+# Anything restricted by robots.txt; used when a run has no robots=... policy of its own.
 DISALLOWED_PAGES = ['/cgi-bin/',
                     '/index-ad-test.php']
+DEFAULT_ROBOTS_POLICY = RobotsPolicy((False, path) for path in DISALLOWED_PAGES)
 
-# This header makes the scraper look like a standard Chrome browser
-HEADERS = {
-'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) \
-AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-}
-
-RESULT_FIELD_MAP = {
-    0: 'university',
-    1: 'program',
-    2: 'degree',
-    3: 'US/International',
-    4: 'application status',
-    5: 'application status date',
-    6: 'GPA',
-    8: 'comments',
-}
+# Errors raised while fetching/parsing a page that should skip that page, not abort the run.
+FETCH_ERRORS = (
+    error.URLError,
+    TimeoutError,
+    ValueError,
+    AttributeError,
+    IndexError,
+    TypeError,
+    RuntimeError,
+)
 
 
 def _is_restricted_path(url):
-    """Check whether a URL path is disallowed by configured robots rules.
+    """Check whether a URL path is disallowed by the run's robots rules.
 
     :param url: Absolute URL to validate.
     :type url: str
-    :returns: ``True`` when the URL contains a disallowed path prefix.
+    :returns: ``True`` when the run's robots policy (or ``DISALLOWED_PAGES``)
+        disallows the URL's path.
     :rtype: bool
     """
-    for restricted_path in DISALLOWED_PAGES:
-        if restricted_path in url:
-            return True
-    return False
+    policy = RUN_STATE['robots']
+    if policy is None:
+        policy = DEFAULT_ROBOTS_POLICY
+    return not policy.allows(url)
+
+
+def _parse(parser, *args):
+    """Run an HTML parser in-thread or on the active parse process pool.
+
+    :param parser: Module-level parse function (must be picklable).
+    :type parser: collections.abc.Callable
+    :param args: Arguments forwarded to ``parser``.
+    :returns: Parser output.
+    :rtype: object
+    """
+    pool = RUN_STATE['parse_pool']
+    with _timed_parse():
+        if pool is None:
+            return parser(*args)
+        # The fetching thread just waits here, so it holds no GIL while the page is parsed.
+        return pool.submit(parser, *args).result()
+
+
+async def _async_parse(parser, *args):
+    """Async counterpart of :func:`_parse` that never blocks the event loop.
+
+    :param parser: Module-level parse function (must be picklable).
+    :type parser: collections.abc.Callable
+    :param args: Arguments forwarded to ``parser``.
+    :returns: Parser output.
+    :rtype: object
+    """
+    pool = RUN_STATE['parse_pool']
+    with _timed_parse():
+        if pool is None:
+            return parser(*args)
+        return await asyncio.get_running_loop().run_in_executor(pool, parser, *args)
+
+
+def _timed_parse():
+    """Time one parse in the run's metrics, if they are enabled.
+
+    :returns: Context manager active for the parse.
+    :rtype: contextlib.AbstractContextManager[None]
+    """
+    metrics = RUN_STATE['metrics']
+    return metrics.parse() if metrics is not None else nullcontext()
+
+
+def _journal_failure(task, exc):
+    """Append a task that failed transiently to the run's failed-task journal.
+
+    Permanent failures (HTTP 404, parse errors) are not journaled because a
+    replay would fail the same way.
+
+    :param task: JSON-serializable task description.
+    :type task: dict[str, object]
+    :param exc: Final exception for the task.
+    :type exc: BaseException
+    :returns: ``None``.
+    :rtype: None
+    """
+    journal = RUN_STATE['journal']
+    if journal is not None and classify_failure(exc) is not None:
+        journal.record(task, exc)
 
 
 def _fetch_table_page(page_num):
@@ -69,74 +153,41 @@ def _fetch_table_page(page_num):
         return []
 
     try:
-        # Create a Request object with the headers
-        req = request.Request(url, headers=HEADERS)
-        # Use a timeout so the script doesn't hang forever
-        with urlopen(req, timeout=10) as response:
-            # Create soup object from response bytes
-            content = response.read()
-            soup = BeautifulSoup(content, 'html.parser')
-        table = soup.find('table')
-
-        # If nothing is found, return
-        if not table:
-            return []
-
-        # Get all rows after skipping the header row
-        rows = table.find_all('tr')[1:]
-
-        # Parse rows and combine the data from rows that are part of the same record
-        parsed_data = []
-        tmp_row = []
-        for row in rows:
-            # A <tr> tag with no attrs indicates the first row of a new record
-            if len(row.attrs) == 0:
-                # If tmp_row contains data, store it in parsed_data then clear it
-                # It is empty here when the very first row is being processed
-                if tmp_row:
-                    parsed_data.append(tmp_row)
-
-                tmp_row = []
-
-            # Extract the information from the columns in each row
-            cells = [col.get_text() for col in row.find_all('td')]
-
-            # Find the link to the corresponding /result/{result_number} path
-            # And insert it at index 0
-            link = row.find('a')
-            if link:
-                link = link.attrs['href']
-                tmp_row.insert(0, link)
-
-            # Add all gathered information in this row to tmp_row
-            tmp_row.extend(cells)
-
-        # Make sure the very last row of data is added to parsed_data
-        if tmp_row:
-            parsed_data.append(tmp_row)
-
-        return parsed_data
+        return _parse(parse_table_html, http_get(url), RUN_STATE['parser'])
 
     except error.HTTPError as e:
         print(f"HTTP Error {e.code} on page {page_num}")
+        _journal_failure({'kind': 'survey', 'page': page_num}, e)
         return []
-    except (error.URLError, TimeoutError, ValueError, AttributeError, RuntimeError) as e:
+    except FETCH_ERRORS as e:
         print(f"Error on page {page_num}: {e}")
+        _journal_failure({'kind': 'survey', 'page': page_num}, e)
         return []
 
 
-def _extract_result_num(url):
-    """Extract integer result id from a result URL.
+async def _async_fetch_table_page(page_num):
+    """Async-engine counterpart of :func:`_fetch_table_page`.
 
-    :param url: URL containing a trailing result identifier segment.
-    :type url: str
-    :returns: Parsed result id or ``None`` when invalid.
-    :rtype: int | None
+    :param page_num: Survey page number to request.
+    :type page_num: int
+    :returns: Parsed rows from the table, grouped by record.
+    :rtype: list[list[str]]
     """
+    url = f"{BASE_URL}/survey/?page={page_num}"
+    if _is_restricted_path(url):
+        return []
+
     try:
-        return int(url.rstrip('/').split('/')[-1])
-    except (ValueError, AttributeError):
-        return None
+        content = await async_get(url)
+        return await _async_parse(parse_table_html, content, RUN_STATE['parser'])
+    except error.HTTPError as e:
+        print(f"HTTP Error {e.code} on page {page_num}")
+        _journal_failure({'kind': 'survey', 'page': page_num}, e)
+        return []
+    except FETCH_ERRORS as e:
+        print(f"Error on page {page_num}: {e}")
+        _journal_failure({'kind': 'survey', 'page': page_num}, e)
+        return []
 
 
 def _fetch_result_page(url, payload):
@@ -158,60 +209,127 @@ def _fetch_result_page(url, payload):
     page_num = url.split('/')[-1]
 
     try:
-        # Create a Request object with the headers
-        req = request.Request(url, headers=HEADERS)
-        # Use a timeout so the script doesn't hang forever
-        with urlopen(req, timeout=10) as response:
-            # Create soup object from response bytes
-            content = response.read()
-            soup = BeautifulSoup(content, 'html.parser')
-
-        # Get all the data fields on the page
-        entries = soup.find('dl').find_all('div')
-
-        # Return if nothing found
-        if not entries:
-            return {}
-
-        # Parse the entries and store raw data in the payload dict, then return
-        payload['url'] = url
-        for i, entry in enumerate(entries):
-            field_name = RESULT_FIELD_MAP.get(i)
-            if field_name is not None:
-                # Check that the field has text content to avoid errors.
-                field_contents = entry.find('dd')
-                if field_contents:
-                    payload[field_name] = field_contents.get_text()
-                continue
+        return _parse(parse_result_html, http_get(url), url, payload, RUN_STATE['parser'])
+
+    except error.HTTPError as e:
+        print(f"HTTP Error {e.code} on page {page_num}")
+        _journal_failure({'kind': 'result', 'url': url, 'payload': payload}, e)
+        return {}
+    except FETCH_ERRORS as e:
+        print(f"Error on page {page_num}: {e}")
+        _journal_failure({'kind': 'result', 'url': url, 'payload': payload}, e)
+        return {}
+
 
-            if i == 7: # The GRE scores have a slightly different format
-                field_contents = list(entry.find_all('li'))
-                # Quant/Verbal/AW values are nested under `<li><span>..</span><b>..</b>`.
-                spans = [e.find('span').next_sibling.next_sibling for e in field_contents]
-                field_contents = [s.get_text() for s in spans]
-                payload['GRE'] = field_contents[0]
-                payload['GRE V'] = field_contents[1]
-                payload['GRE AW'] = field_contents[2]
+async def _async_fetch_result_page(url, payload):
+    """Async-engine counterpart of :func:`_fetch_result_page`.
+
+    :param url: Absolute result page URL.
+    :type url: str
+    :param payload: Existing payload map seeded from survey-table fields.
+    :type payload: dict[str, str]
+    :returns: Updated payload, or empty dict on failure.
+    :rtype: dict[str, str]
+    """
+    if _is_restricted_path(url):
+        return {}
 
-        return payload
+    page_num = url.split('/')[-1]
 
+    try:
+        content = await async_get(url)
+        return await _async_parse(parse_result_html, content, url, payload,
+                                  RUN_STATE['parser'])
     except error.HTTPError as e:
         print(f"HTTP Error {e.code} on page {page_num}")
+        _journal_failure({'kind': 'result', 'url': url, 'payload': payload}, e)
         return {}
-    except (
-        error.URLError,
-        TimeoutError,
-        ValueError,
-        AttributeError,
-        IndexError,
-        TypeError,
-        RuntimeError,
-    ) as e:
+    except FETCH_ERRORS as e:
         print(f"Error on page {page_num}: {e}")
+        _journal_failure({'kind': 'result', 'url': url, 'payload': payload}, e)
         return {}
 
 
-def _concurrent_scraper(worker_func, tasks, is_mapping=False, all_payloads=None):
+def _iter_completed(worker_func, task_args, max_in_flight=None):
+    """Run tasks on the worker pool and yield results as they complete.
+
+    Tasks are read lazily and at most ``max_in_flight`` are submitted at once,
+    so a slow early task never holds back results behind it and only a
+    bounded number of futures/payloads are alive at any time. New tasks are
+    only submitted while the caller keeps pulling, which gives callers
+    natural backpressure.
+
+    :param worker_func: Callable executed per task.
+    :type worker_func: collections.abc.Callable
+    :param task_args: Iterable of argument tuples; ``args[0]`` labels the task in logs.
+    :type task_args: collections.abc.Iterable[tuple]
+    :param max_in_flight: Maximum submitted-but-unfinished tasks (defaults to
+        ``MAX_IN_FLIGHT``).
+    :type max_in_flight: int | None
+    :returns: Iterator of ``(args, result)`` pairs in completion order; tasks
+        that raise a handled fetch error are logged and skipped.
+    :rtype: collections.abc.Iterator[tuple[tuple, object]]
+    """
+    max_in_flight = max_in_flight or MAX_IN_FLIGHT
+    controller = RUN_STATE['concurrency']
+    # In adaptive mode the controller, not the pool size, decides how many requests run.
+    workers = controller.maximum if controller is not None else MAX_WORKERS
+    pending = {}
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        try:
+            for args in task_args:
+                # Backpressure: wait for a free slot before reading the next task.
+                while len(pending) >= max_in_flight:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    yield from _drain_done(done, pending)
+                pending[executor.submit(worker_func, *args)] = args
+
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                yield from _drain_done(done, pending)
+        finally:
+            # Consumer stopped early: drop queued tasks instead of finishing them.
+            for future in pending:
+                future.cancel()
+
+
+def _drain_done(done, pending):
+    """Pop finished futures from ``pending`` and yield their results.
+
+    :param done: Futures reported finished by :func:`concurrent.futures.wait`.
+    :type done: set[concurrent.futures.Future]
+    :param pending: Future-to-args map of outstanding tasks (mutated in place).
+    :type pending: dict[concurrent.futures.Future, tuple]
+    :returns: Iterator of ``(args, result)`` pairs for successful tasks.
+    :rtype: collections.abc.Iterator[tuple[tuple, object]]
+    """
+    for future in done:
+        args = pending.pop(future)
+        _report_progress()
+        try:
+            result = future.result()
+        except FETCH_ERRORS as e:
+            print(f"Task {args[0]} failed with: {e}")
+            continue
+        yield args, result
+
+
+def _report_progress():
+    """Count one finished task and periodically print the adaptive concurrency level.
+
+    :returns: ``None``.
+    :rtype: None
+    """
+    controller = RUN_STATE['concurrency']
+    if controller is None:
+        return
+    RUN_STATE['completed'] += 1
+    if RUN_STATE['completed'] % PROGRESS_INTERVAL == 0:
+        print(f"Progress: {RUN_STATE['completed']} tasks done, concurrency {controller.limit}")
+
+
+def _concurrent_scraper(worker_func, tasks, is_mapping=False, all_payloads=None,
+                        max_in_flight=None):
     """
     Execute scraping tasks concurrently and aggregate successful results.
 
@@ -223,53 +341,280 @@ def _concurrent_scraper(worker_func, tasks, is_mapping=False, all_payloads=None)
     :type is_mapping: bool
     :param all_payloads: Payload lookup table used when ``is_mapping=True``.
     :type all_payloads: dict | None
-    :returns: Combined worker outputs.
+    :param max_in_flight: Maximum submitted-but-unfinished tasks.
+    :type max_in_flight: int | None
+    :returns: Combined worker outputs, in completion order.
     :rtype: list
     """
+    if is_mapping:
+        # Logic for _fetch_result_page
+        task_args = ((u, all_payloads[u]) for u in tasks)
+    else:
+        # Logic for _fetch_table_page
+        task_args = ((t,) for t in tasks)
 
     all_results = []
+    for _, data in _iter_completed(worker_func, task_args, max_in_flight):
+        _collect_result(all_results, data)
+    return all_results
 
-    # Set up ThreadPoolExecutor to handle each worker_func slightly differently
-    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
-        if is_mapping:
-            # Logic for _fetch_result_page
-            future_to_task = {
-                executor.submit(worker_func, u, all_payloads[u]): u
-                for u in tasks
-                }
+
+def _collect_result(all_results, data):
+    """Merge one worker result into the aggregated result list.
+
+    :param all_results: Aggregated results (mutated in place).
+    :type all_results: list
+    :param data: Worker output; lists are extended, other truthy values appended.
+    :type data: list | dict
+    :returns: ``None``.
+    :rtype: None
+    """
+    if data:
+        # Use extend for lists and append for dicts
+        if isinstance(data, list):
+            all_results.extend(data)
         else:
-            # Logic for _fetch_table_page
-            future_to_task = {
-                executor.submit(worker_func, t): t
-                for t in tasks
-                }
-
-        # Collect results, print out any errors encountered and move on
-        for future in future_to_task:
+            all_results.append(data)
+
+
+async def _async_concurrent_scraper(worker_func, tasks, is_mapping=False, all_payloads=None,
+                                    concurrency=None):
+    """Execute async scraping tasks on one event loop and aggregate results.
+
+    Mirrors :func:`_concurrent_scraper`: ``concurrency`` worker coroutines pull
+    tasks from one shared iterator, so only that many requests (and their
+    coroutines) exist at once and results are collected as they complete.
+
+    :param worker_func: Coroutine function executed per task.
+    :type worker_func: collections.abc.Callable
+    :param tasks: Task iterable passed to worker function(s).
+    :type tasks: collections.abc.Iterable
+    :param is_mapping: Whether each task maps to ``all_payloads[task]`` arg pair.
+    :type is_mapping: bool
+    :param all_payloads: Payload lookup table used when ``is_mapping=True``.
+    :type all_payloads: dict | None
+    :param concurrency: Maximum in-flight requests (defaults to ``ASYNC_CONCURRENCY``).
+    :type concurrency: int | None
+    :returns: Combined worker outputs, in completion order.
+    :rtype: list
+    """
+    task_iter = iter(tasks)
+    all_results = []
+
+    async def drain():
+        # The iterator is shared; the event loop is single-threaded so no lock is needed.
+        for task in task_iter:
             try:
-                # Iterate futures directly; ordering is not important for downstream consumers.
-                data = future.result()
-                if data:
-                    # Use extend for lists and append for dicts
-                    if isinstance(data, list):
-                        all_results.extend(data)
-                    else:
-                        all_results.append(data)
-            except (
-                error.URLError,
-                TimeoutError,
-                ValueError,
-                AttributeError,
-                TypeError,
-                RuntimeError,
-            ) as e:
-                task = future_to_task[future]
+                if is_mapping:
+                    data = await worker_func(task, all_payloads[task])
+                else:
+                    data = await worker_func(task)
+            except FETCH_ERRORS as e:
                 print(f"Task {task} failed with: {e}")
+                continue
+            _collect_result(all_results, data)
 
+    await asyncio.gather(*(drain() for _ in range(concurrency or ASYNC_CONCURRENCY)))
     return all_results
 
 
-def _get_raw_payloads(data_rows):
+def _run_scraper(engine, worker_funcs, tasks, **kwargs):
+    """Dispatch tasks to the thread or asyncio engine.
+
+    :param engine: One of ``SCRAPE_ENGINES``.
+    :type engine: str
+    :param worker_funcs: ``(sync_worker, async_worker)`` pair for the task type.
+    :type worker_funcs: tuple[collections.abc.Callable, collections.abc.Callable]
+    :param tasks: Task iterable passed to the worker.
+    :type tasks: collections.abc.Iterable
+    :returns: Combined worker outputs.
+    :rtype: list
+    """
+    sync_worker, async_worker = worker_funcs
+    if engine == 'async':
+        return asyncio.run(_async_concurrent_scraper(async_worker, tasks, **kwargs))
+    return _concurrent_scraper(sync_worker, tasks, **kwargs)
+
+
+def _is_known_row(row, min_result_num, existing_urls):
+    """Return whether a survey row points at an already-ingested record.
+
+    :param row: Parsed survey row whose first element is the result path.
+    :type row: list[str]
+    :param min_result_num: Lowest result id that still counts as new.
+    :type min_result_num: int | None
+    :param existing_urls: URLs already stored downstream.
+    :type existing_urls: set[str] | seen_filter.KnownResults
+    :returns: ``True`` when the row is below ``min_result_num`` or already known.
+    :rtype: bool
+    """
+    url = BASE_URL + row[0]
+    # URL dedupe check handles reruns where source pages still contain old records.
+    if url in existing_urls:
+        return True
+    result_num = extract_result_num(url)
+    return min_result_num is not None and result_num is not None and result_num < min_result_num
+
+
+def _confirm_known(rows, existing_urls):
+    """Resolve Bloom-filter hits for a batch of rows with one database lookup.
+
+    Only :class:`seen_filter.KnownResults` needs this; with a plain set it is a
+    no-op. Later :func:`_is_known_row` calls are then answered from its cache.
+
+    :param rows: Parsed survey rows.
+    :type rows: collections.abc.Iterable[list[str]]
+    :param existing_urls: URLs already stored downstream.
+    :type existing_urls: set[str] | seen_filter.KnownResults
+    :returns: ``None``.
+    :rtype: None
+    """
+    if isinstance(existing_urls, KnownResults):
+        existing_urls.confirm(BASE_URL + row[0] for row in rows if row)
+
+
+def _fetch_table_page_keyed(page_num):
+    """Fetch one survey page and tag its rows with the page number.
+
+    :param page_num: Survey page number to request.
+    :type page_num: int
+    :returns: Single-item list of ``(page_num, rows)``.
+    :rtype: list[tuple[int, list[list[str]]]]
+    """
+    return [(page_num, _fetch_table_page(page_num))]
+
+
+async def _async_fetch_table_page_keyed(page_num):
+    """Async-engine counterpart of :func:`_fetch_table_page_keyed`.
+
+    :param page_num: Survey page number to request.
+    :type page_num: int
+    :returns: Single-item list of ``(page_num, rows)``.
+    :rtype: list[tuple[int, list[list[str]]]]
+    """
+    return [(page_num, await _async_fetch_table_page(page_num))]
+
+
+def fetch_survey_pages(engine, pages):
+    """Fetch survey pages concurrently and return the rows of each page.
+
+    :param engine: One of ``SCRAPE_ENGINES``.
+    :type engine: str
+    :param pages: Survey page numbers to fetch.
+    :type pages: collections.abc.Iterable[int]
+    :returns: ``(page_num, rows)`` pairs in completion order; each page's
+        non-empty rows are ordered newest first.
+    :rtype: list[tuple[int, list[list[str]]]]
+    """
+    fetched = _run_scraper(engine, (_fetch_table_page_keyed, _async_fetch_table_page_keyed), pages)
+    return [(page, newest_first(row for row in rows if row)) for page, rows in fetched]
+
+
+def fetch_result_pages(engine, seeds):
+    """Fetch result pages concurrently and complete their seeded payloads.
+
+    :param engine: One of ``SCRAPE_ENGINES``.
+    :type engine: str
+    :param seeds: Seed payloads keyed by result URL, fetched in key order.
+    :type seeds: dict[str, applicant_record.ApplicantRecord]
+    :returns: Completed payloads for the pages that parsed.
+    :rtype: list[dict[str, str]]
+    """
+    return _run_scraper(engine, (_fetch_result_page, _async_fetch_result_page), list(seeds),
+                        is_mapping=True, all_payloads=seeds)
+
+
+def _walk_survey_pages(min_result_num, existing_urls, engine='thread'):
+    """Fetch survey pages newest-first until a page holds no new records.
+
+    Pages are fetched in windows of ``MAX_WORKERS`` so the walk keeps the usual
+    concurrency, but results are inspected in page order. The walk stops at the
+    first page whose rows are all already known, at the first empty page, or at
+    the run's page cap (:func:`page_discovery.page_cap`).
+
+    :param min_result_num: Lowest result id that still counts as new.
+    :type min_result_num: int | None
+    :param existing_urls: URLs already stored downstream.
+    :type existing_urls: set[str] | seen_filter.KnownResults
+    :param engine: Concurrency engine used for page fetches.
+    :type engine: str
+    :returns: Rows from pages up to the stop page, plus a walk summary with
+        ``pages_fetched``, ``stop_page`` and ``stop_reason``.
+    :rtype: tuple[list[list[str]], dict[str, int | str]]
+    """
+    collected_rows = []
+    pages_fetched = 0
+    page = 1
+    cap = page_cap(NUM_PAGES_OF_DATA)
+    while page <= cap:
+        window = range(page, min(page + MAX_WORKERS, cap + 1))
+        rows_by_page = dict(fetch_survey_pages(engine, window))
+        pages_fetched += len(window)
+        _confirm_known((row for rows in rows_by_page.values() for row in rows), existing_urls)
+        for page_num in window:
+            rows = rows_by_page.get(page_num, [])
+            if not rows:
+                return collected_rows, {'pages_fetched': pages_fetched,
+                                        'stop_page': page_num, 'stop_reason': 'empty_page'}
+            collected_rows.extend(rows)
+            if all(_is_known_row(row, min_result_num, existing_urls) for row in rows):
+                return collected_rows, {'pages_fetched': pages_fetched,
+                                        'stop_page': page_num, 'stop_reason': 'known_page'}
+        page = window.stop
+
+    return collected_rows, {'pages_fetched': pages_fetched,
+                            'stop_page': cap, 'stop_reason': 'page_cap'}
+
+
+def _print_walk_summary(walk_summary):
+    """Print where an incremental survey walk stopped and why.
+
+    :param walk_summary: Summary returned by :func:`_walk_survey_pages`.
+    :type walk_summary: dict[str, int | str]
+    :returns: ``None``.
+    :rtype: None
+    """
+    print(
+        f"Survey walk stopped at page {walk_summary['stop_page']} "
+        f"({walk_summary['stop_reason']}) after {walk_summary['pages_fetched']} pages"
+    )
+
+
+def survey_page_count():
+    """Return how many survey pages a full crawl should fetch.
+
+    See :func:`page_discovery.count_survey_pages`; the cap defaults to
+    ``NUM_PAGES_OF_DATA`` and probes honor the run's robots rules.
+
+    :returns: Number of survey pages, starting at page 1.
+    :rtype: int
+    """
+    return count_survey_pages(BASE_URL, NUM_PAGES_OF_DATA, _is_restricted_path, FETCH_ERRORS)
+
+
+def _crawl_survey_pages(engine):
+    """Fetch every survey page, checkpointing each window when a checkpoint is active.
+
+    The page count comes from :func:`survey_page_count`.
+
+    :param engine: One of ``SCRAPE_ENGINES``.
+    :type engine: str
+    :returns: Parsed survey rows (checkpointed crawls return them in page order).
+    :rtype: list[list[str]]
+    """
+    pages = range(1, survey_page_count() + 1)
+    checkpoint = RUN_STATE['checkpoint']
+    if checkpoint is None:
+        return _run_scraper(engine, (_fetch_table_page, _async_fetch_table_page), pages)
+
+    done = checkpoint.completed_pages()
+    todo = [page for page in pages if page not in done]
+    for start in range(0, len(todo), CHECKPOINT_WINDOW):
+        checkpoint.record_pages(fetch_survey_pages(engine, todo[start:start + CHECKPOINT_WINDOW]))
+    return checkpoint.saved_rows()
+
+
+def _get_raw_payloads(data_rows, engine='thread'):
     """Build full raw payloads from collected survey rows.
 
     The function seeds payloads from table rows, then fetches each linked result
@@ -277,90 +622,374 @@ def _get_raw_payloads(data_rows):
 
     :param data_rows: Parsed survey table rows.
     :type data_rows: list[list[str]]
+    :param engine: Concurrency engine used for result-page fetches.
+    :type engine: str
     :returns: Fully-populated payload dictionaries.
     :rtype: list[dict[str, str]]
     """
-    all_payloads = {}
-    for row in data_rows:
-        payload = {
-                'university': '',
-                'program': '',
-                'degree': '',
-                'term': '',
-                'date added': '',
-                'url': '',
-                'application status': '',
-                'application status date': '',
-                'comments': '',
-                'US/International': '',
-                'GPA': '',
-                'GRE': '',
-                'GRE V': '',
-                'GRE AW': ''
-            }
-
-        try:
-            # These are the only three entries needed from the table on /survey/
-            # The rest of the fields are easier to parse from /result/ pages
-            url = BASE_URL + row[0]
-            payload['url'] = url
-            payload['date added'] = row[3]
-            payload['term'] = row[6]
-            all_payloads[url] = payload
-
-        except (IndexError, TypeError):
-            # Skip any malformed records
-            continue
+    # Seeds keep row order, so the newest records are queued (and finish) first.
+    rows = newest_first(row for row in data_rows if row)
+    all_payloads = dict(filter(None, (seed_payload(row, BASE_URL) for row in rows)))
 
     # Need the URL from the survey table to pull that particular result page and
     # gather the rest of the data for each record
     all_urls = list(all_payloads.keys())
-    all_results = _concurrent_scraper(_fetch_result_page, all_urls,
-                                         is_mapping=True,
-                                         all_payloads=all_payloads)
+    checkpoint = RUN_STATE['checkpoint']
+    if checkpoint is None:
+        all_results = fetch_result_pages(engine, all_payloads)
+    else:
+        # Fetch what the checkpoint lacks window by window, then return everything saved.
+        done = checkpoint.completed_urls()
+        todo = [url for url in all_urls if url not in done]
+        for start in range(0, len(todo), CHECKPOINT_WINDOW):
+            window = todo[start:start + CHECKPOINT_WINDOW]
+            checkpoint.record_results(
+                fetch_result_pages(engine, {url: all_payloads[url] for url in window}))
+        all_results = checkpoint.saved_payloads()
 
     print(f"FINAL RESULTS: {len(all_results)} RECORDS PARSED SUCCESSFULLY")
 
     return all_results
 
 
-def scrape_data(min_result_num=None, existing_urls=None):
-    """Scrape admissions records from GradCafe.
+def _iter_survey_rows(min_result_num, existing_urls, incremental):
+    """Yield survey rows a window of pages at a time.
+
+    :param min_result_num: Lowest result id that still counts as new.
+    :type min_result_num: int | None
+    :param existing_urls: URLs already stored downstream.
+    :type existing_urls: set[str] | seen_filter.KnownResults
+    :param incremental: Use the early-stop newest-first walk.
+    :type incremental: bool
+    :returns: Iterator of unfiltered survey rows, newest first within each window.
+    :rtype: collections.abc.Iterator[list[str]]
+    """
+    if incremental:
+        rows, walk_summary = _walk_survey_pages(min_result_num, existing_urls)
+        _print_walk_summary(walk_summary)
+        yield from newest_first(rows)
+        return
+
+    # Only one window of survey pages is held at a time so memory stays flat; windows go
+    # from page 1 up, and each window's results are queued newest first.
+    last_page = survey_page_count()
+    for start in range(1, last_page + 1, MAX_WORKERS):
+        window = range(start, min(start + MAX_WORKERS, last_page + 1))
+        rows = newest_first(row for row in _concurrent_scraper(_fetch_table_page, window) if row)
+        _confirm_known(rows, existing_urls)
+        yield from rows
+
+
+def iter_scrape_data(min_result_num=None, existing_urls=None, window=None, **options):
+    """Stream admissions records from GradCafe as each result page is parsed.
+
+    Unlike :func:`scrape_data`, no full payload list is built: survey pages are
+    read a window at a time, at most ``window`` result-page fetches are in
+    flight, and each completed payload is yielded immediately (completion
+    order, not page order). Downstream stages such as :func:`clean.clean_data`
+    can therefore start before the crawl finishes.
 
     :param min_result_num: Optional lower-bound result id filter.
     :type min_result_num: int | None
     :param existing_urls: Optional URL set to skip already-ingested records.
-    :type existing_urls: set[str] | None
+    :type existing_urls: set[str] | seen_filter.KnownResults | None
+    :param window: Maximum in-flight result fetches (defaults to ``MAX_IN_FLIGHT``).
+    :type window: int | None
+    :param options: Same keyword options as :func:`scrape_data`; only the
+        ``'thread'`` engine is supported for streaming. Failed tasks are
+        journaled, but replaying a ``retry_journal`` is left to :func:`scrape_data`.
+    :type options: dict[str, object]
+    :returns: Iterator of raw payload dictionaries.
+    :rtype: collections.abc.Iterator[dict[str, str]]
+    :raises ValueError: If an option value is invalid or ``engine='async'``.
+    """
+    options = resolve_options(options)
+    if options['engine'] != 'thread':
+        raise ValueError('iter_scrape_data only supports the thread engine')
+    if options['checkpoint'] is not None:
+        raise ValueError('iter_scrape_data does not support checkpoints')
+    has_filter = min_result_num is not None or bool(existing_urls)
+    existing_urls = existing_urls or set()
+
+    with run_services(options, MAX_WORKERS):
+        yield from _stream_payloads(min_result_num, existing_urls,
+                                    options['incremental'] and has_filter, window)
+
+
+def _stream_payloads(min_result_num, existing_urls, incremental, window):
+    """Generator body of :func:`iter_scrape_data` (options already resolved).
+
+    :param min_result_num: Lowest result id that still counts as new.
+    :type min_result_num: int | None
+    :param existing_urls: URLs already stored downstream.
+    :type existing_urls: set[str] | seen_filter.KnownResults
+    :param incremental: Use the early-stop newest-first survey walk.
+    :type incremental: bool
+    :param window: Maximum in-flight result fetches.
+    :type window: int | None
+    :returns: Iterator of raw payload dictionaries.
+    :rtype: collections.abc.Iterator[dict[str, str]]
+    """
+    has_filter = min_result_num is not None or bool(existing_urls)
+    rows = _iter_survey_rows(min_result_num, existing_urls, incremental)
+    if has_filter:
+        rows = (
+            row for row in rows
+            if row and not _is_known_row(row, min_result_num, existing_urls)
+        )
+    seeds = filter(None, (seed_payload(row, BASE_URL) for row in rows))
+
+    t1 = time.time()
+    yielded = 0
+    for _, data in _iter_completed(_fetch_result_page, seeds, window):
+        if data:
+            yielded += 1
+            yield data
+
+    print(f'Streamed {yielded} raw payloads in {time.time() - t1:.02f} secs')
+
+
+def scrape_data(min_result_num=None, existing_urls=None, **options):
+    """Scrape admissions records from GradCafe.
+
+    Keyword options (defaults in ``scrape_services.SCRAPE_OPTION_DEFAULTS``):
+
+    - ``engine``: ``'thread'`` (blocking requests over the shared keep-alive
+      pool) or ``'async'`` (one event loop with ``ASYNC_CONCURRENCY``
+      in-flight requests).
+    - ``incremental``: walk survey pages newest-first and stop at the first
+      page made up entirely of known records, instead of fetching every page.
+      Only applies when ``min_result_num`` or ``existing_urls`` is given.
+    - ``parse_mode``: ``'thread'`` parses on the fetching thread (best for
+      small runs); ``'process'`` parses on a ``PARSE_WORKERS``-process pool
+      while threads only download bytes.
+    - ``parser``: HTML backend from ``PARSER_BACKENDS``; ``'auto'`` uses a
+      ``SoupStrainer``-limited ``html.parser``; ``'lxml'`` is faster but
+      opt-in. ``'full'`` keeps the original whole-page parse.
+    - ``cache_dir``: directory for an on-disk response cache; fresh pages are
+      served from disk (``/survey/`` for an hour, ``/result/`` for a week)
+      and stale ones are revalidated with ``ETag``/``Last-Modified``.
+    - ``adaptive``: ``True`` replaces the fixed ``MAX_WORKERS`` level with an
+      AIMD controller that grows toward ``ADAPTIVE_MAX_WORKERS`` while
+      responses stay fast and backs off on HTTP 429/5xx or timeouts
+      (thread engine only).
+    - ``retry``: retry HTTP 429/5xx, timeouts, and connection errors with
+      jittered exponential backoff (``retry_queue.DEFAULT_RETRY_POLICIES``).
+    - ``retry_journal``: JSONL path where tasks that still fail are recorded.
+      If the journal already holds tasks, only those tasks are re-fetched
+      instead of a crawl, and the journal keeps just the ones that fail again.
+      Tasks under replay stay on disk until the replay finishes.
+    - ``checkpoint``: SQLite path where a full crawl commits finished survey
+      pages and result payloads every ``CHECKPOINT_WINDOW`` tasks.
+    - ``resume``: with ``checkpoint``, skip work saved by an interrupted run
+      and merge its payloads into the result (otherwise the file is reset).
+    - ``archive_dir``: directory where every fetched page body is appended to
+      a compressed archive, so :func:`reparse_archive` can rebuild payloads
+      offline after the extractors change.
+    - ``metrics_report``: JSON path for a run report with per-kind latency
+      histograms, bytes downloaded, status-code counts, retries, network vs
+      parse time, and in-flight concurrency over time.
+    - ``live_progress``: print a progress line every
+      ``scrape_metrics.PROGRESS_SECONDS`` while the run is going.
+    - ``robots``: robots.txt URL or local file whose rules (longest match
+      wins) replace ``DISALLOWED_PAGES`` for the run.
+    - ``rate_limit``: requests per second allowed to each host, shared by
+      every worker; a robots ``Crawl-delay`` can only lower it.
+    - ``discover_pages``: before a full crawl, find the real last survey
+      page by probing pages 1, 2, 4, ... and bisecting, instead of fetching
+      every page up to the cap.
+    - ``max_pages``: hard survey-page cap for the run (defaults to
+      ``NUM_PAGES_OF_DATA``); also bounds incremental walks.
+
+    :param min_result_num: Optional lower-bound result id filter.
+    :type min_result_num: int | None
+    :param existing_urls: Optional URL set, or the Bloom-filter-backed
+        :func:`load_data.load_known_results` check, to skip already-ingested records.
+    :type existing_urls: set[str] | seen_filter.KnownResults | None
+    :param options: Keyword options described above.
+    :type options: dict[str, object]
     :returns: Raw scraped payload list.
     :rtype: list[dict[str, str]]
+    :raises TypeError: If an unknown option is given.
+    :raises ValueError: If an option value is not recognised.
     """
+    options = resolve_options(options)
+    with run_services(options, MAX_WORKERS):
+        journal = RUN_STATE['journal']
+        replay_tasks = journal.take() if journal is not None else []
+        if replay_tasks:
+            payloads = _replay_failed_tasks(replay_tasks, min_result_num, existing_urls,
+                                            options['engine'])
+            journal.finish_replay()
+            return payloads
+        return _scrape(min_result_num, existing_urls, options['engine'], options['incremental'])
+
+
+def probe_new_results(start_id, existing_urls=None, miss_limit=PROBE_MISS_LIMIT, **options):
+    """Fetch records newer than ``start_id - 1`` by probing result ids directly.
+
+    Instead of walking survey pages, ``/result/<start_id>``, ``start_id + 1``,
+    ... are fetched ``miss_limit`` at a time until ``miss_limit`` ids in a row
+    do not exist. Term and date added, which only appear on survey pages, are
+    then read from survey pages newest-first until every probed id is matched,
+    and only when something was found. Records that no survey page lists are
+    skipped, since they cannot be cleaned without a term.
+
+    :param start_id: First result id to probe (one past the stored maximum).
+    :type start_id: int
+    :param existing_urls: Optional URL set whose records are dropped.
+    :type existing_urls: set[str] | seen_filter.KnownResults | None
+    :param miss_limit: Consecutive missing ids that end the probe.
+    :type miss_limit: int
+    :param options: Same keyword options as :func:`scrape_data`, except
+        checkpoints and incremental walks.
+    :type options: dict[str, object]
+    :returns: Raw payloads in result-id order.
+    :rtype: list[dict[str, str]]
+    :raises ValueError: If an option value is invalid or not supported here.
+    """
+    options = resolve_options(options)
+    if options['checkpoint'] is not None or options['incremental']:
+        raise ValueError('probe_new_results does not use checkpoints or survey walks')
+    t1 = time.time()
+    with run_services(options, MAX_WORKERS):
+        found, probed = probe_ids(start_id, partial(_probe_batch, options['engine']), miss_limit)
+        pages, unlisted = fill_survey_fields(found, _fetch_table_page, page_cap(NUM_PAGES_OF_DATA))
+    existing_urls = existing_urls or ()
+    if isinstance(existing_urls, KnownResults):
+        existing_urls.confirm(p['url'] for p in found.values())
+    raw_payloads = [p for p in found.values() if p['url'] not in existing_urls]
+    print(
+        f'Probed {probed} result ids from {start_id}: {len(raw_payloads)} new records, '
+        f'{pages} survey pages read in {time.time() - t1:.02f} secs'
+        + (f' ({unlisted} not listed on survey pages skipped)' if unlisted else '')
+    )
+    return raw_payloads
 
+
+def _probe_batch(engine, ids):
+    """Fetch one batch of probed result ids concurrently.
+
+    :param engine: One of ``SCRAPE_ENGINES``.
+    :type engine: str
+    :param ids: Result ids to fetch.
+    :type ids: list[int]
+    :returns: Parsed payloads for the ids that exist.
+    :rtype: list[dict[str, str]]
+    """
+    seeds = {f'{BASE_URL}/result/{result_id}': empty_payload() for result_id in ids}
+    return fetch_result_pages(engine, seeds)
+
+
+def reparse_archive(archive_dir, workers=None, parser='auto'):
+    """Rebuild raw payloads from an HTML archive without touching the network.
+
+    :param archive_dir: Directory written by a run with ``archive_dir`` set.
+    :type archive_dir: str | pathlib.Path
+    :param workers: Parse process count (defaults to the CPU count).
+    :type workers: int | None
+    :param parser: HTML backend from ``PARSER_BACKENDS``.
+    :type parser: str
+    :returns: Raw payloads for every archived result reachable from an
+        archived survey page, in survey-page order.
+    :rtype: list[dict[str, str]]
+    :raises ValueError: If the parser backend is not recognised.
+    """
+    options = resolve_options({'parser': parser})
     t1 = time.time()
+    with use_parser_backend(options['parser']):
+        raw_payloads = rebuild_payloads(HtmlArchive(archive_dir), BASE_URL, workers,
+                                        RUN_STATE['parser'])
+    print(f'Re-parsed {len(raw_payloads)} archived payloads in {time.time() - t1:.02f} secs')
+    return raw_payloads
+
+
+def _replay_failed_tasks(tasks, min_result_num, existing_urls, engine):
+    """Re-fetch only the survey and result pages recorded in a failed-task journal.
+
+    :param tasks: Journaled tasks from :meth:`FailedTaskJournal.take`.
+    :type tasks: list[dict[str, object]]
+    :param min_result_num: Optional lower-bound result id filter.
+    :type min_result_num: int | None
+    :param existing_urls: Optional URL set to skip already-ingested records.
+    :type existing_urls: set[str] | seen_filter.KnownResults | None
+    :param engine: One of ``SCRAPE_ENGINES``.
+    :type engine: str
+    :returns: Raw payloads recovered by the replay.
+    :rtype: list[dict[str, str]]
+    """
+    t1 = time.time()
+    existing_urls = existing_urls or set()
+    pages = [task['page'] for task in tasks if task['kind'] == 'survey']
+    rows = _run_scraper(engine, (_fetch_table_page, _async_fetch_table_page), pages)
+    _confirm_known(rows, existing_urls)
+    rows = [row for row in rows if row and not _is_known_row(row, min_result_num, existing_urls)]
+
+    all_payloads = dict(filter(None, (seed_payload(row, BASE_URL) for row in rows)))
+    all_payloads.update(
+        (task['url'], ApplicantRecord.from_dict(task['payload']))
+        for task in tasks if task['kind'] == 'result'
+    )
+    raw_payloads = fetch_result_pages(engine, all_payloads)
+    print(
+        f'Replayed {len(tasks)} journaled tasks: {len(raw_payloads)} raw payloads '
+        f'in {time.time() - t1:.02f} secs'
+    )
+    return raw_payloads
+
+
+def _scrape(min_result_num, existing_urls, engine, incremental):
+    """Run one scrape with already-resolved options.
+
+    :param min_result_num: Optional lower-bound result id filter.
+    :type min_result_num: int | None
+    :param existing_urls: Optional URL set to skip already-ingested records.
+    :type existing_urls: set[str] | seen_filter.KnownResults | None
+    :param engine: One of ``SCRAPE_ENGINES``.
+    :type engine: str
+    :param incremental: Use the early-stop newest-first survey walk.
+    :type incremental: bool
+    :returns: Raw scraped payload list.
+    :rtype: list[dict[str, str]]
+    """
+    t1 = time.time()
+    transfers_before = TRANSFER_STATS.snapshot()
+    connections_before = connection_stats()
+    has_filter = min_result_num is not None or bool(existing_urls)
+    existing_urls = existing_urls or set()
+
     # Collect data from /survey/ pages
-    collected_rows = _concurrent_scraper(_fetch_table_page,
-                                         range(1, NUM_PAGES_OF_DATA + 1))
+    walk_summary = None
+    if incremental and has_filter:
+        collected_rows, walk_summary = _walk_survey_pages(min_result_num, existing_urls, engine)
+    else:
+        collected_rows = _crawl_survey_pages(engine)
 
     # Then collect data from /result/ pages
-    if min_result_num is not None or existing_urls:
-        filtered_rows = []
-        existing_urls = existing_urls or set()
-        for row in collected_rows:
-            if not row:
-                continue
-            url = BASE_URL + row[0]
-            result_num = _extract_result_num(url)
-            # URL dedupe check handles reruns where source pages still contain old records.
-            if url in existing_urls:
-                continue
-            if min_result_num is not None and result_num is not None:
-                if result_num < min_result_num:
-                    continue
-            filtered_rows.append(row)
-        collected_rows = filtered_rows
-
-    raw_payloads = _get_raw_payloads(collected_rows)
+    if has_filter:
+        _confirm_known(collected_rows, existing_urls)
+        collected_rows = [
+            row for row in collected_rows
+            if row and not _is_known_row(row, min_result_num, existing_urls)
+        ]
+
+    raw_payloads = _get_raw_payloads(collected_rows, engine=engine)
     t2 = time.time()
 
     # Print total number of records retrieved and time to execute, then return
     print(f'Collected {len(raw_payloads)} raw payloads in {t2 - t1:.02f} secs')
+    if walk_summary is not None:
+        _print_walk_summary(walk_summary)
+    stats = connection_stats(connections_before)
+    print(
+        f"HTTP pool: {stats['requests']} requests, "
+        f"{stats['connections_opened']} connections opened, "
+        f"{stats['connections_reused']} reused"
+    )
+    compression = TRANSFER_STATS.summary(transfers_before)
+    print(
+        f"Compression: {compression['compressed_responses']}/{compression['responses']} "
+        f"responses compressed, {compression['wire_bytes']} bytes on the wire for "
+        f"{compression['decoded_bytes']} decoded (ratio {compression['ratio']})"
+    )
     return raw_payloads
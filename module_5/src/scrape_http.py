@@ -0,0 +1,193 @@
+"""Run-aware HTTP fetching for the GradCafe scraper."""
+
+# Approach: every page body goes through one path that layers the run's services (response
+# cache, retries, per-host pacing, adaptive slots, metrics, HTML archive) over the shared
+# keep-alive pool.
+from contextlib import nullcontext
+
+from http_client import BROWSER_USER_AGENT, PooledHTTPClient, async_http_fetch
+from scrape_services import ADAPTIVE_MAX_WORKERS, RUN_STATE
+
+# This header makes the scraper look like a standard Chrome browser
+HEADERS = {'User-Agent': BROWSER_USER_AGENT}
+
+# One keep-alive pool shared by every worker thread; sized so each worker can hold a socket
+# at the adaptive ceiling (sockets are only opened on demand).
+HTTP_CLIENT = PooledHTTPClient(maxsize=ADAPTIVE_MAX_WORKERS, headers=HEADERS, timeout=10)
+
+
+def connection_stats(since=None):
+    """Return keep-alive counters of the shared pool, optionally since a snapshot.
+
+    The pool lives as long as the process, so its counters cover every scrape
+    run so far; pass the counters taken when a run started to get that run's.
+
+    :param since: Earlier result of this function to subtract, or ``None``.
+    :type since: dict[str, int] | None
+    :returns: ``requests``, ``connections_opened``, and ``connections_reused``.
+    :rtype: dict[str, int]
+    """
+    stats = HTTP_CLIENT.connection_stats()
+    if since is None:
+        return stats
+    # Evicted host pools take their counts with them, so never report a negative delta.
+    requests = max(stats['requests'] - since['requests'], 0)
+    opened = max(stats['connections_opened'] - since['connections_opened'], 0)
+    return {
+        'requests': requests,
+        'connections_opened': opened,
+        'connections_reused': max(requests - opened, 0),
+    }
+
+
+def http_get(url):
+    """Fetch a URL over the shared keep-alive pool and return the body bytes.
+
+    When a response cache is active, fresh entries are served from disk and
+    stale ones are revalidated with a conditional request. Bodies read from
+    the network are archived; cached ones only when the archive lacks the page.
+
+    :param url: Absolute URL to request.
+    :type url: str
+    :returns: Response body.
+    :rtype: bytes
+    """
+    cache = RUN_STATE['cache']
+    if cache is None:
+        return _archived(url, network_fetch(url)[2])
+    # Cache hits were archived when first downloaded; re-appending them on every rerun would
+    # only grow the archive with copies.
+    return _archived(url, cache.fetch(url, _archiving_fetch), only_new=True)
+
+
+def _archiving_fetch(url, headers=None):
+    """Send one request with :func:`network_fetch` and archive the body it downloaded.
+
+    :param url: Absolute URL to request.
+    :type url: str
+    :param headers: Extra request headers (for example cache validators).
+    :type headers: dict[str, str] | None
+    :returns: ``(status, headers, body)`` from :func:`network_fetch`.
+    :rtype: tuple[int, dict[str, str], bytes]
+    """
+    response = network_fetch(url, headers)
+    # A 304 carries no body; the cached copy it confirms is archived by the caller if missing.
+    if response[0] != 304:
+        _archived(url, response[2])
+    return response
+
+
+def _archived(url, body, only_new=False):
+    """Append a fetched body to the run's HTML archive, if one is active.
+
+    :param url: URL the body was fetched from.
+    :type url: str
+    :param body: Response body.
+    :type body: bytes
+    :param only_new: Skip the page if the archive already holds a copy.
+    :type only_new: bool
+    :returns: ``body`` unchanged.
+    :rtype: bytes
+    """
+    archive = RUN_STATE['archive']
+    if archive is not None:
+        archive.append(url, body, only_new)
+    return body
+
+
+def network_fetch(url, headers=None):
+    """Send one request over the pool, retrying transient failures when enabled.
+
+    :param url: Absolute URL to request.
+    :type url: str
+    :param headers: Extra request headers (for example cache validators).
+    :type headers: dict[str, str] | None
+    :returns: ``(status, headers, body)`` from :meth:`PooledHTTPClient.fetch`.
+    :rtype: tuple[int, dict[str, str], bytes]
+    """
+    retrier = RUN_STATE['retrier']
+    if retrier is None:
+        return _pooled_fetch(url, headers)
+    return retrier.call(_pooled_fetch, url, headers)
+
+
+def _pooled_fetch(url, headers):
+    """Make one pooled request, holding an adaptive-concurrency slot if enabled.
+
+    The slot is taken per attempt, so workers sleeping in a retry backoff do
+    not count against the concurrency level. A per-host rate token is
+    reserved first, so a worker waiting on pacing does not hold a slot either.
+
+    :param url: Absolute URL to request.
+    :type url: str
+    :param headers: Extra request headers, or ``None``.
+    :type headers: dict[str, str] | None
+    :returns: ``(status, headers, body)`` from :meth:`PooledHTTPClient.fetch`.
+    :rtype: tuple[int, dict[str, str], bytes]
+    """
+    limiter = RUN_STATE['rate_limiter']
+    if limiter is not None:
+        limiter.acquire(url)
+    controller = RUN_STATE['concurrency']
+    with controller.slot() if controller is not None else nullcontext(), \
+            _measured(url) as outcome:
+        response = HTTP_CLIENT.fetch(url, headers)
+        outcome['status'], outcome['bytes'] = response[0], len(response[2])
+        return response
+
+
+def _measured(url):
+    """Time one fetch attempt in the run's metrics, if they are enabled.
+
+    :param url: Requested URL.
+    :type url: str
+    :returns: Context manager yielding an outcome dict for the caller to fill.
+    :rtype: contextlib.AbstractContextManager[dict[str, int]]
+    """
+    metrics = RUN_STATE['metrics']
+    if metrics is None:
+        return nullcontext({})
+    return metrics.request(url)
+
+
+async def _async_fetch(url):
+    """Make one async request, paced per host and timed in the run's metrics when enabled.
+
+    :param url: Absolute URL to request.
+    :type url: str
+    :returns: ``(status, body)`` of the response.
+    :rtype: tuple[int, bytes]
+    """
+    limiter = RUN_STATE['rate_limiter']
+    if limiter is not None:
+        await limiter.acquire_async(url)
+    with _measured(url) as outcome:
+        status, _, body = await async_http_fetch(url, HEADERS)
+        outcome['status'], outcome['bytes'] = status, len(body)
+        return status, body
+
+
+async def async_get(url):
+    """Async counterpart of :func:`http_get`.
+
+    The async client has no validator support, so stale entries are simply
+    downloaded again.
+
+    :param url: Absolute URL to request.
+    :type url: str
+    :returns: Response body.
+    :rtype: bytes
+    """
+    cache = RUN_STATE['cache']
+    body = cache.get_fresh(url) if cache is not None else None
+    if body is not None:
+        return _archived(url, body, only_new=True)
+    retrier = RUN_STATE['retrier']
+    if retrier is None:
+        status, body = await _async_fetch(url)
+    else:
+        status, body = await retrier.call_async(_async_fetch, url)
+    if cache is not None and status == 200 and body:
+        # Same rule as ResponseCache.fetch(): only complete successful pages are kept.
+        cache.store(url, body)
+    return _archived(url, body)
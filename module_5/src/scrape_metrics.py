@@ -0,0 +1,267 @@
+"""Per-request instrumentation and JSON run reports for the GradCafe scraper."""
+
+# Approach: fetch attempts and parses are timed through context managers that update one
+# lock-guarded set of counters, so the report costs a few additions per request.
+import bisect
+import json
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from urllib import error
+
+# Latency histogram bucket upper bounds in milliseconds; slower requests land in '+Inf'.
+LATENCY_BUCKETS_MS = (10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+# Minimum seconds between in-flight samples in the concurrency timeline.
+CONCURRENCY_SAMPLE_SECONDS = 1.0
+
+# Seconds between live progress lines when they are enabled.
+PROGRESS_SECONDS = 5.0
+
+
+def request_kind(url):
+    """Classify a URL as a ``'survey'``, ``'result'`` or ``'other'`` request.
+
+    :param url: Requested URL.
+    :type url: str
+    :returns: Request kind used to split the latency histograms.
+    :rtype: str
+    """
+    if '/survey/' in url:
+        return 'survey'
+    if '/result/' in url:
+        return 'result'
+    return 'other'
+
+
+def _outcome_label(exc):
+    """Return the status-code label for a failed attempt.
+
+    :param exc: Exception raised by the attempt.
+    :type exc: BaseException
+    :returns: HTTP status code as text, ``'timeout'``, ``'connection_error'``,
+        ``'invalid_response'`` or the exception class name.
+    :rtype: str
+    """
+    if isinstance(exc, error.HTTPError):
+        return str(exc.code)
+    if isinstance(exc, TimeoutError):
+        return 'timeout'
+    if isinstance(exc, error.URLError):
+        return 'connection_error'
+    if isinstance(exc, ValueError):
+        # Malformed status lines and undecodable bodies.
+        return 'invalid_response'
+    return type(exc).__name__
+
+
+def _histogram_summary(counts):
+    """Summarize one latency histogram.
+
+    Percentiles are reported as the upper bound of the bucket they fall in.
+
+    :param counts: Per-bucket counts (last entry is the overflow bucket).
+    :type counts: list[int]
+    :returns: ``count``, ``buckets`` (label to count) and ``p50_ms``/``p90_ms``/``p99_ms``.
+    :rtype: dict[str, object]
+    """
+    labels = [f'<={bound}' for bound in LATENCY_BUCKETS_MS] + ['+Inf']
+    total = sum(counts)
+    summary = {'count': total, 'buckets': dict(zip(labels, counts))}
+    for name, quantile in (('p50_ms', 0.5), ('p90_ms', 0.9), ('p99_ms', 0.99)):
+        value = None
+        seen = 0
+        for bound, count in zip(LATENCY_BUCKETS_MS + (None,), counts):
+            seen += count
+            if total and seen >= quantile * total:
+                value = bound
+                break
+        summary[name] = value
+    return summary
+
+
+class RunMetrics:
+    """Counters for one scrape run: requests, bytes, statuses, latency, parse time.
+
+    Thread-safe; the async engine uses it from a single thread as well.
+    """
+
+    def __init__(self, progress_seconds=None):
+        """Start the run clock.
+
+        :param progress_seconds: Print a live progress line at most this often,
+            or ``None`` for no progress lines.
+        :type progress_seconds: float | None
+        """
+        self._lock = threading.Lock()
+        self._started = time.perf_counter()
+        self._started_at = datetime.now(timezone.utc)
+        self._progress_seconds = progress_seconds
+        self._last = {'sample': float('-inf'), 'progress': 0.0}
+        self._counts = {
+            'requests': 0, 'bytes': 0, 'in_flight': 0, 'peak_in_flight': 0,
+            'network_seconds': 0.0, 'parse_seconds': 0.0, 'parses': 0,
+        }
+        # Status-code counts, per-kind latency histograms, and (elapsed, in-flight) samples.
+        self._series = {'statuses': {}, 'latency': {}, 'timeline': []}
+
+    def _elapsed(self):
+        """Seconds since the run started.
+
+        :rtype: float
+        """
+        return time.perf_counter() - self._started
+
+    def _sample(self, now):
+        """Append an in-flight sample if the sampling interval has passed (lock held).
+
+        :param now: Seconds since the run started.
+        :type now: float
+        :returns: ``None``.
+        :rtype: None
+        """
+        if now - self._last['sample'] >= CONCURRENCY_SAMPLE_SECONDS:
+            self._last['sample'] = now
+            self._series['timeline'].append([round(now, 3), self._counts['in_flight']])
+
+    @contextmanager
+    def request(self, url):
+        """Time one fetch attempt; the caller fills in the outcome on success.
+
+        :param url: Requested URL.
+        :type url: str
+        :returns: Context manager yielding a dict whose ``'status'`` and
+            ``'bytes'`` the caller sets once the response is read.
+        :rtype: contextlib.AbstractContextManager[dict[str, int]]
+        """
+        outcome = {'status': 'unknown', 'bytes': 0}
+        with self._lock:
+            self._counts['in_flight'] += 1
+            self._counts['peak_in_flight'] = max(self._counts['peak_in_flight'],
+                                                 self._counts['in_flight'])
+            self._sample(self._elapsed())
+        started = time.perf_counter()
+        try:
+            yield outcome
+        except Exception as exc:
+            # Every failed attempt gets a label rather than the 'unknown' placeholder.
+            outcome['status'] = _outcome_label(exc)
+            raise
+        finally:
+            self._finish(request_kind(url), outcome, time.perf_counter() - started)
+
+    def _finish(self, kind, outcome, seconds):
+        """Record a finished attempt and print a progress line when one is due.
+
+        :param kind: Request kind from :func:`request_kind`.
+        :type kind: str
+        :param outcome: ``status`` and ``bytes`` of the attempt.
+        :type outcome: dict[str, int | str]
+        :param seconds: Attempt latency.
+        :type seconds: float
+        :returns: ``None``.
+        :rtype: None
+        """
+        bucket = bisect.bisect_left(LATENCY_BUCKETS_MS, seconds * 1000)
+        status = str(outcome['status'])
+        line = None
+        with self._lock:
+            counts = self._counts
+            counts['in_flight'] -= 1
+            counts['requests'] += 1
+            counts['bytes'] += outcome['bytes']
+            counts['network_seconds'] += seconds
+            statuses = self._series['statuses']
+            statuses[status] = statuses.get(status, 0) + 1
+            histogram = self._series['latency'].setdefault(
+                kind, [0] * (len(LATENCY_BUCKETS_MS) + 1))
+            histogram[bucket] += 1
+            now = self._elapsed()
+            self._sample(now)
+            if self._progress_seconds is not None and \
+                    now - self._last['progress'] >= self._progress_seconds:
+                self._last['progress'] = now
+                line = (
+                    f"[{now:.0f}s] {counts['requests']} requests, {counts['in_flight']} in "
+                    f"flight, {counts['bytes'] / 1e6:.1f} MB, network "
+                    f"{counts['network_seconds']:.1f}s, parse {counts['parse_seconds']:.1f}s"
+                )
+        if line is not None:
+            print(line)
+
+    @contextmanager
+    def parse(self):
+        """Time one HTML parse.
+
+        :returns: Context manager active for the parse.
+        :rtype: contextlib.AbstractContextManager[None]
+        """
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            seconds = time.perf_counter() - started
+            with self._lock:
+                self._counts['parse_seconds'] += seconds
+                self._counts['parses'] += 1
+
+    def report(self, retries=None, compression=None):
+        """Build the JSON-serializable run report.
+
+        ``network_seconds`` and ``parse_seconds`` add up time across workers,
+        so with concurrency they can exceed ``wall_seconds``. ``bytes`` counts
+        decoded bodies; wire sizes are in ``compression``.
+
+        :param retries: Retry counters from :meth:`retry_queue.Retrier.stats`.
+        :type retries: dict[str, int] | None
+        :param compression: Transfer counters from
+            :meth:`http_client.TransferStats.summary`.
+        :type compression: dict[str, object] | None
+        :returns: ``started_at``, ``wall_seconds``, ``requests``, ``time``,
+            ``latency`` (per request kind), ``retries``, ``compression`` and
+            ``concurrency``.
+        :rtype: dict[str, object]
+        """
+        with self._lock:
+            counts = dict(self._counts)
+            statuses = dict(sorted(self._series['statuses'].items()))
+            latency = {kind: list(c) for kind, c in sorted(self._series['latency'].items())}
+            timeline = [list(sample) for sample in self._series['timeline']]
+        return {
+            'started_at': self._started_at.isoformat(timespec='seconds'),
+            'wall_seconds': round(self._elapsed(), 3),
+            'requests': {
+                'total': counts['requests'],
+                'bytes': counts['bytes'],
+                'status_codes': statuses,
+            },
+            'time': {
+                'network_seconds': round(counts['network_seconds'], 3),
+                'parse_seconds': round(counts['parse_seconds'], 3),
+                'parses': counts['parses'],
+            },
+            'latency': {kind: _histogram_summary(c) for kind, c in latency.items()},
+            'retries': retries,
+            'compression': compression,
+            'concurrency': {'peak': counts['peak_in_flight'], 'timeline': timeline},
+        }
+
+    def write_report(self, path, retries=None, compression=None):
+        """Write :meth:`report` to ``path`` as indented JSON.
+
+        :param path: Destination file; parent directories are created.
+        :type path: str | pathlib.Path
+        :param retries: Retry counters to include.
+        :type retries: dict[str, int] | None
+        :param compression: Transfer counters to include.
+        :type compression: dict[str, object] | None
+        :returns: The report that was written.
+        :rtype: dict[str, object]
+        """
+        report = self.report(retries, compression)
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(report, indent=2), encoding='utf-8')
+        return report
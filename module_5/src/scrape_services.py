@@ -0,0 +1,424 @@
+"""Run-scoped services and option handling for the GradCafe scraper."""
+
+# Approach: each scrape option maps to one context manager that installs a service in
+# RUN_STATE for the duration of a run and tears it down (and reports on it) afterwards.
+import os
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+
+from adaptive_concurrency import AIMDController
+from crawl_checkpoint import CrawlCheckpoint
+from html_archive import HtmlArchive
+from http_client import BROWSER_USER_AGENT, TRANSFER_STATS
+from page_parsers import DEFAULT_PARSER, HAS_LXML
+from politeness import HostRateLimiter, load_robots_policy
+from response_cache import ResponseCache
+from retry_queue import FailedTaskJournal, Retrier
+from scrape_metrics import PROGRESS_SECONDS, RunMetrics
+
+# Ceiling for adaptive=True, which starts at scrape.MAX_WORKERS and tunes the level itself
+# (AIMD: +1 per healthy round of requests, halved on HTTP 429/5xx or timeouts).
+ADAPTIVE_MAX_WORKERS = 30
+
+# Smoothed per-request latency (seconds) above which adaptive mode backs off.
+ADAPTIVE_LATENCY_TARGET = 3.0
+
+# Concurrency engines selectable from scrape_data().
+SCRAPE_ENGINES = ('thread', 'async')
+
+# 'thread' parses HTML on the fetching thread; 'process' hands the bytes to a
+# ProcessPoolExecutor so CPU-bound parsing does not compete with I/O for the GIL.
+PARSE_MODES = ('thread', 'process')
+PARSE_WORKERS = os.cpu_count() or 1
+
+# HTML parser backends: 'full' builds the whole page tree (reference behavior),
+# 'strained' parses only the <table>/<dl> subtree with html.parser, and 'lxml'
+# does the same with the much faster lxml parser. 'auto' means 'strained', which
+# matches 'full' exactly; 'lxml' must be asked for since its text can differ.
+PARSER_BACKENDS = ('auto', 'full', 'strained', 'lxml')
+
+# Keyword options accepted by scrape_data()/iter_scrape_data() and their defaults.
+SCRAPE_OPTION_DEFAULTS = {
+    'engine': 'thread',
+    'incremental': False,
+    'parse_mode': 'thread',
+    'parser': 'auto',
+    'cache_dir': None,
+    'adaptive': False,
+    'retry': True,
+    'retry_journal': None,
+    'checkpoint': None,
+    'resume': False,
+    'archive_dir': None,
+    'metrics_report': None,
+    'live_progress': False,
+    'robots': None,
+    'rate_limit': None,
+    'discover_pages': True,
+    'max_pages': None,
+}
+
+# Per-run services set up by run_services(); scrape workers read them at call time.
+RUN_STATE = {
+    'parse_pool': None,
+    'parser': DEFAULT_PARSER,
+    'cache': None,
+    'concurrency': None,
+    'completed': 0,
+    'retrier': None,
+    'journal': None,
+    'checkpoint': None,
+    'archive': None,
+    'metrics': None,
+    'robots': None,
+    'rate_limiter': None,
+    'discover_pages': False,
+    'max_pages': None,
+}
+
+
+@contextmanager
+def use_parse_pool(parse_mode, workers=None):
+    """Provide a process pool for HTML parsing for the duration of a run.
+
+    :param parse_mode: One of ``PARSE_MODES``; ``'thread'`` is a no-op.
+    :type parse_mode: str
+    :param workers: Process count (defaults to ``PARSE_WORKERS``).
+    :type workers: int | None
+    :returns: Context manager active for the run.
+    :rtype: contextlib.AbstractContextManager[None]
+    """
+    if parse_mode != 'process':
+        yield
+        return
+    with ProcessPoolExecutor(max_workers=workers or PARSE_WORKERS) as pool:
+        RUN_STATE['parse_pool'] = pool
+        try:
+            yield
+        finally:
+            RUN_STATE['parse_pool'] = None
+
+
+def resolve_options(options):
+    """Merge caller options with ``SCRAPE_OPTION_DEFAULTS`` and validate them.
+
+    :param options: Keyword options passed to a scrape entry point.
+    :type options: dict[str, object]
+    :returns: Complete option mapping.
+    :rtype: dict[str, object]
+    :raises TypeError: If an unknown option name is given.
+    :raises ValueError: If an option value is not recognised or unsupported.
+    """
+    unknown = sorted(set(options) - set(SCRAPE_OPTION_DEFAULTS))
+    if unknown:
+        raise TypeError(f"Unknown scrape option(s): {', '.join(unknown)}")
+    resolved = {**SCRAPE_OPTION_DEFAULTS, **options}
+    if resolved['engine'] not in SCRAPE_ENGINES:
+        raise ValueError(f"Unknown scrape engine: {resolved['engine']!r}")
+    if resolved['parse_mode'] not in PARSE_MODES:
+        raise ValueError(f"Unknown parse mode: {resolved['parse_mode']!r}")
+    if resolved['parser'] not in PARSER_BACKENDS:
+        raise ValueError(f"Unknown parser backend: {resolved['parser']!r}")
+    if resolved['parser'] == 'lxml' and not HAS_LXML:
+        raise ValueError("parser='lxml' requires the lxml package")
+    if resolved['adaptive'] and resolved['engine'] != 'thread':
+        raise ValueError('adaptive concurrency only supports the thread engine')
+    if resolved['checkpoint'] is None and resolved['resume']:
+        raise ValueError('resume=True requires a checkpoint path')
+    if resolved['checkpoint'] is not None and resolved['incremental']:
+        raise ValueError('checkpoints apply to full crawls, not incremental walks')
+    rate_limit = resolved['rate_limit']
+    if rate_limit is not None and (isinstance(rate_limit, bool)
+                                   or not isinstance(rate_limit, (int, float))
+                                   or rate_limit <= 0):
+        raise ValueError(f"rate_limit must be a positive number, got {rate_limit!r}")
+    max_pages = resolved['max_pages']
+    if max_pages is not None and (isinstance(max_pages, bool) or not isinstance(max_pages, int)
+                                  or max_pages < 1):
+        raise ValueError(f"max_pages must be a positive integer, got {max_pages!r}")
+    return resolved
+
+
+@contextmanager
+def use_parser_backend(name):
+    """Select the HTML parser backend for the duration of a run.
+
+    :param name: One of ``PARSER_BACKENDS``; ``'auto'`` means ``DEFAULT_PARSER``.
+    :type name: str
+    :returns: Context manager active for the run.
+    :rtype: contextlib.AbstractContextManager[None]
+    """
+    previous = RUN_STATE['parser']
+    RUN_STATE['parser'] = DEFAULT_PARSER if name == 'auto' else name
+    try:
+        yield
+    finally:
+        RUN_STATE['parser'] = previous
+
+
+@contextmanager
+def use_page_limit(discover, max_pages):
+    """Set how many survey pages a run may crawl.
+
+    :param discover: Probe for the real last page instead of crawling up to the cap.
+    :type discover: bool
+    :param max_pages: Hard page cap, or ``None`` for ``scrape.NUM_PAGES_OF_DATA``.
+    :type max_pages: int | None
+    :returns: Context manager active for the run.
+    :rtype: contextlib.AbstractContextManager[None]
+    """
+    previous = RUN_STATE['discover_pages'], RUN_STATE['max_pages']
+    RUN_STATE['discover_pages'], RUN_STATE['max_pages'] = discover, max_pages
+    try:
+        yield
+    finally:
+        RUN_STATE['discover_pages'], RUN_STATE['max_pages'] = previous
+
+
+@contextmanager
+def use_response_cache(cache_dir):
+    """Serve fetches from an on-disk response cache for the duration of a run.
+
+    :param cache_dir: Cache directory, or ``None`` to disable caching.
+    :type cache_dir: str | pathlib.Path | None
+    :returns: Context manager active for the run.
+    :rtype: contextlib.AbstractContextManager[None]
+    """
+    if cache_dir is None:
+        yield
+        return
+    cache = ResponseCache(cache_dir)
+    RUN_STATE['cache'] = cache
+    try:
+        yield
+    finally:
+        RUN_STATE['cache'] = None
+        stats = cache.stats()
+        print(
+            f"Response cache: {stats['hits']} hits, {stats['misses']} misses, "
+            f"{stats['revalidated']} revalidated"
+        )
+
+
+@contextmanager
+def use_adaptive_concurrency(enabled, initial):
+    """Gate requests through an AIMD concurrency controller for a run.
+
+    :param enabled: Whether adaptive concurrency was requested.
+    :type enabled: bool
+    :param initial: Starting concurrency level (the fixed worker count).
+    :type initial: int
+    :returns: Context manager active for the run.
+    :rtype: contextlib.AbstractContextManager[None]
+    """
+    if not enabled:
+        yield
+        return
+    controller = AIMDController(
+        initial,
+        maximum=ADAPTIVE_MAX_WORKERS,
+        latency_target=ADAPTIVE_LATENCY_TARGET,
+    )
+    RUN_STATE['concurrency'] = controller
+    RUN_STATE['completed'] = 0
+    try:
+        yield
+    finally:
+        RUN_STATE['concurrency'] = None
+        stats = controller.stats()
+        print(
+            f"Adaptive concurrency: final {stats['limit']}, peak {stats['peak']}, "
+            f"{stats['decreases']} backoffs"
+        )
+
+
+@contextmanager
+def use_retries(enabled, journal_path):
+    """Retry transient fetch failures and journal tasks that still fail.
+
+    :param enabled: Whether failed requests are retried with backoff.
+    :type enabled: bool
+    :param journal_path: JSONL path for tasks that fail for good, or ``None``.
+    :type journal_path: str | pathlib.Path | None
+    :returns: Context manager active for the run.
+    :rtype: contextlib.AbstractContextManager[None]
+    """
+    retrier = Retrier() if enabled else None
+    journal = FailedTaskJournal(journal_path) if journal_path is not None else None
+    RUN_STATE['retrier'] = retrier
+    RUN_STATE['journal'] = journal
+    try:
+        yield
+    finally:
+        RUN_STATE['retrier'] = None
+        RUN_STATE['journal'] = None
+        if retrier is not None:
+            stats = retrier.stats()
+            print(
+                f"Retries: {stats['retries']} retried, {stats['recovered']} recovered, "
+                f"{stats['exhausted']} gave up"
+            )
+        if journal is not None and journal.recorded:
+            print(f"Failed-task journal: {journal.recorded} tasks written to {journal.path}")
+
+
+@contextmanager
+def use_checkpoint(path, resume):
+    """Record full-crawl progress to a SQLite checkpoint for the duration of a run.
+
+    :param path: Checkpoint file, or ``None`` to disable checkpointing.
+    :type path: str | pathlib.Path | None
+    :param resume: Keep progress saved by an earlier run instead of starting over.
+    :type resume: bool
+    :returns: Context manager active for the run.
+    :rtype: contextlib.AbstractContextManager[None]
+    """
+    if path is None:
+        yield
+        return
+    checkpoint = CrawlCheckpoint(path)
+    if resume:
+        stats = checkpoint.stats()
+        print(f"Resuming crawl: {stats['pages']} survey pages and {stats['results']} results saved")
+    else:
+        checkpoint.reset()
+    RUN_STATE['checkpoint'] = checkpoint
+    try:
+        yield
+    finally:
+        RUN_STATE['checkpoint'] = None
+        stats = checkpoint.stats()
+        checkpoint.close()
+        print(
+            f"Checkpoint: {stats['pages']} survey pages and {stats['results']} results "
+            f"saved to {path}"
+        )
+
+
+@contextmanager
+def use_html_archive(archive_dir):
+    """Append every fetched survey and result page to an HTML archive for a run.
+
+    :param archive_dir: Archive directory, or ``None`` to disable archiving.
+    :type archive_dir: str | pathlib.Path | None
+    :returns: Context manager active for the run.
+    :rtype: contextlib.AbstractContextManager[None]
+    """
+    if archive_dir is None:
+        yield
+        return
+    archive = HtmlArchive(archive_dir)
+    RUN_STATE['archive'] = archive
+    try:
+        yield
+    finally:
+        RUN_STATE['archive'] = None
+        stats = archive.stats()
+        print(
+            f"HTML archive: {stats['pages']} pages, {stats['raw_bytes']} bytes stored "
+            f"as {stats['stored_bytes']} in {archive_dir}"
+        )
+
+
+@contextmanager
+def use_metrics(report_path, live_progress):
+    """Time every fetch attempt and parse, and report where the run's time went.
+
+    Set up inside :func:`use_retries` so retry counters can join the report.
+    Wire vs decoded byte counts cover only the responses read during the run.
+
+    :param report_path: JSON run-report path, or ``None`` for no file.
+    :type report_path: str | pathlib.Path | None
+    :param live_progress: Print a progress line every ``PROGRESS_SECONDS``.
+    :type live_progress: bool
+    :returns: Context manager active for the run.
+    :rtype: contextlib.AbstractContextManager[None]
+    """
+    if report_path is None and not live_progress:
+        yield
+        return
+    metrics = RunMetrics(PROGRESS_SECONDS if live_progress else None)
+    transfers_before = TRANSFER_STATS.snapshot()
+    RUN_STATE['metrics'] = metrics
+    try:
+        yield
+    finally:
+        RUN_STATE['metrics'] = None
+        retrier = RUN_STATE['retrier']
+        retries = retrier.stats() if retrier is not None else None
+        compression = TRANSFER_STATS.summary(transfers_before)
+        if report_path is None:
+            report = metrics.report(retries, compression)
+        else:
+            report = metrics.write_report(report_path, retries, compression)
+        print(
+            f"Run metrics: {report['requests']['total']} requests, "
+            f"{report['requests']['bytes']} bytes ({compression['wire_bytes']} on the wire), "
+            f"network {report['time']['network_seconds']}s, "
+            f"parse {report['time']['parse_seconds']}s, wall {report['wall_seconds']}s"
+            + (f"; report written to {report_path}" if report_path is not None else '')
+        )
+
+
+@contextmanager
+def use_politeness(robots, rate_limit):
+    """Apply a robots.txt policy and per-host request pacing for the duration of a run.
+
+    A ``Crawl-delay`` in the policy caps the rate: the slower of it and
+    ``rate_limit`` wins.
+
+    :param robots: robots.txt URL or local file, or ``None`` for the built-in rules.
+    :type robots: str | pathlib.Path | None
+    :param rate_limit: Requests per second allowed to each host, or ``None``.
+    :type rate_limit: float | None
+    :returns: Context manager active for the run.
+    :rtype: contextlib.AbstractContextManager[None]
+    """
+    policy = load_robots_policy(robots, BROWSER_USER_AGENT) if robots is not None else None
+    rates = [rate_limit] if rate_limit is not None else []
+    if policy is not None and policy.crawl_delay:
+        rates.append(1 / policy.crawl_delay)
+    if policy is None and not rates:
+        yield
+        return
+    limiter = HostRateLimiter(min(rates)) if rates else None
+    RUN_STATE['robots'] = policy
+    RUN_STATE['rate_limiter'] = limiter
+    try:
+        yield
+    finally:
+        RUN_STATE['robots'] = None
+        RUN_STATE['rate_limiter'] = None
+        source = f"robots.txt from {robots}" if policy is not None else 'built-in robots rules'
+        if limiter is None:
+            print(f"Politeness: {source}, no rate limit")
+        else:
+            stats = limiter.stats()
+            print(
+                f"Politeness: {source}, {limiter.rate:g} requests/s per host; "
+                f"{stats['throttled']}/{stats['requests']} requests waited "
+                f"{stats['wait_seconds']}s"
+            )
+
+
+@contextmanager
+def run_services(options, workers):
+    """Set up every per-run service selected by resolved scrape options.
+
+    :param options: Options returned by :func:`resolve_options`.
+    :type options: dict[str, object]
+    :param workers: Fixed worker count, used as the adaptive starting level.
+    :type workers: int
+    :returns: Context manager active for the run.
+    :rtype: contextlib.AbstractContextManager[None]
+    """
+    with use_parse_pool(options['parse_mode']), use_parser_backend(options['parser']), \
+            use_page_limit(options['discover_pages'], options['max_pages']), \
+            use_response_cache(options['cache_dir']), \
+            use_politeness(options['robots'], options['rate_limit']), \
+            use_adaptive_concurrency(options['adaptive'], workers), \
+            use_retries(options['retry'], options['retry_journal']), \
+            use_checkpoint(options['checkpoint'], options['resume']), \
+            use_html_archive(options['archive_dir']), \
+            use_metrics(options['metrics_report'], options['live_progress']):
+        yield
@@ -0,0 +1,184 @@
+"""Persistent Bloom filter of ingested GradCafe result ids."""
+
+# Approach: a fixed-size bit array keyed by the result id at the end of each URL answers
+# "definitely new" locally; only "maybe known" URLs cost a database lookup, batched per window.
+import hashlib
+import math
+import os
+import struct
+from pathlib import Path
+
+# File written next to the cumulative datasets in ``src/``.
+FILTER_FILENAME = 'seen_results.bloom'
+
+# Sized for this many ids at ``FILTER_ERROR_RATE`` false positives (about 0.9 MB).
+FILTER_CAPACITY = 500_000
+FILTER_ERROR_RATE = 0.001
+
+# magic, hash count, bit count, capacity, rows represented.
+_HEADER = struct.Struct('<4sIQQQ')
+_MAGIC = b'RIDB'
+
+
+def result_key(url):
+    """Return the filter key for a result URL (its trailing result id).
+
+    :param url: Absolute or relative ``/result/<id>`` URL.
+    :type url: str
+    :returns: Result id text.
+    :rtype: str
+    """
+    return url.rstrip('/').rsplit('/', 1)[-1]
+
+
+class ResultIdFilter:
+    """Bloom filter over result ids, with a count of the database rows it covers.
+
+    Lookups can return false positives (about ``error_rate`` once ``capacity``
+    ids are stored) but never false negatives, so a miss proves a result is new.
+    """
+
+    def __init__(self, capacity=FILTER_CAPACITY, error_rate=FILTER_ERROR_RATE):
+        """Create an empty filter sized for ``capacity`` ids.
+
+        :param capacity: Expected number of ids.
+        :type capacity: int
+        :param error_rate: Target false-positive probability at ``capacity``.
+        :type error_rate: float
+        """
+        ln2 = math.log(2)
+        # Standard Bloom sizing: m = -n ln p / (ln 2)^2 bits and k = (m / n) ln 2 hashes.
+        num_bits = max(64, int(-capacity * math.log(error_rate) / (ln2 * ln2)))
+        self.capacity = capacity
+        self.num_bits = num_bits
+        self.hashes = max(1, round(num_bits / capacity * ln2))
+        self.count = 0
+        self._bits = bytearray((num_bits + 7) // 8)
+
+    @property
+    def saturated(self):
+        """Whether more ids than ``capacity`` were added (error rate above target).
+
+        :rtype: bool
+        """
+        return self.count > self.capacity
+
+    def _positions(self, key):
+        """Yield the bit positions of ``key`` by double hashing one BLAKE2b digest.
+
+        :param key: Result id.
+        :type key: str | int
+        :returns: Iterator of ``hashes`` bit positions.
+        :rtype: collections.abc.Iterator[int]
+        """
+        digest = hashlib.blake2b(str(key).encode(), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], 'little')
+        step = int.from_bytes(digest[8:], 'little') | 1
+        for i in range(self.hashes):
+            yield (first + i * step) % self.num_bits
+
+    def add(self, key):
+        """Add one result id and count it as one covered row.
+
+        :param key: Result id.
+        :type key: str | int
+        :returns: ``None``.
+        :rtype: None
+        """
+        for position in self._positions(key):
+            self._bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, key):
+        return all(self._bits[p >> 3] & (1 << (p & 7)) for p in self._positions(key))
+
+    def save(self, path):
+        """Write the filter atomically (temp file, then rename).
+
+        :param path: Destination file.
+        :type path: str | pathlib.Path
+        :returns: ``None``.
+        :rtype: None
+        """
+        path = Path(path)
+        tmp_path = path.with_name(path.name + '.tmp')
+        with open(tmp_path, 'wb') as f:
+            f.write(_HEADER.pack(_MAGIC, self.hashes, self.num_bits, self.capacity, self.count))
+            f.write(self._bits)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path):
+        """Read a filter written by :meth:`save`.
+
+        :param path: Filter file.
+        :type path: str | pathlib.Path
+        :returns: Loaded filter, or ``None`` if the file is missing or not a filter.
+        :rtype: ResultIdFilter | None
+        """
+        try:
+            data = Path(path).read_bytes()
+            magic, hashes, num_bits, capacity, count = _HEADER.unpack_from(data)
+        except (OSError, struct.error):
+            return None
+        bits = data[_HEADER.size:]
+        if magic != _MAGIC or len(bits) != (num_bits + 7) // 8:
+            return None
+        bloom = cls.__new__(cls)
+        bloom.capacity, bloom.num_bits, bloom.hashes, bloom.count = (
+            capacity, num_bits, hashes, count)
+        bloom._bits = bytearray(bits)
+        return bloom
+
+
+class KnownResults:
+    """Exact "already ingested" URL check backed by a :class:`ResultIdFilter`.
+
+    Usable wherever the scraper accepts ``existing_urls``. A filter miss is
+    answered locally; filter hits are confirmed with ``lookup`` (one batched
+    database query per :meth:`confirm` call) and the answers are cached.
+    """
+
+    def __init__(self, bloom, lookup):
+        """Wrap a filter and the database check used for its maybe-hits.
+
+        :param bloom: Filter covering every stored result id.
+        :type bloom: ResultIdFilter
+        :param lookup: Returns which of the given URLs are really stored.
+        :type lookup: collections.abc.Callable[[list[str]], set[str]]
+        """
+        self.bloom = bloom
+        self._lookup = lookup
+        self._confirmed = {}
+        self.stats = {'lookups': 0, 'maybe': 0, 'false_positives': 0}
+
+    def confirm(self, urls):
+        """Resolve every undecided filter hit among ``urls`` with one lookup.
+
+        :param urls: Candidate result URLs.
+        :type urls: collections.abc.Iterable[str]
+        :returns: ``None``.
+        :rtype: None
+        """
+        maybe = list(dict.fromkeys(
+            url for url in urls
+            if url not in self._confirmed and result_key(url) in self.bloom
+        ))
+        if not maybe:
+            return
+        stored = self._lookup(maybe)
+        self.stats['lookups'] += 1
+        self.stats['maybe'] += len(maybe)
+        for url in maybe:
+            self._confirmed[url] = url in stored
+            self.stats['false_positives'] += url not in stored
+
+    def __contains__(self, url):
+        if result_key(url) not in self.bloom:
+            return False
+        if url not in self._confirmed:
+            self.confirm([url])
+        return self._confirmed[url]
+
+    def __bool__(self):
+        return self.bloom.count > 0
@@ -1,4 +1,5 @@
 import pytest
+import socket
 import sys
 import types
 from pathlib import Path
@@ -12,6 +13,38 @@ if str(MODULE_4_ROOT) not in sys.path:
     sys.path.insert(0, str(MODULE_4_ROOT))
 
 
+# Hosts tests may reach: loopback servers, mock sites, and a local Postgres.
+LOOPBACK_HOSTS = {"127.0.0.1", "::1", "localhost"}
+
+
+@pytest.fixture(autouse=True)
+def no_external_network(monkeypatch):
+    """Fail any test that resolves or connects to a non-loopback host."""
+    attempts = []
+    real_getaddrinfo = socket.getaddrinfo
+    real_connect = socket.socket.connect
+
+    def guarded_getaddrinfo(host, *args, **kwargs):
+        if host not in LOOPBACK_HOSTS and host is not None:
+            attempts.append(host)
+            raise socket.gaierror(f"external lookup blocked in tests: {host}")
+        return real_getaddrinfo(host, *args, **kwargs)
+
+    def guarded_connect(sock, address):
+        host = address[0] if isinstance(address, tuple) else None
+        if host is not None and host not in LOOPBACK_HOSTS:
+            attempts.append(host)
+            raise ConnectionRefusedError(f"external connection blocked in tests: {host}")
+        return real_connect(sock, address)
+
+    monkeypatch.setattr(socket, "getaddrinfo", guarded_getaddrinfo)
+    monkeypatch.setattr(socket.socket, "connect", guarded_connect)
+    yield
+    # Code under test often swallows the blocked error, so report it here instead.
+    if attempts:
+        pytest.fail(f"Test tried to reach external hosts: {sorted(set(attempts))}")
+
+
 @pytest.fixture
 def fake_results_payload():
     """Shared deterministic analysis payload for web-layer tests."""
@@ -4,6 +4,9 @@
 class FakeCursor:
     """Minimal cursor fake that records executed SQL and returns canned rows."""
 
+    # Every statement reports one affected row, like a successful single-row INSERT.
+    rowcount = 1
+
     def __init__(self, fetchone_values=None, fetchall_values=None):
         self.fetchone_values = list(fetchone_values or [])
         self.fetchall_values = list(fetchall_values or [])
@@ -18,6 +21,10 @@ class FakeCursor:
     def execute(self, query, params=None):
         self.executed.append((query, params))
 
+    def executemany(self, query, params_seq):
+        for params in params_seq:
+            self.executed.append((query, params))
+
     def fetchone(self):
         if self.fetchone_values:
             return self.fetchone_values.pop(0)
@@ -28,6 +35,10 @@ class FakeCursor:
             return self.fetchall_values.pop(0)
         return []
 
+    def __iter__(self):
+        # Server-side cursors are iterated; serve the next canned batch.
+        return iter(self.fetchall())
+
 
 class FakeConn:
     """Minimal connection fake exposing cursor context and commit tracking."""
@@ -35,6 +46,7 @@ class FakeConn:
     def __init__(self, cursor):
         self._cursor = cursor
         self.committed = False
+        self.cursor_names = []
 
     def __enter__(self):
         return self
@@ -42,7 +54,9 @@ class FakeConn:
     def __exit__(self, exc_type, exc, tb):
         return False
 
-    def cursor(self):
+    def cursor(self, name=None):
+        if name is not None:
+            self.cursor_names.append(name)
         return self._cursor
 
     def commit(self):
@@ -0,0 +1,80 @@
+import sys
+from pathlib import Path
+from urllib import error, request
+
+import pytest
+
+# Crawls the benchmark's mock GradCafe server end to end so its markup stays parseable.
+pytestmark = [pytest.mark.web, pytest.mark.integration]
+
+MODULE_5_ROOT = Path(__file__).resolve().parents[1]
+SRC_ROOT = MODULE_5_ROOT / "src"
+BENCH_ROOT = MODULE_5_ROOT / "benchmarks"
+for path in (SRC_ROOT, BENCH_ROOT):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
+
+
+def test_scraper_reads_every_synthetic_record(monkeypatch, capsys):
+    """Validate the thread and async engines parse all mock pages like real ones."""
+    import scrape
+    from mock_gradcafe import MockGradCafe, synthetic_record
+
+    with MockGradCafe(pages=2, per_page=5) as site:
+        monkeypatch.setattr(scrape, "BASE_URL", site.base_url)
+        monkeypatch.setattr(scrape, "NUM_PAGES_OF_DATA", 3)
+        payloads = scrape.scrape_data(retry=False)
+        out = capsys.readouterr().out
+        async_payloads = scrape.scrape_data(engine="async", retry=False)
+        last_id = site.last_result_id
+
+    # Assertions: the empty third page is found by discovery and never crawled.
+    assert "Discovered 2 survey pages (cap 3) with 3 probe requests" in out
+    # Assertions: every page was negotiated as gzip and decoded before parsing.
+    assert "Compression: 15/15 responses compressed" in out
+
+    # Assertions: every record is found once, with survey and result fields filled in.
+    by_url = {p["url"]: p for p in payloads}
+    assert len(by_url) == len(payloads) == 10
+    newest = by_url[f"{site.base_url}/result/{last_id}"]
+    expected = synthetic_record(last_id)
+    assert newest["university"] == expected["school"]
+    assert newest["GRE V"] == expected["gre_v"]
+    assert expected["term"] in newest["term"] and newest["date added"] == expected["added"]
+    assert sorted(p["url"] for p in async_payloads) == sorted(by_url)
+    capsys.readouterr()
+
+
+def test_mock_server_injects_errors_and_404s():
+    """Validate error injection, unknown ids, and request counters."""
+    from mock_gradcafe import MockGradCafe
+
+    with MockGradCafe(pages=1, per_page=1, error_rate=1.0) as site:
+        with pytest.raises(error.HTTPError) as excinfo:
+            request.urlopen(f"{site.base_url}/survey/?page=1")
+        assert excinfo.value.code == 503
+        site.error_rate = 0.0
+        for path in ("/result/1", "/result/abc", "/about"):
+            with pytest.raises(error.HTTPError) as excinfo:
+                request.urlopen(site.base_url + path)
+            assert excinfo.value.code == 404
+        assert site.counters == {"requests": 4, "errors": 1}
+
+
+def test_probed_records_beyond_the_newest_pages_clean(monkeypatch, capsys):
+    """Validate a 200-record refresh finds term/date for every record and cleans them all."""
+    import clean
+    import scrape
+    from mock_gradcafe import MockGradCafe
+
+    with MockGradCafe(pages=15, per_page=20) as site:
+        monkeypatch.setattr(scrape, "BASE_URL", site.base_url)
+        start = site.last_result_id - 199
+        raw = scrape.probe_new_results(start, retry=False)
+        out = capsys.readouterr().out
+
+    # Assertions: survey pages are read until the oldest probed id (page 10), not a fixed 5.
+    assert "Probed 220 result ids" in out and "200 new records, 10 survey pages read" in out
+    cleaned = clean.clean_data(raw)
+    assert len(cleaned) == 200
+    assert all(record["term"] and record["date added"] for record in cleaned)
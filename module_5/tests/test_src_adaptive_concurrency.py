@@ -0,0 +1,122 @@
+import sys
+import threading
+from pathlib import Path
+from urllib import error
+
+import pytest
+
+# Exercises the AIMD controller directly; no network or scraper state involved.
+pytestmark = [pytest.mark.web, pytest.mark.integration]
+
+MODULE_5_ROOT = Path(__file__).resolve().parents[1]
+SRC_ROOT = MODULE_5_ROOT / "src"
+if str(SRC_ROOT) not in sys.path:
+    sys.path.insert(0, str(SRC_ROOT))
+
+
+def _fail(controller, exc):
+    """Run one request through ``controller`` that raises ``exc``."""
+    with pytest.raises(type(exc)):
+        with controller.slot():
+            raise exc
+
+
+def test_congestion_classification():
+    """Validate only overload signals count as congestion."""
+    from adaptive_concurrency import is_congestion_error
+
+    # Assertions: 429/5xx and timeouts back off; missing pages and parse errors do not.
+    assert is_congestion_error(error.HTTPError("u", 429, "slow down", None, None))
+    assert is_congestion_error(error.HTTPError("u", 503, "busy", None, None))
+    assert is_congestion_error(TimeoutError())
+    assert not is_congestion_error(error.HTTPError("u", 404, "missing", None, None))
+    assert not is_congestion_error(ValueError("bad html"))
+
+
+def test_additive_increase_and_multiplicative_decrease():
+    """Validate growth per healthy round, halving on congestion, and the bounds."""
+    from adaptive_concurrency import AIMDController
+
+    controller = AIMDController(4, minimum=2, maximum=6)
+    # Assertions: four healthy requests at limit 4 add roughly one slot.
+    for _ in range(4):
+        with controller.slot():
+            pass
+    assert controller.limit == 4
+    with controller.slot():
+        pass
+    assert controller.limit == 5
+
+    for _ in range(50):
+        with controller.slot():
+            pass
+    assert controller.stats() == {"limit": 6, "peak": 6, "decreases": 0}
+
+    # Assertions: congestion halves the limit but never below the minimum.
+    _fail(controller, error.HTTPError("u", 429, "slow down", None, None))
+    assert controller.limit == 3
+    _fail(controller, TimeoutError())
+    assert controller.limit == 2
+    # Non-congestion failures leave the level alone.
+    _fail(controller, error.HTTPError("u", 404, "missing", None, None))
+    assert controller.stats() == {"limit": 2, "peak": 6, "decreases": 2}
+
+    # Assertions: the starting level is clamped into [minimum, maximum].
+    assert AIMDController(100, maximum=30).limit == 30
+
+
+def test_one_cut_per_burst_and_latency_backoff(monkeypatch):
+    """Validate in-flight failures cut once and slow responses trigger a backoff."""
+    import adaptive_concurrency
+    from adaptive_concurrency import AIMDController
+
+    clock = {"now": 100.0}
+    monkeypatch.setattr(adaptive_concurrency.time, "monotonic", lambda: clock["now"])
+
+    controller = AIMDController(8)
+    first = controller.slot()
+    second = controller.slot()
+    first.__enter__()
+    second.__enter__()
+    clock["now"] += 1
+    busy = error.HTTPError("u", 503, "busy", None, None)
+    # Assertions: both requests started before the first cut, so only one cut applies.
+    assert first.__exit__(type(busy), busy, None) is False
+    assert second.__exit__(type(busy), busy, None) is False
+    assert controller.stats()["limit"] == 4
+    assert controller.stats()["decreases"] == 1
+
+    # Assertions: smoothed latency above the target is treated as congestion.
+    slow = AIMDController(8, latency_target=2.0)
+    with slow.slot():
+        clock["now"] += 5
+    assert slow.limit == 4
+
+
+def test_slot_blocks_at_limit():
+    """Validate no more than ``limit`` requests run at once."""
+    from adaptive_concurrency import AIMDController
+
+    controller = AIMDController(2, maximum=2)
+    lock = threading.Lock()
+    state = {"running": 0, "peak": 0}
+    gate = threading.Event()
+
+    def request():
+        with controller.slot():
+            with lock:
+                state["running"] += 1
+                state["peak"] = max(state["peak"], state["running"])
+            gate.wait(timeout=5)
+            with lock:
+                state["running"] -= 1
+
+    threads = [threading.Thread(target=request) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    gate.set()
+    for thread in threads:
+        thread.join(timeout=5)
+    # Assertions: five callers were served at most two at a time.
+    assert state["running"] == 0
+    assert 1 <= state["peak"] <= 2
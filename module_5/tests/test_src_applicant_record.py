@@ -0,0 +1,50 @@
+import json
+import pickle
+import sys
+from pathlib import Path
+
+import pytest
+
+# Covers the slotted payload record's mapping behaviour and its dict/JSON edges.
+pytestmark = [pytest.mark.web, pytest.mark.integration]
+
+MODULE_5_ROOT = Path(__file__).resolve().parents[1]
+SRC_ROOT = MODULE_5_ROOT / "src"
+if str(SRC_ROOT) not in sys.path:
+    sys.path.insert(0, str(SRC_ROOT))
+
+
+def test_record_reads_and_writes_like_a_payload_dict():
+    """Validate blank defaults, item access, and rejection of unknown or deleted keys."""
+    from applicant_record import FIELD_SLOTS, ApplicantRecord
+
+    record = ApplicantRecord({"university": "MIT", "GPA": "3.90"})
+    record["comments"] = None
+    # Assertions: every raw field exists, in scrape order, with unset ones blank.
+    assert list(record) == list(FIELD_SLOTS) and len(record) == 14
+    assert record["university"] == "MIT" and record["term"] == "" and record["comments"] is None
+    assert not hasattr(record, "__dict__")
+
+    # Assertions: unknown keys and deletion fail instead of silently growing the record.
+    with pytest.raises(KeyError):
+        record["GRE Q"]
+    with pytest.raises(KeyError):
+        record["GRE Q"] = "160"
+    with pytest.raises(KeyError):
+        ApplicantRecord({"extra": "x"})
+    with pytest.raises(TypeError):
+        del record["GPA"]
+    assert record.get("GRE Q", "missing") == "missing"
+
+
+def test_record_converts_at_dict_json_and_pickle_edges():
+    """Validate to_dict/from_dict, dict equality, JSON via default=dict, and pickling."""
+    from applicant_record import ApplicantRecord
+
+    payload = {key: f"v{i}" for i, key in enumerate(ApplicantRecord())}
+    record = ApplicantRecord.from_dict(payload)
+    # Assertions: a record and its dict are interchangeable for comparisons and output.
+    assert record == payload and record.to_dict() == payload
+    assert json.loads(json.dumps([record], default=dict)) == [payload]
+    assert pickle.loads(pickle.dumps(record)) == record
+    assert repr(record).startswith("ApplicantRecord({'university': 'v0'")
@@ -63,21 +63,152 @@ def test_clean_remove_whitespace_and_clean_data_branches():
     assert cleaned[0]["GRE AW"] is None
     assert cleaned[1]["comments"] == "kept"
 
+    # Assertions: dict input comes back as new records equal to the cleaned dicts; input untouched.
+    from applicant_record import ApplicantRecord
+
+    assert raw[0] == _sample_payload(term="Fall 2026")
+    assert all(isinstance(record, ApplicantRecord) for record in cleaned)
+    assert cleaned[1] == dict(cleaned[1].to_dict()) and cleaned[1]["university"] == "MIT"
+
+    # Assertions: keys a record cannot hold are rejected instead of dropped.
+    with pytest.raises(ValueError, match="source"):
+        clean.clean_data([{**_sample_payload(), "source": "forum"}])
+
+
+def test_iter_clean_data_streams_records_like_clean_data():
+    """Validate the streaming cleaner is lazy and matches the list cleaner record for record."""
+    import clean
+
+    pulled = []
+
+    def source():
+        for term in ("\nFall 2026\n\tInternational", "Spring 2025\n", "Summer 2025"):
+            pulled.append(term)
+            yield _sample_payload(term=term)
+
+    stream = clean.iter_clean_data(source())
+    first = next(stream)
+    # Assertions: records are cleaned one at a time, as the source yields them.
+    assert pulled == ["\nFall 2026\n\tInternational"]
+    assert first["term"] == "Fall 2026" and first["comments"] is None
+    assert next(stream)["term"] == "Spring 2025"
+    # Assertions: a term cell without fall/spring fails the same way clean_data does.
+    with pytest.raises(IndexError):
+        next(stream)
+
+    raw = [_sample_payload(term="Fall 2026"), _sample_payload(term="Spring 2025")]
+    raw[1]["university"] = "M\tI\nT"
+    expected = [record.to_dict() for record in clean.clean_data([dict(p) for p in raw])]
+    assert [record.to_dict() for record in clean.iter_clean_data(raw)] == expected
+    assert expected[1]["university"] == "MIT"
+
+
+def test_clean_data_parallel_matches_serial_output(monkeypatch):
+    """Validate the process-pool path returns byte-identical records in input order."""
+    import json
+
+    import clean
+    from applicant_record import ApplicantRecord
+
+    def batch():
+        payloads = []
+        for index in range(11):
+            payload = _sample_payload(term=f"\nFall {2020 + index}\n\tInternational")
+            payload["university"] = f"Uni\t{index}\n"
+            payload["comments"] = "" if index % 2 else f"note {index}"
+            payload["GPA"] = "0.00" if index % 3 else "3.9"
+            payloads.append(ApplicantRecord(payload) if index % 4 else payload)
+        return payloads
+
+    serial = clean.clean_data(batch())
+    monkeypatch.setattr(clean, "PARALLEL_CLEAN_MIN_RECORDS", 10)
+    raw = batch()
+    parallel = clean.clean_data(raw, workers=2, chunk_size=3)
+    # Assertions: same JSON bytes and order as the serial path; records are cleaned in place.
+    assert json.dumps(parallel, default=dict) == json.dumps(serial, default=dict)
+    assert all(isinstance(record, ApplicantRecord) for record in parallel)
+    assert parallel[1] is raw[1] and parallel[1]["term"] == "Fall 2021"
+
+    # Assertions: the worker entry point cleans tuples of slot values the same way.
+    rows = [clean._slot_values(ApplicantRecord(p)) for p in batch()[:3]]
+    copy = ApplicantRecord()
+    clean._set_slot_values(copy, rows[0])
+    assert copy == ApplicantRecord(batch()[0])
+    assert clean._clean_rows(rows) == [clean._slot_values(r) for r in serial[:3]]
+
+    # Assertions: chunks are submitted in a bounded window and still written back in order.
+    events = []
+
+    class WindowPool:
+        def __init__(self, max_workers):
+            self.max_workers = max_workers
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            return False
+
+        def submit(self, fn, chunk):
+            events.append(1)
+            rows = fn(chunk)
+            return types.SimpleNamespace(result=lambda: events.append(-1) or rows)
+
+    monkeypatch.setattr(clean, "ProcessPoolExecutor", WindowPool)
+    windowed = clean.clean_data(batch(), workers=2, chunk_size=1)
+    assert json.dumps(windowed, default=dict) == json.dumps(serial, default=dict)
+    in_flight = [sum(events[:i + 1]) for i in range(len(events))]
+    assert max(in_flight) == 2 * clean.CLEAN_CHUNKS_PER_WORKER and in_flight[-1] == 0
+
+    # Assertions: below the threshold the pool is never started; bad sizes are rejected.
+    monkeypatch.setattr(clean, "ProcessPoolExecutor", None)
+    assert len(clean.clean_data(batch()[:9], workers=4)) == 9
+    for bad in ({"workers": 0}, {"chunk_size": -1}, {"workers": 2.0}, {"chunk_size": True}):
+        with pytest.raises(ValueError):
+            clean.clean_data(batch(), **bad)
+
 
 def test_clean_save_and_load_data(tmp_path, monkeypatch):
-    """Validate JSON save/load helpers for cleaned payloads."""
+    """Validate JSONL save/load helpers for cleaned payloads, including legacy JSON arrays."""
     import clean
 
-    # Setup: save sample JSON to tmp path, then load from controlled working dir.
+    # Setup: save sample records to tmp path, then load from controlled working dir.
     data = [{"x": 1}, {"x": 2}]
-    out_path = tmp_path / "sample.json"
-    clean.save_data(data, str(out_path))
-    assert json.loads(out_path.read_text()) == data
+    out_path = tmp_path / "sample.jsonl"
+    assert clean.save_data(data, str(out_path)) == 2
+    assert [json.loads(line) for line in out_path.read_text().splitlines()] == data
+    assert clean.save_data(iter([{"x": 3}]), str(out_path), append=True) == 1
 
     monkeypatch.chdir(tmp_path)
+    out_path.rename(tmp_path / "applicant_data.jsonl")
+    # Assertions: persisted JSONL round-trips without mutation; appends land at the end.
+    assert clean.load_data() == data + [{"x": 3}]
+    # Assertions: a legacy applicant_data.json array still loads.
     (tmp_path / "applicant_data.json").write_text(json.dumps(data))
-    # Assertions: persisted JSON round-trips without mutation.
-    assert clean.load_data() == data
+    assert clean.load_data("applicant_data.json") == data
+
+
+def test_save_data_append_migrates_a_legacy_json_dataset_first(tmp_path):
+    """Validate the first append converts applicant_data.json so old records are kept."""
+    import clean
+
+    legacy = [{"url": "https://x/result/1"}, {"url": "https://x/result/2"}]
+    (tmp_path / "applicant_data.json").write_text(json.dumps(legacy))
+    target = tmp_path / "applicant_data.jsonl"
+
+    # Assertions: the legacy array is converted before the new records are appended.
+    assert clean.save_data([{"url": "https://x/result/3"}], str(target), append=True) == 1
+    assert clean.load_data(str(target)) == legacy + [{"url": "https://x/result/3"}]
+    assert not (tmp_path / "applicant_data.jsonl.partial").exists()
+    # Assertions: later appends and full saves never convert the legacy file again.
+    clean.save_data([{"url": "https://x/result/4"}], str(target), append=True)
+    assert len(clean.load_data(str(target))) == 4
+    assert clean._migrate_legacy_dataset(target) == 0
+    assert clean._migrate_legacy_dataset(tmp_path / "applicant_data.json") == 0
+    fresh = tmp_path / "fresh" / "applicant_data.jsonl"
+    fresh.parent.mkdir()
+    assert clean.save_data([{"x": 1}], str(fresh), append=True) == 1
+    assert clean.load_data(str(fresh)) == [{"x": 1}]
 
 
 def test_main_run_llm_pipeline_success_and_error(tmp_path, monkeypatch, capsys):
@@ -97,7 +228,7 @@ def test_main_run_llm_pipeline_success_and_error(tmp_path, monkeypatch, capsys):
 
     monkeypatch.setattr(main.subprocess, "run", fake_run_ok)
     # Assertions: success path runs subprocess and emits completion message.
-    main._run_llm_pipeline("applicant_data.json", "out.jsonl")
+    main._run_llm_pipeline("applicant_data.jsonl", "out.jsonl")
     assert called["ok"] is True
     assert "Pipeline executed successfully!" in capsys.readouterr().out
 
@@ -106,7 +237,7 @@ def test_main_run_llm_pipeline_success_and_error(tmp_path, monkeypatch, capsys):
 
     monkeypatch.setattr(main.subprocess, "run", fake_run_fail)
     # Assertions: failure path is reported via printed status (without propagating error).
-    main._run_llm_pipeline("applicant_data.json", "out2.jsonl")
+    main._run_llm_pipeline("applicant_data.jsonl", "out2.jsonl")
     assert "failed with error code: 3" in capsys.readouterr().out
 
 
@@ -141,17 +272,6 @@ def test_main_append_helpers_and_main_flow(tmp_path, monkeypatch):
     # Setup: exercise append helpers directly, then monkeypatch orchestration side effects.
     monkeypatch.chdir(tmp_path)
 
-    # _append_json_records branch: file exists but non-list payload
-    j = tmp_path / "full.json"
-    j.write_text(json.dumps({"bad": "shape"}))
-    main._append_json_records([{"a": 1}], j)
-    assert json.loads(j.read_text()) == [{"a": 1}]
-
-    # _append_json_records branch: file missing
-    j2 = tmp_path / "new.json"
-    main._append_json_records([{"a": 2}], j2)
-    assert json.loads(j2.read_text()) == [{"a": 2}]
-
     # _append_jsonl_records branch: blank lines are skipped
     src = tmp_path / "in.jsonl"
     dst = tmp_path / "out.jsonl"
@@ -160,15 +280,45 @@ def test_main_append_helpers_and_main_flow(tmp_path, monkeypatch):
     assert dst.read_text() == '{"a":1}\n{"a":2}\n'
 
     flow = []
+    scrape_kwargs = {}
     # Record call sequence to verify orchestration order without invoking real side effects.
-    monkeypatch.setattr(main, "scrape_data", lambda: [{"x": 1}])
-    monkeypatch.setattr(main, "clean_data", lambda raw: [{"y": raw[0]["x"]}])
-    monkeypatch.setattr(main, "save_data", lambda data, path: flow.append(("save", path, data)))
+    monkeypatch.setattr(main, "scrape_data", lambda **kwargs: scrape_kwargs.update(kwargs) or [{"x": 1}])
+    clean_kwargs = {}
+    monkeypatch.setattr(main, "clean_data",
+                        lambda raw, **kwargs: clean_kwargs.update(kwargs) or [{"y": raw[0]["x"]}])
+    monkeypatch.setattr(main, "save_data",
+                        lambda data, path, append=False: flow.append(("save", path, data)))
     monkeypatch.setattr(main, "_run_llm_pipeline", lambda i, o: flow.append(("llm", i, o)))
+    (tmp_path / main.CHECKPOINT_PATH).write_text("state")
     main.main()
     # Assertions: `main()` performs save first and then runs LLM pipeline on saved file.
-    assert ("save", "applicant_data.json", [{"y": 1}]) in flow
-    assert ("llm", "applicant_data.json", "llm_extend_applicant_data.jsonl") in flow
+    assert ("save", "applicant_data.jsonl", [{"y": 1}]) in flow
+    assert clean_kwargs == {}
+    assert ("llm", "applicant_data.jsonl", "llm_extend_applicant_data.jsonl") in flow
+    # Assertions: full crawls are checkpointed, and the checkpoint is dropped once output is saved.
+    assert scrape_kwargs == {"checkpoint": main.CHECKPOINT_PATH, "resume": False,
+                             "metrics_report": None, "live_progress": False}
+    assert not (tmp_path / main.CHECKPOINT_PATH).exists()
+    main.main(resume=True)
+    assert scrape_kwargs["resume"] is True
+
+    # Assertions: a crawl id switches to the distributed queue instead of the checkpoint.
+    distributed = {}
+    monkeypatch.setattr(main, "distributed_scrape_data",
+                        lambda crawl_id, **kwargs: distributed.update(kwargs, id=crawl_id) or [{"x": 2}])
+    main.main(crawl_id="nightly")
+    assert distributed == {"id": "nightly", "metrics_report": None, "live_progress": False}
+    assert ("save", "applicant_data.jsonl", [{"y": 2}]) in flow
+
+    # Assertions: the CLI exposes --resume, --metrics-report, --progress, --crawl-id and --worker.
+    assert main._parse_args(["--resume"]).resume is True
+    assert main._parse_args([]).resume is False
+    args = main._parse_args(["--metrics-report", "run.json", "--progress"])
+    assert args.metrics_report == "run.json" and args.progress is True
+    args = main._parse_args(["--crawl-id", "nightly", "--worker"])
+    assert args.crawl_id == "nightly" and args.worker is True
+    with pytest.raises(SystemExit):
+        main._parse_args(["--worker"])
 
 
 def test_main_update_new_records_no_new_and_updated(tmp_path, monkeypatch):
@@ -177,45 +327,99 @@ def test_main_update_new_records_no_new_and_updated(tmp_path, monkeypatch):
 
     # Setup: fix DB lookup responses so update path receives deterministic scrape bounds.
     monkeypatch.chdir(tmp_path)
-    monkeypatch.setattr(main, "get_existing_urls", lambda: {"u1"})
+    monkeypatch.setattr(main, "load_known_results", lambda path: {"u1"})
     monkeypatch.setattr(main, "get_max_result_page", lambda: 10)
 
     # no_new branch
-    monkeypatch.setattr(main, "scrape_data", lambda **kwargs: [])
+    monkeypatch.setattr(main, "probe_new_results", lambda start_id, **kwargs: [])
     # Assertions: no-new branch exits early with minimal status payload.
     assert main.update_new_records() == {"status": "no_new"}
 
     # updated branch
     calls = []
-    monkeypatch.setattr(main, "scrape_data", lambda **kwargs: [{"url": "u2"}])
+    probe_args = {}
+
+    def fake_probe(start_id, **kwargs):
+        probe_args.update(kwargs, start_id=start_id)
+        return [{"url": "u2"}]
+
+    monkeypatch.setattr(main, "probe_new_results", fake_probe)
     monkeypatch.setattr(main, "clean_data", lambda raw: [{"cleaned": True}])
-    monkeypatch.setattr(main, "save_data", lambda data, path: calls.append(("save", path)))
+    monkeypatch.setattr(main, "save_data",
+                        lambda data, path, append=False: calls.append(("save", path, append)))
     monkeypatch.setattr(main, "_run_llm_pipeline", lambda i, o: calls.append(("llm", i, o)))
-    monkeypatch.setattr(main, "_append_json_records", lambda r, p: calls.append(("append_json", p)))
     monkeypatch.setattr(main, "_append_jsonl_records", lambda s, t: calls.append(("append_jsonl", s, t)))
     monkeypatch.setattr(main, "stream_jsonl_to_postgres", lambda p: calls.append(("stream", p)))
     out = main.update_new_records()
     # Assertions: updated branch writes/loads only "_new" artifacts and returns counts.
     assert out == {"status": "updated", "records": 1}
-    assert any(call[0] == "save" and Path(call[1]).name == "applicant_data_new.json" for call in calls)
+    # Assertions: with a known max id, updates probe result ids from the next one.
+    assert probe_args == {"start_id": 11, "existing_urls": {"u1"}}
+    saves = [(Path(call[1]).name, call[2]) for call in calls if call[0] == "save"]
+    assert saves == [("applicant_data_new.jsonl", False), ("applicant_data.jsonl", True)]
     assert any(call[0] == "stream" and Path(call[1]).name == "llm_extend_applicant_data_new.jsonl" for call in calls)
 
+    # Assertions: an empty database falls back to the early-stop survey walk.
+    scrape_kwargs = {}
+    monkeypatch.setattr(main, "get_max_result_page", lambda: None)
+    monkeypatch.setattr(main, "iter_scrape_data", lambda **kwargs: scrape_kwargs.update(kwargs) or iter([]))
+    assert main.update_new_records() == {"status": "no_new"}
+    assert scrape_kwargs == {"existing_urls": {"u1"}, "incremental": True}
+
+
+def test_main_update_streams_batches_downstream_in_order(monkeypatch):
+    """Validate a streamed pull is cleaned and loaded batch by batch, newest first."""
+    import main
+
+    # Setup: five streamed payloads in batches of two.
+    monkeypatch.setattr(main, "INGEST_BATCH_SIZE", 2)
+    monkeypatch.setattr(main, "load_known_results", lambda path: set())
+    monkeypatch.setattr(main, "get_max_result_page", lambda: None)
+    pulled = []
+
+    def fake_stream(**kwargs):
+        for result_id in (50, 49, 48, 47, 46):
+            pulled.append(result_id)
+            yield {"url": f"/result/{result_id}"}
+
+    loaded = []
+    monkeypatch.setattr(main, "iter_scrape_data", fake_stream)
+    monkeypatch.setattr(main, "clean_data", lambda raw: list(raw))
+    monkeypatch.setattr(main, "save_data", lambda data, path, append=False: append or loaded.append(
+        [d["url"] for d in data]))
+    monkeypatch.setattr(main, "_run_llm_pipeline", lambda i, o: None)
+    monkeypatch.setattr(main, "_append_jsonl_records", lambda s, t: None)
+    monkeypatch.setattr(main, "stream_jsonl_to_postgres", lambda p: None)
+
+    # Assertions: every payload is pulled once and batches load in stream order.
+    assert main.update_new_records() == {"status": "updated", "records": 5}
+    assert pulled == [50, 49, 48, 47, 46]
+    assert loaded == [["/result/50", "/result/49"], ["/result/48", "/result/47"], ["/result/46"]]
+    assert list(main._batched([], 3)) == []
+
 
 def test_main_module_main_guard_executes(monkeypatch):
     """Validate ``main.py`` script guard executes pipeline side effects."""
     # Setup: install fake modules so running `main.py` as script has no external dependencies.
     fake_scrape = types.ModuleType("scrape")
-    fake_scrape.scrape_data = lambda: []
+    fake_scrape.scrape_data = lambda **kwargs: []
+    fake_scrape.probe_new_results = lambda start_id, **kwargs: []
+    fake_scrape.iter_scrape_data = lambda **kwargs: iter([])
+    workers = []
+    fake_distributed = types.ModuleType("distributed_crawl")
+    fake_distributed.crawl_worker = lambda crawl_id, **kwargs: workers.append(crawl_id)
+    fake_distributed.distributed_scrape_data = lambda crawl_id, **kwargs: []
     fake_clean = types.ModuleType("clean")
-    fake_clean.clean_data = lambda raw: raw
-    fake_clean.save_data = lambda data, path: None
+    fake_clean.clean_data = lambda raw, **kwargs: raw
+    fake_clean.save_data = lambda data, path, append=False: None
     fake_clean.load_data = lambda: []
     fake_load = types.ModuleType("load_data")
     fake_load.stream_jsonl_to_postgres = lambda path: None
-    fake_load.get_existing_urls = lambda: set()
+    fake_load.load_known_results = lambda path: set()
     fake_load.get_max_result_page = lambda: None
 
     monkeypatch.setitem(sys.modules, "scrape", fake_scrape)
+    monkeypatch.setitem(sys.modules, "distributed_crawl", fake_distributed)
     monkeypatch.setitem(sys.modules, "clean", fake_clean)
     monkeypatch.setitem(sys.modules, "load_data", fake_load)
 
@@ -229,17 +433,24 @@ def test_main_module_main_guard_executes(monkeypatch):
     monkeypatch.setitem(sys.modules, "subprocess", FakeSubprocess())
 
     tests_dir = MODULE_4_ROOT / "tests"
-    generated_json = tests_dir / "applicant_data.json"
+    generated_data = tests_dir / "applicant_data.jsonl"
     generated_jsonl = tests_dir / "llm_extend_applicant_data.jsonl"
-    generated_json.unlink(missing_ok=True)
+    generated_data.unlink(missing_ok=True)
     generated_jsonl.unlink(missing_ok=True)
 
     monkeypatch.chdir(tests_dir)
+    monkeypatch.setattr(sys, "argv", ["main.py"])
     # Assertions: script guard runs pipeline and creates expected relative output artifact.
     runpy.run_path(str(SRC_ROOT / "main.py"), run_name="__main__")
 
     # Running main.py as a script writes relative outputs in the current CWD.
     assert generated_jsonl.exists()
-    generated_json.unlink(missing_ok=True)
+    generated_data.unlink(missing_ok=True)
     generated_jsonl.unlink(missing_ok=True)
     assert called["n"] == 1
+
+    # Assertions: worker mode only works the queue; nothing is cleaned or normalized.
+    monkeypatch.setattr(sys, "argv", ["main.py", "--crawl-id", "nightly", "--worker"])
+    runpy.run_path(str(SRC_ROOT / "main.py"), run_name="__main__")
+    assert workers == ["nightly"] and called["n"] == 1
+    assert not generated_jsonl.exists()
@@ -0,0 +1,41 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+# Exercises the SQLite crawl checkpoint on a temporary file.
+pytestmark = [pytest.mark.web, pytest.mark.integration]
+
+MODULE_5_ROOT = Path(__file__).resolve().parents[1]
+SRC_ROOT = MODULE_5_ROOT / "src"
+if str(SRC_ROOT) not in sys.path:
+    sys.path.insert(0, str(SRC_ROOT))
+
+
+def test_checkpoint_persists_pages_and_results_across_reopen(tmp_path):
+    """Validate saved progress survives a reopen and can be reset."""
+    from crawl_checkpoint import CrawlCheckpoint
+
+    path = tmp_path / "state" / "crawl.sqlite3"
+    checkpoint = CrawlCheckpoint(path)
+    # Pages are saved per window; empty pages are left for the next attempt.
+    checkpoint.record_pages([(2, [["/result/3", "c"]]), (1, [["/result/2", "b"], ["/result/1", "a"]]), (3, [])])
+    checkpoint.record_results([{"url": "u1", "term": "Fall 2026"}])
+    checkpoint.record_results([{"url": "u1", "term": "Fall 2026", "GPA": "3.9"}, {"url": "u2"}])
+    checkpoint.close()
+
+    reopened = CrawlCheckpoint(path)
+    # Assertions: rows come back in page order, and results are keyed by URL.
+    assert reopened.completed_pages() == {1, 2}
+    assert reopened.saved_rows() == [["/result/2", "b"], ["/result/1", "a"], ["/result/3", "c"]]
+    assert reopened.completed_urls() == {"u1", "u2"}
+    saved = {payload["url"]: payload for payload in reopened.saved_payloads()}
+    assert saved["u1"]["GPA"] == "3.9" and saved["u1"]["term"] == "Fall 2026"
+    assert saved["u2"]["GPA"] == ""
+    assert reopened.stats() == {"pages": 2, "results": 2}
+
+    # Assertions: reset starts the next crawl from scratch.
+    reopened.reset()
+    assert reopened.stats() == {"pages": 0, "results": 0}
+    assert reopened.saved_rows() == [] and reopened.saved_payloads() == []
+    reopened.close()
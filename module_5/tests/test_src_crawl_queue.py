@@ -0,0 +1,281 @@
+import json
+import multiprocessing
+import sys
+import threading
+import types
+import uuid
+from pathlib import Path
+
+import pytest
+from tests.test_doubles import FakeConn, FakeCursor
+
+# Exercises the Postgres crawl queue with DB fakes, an in-memory queue shared by workers,
+# and (when a database is reachable) several worker processes against a live Postgres.
+pytestmark = [pytest.mark.db, pytest.mark.integration]
+
+MODULE_5_ROOT = Path(__file__).resolve().parents[1]
+SRC_ROOT = MODULE_5_ROOT / "src"
+BENCH_ROOT = MODULE_5_ROOT / "benchmarks"
+for path in (SRC_ROOT, BENCH_ROOT):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
+
+
+def test_crawl_queue_statements_and_row_decoding(monkeypatch):
+    """Validate queue SQL parameters, claim decoding, and stats aggregation."""
+    import crawl_queue
+    from applicant_record import ApplicantRecord
+
+    cursor = FakeCursor(fetchone_values=[None, ("crawl_tasks",)], fetchall_values=[
+        [("survey", "7", None), ("result", "https://x/result/42", {"url": "https://x/result/42"})],
+        [("survey", "done", 2, 0), ("result", "pending", 3, 3), ("result", "claimed", 1, 1)],
+        [({"url": "https://x/result/42", "GPA": "3.9"},)],
+    ])
+    conn = FakeConn(cursor)
+    monkeypatch.setattr(crawl_queue.psycopg, "connect", lambda *args, **kwargs: conn)
+    queue = crawl_queue.CrawlQueue("nightly", conn_info="dbname=test")
+
+    queue.ensure_schema()
+    queue.ensure_schema()
+    # Assertions: the table is only created when it does not exist yet.
+    assert sum("CREATE TABLE" in query for query, _ in cursor.executed) == 1
+    queue.enqueue_pages([1, 2])
+    # Assertions: survey pages sort ahead of every result id, page 1 first.
+    inserts = [params for query, params in cursor.executed if "VALUES (%s, 'survey'" in query]
+    assert inserts == [("nightly", "1", crawl_queue.SURVEY_PRIORITY_BASE - 1),
+                       ("nightly", "2", crawl_queue.SURVEY_PRIORITY_BASE - 2)]
+
+    tasks = queue.claim("w1", 5)
+    # Assertions: claims skip locked rows and decode page numbers and seed records.
+    claim_sql, claim_params = cursor.executed[-1]
+    assert "FOR UPDATE SKIP LOCKED" in claim_sql
+    assert claim_params == ("w1", "nightly", crawl_queue.MAX_ATTEMPTS, crawl_queue.LEASE_SECONDS, 5)
+    assert tasks[0] == ("survey", 7, None)
+    assert isinstance(tasks[1][2], ApplicantRecord) and tasks[1][2]["url"] == "https://x/result/42"
+
+    seed = ApplicantRecord.from_dict({"url": "https://x/result/42"})
+    queue.complete_page(7, [("https://x/result/42", seed), ("https://x/result/about", seed)])
+    # Assertions: result tasks are ranked by id (no id ranks last) in the page's transaction.
+    results = [params for query, params in cursor.executed if "VALUES (%s, 'result'" in query]
+    assert [params[2] for params in results] == [42, 0]
+    assert json.loads(results[0][3])["url"] == "https://x/result/42"
+    assert cursor.executed[-1][1] == ("nightly", "7")
+    queue.complete_page(8, [])
+
+    executed = len(cursor.executed)
+    queue.complete_results([])
+    queue.release([])
+    assert len(cursor.executed) == executed
+    queue.complete_results([seed])
+    queue.release([("survey", 8), ("result", "https://x/result/43")])
+    assert cursor.executed[-1][1] == (crawl_queue.MAX_ATTEMPTS, "nightly", "result",
+                                      "https://x/result/43")
+
+    # Assertions: stats report per kind/status counts plus the tasks still open.
+    assert queue.stats() == {"open": 4, "survey_done": 2, "result_pending": 3, "result_claimed": 1}
+    assert queue.saved_payloads()[0]["GPA"] == "3.9"
+    assert conn.committed is True
+
+    # Assertions: the default connection info comes from db_config.
+    monkeypatch.setattr(crawl_queue, "get_db_conn_info", lambda: "dbname=app")
+    assert crawl_queue.CrawlQueue("x").conn_info == "dbname=app"
+
+
+class MemoryQueue:
+    """Thread-safe in-memory stand-in for ``crawl_queue.CrawlQueue``."""
+
+    def __init__(self, max_attempts):
+        self.max_attempts = max_attempts
+        self.lock = threading.Lock()
+        self.tasks = {}
+        self.claims = []
+        self.idle_polls = 0
+
+    def ensure_schema(self):
+        pass
+
+    def enqueue_pages(self, pages):
+        for page in pages:
+            self._add("survey", page, 10 ** 9 - page, None)
+
+    def _add(self, kind, key, priority, seed):
+        self.tasks.setdefault((kind, key), {"priority": priority, "seed": seed, "status": "pending",
+                                            "attempts": 0, "payload": None})
+
+    def claim(self, worker_id, limit):
+        with self.lock:
+            if self.idle_polls:
+                # Pretend another worker holds everything once, to exercise the poll wait.
+                self.idle_polls -= 1
+                return []
+            open_tasks = sorted(
+                (key for key, task in self.tasks.items()
+                 if task["status"] == "pending" and task["attempts"] < self.max_attempts),
+                key=lambda key: -self.tasks[key]["priority"],
+            )[:limit]
+            for key in open_tasks:
+                self.tasks[key].update(status="claimed", attempts=self.tasks[key]["attempts"] + 1)
+                self.claims.append((worker_id, key))
+            return [(kind, key, self.tasks[(kind, key)]["seed"]) for kind, key in open_tasks]
+
+    def complete_page(self, page, seeds):
+        with self.lock:
+            for url, seed in seeds:
+                self._add("result", url, int(url.rsplit("/", 1)[-1]), seed)
+            self.tasks[("survey", page)]["status"] = "done"
+
+    def complete_results(self, payloads):
+        with self.lock:
+            for payload in payloads:
+                self.tasks[("result", payload["url"])].update(status="done", payload=payload)
+
+    def release(self, tasks):
+        with self.lock:
+            for key in tasks:
+                task = self.tasks[key]
+                task["status"] = "failed" if task["attempts"] >= self.max_attempts else "pending"
+
+    def stats(self):
+        with self.lock:
+            counts = {"open": 0}
+            for (kind, _), task in self.tasks.items():
+                name = f"{kind}_{task['status']}"
+                counts[name] = counts.get(name, 0) + 1
+                counts["open"] += task["status"] in ("pending", "claimed")
+            return counts
+
+    def saved_payloads(self):
+        done = [task for (kind, _), task in self.tasks.items()
+                if kind == "result" and task["status"] == "done"]
+        return [task["payload"] for task in sorted(done, key=lambda task: -task["priority"])]
+
+
+def test_distributed_crawl_shares_one_queue_between_workers(monkeypatch, capsys, tmp_path):
+    """Validate coordinator and worker split tasks, retry failures, and collect every payload."""
+    import distributed_crawl
+    import scrape
+    import scrape_http
+
+    fixtures = Path(__file__).resolve().parent / "fixtures"
+    survey_html = (fixtures / "survey_page.html").read_bytes()
+    result_html = (fixtures / "result_page.html").read_bytes()
+    monkeypatch.setattr(scrape, "NUM_PAGES_OF_DATA", 2)
+    monkeypatch.setattr(distributed_crawl, "QUEUE_POLL_SECONDS", 0)
+    calls = []
+
+    def fake_fetch(url, headers=None):
+        calls.append(url)
+        if url.endswith("/result/990002") and calls.count(url) == 1:
+            raise TimeoutError("slow")
+        if "/survey/" in url:
+            return 200, {}, survey_html if url.endswith("page=1") else b"<table></table>"
+        return 200, {}, result_html
+
+    monkeypatch.setattr(scrape_http, "HTTP_CLIENT", types.SimpleNamespace(
+        fetch=fake_fetch,
+        connection_stats=lambda: {"requests": 0, "connections_opened": 0, "connections_reused": 0},
+    ))
+    queue = MemoryQueue(max_attempts=2)
+    monkeypatch.setattr(distributed_crawl, "CrawlQueue", lambda crawl_id: queue)
+
+    # A worker that starts before the coordinator finds nothing open and exits.
+    assert distributed_crawl.crawl_worker("nightly", worker_id="early", retry=False) == 0
+    queue.idle_polls = 1
+    service_runs = []
+    real_run_services = distributed_crawl.run_services
+
+    def counting_run_services(options, workers):
+        service_runs.append(options["metrics_report"])
+        return real_run_services(options, workers)
+
+    monkeypatch.setattr(distributed_crawl, "run_services", counting_run_services)
+    report = tmp_path / "crawl.json"
+    payloads = distributed_crawl.distributed_scrape_data("nightly", worker_id="coord", batch_size=2,
+                                                         retry=False, discover_pages=False,
+                                                         metrics_report=str(report))
+    out = capsys.readouterr().out
+
+    # Assertions: the page-count probe and the crawl share one set of services and one report.
+    assert service_runs == [str(report)]
+    assert json.loads(report.read_text())
+
+    # Assertions: every result is collected once, newest first, despite one failed attempt.
+    assert [p["url"] for p in payloads] == [f"{scrape.BASE_URL}/result/99000{i}" for i in (3, 2, 1)]
+    assert payloads[0]["GPA"] and payloads[0]["term"]
+    assert queue.tasks[("result", f"{scrape.BASE_URL}/result/990002")]["attempts"] == 2
+    # Assertions: the empty page past the end is retried, then given up on.
+    assert queue.tasks[("survey", 2)]["status"] == "failed"
+    assert queue.claims[0] == ("coord", ("survey", 1))
+    assert "Worker coord completed 4 tasks" in out
+    assert "Distributed crawl nightly: 3 raw payloads" in out
+
+    # Assertions: checkpoints and incremental walks are rejected for queue workers.
+    with pytest.raises(ValueError):
+        distributed_crawl.crawl_worker("nightly", checkpoint="x.sqlite3")
+    with pytest.raises(ValueError):
+        distributed_crawl.crawl_worker("nightly", incremental=True)
+
+
+def _postgres_conn_info():
+    """Return app connection info when a Postgres server answers, else ``None``."""
+    import psycopg
+
+    from db_config import get_db_conn_info
+
+    conn_info = get_db_conn_info()
+    try:
+        with psycopg.connect(conn_info, connect_timeout=2):
+            return conn_info
+    except psycopg.Error:
+        return None
+
+
+def _worker_process(base_url, crawl_id, worker_id):
+    """Run one crawl worker in a child process against the mock site."""
+    import distributed_crawl
+    import scrape
+
+    scrape.BASE_URL = base_url
+    distributed_crawl.crawl_worker(crawl_id, worker_id=worker_id, batch_size=3, retry=False)
+
+
+def test_worker_processes_split_a_live_postgres_queue(monkeypatch, capsys):
+    """Validate several worker processes drain one Postgres queue without duplicate work."""
+    conn_info = _postgres_conn_info()
+    if conn_info is None:
+        pytest.skip("no PostgreSQL server reachable")
+    import psycopg
+
+    import scrape
+    from crawl_queue import CrawlQueue
+    from mock_gradcafe import MockGradCafe
+
+    crawl_id = f"test-{uuid.uuid4().hex}"
+    queue = CrawlQueue(crawl_id, conn_info)
+    try:
+        with MockGradCafe(pages=4, per_page=5) as site:
+            monkeypatch.setattr(scrape, "BASE_URL", site.base_url)
+            monkeypatch.setattr(scrape, "NUM_PAGES_OF_DATA", 4)
+            queue.ensure_schema()
+            queue.enqueue_pages(range(1, 5))
+            context = multiprocessing.get_context("fork")
+            workers = [
+                context.Process(target=_worker_process, args=(site.base_url, crawl_id, f"w{i}"))
+                for i in range(3)
+            ]
+            for worker in workers:
+                worker.start()
+            for worker in workers:
+                worker.join(60)
+            payloads = queue.saved_payloads()
+            requests = site.counters["requests"]
+
+        # Assertions: all processes exit cleanly and each record was fetched exactly once.
+        assert [worker.exitcode for worker in workers] == [0, 0, 0]
+        assert len({p["url"] for p in payloads}) == len(payloads) == 20
+        assert requests == 4 + 20
+        assert queue.stats() == {"open": 0, "survey_done": 4, "result_done": 20}
+    finally:
+        with psycopg.connect(conn_info) as conn:
+            conn.execute("DELETE FROM crawl_tasks WHERE crawl_id = %s;", (crawl_id,))
+    capsys.readouterr()
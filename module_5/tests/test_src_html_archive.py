@@ -0,0 +1,101 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+# Exercises the compressed HTML archive and offline re-parse on temporary files.
+pytestmark = [pytest.mark.web, pytest.mark.integration]
+
+MODULE_5_ROOT = Path(__file__).resolve().parents[1]
+SRC_ROOT = MODULE_5_ROOT / "src"
+FIXTURES = Path(__file__).resolve().parent / "fixtures"
+if str(SRC_ROOT) not in sys.path:
+    sys.path.insert(0, str(SRC_ROOT))
+
+BASE = "https://www.thegradcafe.com"
+
+
+def test_archive_key_maps_survey_and_result_urls():
+    """Validate URL-to-key mapping for archived and ignored pages."""
+    from html_archive import archive_key
+
+    assert archive_key(BASE + "/result/990001") == ("result", 990001)
+    assert archive_key(BASE + "/survey/?page=7") == ("survey", 7)
+    assert archive_key(BASE + "/survey/") == ("survey", 1)
+    # Assertions: unparseable ids and unrelated paths are not archived.
+    assert archive_key(BASE + "/result/abc") is None
+    assert archive_key(BASE + "/survey/?page=x") is None
+    assert archive_key(BASE + "/about") is None
+
+
+def test_archive_append_index_and_latest_entry_wins(tmp_path):
+    """Validate compressed appends, offset lookups, and torn index lines."""
+    from html_archive import HtmlArchive
+
+    archive = HtmlArchive(tmp_path / "archive")
+    # Assertions: an empty archive has no entries.
+    assert archive.entries("result") == {} and archive.get("result", 1) is None
+
+    body = b"<html>" + b"x" * 1000 + b"</html>"
+    assert archive.append(BASE + "/result/1", body) is True
+    assert archive.append(BASE + "/survey/?page=1", b"<table></table>") is True
+    assert archive.append(BASE + "/result/1", b"<html>v2</html>") is True
+    assert archive.append(BASE + "/about", b"skip") is False
+
+    # Assertions: the newest copy wins and stored bytes are compressed.
+    assert archive.get("result", 1) == b"<html>v2</html>"
+    assert archive.get("survey", 1) == b"<table></table>"
+    stats = archive.stats()
+    assert stats["pages"] == 3 and stats["stored_bytes"] < stats["raw_bytes"]
+
+    # Assertions: a half-written trailing index line is ignored.
+    with archive.index_path.open("a", encoding="utf-8") as f:
+        f.write("result\t2\t0")
+    reopened = HtmlArchive(tmp_path / "archive")
+    assert set(reopened.entries("result")) == {1}
+
+    # Assertions: only_new appends skip pages the index already holds, including earlier runs'.
+    assert reopened.append(BASE + "/result/1", b"<html>v3</html>", only_new=True) is False
+    assert reopened.append(BASE + "/result/2", b"<html>new</html>", only_new=True) is True
+    assert reopened.append(BASE + "/result/2", b"<html>again</html>", only_new=True) is False
+    assert reopened.get("result", 1) == b"<html>v2</html>" and reopened.stats()["pages"] == 1
+
+
+def test_rebuild_payloads_matches_live_parsing(tmp_path, monkeypatch):
+    """Validate offline re-parse output and per-page error handling in chunk workers."""
+    import html_archive
+    from page_parsers import parse_result_html, seed_payload
+
+    survey_html = (FIXTURES / "survey_page.html").read_bytes()
+    result_html = (FIXTURES / "result_page.html").read_bytes()
+    archive = html_archive.HtmlArchive(tmp_path)
+    archive.append(BASE + "/survey/?page=1", survey_html)
+    for result_id in (990001, 990003):
+        archive.append(f"{BASE}/result/{result_id}", result_html)
+
+    expected = []
+    for row in html_archive.parse_table_html(survey_html):
+        seeded = seed_payload(row, BASE)
+        if seeded and not seeded[0].endswith("990002"):
+            expected.append(parse_result_html(result_html, *seeded))
+
+    # Assertions: only results with an archived page are rebuilt, in survey order.
+    monkeypatch.setattr(html_archive, "REPARSE_CHUNK", 1)
+    assert html_archive.rebuild_payloads(archive, BASE, workers=1) == expected
+
+    # The chunk workers run in-process here so their branches are exercised directly.
+    spans = sorted(archive.entries("survey").items())
+    assert html_archive._parse_survey_chunk(archive.bodies_path, "full", spans)[0][0] == 1
+    offset, length = archive.entries("result")[990001]
+    empty = archive.entries("survey")[1]
+    items = [
+        (offset, length, BASE + "/result/990001", expected[0]),
+        (*empty, BASE + "/result/2", {}),
+    ]
+    assert html_archive._parse_result_chunk(archive.bodies_path, "full", items) == [expected[0]]
+
+    def broken(*args):
+        raise IndexError("bad page")
+
+    monkeypatch.setattr(html_archive, "parse_result_html", broken)
+    assert html_archive._parse_result_chunk(archive.bodies_path, "full", items) == []
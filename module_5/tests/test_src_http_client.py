@@ -0,0 +1,356 @@
+import asyncio
+import gzip
+import sys
+import threading
+import types
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib import error
+
+import pytest
+
+# Exercises the transport helpers against a loopback asyncio server (no external network).
+pytestmark = [pytest.mark.web, pytest.mark.integration]
+
+MODULE_5_ROOT = Path(__file__).resolve().parents[1]
+SRC_ROOT = MODULE_5_ROOT / "src"
+if str(SRC_ROOT) not in sys.path:
+    sys.path.insert(0, str(SRC_ROOT))
+
+
+async def _serve_once(raw_response, handler_log):
+    """Start a loopback server that replies with ``raw_response`` to every request."""
+
+    async def handle(reader, writer):
+        handler_log.append(await reader.readuntil(b"\r\n\r\n"))
+        writer.write(raw_response)
+        await writer.drain()
+        writer.close()
+
+    return await asyncio.start_server(handle, "127.0.0.1", 0)
+
+
+def test_parse_http_response_plain_chunked_and_errors():
+    """Validate status handling, chunked decoding, and malformed-head rejection."""
+    import http_client
+
+    # Assertions: plain bodies are returned unchanged.
+    raw = b"HTTP/1.1 200 OK\r\nContent-Type: text/html\r\n\r\n<html></html>"
+    assert http_client.parse_http_response(raw, "u") == b"<html></html>"
+
+    # Assertions: chunked bodies (with a chunk extension) are reassembled.
+    chunked = (
+        b"HTTP/1.1 200 OK\r\nTransfer-Encoding: chunked\r\n\r\n"
+        b"4;ext=1\r\n<htm\r\n5\r\nl></>\r\n0\r\n\r\n"
+    )
+    assert http_client.parse_http_response(chunked, "u") == b"<html></>"
+
+    # Assertions: error statuses surface as urllib HTTPError, like urlopen.
+    with pytest.raises(error.HTTPError) as excinfo:
+        http_client.parse_http_response(b"HTTP/1.1 503 Service Unavailable\r\n\r\n", "u")
+    assert excinfo.value.code == 503
+    with pytest.raises(error.HTTPError):
+        http_client.parse_http_response(b"HTTP/1.1 404\r\n\r\n", "u")
+
+    with pytest.raises(ValueError):
+        http_client.parse_http_response(b"garbage\r\n\r\n", "u")
+
+
+def test_async_http_get_roundtrip_and_connection_errors(monkeypatch):
+    """Validate async GET request framing plus URLError/timeout wrapping."""
+    import http_client
+
+    async def scenario():
+        seen = []
+        server = await _serve_once(b"HTTP/1.1 200 OK\r\n\r\nhello", seen)
+        port = server.sockets[0].getsockname()[1]
+        async with server:
+            body = await http_client.async_http_get(
+                f"http://127.0.0.1:{port}/survey/?page=2", headers={"User-Agent": "t"}
+            )
+            bare = await http_client.async_http_get(f"http://127.0.0.1:{port}")
+        return body, bare, seen
+
+    body, bare, seen = asyncio.run(scenario())
+    # Assertions: body is returned and request line/headers carry path, query, and UA.
+    assert body == b"hello"
+    assert bare == b"hello"
+    assert seen[0].startswith(b"GET /survey/?page=2 HTTP/1.1\r\n")
+    assert b"User-Agent: t" in seen[0]
+    assert seen[1].startswith(b"GET / HTTP/1.1\r\n")
+
+    # Assertions: the TLS context is built once and reused.
+    assert http_client._ssl_context() is http_client._ssl_context()
+
+    async def refuse(*args, **kwargs):
+        raise ConnectionRefusedError("refused")
+
+    monkeypatch.setattr(http_client.asyncio, "open_connection", refuse)
+    with pytest.raises(error.URLError):
+        asyncio.run(http_client.async_http_get("https://example.invalid/result/1"))
+
+    async def too_slow(*args, **kwargs):
+        raise TimeoutError("slow")
+
+    monkeypatch.setattr(http_client.asyncio, "open_connection", too_slow)
+    with pytest.raises(TimeoutError):
+        asyncio.run(http_client.async_http_get("http://example.invalid/"))
+
+
+def test_async_http_get_follows_redirects_up_to_the_pool_limit():
+    """Validate 3xx Location headers are followed like the pooled client, then refused."""
+    import http_client
+
+    routes = {
+        b"/a": b"HTTP/1.1 302 Found\r\nLocation: /b?x=1\r\n\r\nmoved",
+        b"/b?x=1": b"HTTP/1.1 301 Moved\r\nLocation: http://127.0.0.1:{port}/c\r\n\r\n",
+        b"/c": b"HTTP/1.1 200 OK\r\n\r\ndone",
+        b"/loop": b"HTTP/1.1 307 Temporary Redirect\r\nLocation: /loop\r\n\r\n",
+    }
+    seen = []
+
+    async def scenario():
+        async def handle(reader, writer):
+            request = await reader.readuntil(b"\r\n\r\n")
+            path = request.split(b" ")[1]
+            seen.append(path)
+            writer.write(routes[path].replace(b"{port}", str(port).encode()))
+            await writer.drain()
+            writer.close()
+
+        server = await asyncio.start_server(handle, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        async with server:
+            body = await http_client.async_http_get(f"http://127.0.0.1:{port}/a")
+            status, _, _ = await http_client.async_http_fetch(f"http://127.0.0.1:{port}/a")
+            with pytest.raises(error.URLError, match="too many redirects"):
+                await http_client.async_http_get(f"http://127.0.0.1:{port}/loop")
+        return body, status
+
+    # Assertions: relative and absolute Locations lead to the final body and status.
+    assert asyncio.run(scenario()) == (b"done", 200)
+    assert seen[:3] == [b"/a", b"/b?x=1", b"/c"]
+    # Assertions: a redirect loop stops after the same budget urllib3 is given.
+    assert http_client.POOL_RETRIES.redirect == http_client.MAX_REDIRECTS
+    assert seen[6:] == [b"/loop"] * (http_client.MAX_REDIRECTS + 1)
+
+
+def test_async_http_get_read_failures(monkeypatch):
+    """Validate read-phase timeout and socket errors after a successful connect."""
+    import http_client
+
+    class FakeWriter:
+        def __init__(self):
+            self.closed = False
+
+        def write(self, data):
+            self.data = data
+
+        async def drain(self):
+            return None
+
+        def close(self):
+            self.closed = True
+
+    class FakeReader:
+        def __init__(self, exc):
+            self.exc = exc
+
+        async def read(self):
+            raise self.exc
+
+    writers = []
+
+    def connect_with(exc):
+        async def fake_open(*args, **kwargs):
+            writer = FakeWriter()
+            writers.append(writer)
+            return FakeReader(exc), writer
+
+        return fake_open
+
+    monkeypatch.setattr(http_client.asyncio, "open_connection", connect_with(TimeoutError()))
+    with pytest.raises(TimeoutError):
+        asyncio.run(http_client.async_http_get("http://x/"))
+
+    monkeypatch.setattr(http_client.asyncio, "open_connection", connect_with(ConnectionResetError()))
+    with pytest.raises(error.URLError):
+        asyncio.run(http_client.async_http_get("http://x/"))
+    # Assertions: connections are closed even when reading fails.
+    assert all(w.closed for w in writers)
+
+
+def test_body_decoder_codings_and_transfer_stats(monkeypatch):
+    """Validate streamed gzip/deflate/brotli decoding and wire vs decoded accounting."""
+    import http_client
+
+    page = b"<table>" + b"<tr><td>row</td></tr>" * 200 + b"</table>"
+    deflated = zlib.compress(page)
+    raw_deflate = deflated[2:-4]
+    gzipped = gzip.compress(page)
+    for encoding, wire in (("gzip", gzipped), ("deflate", deflated), ("Deflate", raw_deflate),
+                           (None, page)):
+        decoder = http_client.BodyDecoder(encoding)
+        chunks = [wire[i:i + 7] for i in range(0, len(wire), 7)]
+        # Assertions: small wire chunks decode to the original page, raw deflate included.
+        assert decoder.decode(chunks) == page
+        assert (decoder.wire_bytes, decoder.decoded_bytes) == (len(wire), len(page))
+
+    # Assertions: unknown codings and corrupt streams raise ValueError (a handled fetch error).
+    with pytest.raises(ValueError):
+        http_client.BodyDecoder("compress")
+    with pytest.raises(ValueError):
+        http_client.BodyDecoder("gzip").decode([b"not gzip at all"])
+    with pytest.raises(ValueError):
+        http_client.BodyDecoder("deflate").decode([b"\xff" * 8])
+
+    class FakeBrotli:
+        class Decompressor:
+            def process(self, chunk):
+                return chunk.upper()
+
+    monkeypatch.setattr(http_client, "HAS_BROTLI", True)
+    monkeypatch.setitem(sys.modules, "brotli", FakeBrotli)
+    # Assertions: 'br' goes through the optional brotli package when it is installed.
+    assert http_client.BodyDecoder("br").decode([b"ab", b"c"]) == b"ABC"
+    monkeypatch.setattr(http_client, "HAS_BROTLI", False)
+    with pytest.raises(ValueError):
+        http_client.BodyDecoder("br")
+
+    stats = http_client.TransferStats()
+    assert stats.summary()["ratio"] is None
+    for encoding, wire in (("gzip", gzipped), ("identity", page)):
+        decoder = http_client.BodyDecoder(encoding)
+        decoder.decode([wire])
+        stats.record(decoder)
+        before = stats.snapshot()
+    summary = stats.summary()
+    # Assertions: totals split per coding; the ratio is decoded bytes per wire byte.
+    assert summary["responses"] == 2 and summary["compressed_responses"] == 1
+    assert summary["wire_bytes"] == len(gzipped) + len(page)
+    assert summary["ratio"] == round(2 * len(page) / (len(gzipped) + len(page)), 2)
+    assert summary["encodings"]["gzip"] == {"responses": 1, "wire_bytes": len(gzipped),
+                                            "decoded_bytes": len(page)}
+    # Assertions: a snapshot baseline drops codings with no new responses.
+    assert stats.summary(before)["encodings"] == {}
+
+
+def test_parse_http_response_decodes_content_encoding():
+    """Validate gzip bodies are de-chunked, then decoded and counted."""
+    import http_client
+
+    body = gzip.compress(b"<html>compressed</html>")
+    chunked = b"%x\r\n%s\r\n0\r\n\r\n" % (len(body), body)
+    raw = (b"HTTP/1.1 200 OK\r\nContent-Encoding: gzip\r\nTransfer-Encoding: chunked\r\n\r\n"
+           + chunked)
+    before = http_client.TRANSFER_STATS.snapshot()
+    # Assertions: the caller gets decoded HTML and the wire size is recorded.
+    assert http_client.parse_http_response(raw, "u") == b"<html>compressed</html>"
+    assert http_client.TRANSFER_STATS.summary(before)["encodings"]["gzip"]["wire_bytes"] == len(body)
+
+
+class _KeepAliveHandler(BaseHTTPRequestHandler):
+    """Loopback handler that keeps connections open between requests."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        status = 503 if self.path.startswith("/fail") else 200
+        body = f"path={self.path};ua={self.headers.get('User-Agent')}".encode()
+        self.send_response(status)
+        if self.path.startswith("/gzip") and "gzip" in self.headers.get("Accept-Encoding", ""):
+            body = gzip.compress(body * 50)
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def keep_alive_server():
+    """Serve ``_KeepAliveHandler`` on an ephemeral loopback port."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _KeepAliveHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_pooled_client_reuses_connections(keep_alive_server):
+    """Validate keep-alive reuse counters and default headers on pooled requests."""
+    import http_client
+
+    client = http_client.PooledHTTPClient(maxsize=2, headers={"User-Agent": "pool-test"})
+    # Assertions: no traffic yet means zeroed counters.
+    assert client.connection_stats() == {"requests": 0, "connections_opened": 0, "connections_reused": 0}
+
+    bodies = [client.get(f"{keep_alive_server}/result/{i}") for i in range(5)]
+    assert bodies[0] == b"path=/result/0;ua=pool-test"
+
+    # Assertions: sequential requests ride one socket, so four of five are reuses.
+    stats = client.connection_stats()
+    assert stats == {"requests": 5, "connections_opened": 1, "connections_reused": 4}
+
+    # Assertions: fetch() exposes status/headers and merges per-request headers over defaults.
+    status, headers, body = client.fetch(f"{keep_alive_server}/x", {"If-None-Match": '"e"'})
+    assert status == 200
+    assert headers["content-length"] == str(len(body))
+    assert body == b"path=/x;ua=pool-test"
+
+    # Assertions: gzip is negotiated by default and decoded before it reaches the caller.
+    before = http_client.TRANSFER_STATS.snapshot()
+    status, headers, body = client.fetch(f"{keep_alive_server}/gzip")
+    assert headers["content-encoding"] == "gzip"
+    assert body == b"path=/gzip;ua=pool-test" * 50
+    compression = http_client.TRANSFER_STATS.summary(before)
+    assert compression["decoded_bytes"] == len(body) > compression["wire_bytes"]
+
+    # Assertions: error statuses surface as urllib HTTPError.
+    with pytest.raises(error.HTTPError) as excinfo:
+        client.get(f"{keep_alive_server}/fail")
+    assert excinfo.value.code == 503
+
+
+def test_pooled_client_error_translation_and_evicted_pools():
+    """Validate urllib3 exceptions map to urllib/TimeoutError types."""
+    import urllib3
+
+    import http_client
+
+    client = http_client.PooledHTTPClient(maxsize=1)
+
+    class RaisingManager:
+        def __init__(self, exc):
+            self.exc = exc
+            self.pools = {}
+
+        def request(self, method, url, **kwargs):
+            raise self.exc
+
+    pool = urllib3.HTTPConnectionPool("example.invalid")
+    cases = [
+        (urllib3.exceptions.ReadTimeoutError(pool, "/", "read timed out"), TimeoutError),
+        (urllib3.exceptions.MaxRetryError(pool, "/", urllib3.exceptions.ConnectTimeoutError("t")), TimeoutError),
+        (urllib3.exceptions.MaxRetryError(pool, "/", urllib3.exceptions.NewConnectionError(None, "refused")), error.URLError),
+        (urllib3.exceptions.ProtocolError("reset"), error.URLError),
+    ]
+    for raised, expected in cases:
+        client._manager = RaisingManager(raised)
+        with pytest.raises(expected):
+            client.get("http://example.invalid/")
+
+    class EvictingPools(dict):
+        def keys(self):
+            return ["gone", "kept"]
+
+    # Assertions: pools evicted mid-scan are skipped rather than crashing the stats call.
+    manager = RaisingManager(None)
+    kept = types.SimpleNamespace(num_requests=3, num_connections=1)
+    manager.pools = EvictingPools(kept=kept)
+    client._manager = manager
+    assert client.connection_stats() == {"requests": 3, "connections_opened": 1, "connections_reused": 2}
@@ -0,0 +1,84 @@
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+# Covers streaming JSONL save/load, both JSON backends, and the legacy JSON array reader.
+pytestmark = [pytest.mark.analysis, pytest.mark.integration]
+
+MODULE_5_ROOT = Path(__file__).resolve().parents[1]
+SRC_ROOT = MODULE_5_ROOT / "src"
+if str(SRC_ROOT) not in sys.path:
+    sys.path.insert(0, str(SRC_ROOT))
+
+
+def _records():
+    from applicant_record import ApplicantRecord
+
+    record = ApplicantRecord({"university": "Université de Montréal", "GPA": None})
+    return [record, {"university": "MIT", "comments": "a \"quoted\"\nline", "GRE": 170}]
+
+
+def test_write_and_iter_jsonl_round_trip_with_every_backend(tmp_path):
+    """Validate one line per record, identical bytes across backends, and appends."""
+    import jsonl_io
+
+    expected = [dict(record) for record in _records()]
+    outputs = {}
+    for backend in ["auto", "json"] + (["orjson"] if jsonl_io.HAS_ORJSON else []):
+        path = tmp_path / f"{backend}.jsonl"
+        # Assertions: records are written one per line and stream back unchanged.
+        assert jsonl_io.write_jsonl(iter(_records()), path, backend=backend) == 2
+        assert len(path.read_bytes().splitlines()) == 2
+        assert list(jsonl_io.iter_jsonl(path, backend=backend)) == expected
+        outputs[backend] = path.read_bytes()
+    assert outputs["json"] == outputs.get("orjson", outputs["json"]) == outputs["auto"]
+    assert "Montréal".encode() in outputs["json"]
+
+    # Assertions: append adds lines after existing ones; blank lines are skipped on read.
+    path = tmp_path / "json.jsonl"
+    jsonl_io.write_jsonl([{"n": 3}], path, append=True, backend="json")
+    with open(path, "ab") as f:
+        f.write(b"\n  \n")
+    assert list(jsonl_io.iter_jsonl(path)) == expected + [{"n": 3}]
+    empty = tmp_path / "empty.jsonl"
+    assert jsonl_io.write_jsonl([], empty) == 0 and list(jsonl_io.iter_jsonl(empty)) == []
+
+
+def test_iter_jsonl_streams_legacy_json_arrays(tmp_path, monkeypatch):
+    """Validate legacy json.dump arrays decode element by element across chunk edges."""
+    import jsonl_io
+
+    # Setup: tiny chunks force elements, strings, and numbers to straddle refills.
+    monkeypatch.setattr(jsonl_io, "READ_CHUNK_CHARS", 7)
+    expected = [dict(record) for record in _records()] + [12345678, "x, ]", [], {}]
+    for text in (json.dumps(expected, default=dict), "\n  " + json.dumps(expected, indent=2)):
+        path = tmp_path / "legacy.json"
+        path.write_text(text, encoding="utf-8")
+        # Assertions: compact and pretty-printed arrays both read back in order.
+        assert list(jsonl_io.iter_jsonl(path)) == expected
+    path.write_text("[ ]")
+    assert list(jsonl_io.iter_jsonl(path)) == []
+
+    # Assertions: truncated or malformed arrays raise instead of stopping early.
+    for broken in ('[{"a": 1}, {"a": ', '[{"a": 1} x]', '[1, 2'):
+        path.write_text(broken)
+        with pytest.raises(ValueError):
+            list(jsonl_io.iter_jsonl(path))
+
+
+def test_jsonl_backend_selection_and_errors(tmp_path, monkeypatch):
+    """Validate unknown backends fail and orjson is required only when asked for."""
+    import jsonl_io
+
+    path = tmp_path / "out.jsonl"
+    with pytest.raises(ValueError, match="Unknown JSON backend"):
+        jsonl_io.write_jsonl([], path, backend="ujson")
+    monkeypatch.setattr(jsonl_io, "HAS_ORJSON", False)
+    with pytest.raises(ValueError, match="requires the orjson package"):
+        list(jsonl_io.iter_jsonl(path, backend="orjson"))
+    # Assertions: the stdlib backend keeps working without orjson.
+    monkeypatch.setattr(jsonl_io, "DEFAULT_JSON_BACKEND", "json")
+    assert jsonl_io.write_jsonl([{"a": 1}], path) == 1
+    assert list(jsonl_io.iter_jsonl(path)) == [{"a": 1}]
@@ -198,6 +198,63 @@ def test_get_existing_urls_paginates_until_empty_batch(monkeypatch):
     assert len(c.executed) == 2
 
 
+def test_result_filter_rebuild_reuse_and_update_on_load(monkeypatch, tmp_path, capsys):
+    """Validate the result-id filter is rebuilt when stale, reused, and extended on load."""
+    import load_data
+    from seen_filter import ResultIdFilter
+
+    # Setup: 150 stored rows, streamed back through one server-side cursor.
+    c = FakeCursor(fetchone_values=[(150,), (150,), (150,)],
+                   fetchall_values=[[(i,) for i in range(1, 151)]])
+    conns = []
+
+    def connect(*args, **kwargs):
+        conns.append(FakeConn(c))
+        return conns[-1]
+
+    monkeypatch.setattr(load_data.psycopg, "connect", connect)
+    filter_path = tmp_path / "seen_results.bloom"
+
+    known = load_data.load_known_results(filter_path)
+    # Assertions: a missing filter is rebuilt from one named-cursor query and saved.
+    assert [str(q) for q, _ in c.executed].count("SELECT result_page FROM admissions;") == 1
+    assert conns[-1].cursor_names == ["result_filter_ids"]
+    assert c.itersize == load_data.RESULT_FILTER_FETCH_ROWS
+    assert known.bloom.count == 150 and 150 in known.bloom and "150" in known.bloom
+    assert ResultIdFilter.load(filter_path).count == 150
+
+    # Assertions: a filter whose count matches the table is reused without a rebuild.
+    c.executed.clear()
+    load_data.load_known_results(filter_path)
+    assert [str(q) for q, _ in c.executed] == ["SELECT COUNT(*) FROM admissions;"]
+
+    # Assertions: hits are confirmed with one ANY() query; errors count as "not stored".
+    c.fetchall_values = [[("https://x/result/7",)]]
+    assert load_data.find_existing_urls(["https://x/result/7", "https://x/result/8"]) == {
+        "https://x/result/7"}
+    assert c.executed[-1][1] == (["https://x/result/7", "https://x/result/8"],)
+
+    # Assertions: loading JSONL next to the filter adds the inserted ids to it.
+    record = {"university": "MIT", "url": "https://x/result/900"}
+    jsonl = tmp_path / "new.jsonl"
+    jsonl.write_text(json.dumps(record) + "\n")
+    monkeypatch.setattr(load_data, "create_db_if_not_exists", lambda: None)
+    c.fetchone_values = [("admissions",)]
+    load_data.stream_jsonl_to_postgres(str(jsonl))
+    updated = ResultIdFilter.load(filter_path)
+    assert updated.count == 151 and "900" in updated
+    capsys.readouterr()
+
+    def raise_connect(*args, **kwargs):
+        raise RuntimeError("db down")
+
+    monkeypatch.setattr(load_data.psycopg, "connect", raise_connect)
+    # Assertions: without a database the check is empty and the saved filter is kept.
+    assert not load_data.load_known_results(filter_path)
+    assert load_data.find_existing_urls(["https://x/result/7"]) == set()
+    assert ResultIdFilter.load(filter_path).count == 151
+
+
 def test_query_data_run_analysis_and_execute_query_error(monkeypatch):
     """Validate query aggregation outputs and execute_query error wrapping."""
     import query_data
@@ -0,0 +1,102 @@
+import sys
+from pathlib import Path
+from urllib import error
+
+import pytest
+
+# Exercises survey page-count discovery: the search itself, and how scrape runs use it.
+pytestmark = [pytest.mark.web, pytest.mark.integration]
+
+MODULE_5_ROOT = Path(__file__).resolve().parents[1]
+SRC_ROOT = MODULE_5_ROOT / "src"
+if str(SRC_ROOT) not in sys.path:
+    sys.path.insert(0, str(SRC_ROOT))
+
+FIXTURES = Path(__file__).resolve().parent / "fixtures"
+
+
+def test_find_last_page_probes_logarithmically():
+    """Validate the doubling-then-bisect search for every page count under a cap."""
+    from page_discovery import find_last_page
+
+    for cap in (1, 2, 7, 64, 2000):
+        for last in sorted({0, 1, 2, 3, cap // 2, cap - 1, cap, cap + 1}):
+            probed = []
+
+            def has_rows(page, last=last):
+                probed.append(page)
+                return page <= last
+
+            found, probes = find_last_page(has_rows, cap)
+            # Assertions: the exact last page is found without probing past the cap.
+            assert found == min(last, cap)
+            assert probes == len(probed) == len(set(probed))
+            assert max(probed) <= cap
+            assert probes <= 2 * cap.bit_length() + 1
+    assert find_last_page(lambda page: True, 0) == (0, 0)
+
+
+def test_survey_page_count_discovers_caps_and_falls_back(monkeypatch, capsys):
+    """Validate discovery in scrape runs, the max_pages cap, and fallbacks on failure."""
+    import page_discovery
+    import scrape
+    import scrape_services
+
+    survey_html = (FIXTURES / "survey_page.html").read_bytes()
+    result_html = (FIXTURES / "result_page.html").read_bytes()
+    calls = []
+
+    def fake_get(url):
+        calls.append(url)
+        if "/survey/" not in url:
+            return result_html
+        page = int(url.rsplit("=", 1)[-1])
+        if page > 6:
+            raise error.HTTPError(url, 404, "Not Found", hdrs=None, fp=None)
+        return survey_html if page <= 5 else b"<table></table>"
+
+    for module in (scrape, page_discovery):
+        monkeypatch.setattr(module, "http_get", fake_get)
+    monkeypatch.setattr(scrape, "NUM_PAGES_OF_DATA", 40)
+
+    scrape.scrape_data(retry=False)
+    out = capsys.readouterr().out
+    # Assertions: 5 pages are found with 6 probes (1, 2, 4, 8, 6, 5); 404 past the end is empty.
+    assert "Discovered 5 survey pages (cap 40) with 6 probe requests" in out
+    survey_calls = [url for url in calls if "/survey/" in url]
+    assert len(survey_calls) == 6 + 5
+
+    # Assertions: max_pages caps discovery, and streaming uses the discovered count too.
+    calls.clear()
+    assert list(scrape.iter_scrape_data(max_pages=3, retry=False))
+    assert "Discovered 3 survey pages (cap 3) with 3 probe requests" in capsys.readouterr().out
+    assert sum("/survey/" in url for url in calls) == 3 + 3
+
+    # Assertions: incremental walks stop at max_pages too.
+    scrape.scrape_data(existing_urls={"x"}, incremental=True, max_pages=2, retry=False)
+    assert "Survey walk stopped at page 2 (page_cap)" in capsys.readouterr().out
+
+    # Assertions: a failed probe falls back to the cap instead of cutting the crawl short.
+    def flaky_get(url):
+        if url.endswith("page=2"):
+            raise TimeoutError("slow")
+        return fake_get(url)
+
+    monkeypatch.setattr(page_discovery, "http_get", flaky_get)
+    with scrape_services.use_page_limit(True, 4):
+        assert scrape.survey_page_count() == 4
+    assert "discovery failed (slow); crawling up to the cap of 4 pages" in capsys.readouterr().out
+
+    # Assertions: other HTTP errors propagate to the fallback; robots-blocked pages are empty.
+    monkeypatch.setattr(page_discovery, "http_get", lambda url: (_ for _ in ()).throw(
+        error.HTTPError(url, 503, "busy", hdrs=None, fp=None)))
+    with scrape_services.use_page_limit(True, None):
+        assert scrape.survey_page_count() == 40
+        monkeypatch.setattr(scrape, "_is_restricted_path", lambda url: True)
+        assert scrape.survey_page_count() == 0
+    capsys.readouterr()
+
+    # Assertions: max_pages must be a positive integer.
+    for bad in (0, -3, 2.5, "10", True):
+        with pytest.raises(ValueError):
+            scrape_services.resolve_options({"max_pages": bad})
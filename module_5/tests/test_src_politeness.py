@@ -0,0 +1,165 @@
+import asyncio
+import sys
+from pathlib import Path
+from urllib import error
+
+import pytest
+
+# Exercises robots.txt parsing and caching, token-bucket pacing with a fake clock,
+# and a polite crawl of the mock GradCafe server.
+pytestmark = [pytest.mark.web, pytest.mark.integration]
+
+MODULE_5_ROOT = Path(__file__).resolve().parents[1]
+SRC_ROOT = MODULE_5_ROOT / "src"
+BENCH_ROOT = MODULE_5_ROOT / "benchmarks"
+for path in (SRC_ROOT, BENCH_ROOT):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
+
+ROBOTS_TXT = """\
+Disallow: /ignored-before-any-group
+User-agent: OtherBot
+Disallow: /
+
+User-agent: *   # everyone else
+Disallow: /cgi-bin/
+Disallow: /private
+Allow: /private/public
+Disallow: /*.php$
+Disallow:
+Crawl-delay: soon
+
+User-agent: Chrome
+User-agent: SomethingElse
+Allow: /cgi-bin/ok
+Disallow: /cgi-bin/
+Crawl-delay: 2
+"""
+
+
+def test_robots_policy_groups_and_longest_match():
+    """Validate group selection, prefix/wildcard rules, tie-breaking, and crawl delay."""
+    from politeness import RobotsPolicy
+
+    generic = RobotsPolicy.parse(ROBOTS_TXT, "curl/8.0")
+    # Assertions: the '*' group applies; longest match decides and empty rules are ignored.
+    assert not generic.allows("https://x/cgi-bin/a")
+    assert not generic.allows("https://x/private/x")
+    assert generic.allows("https://x/private/public/x")
+    assert not generic.allows("https://x/index-ad-test.php")
+    assert generic.allows("https://x/index.php?page=2")
+    assert generic.allows("https://x/survey/?page=1")
+    assert generic.allows("https://x")
+    assert generic.crawl_delay is None
+
+    # Assertions: a named group matching a token of the full User-Agent wins over '*'.
+    chrome = RobotsPolicy.parse(ROBOTS_TXT, "Mozilla/5.0 Chrome/120.0 Safari/537.36")
+    assert chrome.allows("https://x/cgi-bin/ok/1")
+    assert not chrome.allows("https://x/cgi-bin/other")
+    assert chrome.allows("https://x/private/x")
+    assert chrome.crawl_delay == 2.0
+
+    # Assertions: Allow wins a tie of equal length; no matching group means no rules.
+    tie = RobotsPolicy([(False, "/a"), (True, "/a")])
+    assert tie.allows("/a/b")
+    assert RobotsPolicy.parse("User-agent: OtherBot\nDisallow: /\n", "curl").allows("/x")
+
+
+def test_load_robots_policy_from_file_and_url(tmp_path, monkeypatch):
+    """Validate local robots files are cached, and URLs honor 4xx as allow-all."""
+    import politeness
+    from mock_gradcafe import MockGradCafe
+
+    monkeypatch.setattr(politeness, "_POLICY_CACHE", {})
+    robots_file = tmp_path / "robots.txt"
+    robots_file.write_text("User-agent: *\nDisallow: /survey/\n", encoding="utf-8")
+    policy = politeness.load_robots_policy(robots_file)
+    robots_file.write_text("User-agent: *\nDisallow: /result/\n", encoding="utf-8")
+    # Assertions: a cached policy is reused until it expires.
+    assert politeness.load_robots_policy(robots_file) is policy
+    assert not policy.allows("/survey/?page=1")
+    monkeypatch.setattr(politeness, "ROBOTS_CACHE_SECONDS", 0)
+    assert not politeness.load_robots_policy(robots_file).allows("/result/1")
+
+    with MockGradCafe(pages=1, per_page=1, robots_txt="User-agent: *\nCrawl-delay: 0.5\n") as site:
+        # Assertions: robots.txt is fetched over HTTP; a missing file allows everything.
+        assert politeness.load_robots_policy(f"{site.base_url}/robots.txt").crawl_delay == 0.5
+        site.robots_txt = None
+        assert politeness.load_robots_policy(f"{site.base_url}/robots.txt").allows("/cgi-bin/")
+        site.error_rate = 1.0
+        with pytest.raises(error.HTTPError):
+            politeness.load_robots_policy(f"{site.base_url}/robots.txt")
+
+
+def test_host_rate_limiter_paces_each_host_with_a_fake_clock(monkeypatch):
+    """Validate token reservations, per-host buckets, refill, and async waiting."""
+    import politeness
+
+    clock = {"now": 100.0}
+    sleeps = []
+    monkeypatch.setattr(politeness.time, "monotonic", lambda: clock["now"])
+    monkeypatch.setattr(politeness.time, "sleep", sleeps.append)
+
+    async def fake_async_sleep(delay):
+        sleeps.append(("async", delay))
+
+    monkeypatch.setattr(politeness.asyncio, "sleep", fake_async_sleep)
+
+    limiter = politeness.HostRateLimiter(rate=2.0)
+    limiter.acquire("https://a/1")
+    limiter.acquire("https://a/2")
+    limiter.acquire("https://a/3")
+    limiter.acquire("https://b/1")
+    # Assertions: the first request per host is free; later ones queue 0.5s apart.
+    assert sleeps == [0.5, 1.0]
+
+    clock["now"] += 10
+    limiter.acquire("https://a/4")
+    asyncio.run(limiter.acquire_async("https://a/5"))
+    asyncio.run(limiter.acquire_async("https://b/2"))
+    # Assertions: an idle bucket refills only up to its capacity.
+    assert sleeps[2:] == [("async", 0.5)]
+    assert limiter.stats() == {"requests": 7, "throttled": 3, "wait_seconds": 2.0}
+
+
+def test_polite_crawl_skips_disallowed_results_and_paces_requests(tmp_path, monkeypatch, capsys):
+    """Validate a robots policy and crawl delay apply to both scrape engines."""
+    import scrape
+    import scrape_services
+    from mock_gradcafe import MockGradCafe
+
+    robots = "User-agent: *\nDisallow: /result/*0$\nCrawl-delay: 0.01\n"
+    with MockGradCafe(pages=2, per_page=5, robots_txt=robots) as site:
+        monkeypatch.setattr(scrape, "BASE_URL", site.base_url)
+        monkeypatch.setattr(scrape, "NUM_PAGES_OF_DATA", 3)
+        options = {"robots": f"{site.base_url}/robots.txt", "rate_limit": 1000, "retry": False}
+        payloads = scrape.scrape_data(**options)
+        out = capsys.readouterr().out
+        async_payloads = scrape.scrape_data(engine="async", **options)
+        async_out = capsys.readouterr().out
+
+    # Assertions: the disallowed result is never fetched and the crawl delay sets the rate.
+    urls = sorted(p["url"] for p in payloads)
+    assert len(urls) == 9 and f"{site.base_url}/result/900010" not in urls
+    assert sorted(p["url"] for p in async_payloads) == urls
+    assert "Politeness: robots.txt from" in out and "100 requests/s per host" in out
+    assert "/14 requests waited" in async_out
+    assert scrape_services.RUN_STATE["robots"] is None
+    assert scrape_services.RUN_STATE["rate_limiter"] is None
+
+    # Assertions: a robots file without a crawl delay or rate limit only filters URLs.
+    robots_file = tmp_path / "robots.txt"
+    robots_file.write_text("User-agent: *\nDisallow: /survey/\n", encoding="utf-8")
+    with scrape_services.use_politeness(robots_file, None):
+        assert scrape._is_restricted_path("https://x/survey/?page=1")
+        assert scrape_services.RUN_STATE["rate_limiter"] is None
+    assert "no rate limit" in capsys.readouterr().out
+    with scrape_services.use_politeness(None, 5):
+        assert not scrape._is_restricted_path("https://x/survey/?page=1")
+        assert scrape._is_restricted_path("https://x/cgi-bin/a")
+    capsys.readouterr()
+
+    # Assertions: rate limits must be positive numbers.
+    for bad in (0, -1, "fast", True):
+        with pytest.raises(ValueError):
+            scrape_services.resolve_options({"rate_limit": bad})
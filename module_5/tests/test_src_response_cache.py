@@ -0,0 +1,134 @@
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+# Validates TTL policy, conditional revalidation, and content-addressed storage offline.
+pytestmark = [pytest.mark.web, pytest.mark.integration]
+
+MODULE_5_ROOT = Path(__file__).resolve().parents[1]
+SRC_ROOT = MODULE_5_ROOT / "src"
+if str(SRC_ROOT) not in sys.path:
+    sys.path.insert(0, str(SRC_ROOT))
+
+SURVEY_URL = "https://www.thegradcafe.com/survey/?page=1"
+RESULT_URL = "https://www.thegradcafe.com/result/990001"
+
+
+class FakeFetcher:
+    """Records conditional headers and replays scripted ``(status, headers, body)`` replies."""
+
+    def __init__(self, *replies):
+        self.replies = list(replies)
+        self.calls = []
+
+    def __call__(self, url, headers):
+        self.calls.append((url, headers))
+        return self.replies.pop(0)
+
+
+def test_cache_miss_hit_and_ttl_policy(tmp_path):
+    """Validate misses store bodies, fresh hits skip the network, and TTL by path."""
+    from response_cache import ResponseCache
+
+    cache = ResponseCache(tmp_path)
+    # Assertions: TTL policy is per path type; unknown paths always revalidate.
+    assert cache.ttl_for(SURVEY_URL) == 3600
+    assert cache.ttl_for(RESULT_URL) == 7 * 24 * 3600
+    assert cache.ttl_for("https://www.thegradcafe.com/about") == 0
+
+    fetcher = FakeFetcher((200, {"etag": '"v1"'}, b"<dl>result</dl>"))
+    assert cache.fetch(RESULT_URL, fetcher) == b"<dl>result</dl>"
+    # Second read is served from disk without calling the fetcher.
+    assert cache.fetch(RESULT_URL, fetcher) == b"<dl>result</dl>"
+    assert len(fetcher.calls) == 1
+    assert fetcher.calls[0] == (RESULT_URL, {})
+    assert cache.stats() == {"hits": 1, "misses": 1, "revalidated": 0}
+
+    # Assertions: identical bodies under different URLs share one content-addressed blob.
+    cache.store(RESULT_URL + "-copy", b"<dl>result</dl>")
+    assert len(list((tmp_path / "objects").iterdir())) == 1
+    assert len(list((tmp_path / "urls").iterdir())) == 2
+
+
+def test_cache_conditional_revalidation(tmp_path, monkeypatch):
+    """Validate stale entries send validators and honor ``304 Not Modified``."""
+    import response_cache
+    from response_cache import ResponseCache
+
+    cache = ResponseCache(tmp_path)
+    cache.store(SURVEY_URL, b"<table>v1</table>", {"etag": '"abc"', "last-modified": "Wed, 01 Jan 2026 00:00:00 GMT"})
+
+    # Age the entry past the one-hour survey TTL.
+    now = time.time()
+    monkeypatch.setattr(response_cache.time, "time", lambda: now + 7200)
+    assert cache.get_fresh(SURVEY_URL) is None
+
+    fetcher = FakeFetcher((304, {}, b""))
+    # Assertions: 304 returns the cached body and refreshes the entry timestamp.
+    assert cache.fetch(SURVEY_URL, fetcher) == b"<table>v1</table>"
+    assert fetcher.calls[0][1] == {
+        "If-None-Match": '"abc"',
+        "If-Modified-Since": "Wed, 01 Jan 2026 00:00:00 GMT",
+    }
+    assert cache.get_fresh(SURVEY_URL) == b"<table>v1</table>"
+
+    # Assertions: a changed page (200) replaces the entry.
+    monkeypatch.setattr(response_cache.time, "time", lambda: now + 20000)
+    fetcher = FakeFetcher((200, {}, b"<table>v2</table>"))
+    assert cache.fetch(SURVEY_URL, fetcher) == b"<table>v2</table>"
+    assert cache.conditional_headers(SURVEY_URL) == {}
+    assert cache.stats() == {"hits": 1, "misses": 2, "revalidated": 1}
+
+
+def test_cache_missing_and_corrupt_entries(tmp_path):
+    """Validate absent, corrupt, and concurrently removed entries degrade to misses."""
+    from response_cache import ResponseCache
+
+    cache = ResponseCache(tmp_path)
+    # Assertions: nothing cached means no validators and no fresh body.
+    assert cache.conditional_headers(RESULT_URL) == {}
+    assert cache.get_fresh(RESULT_URL) is None
+    assert cache.revalidated(RESULT_URL) is None
+
+    cache.store(RESULT_URL, b"body")
+    cache._meta_path(RESULT_URL).write_text("{not json")
+    assert cache.get_fresh(RESULT_URL) is None
+
+    # A 304 for an entry that vanished triggers one unconditional re-fetch.
+    cache.store(SURVEY_URL, b"old", {"etag": '"e"'})
+    fetcher = FakeFetcher((304, {}, b""), (200, {}, b"new"))
+    cache._meta_path(SURVEY_URL).unlink()
+    original_headers = cache.conditional_headers
+
+    def headers_then_vanish(url):
+        return {"If-None-Match": '"e"'}
+
+    cache.conditional_headers = headers_then_vanish
+    assert cache.fetch(SURVEY_URL, fetcher) == b"new"
+    assert [headers for _, headers in fetcher.calls] == [{"If-None-Match": '"e"'}, {}]
+    cache.conditional_headers = original_headers
+
+
+def test_cache_expires_result_pages_and_skips_non_200_bodies(tmp_path, monkeypatch):
+    """Validate a cached result page expires and bad replies never replace or seed entries."""
+    import response_cache
+    from response_cache import ResponseCache
+
+    cache = ResponseCache(tmp_path)
+    # Assertions: a non-200 or empty reply is returned but not cached; the next read refetches.
+    fetcher = FakeFetcher((203, {}, b"<p>partial</p>"), (200, {}, b""), (200, {}, b"<dl>ok</dl>"))
+    assert cache.fetch(RESULT_URL, fetcher) == b"<p>partial</p>"
+    assert cache.fetch(RESULT_URL, fetcher) == b""
+    assert cache.get_fresh(RESULT_URL) is None
+    assert cache.fetch(RESULT_URL, fetcher) == b"<dl>ok</dl>"
+    assert cache.stats()["misses"] == 1
+
+    # Assertions: after the result TTL the entry is revalidated instead of served forever.
+    now = time.time()
+    monkeypatch.setattr(response_cache.time, "time", lambda: now + cache.ttl_for(RESULT_URL) + 1)
+    assert cache.get_fresh(RESULT_URL) is None
+    fetcher = FakeFetcher((200, {}, b"<dl>fixed</dl>"))
+    assert cache.fetch(RESULT_URL, fetcher) == b"<dl>fixed</dl>"
+    assert cache.get_fresh(RESULT_URL) == b"<dl>fixed</dl>"
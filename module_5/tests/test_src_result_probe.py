@@ -0,0 +1,80 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+# Exercises result-id probing and survey-field filling with in-memory fetchers.
+pytestmark = [pytest.mark.web, pytest.mark.integration]
+
+MODULE_5_ROOT = Path(__file__).resolve().parents[1]
+SRC_ROOT = MODULE_5_ROOT / "src"
+if str(SRC_ROOT) not in sys.path:
+    sys.path.insert(0, str(SRC_ROOT))
+
+
+def test_probe_ids_stops_after_consecutive_misses():
+    """Validate gaps shorter than the miss limit are crossed and batches are fixed-size."""
+    import result_probe
+
+    existing = {101, 102, 105, 109}
+    batches = []
+
+    def fetch_batch(ids):
+        batches.append(ids)
+        return [{"url": f"/result/{i}"} for i in ids if i in existing]
+
+    found, probed = result_probe.probe_ids(101, fetch_batch, miss_limit=4)
+    # Assertions: the 3-id gap before 109 is crossed; four misses after it end the probe.
+    assert list(found) == [101, 102, 105, 109]
+    assert batches == [[101, 102, 103, 104], [105, 106, 107, 108], [109, 110, 111, 112],
+                       [113, 114, 115, 116]]
+    assert probed == 16
+
+    # Assertions: nothing new costs exactly one batch.
+    found, probed = result_probe.probe_ids(500, fetch_batch, miss_limit=4)
+    assert found == {} and probed == 4
+    assert result_probe.result_id("/result/x") is None
+
+
+def test_fill_survey_fields_reads_only_needed_pages():
+    """Validate term/date seeding and each survey-walk stop condition."""
+    import result_probe
+
+    def row(result_id, term="Fall 2026"):
+        return [f"/result/{result_id}", "U", "P", f"day {result_id}", "s", "", term]
+
+    pages = {
+        1: [row(203), row(202), ["/result/bad"], []],
+        2: [row(201, "Spring 2027"), row(150)],
+        3: [row(100)],
+    }
+    read = []
+
+    def fetch_page(page):
+        read.append(page)
+        return pages.get(page, [])
+
+    found = {201: {"term": ""}, 202: {"term": ""}, 203: {"term": ""}}
+    # Assertions: the walk stops once every probed id is matched.
+    assert result_probe.fill_survey_fields(found, fetch_page, 10) == (2, 0)
+    assert found[201] == {"term": "Spring 2027", "date added": "day 201"}
+    assert found[203]["date added"] == "day 203"
+
+    # Assertions: a page older than every unmatched id, an empty page, or the cap ends the
+    # walk, and whatever is still unmatched is dropped rather than left without a term.
+    read.clear()
+    unlisted = {190: {}}
+    assert result_probe.fill_survey_fields(unlisted, fetch_page, 10) == (3, 1) and unlisted == {}
+    assert read == [1, 2, 3]
+    assert result_probe.fill_survey_fields({999: {}}, lambda page: [], 10) == (1, 1)
+    assert result_probe.fill_survey_fields({999: {}}, fetch_page, 1) == (1, 1)
+    short = {202: {}}
+    pages[1][1] = ["/result/202", "U"]
+    assert result_probe.fill_survey_fields(short, fetch_page, 10) == (2, 1) and short == {}
+    assert result_probe.fill_survey_fields({}, fetch_page, 10) == (0, 0)
+
+    # Assertions: matched ids older than the walk's newest page do not end it early.
+    read.clear()
+    mixed = {203: {}, 150: {}}
+    assert result_probe.fill_survey_fields(mixed, fetch_page, 10) == (2, 0)
+    assert mixed[150]["date added"] == "day 150"
@@ -0,0 +1,140 @@
+import asyncio
+import json
+import sys
+from pathlib import Path
+from urllib import error
+
+import pytest
+
+# Exercises retry classification, backoff, and the failed-task journal without sleeping.
+pytestmark = [pytest.mark.web, pytest.mark.integration]
+
+MODULE_5_ROOT = Path(__file__).resolve().parents[1]
+SRC_ROOT = MODULE_5_ROOT / "src"
+if str(SRC_ROOT) not in sys.path:
+    sys.path.insert(0, str(SRC_ROOT))
+
+
+def _http_error(code):
+    return error.HTTPError("u", code, "err", hdrs=None, fp=None)
+
+
+def test_failure_classes_and_jittered_backoff(monkeypatch):
+    """Validate error-class mapping and the full-jitter delay ceiling."""
+    import retry_queue
+
+    # Assertions: transient failures map to a policy; permanent ones do not.
+    assert retry_queue.classify_failure(_http_error(429)) == "throttled"
+    assert retry_queue.classify_failure(_http_error(503)) == "server_error"
+    assert retry_queue.classify_failure(TimeoutError()) == "timeout"
+    assert retry_queue.classify_failure(error.URLError("refused")) == "connection"
+    assert retry_queue.classify_failure(_http_error(404)) is None
+    assert retry_queue.classify_failure(ValueError("bad html")) is None
+
+    # Assertions: the ceiling doubles per attempt and is capped at max_delay.
+    monkeypatch.setattr(retry_queue.random, "uniform", lambda low, high: high)
+    assert [retry_queue.backoff_delay(n, 1.0, 5.0) for n in range(5)] == [1.0, 2.0, 4.0, 5.0, 5.0]
+
+
+def test_retrier_recovers_gives_up_and_skips_permanent(monkeypatch):
+    """Validate retries per policy budget, recovery counting, and immediate re-raise."""
+    import retry_queue
+
+    sleeps = []
+    monkeypatch.setattr(retry_queue.time, "sleep", sleeps.append)
+    monkeypatch.setattr(retry_queue, "backoff_delay", lambda attempt, base, cap: base * 2 ** attempt)
+    retrier = retry_queue.Retrier({"timeout": (3, 1.0, 10.0), "server_error": (2, 0.5, 1.0)})
+
+    outcomes = [TimeoutError("slow"), TimeoutError("slow"), b"ok"]
+
+    def flaky():
+        outcome = outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    # Assertions: two timeouts then success recovers after backing off 1s and 2s.
+    assert retrier.call(flaky) == b"ok"
+    assert sleeps == [1.0, 2.0]
+
+    def always_busy():
+        raise _http_error(503)
+
+    with pytest.raises(error.HTTPError):
+        retrier.call(always_busy)
+    assert sleeps == [1.0, 2.0, 0.5]
+
+    def missing():
+        raise _http_error(404)
+
+    def broken():
+        raise KeyError("not a fetch error")
+
+    # Assertions: permanent failures and unrelated errors are not retried.
+    with pytest.raises(error.HTTPError):
+        retrier.call(missing)
+    with pytest.raises(KeyError):
+        retrier.call(broken)
+    assert len(sleeps) == 3
+    assert retrier.stats() == {"retries": 3, "recovered": 1, "exhausted": 1}
+    assert retry_queue.Retrier().policies is retry_queue.DEFAULT_RETRY_POLICIES
+
+
+def test_retrier_async_backoff(monkeypatch):
+    """Validate the async retry loop mirrors the sync one."""
+    import retry_queue
+
+    monkeypatch.setattr(retry_queue, "backoff_delay", lambda attempt, base, cap: 0)
+    retrier = retry_queue.Retrier({"throttled": (2, 1.0, 1.0)})
+    calls = []
+
+    async def throttled_once(url):
+        calls.append(url)
+        if len(calls) == 1:
+            raise _http_error(429)
+        return b"ok"
+
+    async def always_throttled(url):
+        raise _http_error(429)
+
+    # Assertions: one retry recovers; a second 429 exhausts the two-attempt budget.
+    assert asyncio.run(retrier.call_async(throttled_once, "u")) == b"ok"
+    assert calls == ["u", "u"]
+    with pytest.raises(error.HTTPError):
+        asyncio.run(retrier.call_async(always_throttled, "u"))
+    assert retrier.stats() == {"retries": 2, "recovered": 1, "exhausted": 1}
+
+
+def test_failed_task_journal_roundtrip(tmp_path):
+    """Validate JSONL append, take-and-clear, and tolerance of damaged lines."""
+    from retry_queue import FailedTaskJournal
+
+    journal = FailedTaskJournal(tmp_path / "nested" / "failed.jsonl")
+    # Assertions: an empty/missing journal yields nothing to replay.
+    assert journal.take() == []
+
+    journal.record({"kind": "survey", "page": 7}, TimeoutError("slow"))
+    journal.record({"kind": "result", "url": "u", "payload": {"term": "Fall 2026"}}, _http_error(503))
+    with journal.path.open("a", encoding="utf-8") as f:
+        f.write('{"kind": "result", "url"\n')
+    lines = journal.path.read_text(encoding="utf-8").splitlines()
+    assert json.loads(lines[0])["error"] == "slow"
+    assert journal.recorded == 2
+
+    tasks = journal.take()
+    # Assertions: valid tasks come back in order and wait on disk beside the emptied journal.
+    assert [t["kind"] for t in tasks] == ["survey", "result"]
+    assert tasks[1]["payload"] == {"term": "Fall 2026"}
+    assert "failed_at" in tasks[0]
+    assert not journal.path.exists() and journal.replay_path.exists()
+
+    # Assertions: after a crashed replay, leftovers merge with new failures, each task once.
+    with journal.replay_path.open("a", encoding="utf-8") as f:
+        f.write('{"kind": "survey", "pa')
+    journal.record({"kind": "survey", "page": 7}, TimeoutError("again"))
+    journal.record({"kind": "survey", "page": 8}, TimeoutError("new"))
+    merged = FailedTaskJournal(journal.path).take()
+    assert [(t["kind"], t.get("page")) for t in merged] == [("survey", 7), ("result", None), ("survey", 8)]
+    assert merged[0]["error"] == "again"
+    journal.finish_replay()
+    assert journal.take() == [] and not journal.replay_path.exists()
@@ -0,0 +1,68 @@
+import json
+import sys
+from contextlib import nullcontext
+from pathlib import Path
+from urllib import error
+
+import pytest
+
+# Exercises run metrics counters, histograms, progress lines, and the JSON report.
+pytestmark = [pytest.mark.web, pytest.mark.integration]
+
+MODULE_5_ROOT = Path(__file__).resolve().parents[1]
+SRC_ROOT = MODULE_5_ROOT / "src"
+if str(SRC_ROOT) not in sys.path:
+    sys.path.insert(0, str(SRC_ROOT))
+
+
+def test_run_metrics_counts_outcomes_latency_and_parse_time(monkeypatch, tmp_path, capsys):
+    """Validate status labels, byte and latency accounting, sampling, and report output."""
+    import scrape_metrics
+
+    clock = {"now": 100.0}
+    monkeypatch.setattr(scrape_metrics.time, "perf_counter", lambda: clock["now"])
+    metrics = scrape_metrics.RunMetrics(progress_seconds=0.0)
+
+    def attempt(url, seconds, fail=None, status=200, size=0):
+        with pytest.raises(type(fail)) if fail else nullcontext():
+            with metrics.request(url) as outcome:
+                clock["now"] += seconds
+                if fail:
+                    raise fail
+                outcome["status"], outcome["bytes"] = status, size
+
+    attempt("https://x/survey/?page=1", 0.02, size=1000)
+    attempt("https://x/result/1", 0.3, size=500)
+    attempt("https://x/result/2", 12.0, fail=error.HTTPError("u", 503, "busy", None, None))
+    attempt("https://x/result/3", 0.04, fail=TimeoutError("slow"))
+    attempt("https://x/result/4", 0.04, fail=error.URLError("refused"))
+    attempt("https://x/robots.txt", 0.001, fail=ConnectionResetError("reset"), status=None)
+    attempt("https://x/result/5", 0.001, fail=ValueError("Malformed HTTP status line"))
+    attempt("https://x/result/6", 0.001, fail=KeyError("location"))
+    with metrics.parse():
+        clock["now"] += 0.5
+
+    report = metrics.write_report(tmp_path / "out" / "run.json", retries={"retries": 1})
+    # Assertions: every attempt is counted once with its status label and bytes.
+    assert report["requests"] == {
+        "total": 8,
+        "bytes": 1500,
+        "status_codes": {"200": 2, "503": 1, "ConnectionResetError": 1, "KeyError": 1,
+                         "connection_error": 1, "invalid_response": 1, "timeout": 1},
+    }
+    assert report["time"] == {"network_seconds": 12.403, "parse_seconds": 0.5, "parses": 1}
+    assert report["retries"] == {"retries": 1}
+    # Assertions: histograms are split per request kind; percentiles are bucket bounds.
+    result = report["latency"]["result"]
+    assert result["count"] == 6 and result["buckets"]["<=50"] == 2
+    assert result["buckets"]["+Inf"] == 1 and result["p50_ms"] == 50 and result["p99_ms"] is None
+    assert report["latency"]["survey"]["p90_ms"] == 25
+    assert report["latency"]["other"]["buckets"]["<=10"] == 1
+    # Assertions: the in-flight timeline is sampled at most once per interval.
+    assert report["concurrency"]["peak"] == 1
+    assert [n for _, n in report["concurrency"]["timeline"]] == [1, 0]
+    assert json.loads((tmp_path / "out" / "run.json").read_text()) == report
+    # Assertions: live progress lines show totals so far.
+    assert "8 requests, 0 in flight, 0.0 MB" in capsys.readouterr().out.splitlines()[-1]
+    assert scrape_metrics._histogram_summary([0] * 11)["p50_ms"] is None
+
@@ -0,0 +1,146 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+# Parity suite: fast-path parser backends must extract what the full parse does; lxml is
+# only held to that on the saved pages, since it reads CRLF and unclosed cells differently.
+pytestmark = [pytest.mark.web, pytest.mark.integration]
+
+MODULE_5_ROOT = Path(__file__).resolve().parents[1]
+SRC_ROOT = MODULE_5_ROOT / "src"
+FIXTURES = Path(__file__).resolve().parent / "fixtures"
+if str(SRC_ROOT) not in sys.path:
+    sys.path.insert(0, str(SRC_ROOT))
+
+import page_parsers  # noqa: E402
+import scrape  # noqa: E402
+import scrape_services  # noqa: E402
+
+FAST_BACKENDS = ["strained"] + (["lxml"] if page_parsers.HAS_LXML else [])
+
+# Inline edge cases complement the saved pages: missing table/dl, split records, empty <dl>.
+EDGE_SURVEY_PAGES = [
+    b"<html><body></body></html>",
+    b"<html><body><table><tr><th>h</th></tr></table></body></html>",
+    b"""<table><tr><th>h</th></tr>
+      <tr><td><a href="/result/11">L</a></td><td>a</td></tr>
+      <tr class="alt"><td>cont</td></tr>
+      <tr><td>no link</td></tr></table>""",
+]
+EDGE_RESULT_PAGES = [
+    b"<html><body><dl></dl></body></html>",
+    b"<html><body><dl><div><dd>MIT</dd></div><div></div></dl></body></html>",
+]
+
+# Markup lxml reads differently from html.parser: CRLF inside cells and unclosed <td>/<dd>.
+CRLF_SURVEY_PAGE = (
+    b"<table>\r\n<tr><th>h</th></tr>\r\n"
+    b'<tr><td><a href="/result/12">L</a></td><td>still\r\n</td><td>x</td></tr></table>'
+)
+UNCLOSED_SURVEY_PAGE = (
+    b'<table><tr><th>h</th></tr><tr><td><a href="/result/13">L</a><td>a<td>b</tr>'
+    b'<tr class="alt"><td>c<tr><td>d</table>'
+)
+CRLF_RESULT_PAGE = b"<dl><div><dd>MIT\r\n</dd></div><div><dd>CS<div><dd>PhD</dl>"
+
+
+def _read(name):
+    return (FIXTURES / name).read_bytes()
+
+
+@pytest.mark.parametrize("backend", FAST_BACKENDS)
+@pytest.mark.parametrize("html", [_read("survey_page.html")] + EDGE_SURVEY_PAGES)
+def test_table_parser_backends_match_full_parse(backend, html):
+    """Validate survey-table extraction is identical across parser backends."""
+    # Assertions: fast-path output equals the reference whole-page parse.
+    assert page_parsers.parse_table_html(html, backend) == page_parsers.parse_table_html(html, "full")
+
+
+@pytest.mark.parametrize("backend", FAST_BACKENDS)
+@pytest.mark.parametrize(
+    "html",
+    [_read("result_page.html"), _read("result_page_sparse.html")] + EDGE_RESULT_PAGES,
+)
+def test_result_parser_backends_match_full_parse(backend, html):
+    """Validate result-page extraction is identical across parser backends."""
+    url = "https://www.thegradcafe.com/result/990003"
+    # Assertions: fast-path output equals the reference whole-page parse.
+    expected = page_parsers.parse_result_html(html, url, {"term": "Fall 2026"}, "full")
+    assert page_parsers.parse_result_html(html, url, {"term": "Fall 2026"}, backend) == expected
+
+
+@pytest.mark.parametrize("html", [CRLF_SURVEY_PAGE, UNCLOSED_SURVEY_PAGE])
+def test_default_backend_matches_full_parse_on_crlf_and_unclosed_cells(html):
+    """Validate the 'auto' backend keeps CRLF text and unclosed-cell rows as full does."""
+    expected = page_parsers.parse_table_html(html, "full")
+    # Assertions: CRLF survives and unclosed cells nest exactly as html.parser builds them.
+    assert page_parsers.parse_table_html(html, page_parsers.DEFAULT_PARSER) == expected
+    assert page_parsers.parse_result_html(CRLF_RESULT_PAGE, "u", {}, page_parsers.DEFAULT_PARSER) == (
+        page_parsers.parse_result_html(CRLF_RESULT_PAGE, "u", {}, "full")
+    )
+    assert expected[0][2:4] == (["still\r\n", "x"] if html is CRLF_SURVEY_PAGE else ["ab", "b"])
+
+
+@pytest.mark.skipif(not page_parsers.HAS_LXML, reason="lxml not installed")
+def test_lxml_differs_from_full_parse_so_it_is_opt_in():
+    """Validate lxml's CRLF and unclosed-cell output differs, which is why 'auto' avoids it."""
+    # Assertions: lxml folds CRLF and closes cells early; the default backend is not lxml.
+    assert page_parsers.parse_table_html(CRLF_SURVEY_PAGE, "lxml")[0][2] == "still\n"
+    assert page_parsers.parse_table_html(UNCLOSED_SURVEY_PAGE, "lxml")[0][2:4] == ["a", "b"]
+    assert page_parsers.DEFAULT_PARSER == "strained"
+
+
+@pytest.mark.parametrize("backend", FAST_BACKENDS)
+def test_result_parser_backends_raise_like_full_parse_without_dl(backend):
+    """Validate a page without ``<dl>`` fails the same way for every backend."""
+    html = b"<html><body><p>Not found</p></body></html>"
+    with pytest.raises(AttributeError):
+        page_parsers.parse_result_html(html, "u", {}, "full")
+    with pytest.raises(AttributeError):
+        page_parsers.parse_result_html(html, "u", {}, backend)
+
+
+def test_saved_fixtures_extract_expected_fields():
+    """Validate the saved fixtures exercise every extracted field."""
+    rows = page_parsers.parse_table_html(_read("survey_page.html"), "full")
+    # Assertions: three records, each led by its result link and carrying date/term cells.
+    assert [r[0] for r in rows] == ["/result/990003", "/result/990002", "/result/990001"]
+    assert rows[0][3] == "January 28, 2026"
+    assert "Fall 2026" in rows[0][6]
+
+    payload = page_parsers.parse_result_html(_read("result_page.html"), "u", {}, "full")
+    assert payload["university"] == "Massachusetts Institute of Technology"
+    assert payload["GRE"] == "168"
+    assert payload["GRE V"] == "162"
+    assert payload["GRE AW"] == "4.50"
+    assert payload["comments"].startswith("Got the email")
+
+    sparse = page_parsers.parse_result_html(_read("result_page_sparse.html"), "u", {}, "full")
+    assert "GPA" not in sparse
+    assert sparse["comments"] == ""
+
+
+def test_parser_backend_selection_and_validation(monkeypatch):
+    """Validate backend option resolution and the run-scoped backend switch."""
+    # Assertions: 'auto' resolves to the default strained backend for the run only.
+    before = scrape_services.RUN_STATE["parser"]
+    with scrape_services.use_parser_backend("auto"):
+        assert scrape_services.RUN_STATE["parser"] == page_parsers.DEFAULT_PARSER
+    with scrape_services.use_parser_backend("full"):
+        assert scrape_services.RUN_STATE["parser"] == "full"
+    assert scrape_services.RUN_STATE["parser"] == before
+
+    # Assertions: fetchers pass the active backend to the parse step.
+    seen = []
+    monkeypatch.setattr(scrape, "http_get", lambda url: b"<table></table>")
+    monkeypatch.setattr(scrape, "parse_table_html", lambda content, backend: seen.append(backend) or [])
+    with scrape_services.use_parser_backend("strained"):
+        scrape._fetch_table_page(1)
+    assert seen == ["strained"]
+
+    with pytest.raises(ValueError):
+        scrape.scrape_data(parser="regex")
+    monkeypatch.setattr(scrape_services, "HAS_LXML", False)
+    with pytest.raises(ValueError):
+        scrape.scrape_data(parser="lxml")
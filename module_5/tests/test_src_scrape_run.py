@@ -1,4 +1,5 @@
 import io
+import json
 import runpy
 import sys
 import types
@@ -15,24 +16,24 @@ SRC_ROOT = MODULE_4_ROOT / "src"
 if str(SRC_ROOT) not in sys.path:
     sys.path.insert(0, str(SRC_ROOT))
 
+# Scrape options that keep a faked run offline: no live page-count probe and no retry backoff.
+OFFLINE = {"discover_pages": False, "retry": False}
 
-class DummyResponse:
-    def __init__(self, payload):
-        self.payload = payload
 
-    def __enter__(self):
-        return self
+def _with_status(fake_get, status=200):
+    """Adapt a body-only async fake to the ``async_http_fetch`` return shape."""
 
-    def __exit__(self, exc_type, exc, tb):
-        return False
+    async def fetch(url, headers=None, timeout=10):
+        return status, {}, await fake_get(url, headers, timeout)
 
-    def read(self):
-        return self.payload
+    return fetch
 
 
 def test_scrape_fetch_table_and_result_pages(monkeypatch, capsys):
     """Validate table/result scraping success paths and handled fetch failures."""
     import scrape
+    import scrape_http
+    import scrape_services
 
     # Setup: validate restricted-path helper first, then drive network/parsing branches with fakes.
     assert scrape._is_restricted_path("https://x/cgi-bin/a")
@@ -53,7 +54,7 @@ def test_scrape_fetch_table_and_result_pages(monkeypatch, capsys):
       <tr class="alt"><td>cont</td></tr>
     </table></body></html>
     """
-    monkeypatch.setattr(scrape, "urlopen", lambda req, timeout=10: DummyResponse(table_html))
+    monkeypatch.setattr(scrape, "http_get", lambda url: table_html)
     rows = scrape._fetch_table_page(1)
     # Assertions: table parser returns row groups and preserves result URL field.
     assert rows and rows[0][0] == "/result/11"
@@ -71,7 +72,7 @@ def test_scrape_fetch_table_and_result_pages(monkeypatch, capsys):
       <div><dd>comment</dd></div>
     </dl></body></html>
     """
-    monkeypatch.setattr(scrape, "urlopen", lambda req, timeout=10: DummyResponse(result_html))
+    monkeypatch.setattr(scrape, "http_get", lambda url: result_html)
     payload = scrape._fetch_result_page("https://x/result/12", {})
     # Assertions: result parser extracts core fields and GRE subfields correctly.
     assert payload["university"] == "MIT"
@@ -80,13 +81,13 @@ def test_scrape_fetch_table_and_result_pages(monkeypatch, capsys):
     assert payload["GRE AW"] == "4.5"
 
     empty_result_html = b"<html><body><dl></dl></body></html>"
-    monkeypatch.setattr(scrape, "urlopen", lambda req, timeout=10: DummyResponse(empty_result_html))
+    monkeypatch.setattr(scrape, "http_get", lambda url: empty_result_html)
     assert scrape._fetch_result_page("https://x/result/13", {}) == {}
 
     def raise_http(*args, **kwargs):
         raise error.HTTPError("u", 500, "err", hdrs=None, fp=None)
 
-    monkeypatch.setattr(scrape, "urlopen", raise_http)
+    monkeypatch.setattr(scrape, "http_get", raise_http)
     assert scrape._fetch_table_page(2) == []
     assert scrape._fetch_result_page("https://x/result/14", {}) == {}
     # Assertions: HTTP errors are handled without raising and produce logged message.
@@ -95,14 +96,35 @@ def test_scrape_fetch_table_and_result_pages(monkeypatch, capsys):
     def raise_generic(*args, **kwargs):
         raise RuntimeError("boom")
 
-    monkeypatch.setattr(scrape, "urlopen", raise_generic)
+    monkeypatch.setattr(scrape, "http_get", raise_generic)
     assert scrape._fetch_table_page(3) == []
     assert scrape._fetch_result_page("https://x/result/15", {}) == {}
 
+    # Assertions: the shared keep-alive pool can hold a socket per worker at the adaptive ceiling.
+    assert isinstance(scrape_http.HTTP_CLIENT, scrape_http.PooledHTTPClient)
+    assert scrape_http.HTTP_CLIENT.maxsize == scrape_services.ADAPTIVE_MAX_WORKERS >= scrape.MAX_WORKERS
+
     # Assertions: result-number extraction handles valid, invalid, and None inputs.
-    assert scrape._extract_result_num("https://x/result/123") == 123
-    assert scrape._extract_result_num("https://x/result/not-int") is None
-    assert scrape._extract_result_num(None) is None
+    assert scrape.extract_result_num("https://x/result/123") == 123
+    assert scrape.extract_result_num("https://x/result/not-int") is None
+    assert scrape.extract_result_num(None) is None
+
+
+def test_scrape_http_get_uses_shared_pool(monkeypatch):
+    """Validate ``http_get`` delegates to the shared keep-alive client."""
+    import scrape
+    import scrape_http
+
+    requested = []
+
+    def fake_fetch(url, headers=None):
+        requested.append(url)
+        return 200, {}, b"body"
+
+    monkeypatch.setattr(scrape_http, "HTTP_CLIENT", types.SimpleNamespace(fetch=fake_fetch))
+    # Assertions: body bytes come straight from the pooled client.
+    assert scrape.http_get("https://x/result/1") == b"body"
+    assert requested == ["https://x/result/1"]
 
 
 def test_scrape_concurrency_get_payloads_and_filtering(monkeypatch):
@@ -137,16 +159,16 @@ def test_scrape_concurrency_get_payloads_and_filtering(monkeypatch):
         [],
     ]
     monkeypatch.setattr(scrape, "_concurrent_scraper", lambda *args, **kwargs: rows)
-    monkeypatch.setattr(scrape, "_get_raw_payloads", lambda rows_in: rows_in)
+    monkeypatch.setattr(scrape, "_get_raw_payloads", lambda rows_in, **kwargs: rows_in)
     # Use a fixed clock to avoid flaky runtime-print assertions if added later.
     monkeypatch.setattr(scrape.time, "time", lambda: 0.0)
-    filtered = scrape.scrape_data(min_result_num=15, existing_urls={scrape.BASE_URL + "/result/20"})
+    filtered = scrape.scrape_data(min_result_num=15, existing_urls={scrape.BASE_URL + "/result/20"}, **OFFLINE)
     # Assertions: filter removes old/known rows under min-result and existing-url constraints.
     assert filtered == []
 
     monkeypatch.setattr(scrape, "_concurrent_scraper", lambda *args, **kwargs: rows)
-    monkeypatch.setattr(scrape, "_get_raw_payloads", lambda rows_in: rows_in)
-    all_rows = scrape.scrape_data()
+    monkeypatch.setattr(scrape, "_get_raw_payloads", lambda rows_in, **kwargs: rows_in)
+    all_rows = scrape.scrape_data(**OFFLINE)
     # Assertions: unfiltered scrape returns all mocked rows.
     assert len(all_rows) == 3
 
@@ -159,7 +181,7 @@ def test_scrape_uncovered_branches_for_table_result_and_filter_append(monkeypatc
     monkeypatch.setattr(scrape, "_is_restricted_path", lambda url: False)
 
     # No table found branch.
-    monkeypatch.setattr(scrape, "urlopen", lambda req, timeout=10: DummyResponse(b"<html><body></body></html>"))
+    monkeypatch.setattr(scrape, "http_get", lambda url: b"<html><body></body></html>")
     assert scrape._fetch_table_page(1) == []
 
     # Append tmp_row when a new record begins and tmp_row already has data.
@@ -170,7 +192,7 @@ def test_scrape_uncovered_branches_for_table_result_and_filter_append(monkeypatc
       <tr><td><a href="/result/12">L2</a></td><td>a2</td><td>b2</td><td>January 2, 2026</td><td>x2</td><td>y2</td><td>Spring 2025</td></tr>
     </table></body></html>
     """
-    monkeypatch.setattr(scrape, "urlopen", lambda req, timeout=10: DummyResponse(table_html_two_records))
+    monkeypatch.setattr(scrape, "http_get", lambda url: table_html_two_records)
     parsed = scrape._fetch_table_page(2)
     # Assertions: parser emits two distinct row records from consecutive table entries.
     assert len(parsed) == 2
@@ -191,7 +213,7 @@ def test_scrape_uncovered_branches_for_table_result_and_filter_append(monkeypatc
       <div><dd>comment</dd></div>
     </dl></body></html>
     """
-    monkeypatch.setattr(scrape, "urlopen", lambda req, timeout=10: DummyResponse(result_missing_dd_html))
+    monkeypatch.setattr(scrape, "http_get", lambda url: result_missing_dd_html)
     payload = scrape._fetch_result_page("https://x/result/22", {})
     # Assertions: missing `<dd>` skips that field but retains other parsed values.
     assert payload["university"] == "MIT"
@@ -200,12 +222,863 @@ def test_scrape_uncovered_branches_for_table_result_and_filter_append(monkeypatc
     # filtered_rows.append(row) branch in scrape_data filtering path.
     rows = [["/result/30", "a", "b", "Jan 1", "x", "y", "Fall 2026"]]
     monkeypatch.setattr(scrape, "_concurrent_scraper", lambda *args, **kwargs: rows)
-    monkeypatch.setattr(scrape, "_get_raw_payloads", lambda rows_in: rows_in)
-    kept = scrape.scrape_data(min_result_num=10, existing_urls=set())
+    monkeypatch.setattr(scrape, "_get_raw_payloads", lambda rows_in, **kwargs: rows_in)
+    kept = scrape.scrape_data(min_result_num=10, existing_urls=set(), **OFFLINE)
     # Assertions: qualifying row is retained by filter append branch.
     assert kept == rows
 
 
+def test_scrape_async_engine_matches_thread_parsing(monkeypatch, capsys):
+    """Validate the asyncio engine reuses page parsing and engine dispatch."""
+    import asyncio
+
+    import scrape
+    import scrape_http
+
+    table_html = b"""
+    <html><body><table>
+      <tr><th>h</th></tr>
+      <tr><td><a href="/result/11">L</a></td><td>a</td><td>b</td><td>January 1, 2026</td><td>x</td><td>y</td><td>Fall 2026</td></tr>
+    </table></body></html>
+    """
+    result_html = b"""
+    <html><body><dl>
+      <div><dd>MIT</dd></div>
+      <div><dd>CS</dd></div>
+    </dl></body></html>
+    """
+
+    async def fake_async_get(url, headers=None, timeout=10):
+        assert headers == scrape_http.HEADERS
+        return table_html if "/survey/" in url else result_html
+
+    # Setup: route both engines to the same canned HTML.
+    monkeypatch.setattr(scrape_http, "async_http_fetch", _with_status(fake_async_get))
+    monkeypatch.setattr(scrape, "http_get", lambda url: table_html if "/survey/" in url else result_html)
+
+    # Assertions: async workers return the same rows/payloads as the thread workers.
+    assert asyncio.run(scrape._async_fetch_table_page(1)) == scrape._fetch_table_page(1)
+    url = scrape.BASE_URL + "/result/11"
+    assert asyncio.run(scrape._async_fetch_result_page(url, {})) == scrape._fetch_result_page(url, {})
+
+    # Restricted paths short-circuit before any request is made.
+    monkeypatch.setattr(scrape, "_is_restricted_path", lambda url: True)
+    assert asyncio.run(scrape._async_fetch_table_page(1)) == []
+    assert asyncio.run(scrape._async_fetch_result_page(url, {})) == {}
+    monkeypatch.setattr(scrape, "_is_restricted_path", lambda url: False)
+
+    async def raise_http(url, headers=None, timeout=10):
+        raise error.HTTPError(url, 429, "slow down", hdrs=None, fp=None)
+
+    monkeypatch.setattr(scrape_http, "async_http_fetch", _with_status(raise_http))
+    assert asyncio.run(scrape._async_fetch_table_page(2)) == []
+    assert asyncio.run(scrape._async_fetch_result_page(url, {})) == {}
+    assert "HTTP Error 429" in capsys.readouterr().out
+
+    async def raise_timeout(url, headers=None, timeout=10):
+        raise TimeoutError("slow")
+
+    monkeypatch.setattr(scrape_http, "async_http_fetch", _with_status(raise_timeout))
+    assert asyncio.run(scrape._async_fetch_table_page(3)) == []
+    assert asyncio.run(scrape._async_fetch_result_page(url, {})) == {}
+    assert "Error on page 3: slow" in capsys.readouterr().out
+
+    # _async_concurrent_scraper: list/dict aggregation, handled errors, and the semaphore cap.
+    in_flight = {"now": 0, "peak": 0}
+
+    async def worker_list(x):
+        in_flight["now"] += 1
+        in_flight["peak"] = max(in_flight["peak"], in_flight["now"])
+        await asyncio.sleep(0)
+        in_flight["now"] -= 1
+        if x == 2:
+            raise ValueError("bad")
+        return [x]
+
+    out = asyncio.run(scrape._async_concurrent_scraper(worker_list, [1, 2, 3, 4], concurrency=2))
+    assert sorted(out) == [1, 3, 4]
+    assert in_flight["peak"] <= 2
+    assert "Task 2 failed with: bad" in capsys.readouterr().out
+
+    async def worker_map(task, payload):
+        return {"url": task, **payload}
+
+    payload_map = {"u1": {"seed": 1}, "u2": {"seed": 2}}
+    out2 = asyncio.run(
+        scrape._async_concurrent_scraper(worker_map, list(payload_map), is_mapping=True, all_payloads=payload_map)
+    )
+    assert sorted(p["url"] for p in out2) == ["u1", "u2"]
+
+    async def worker_crash(x):
+        raise KeyError("unexpected")
+
+    # Unexpected exceptions are not swallowed.
+    with pytest.raises(KeyError):
+        asyncio.run(scrape._async_concurrent_scraper(worker_crash, [1]))
+
+    # scrape_data engine selection routes through the async scraper and validates names.
+    calls = []
+
+    async def fake_async_scraper(worker_func, tasks, **kwargs):
+        calls.append(worker_func.__name__)
+        if worker_func is scrape._async_fetch_table_page:
+            return [["/result/11", "a", "b", "Jan 1", "x", "y", "Fall 2026"]]
+        return [{"url": t} for t in tasks]
+
+    monkeypatch.setattr(scrape, "_async_concurrent_scraper", fake_async_scraper)
+    monkeypatch.setattr(scrape, "NUM_PAGES_OF_DATA", 1)
+    payloads = scrape.scrape_data(engine="async", **OFFLINE)
+    assert payloads == [{"url": scrape.BASE_URL + "/result/11"}]
+    assert calls == ["_async_fetch_table_page", "_async_fetch_result_page"]
+
+    with pytest.raises(ValueError):
+        scrape.scrape_data(engine="carrier-pigeon")
+
+
+def test_scrape_incremental_walk_stops_at_known_page(monkeypatch, capsys):
+    """Validate newest-first survey walk and each early-stop reason."""
+    import asyncio
+
+    import scrape
+
+    def row(result_id):
+        return [f"/result/{result_id}", "a", "b", "Jan 1", "x", "y", "Fall 2026"]
+
+    # Page 1 is all new, page 2 mixes new/old, page 3 is entirely old, page 4+ never needed.
+    pages = {1: [row(50), row(49)], 2: [row(48), row(9)], 3: [row(8), row(7)], 4: [row(6)]}
+    fetched = []
+
+    def fake_table(page_num):
+        fetched.append(page_num)
+        return pages.get(page_num, [])
+
+    monkeypatch.setattr(scrape, "_fetch_table_page", fake_table)
+    monkeypatch.setattr(scrape, "MAX_WORKERS", 2)
+    monkeypatch.setattr(scrape, "NUM_PAGES_OF_DATA", 2000)
+
+    rows, summary = scrape._walk_survey_pages(10, set())
+    # Assertions: walk stops on page 3 and only fetched two windows of two pages.
+    assert summary == {"pages_fetched": 4, "stop_page": 3, "stop_reason": "known_page"}
+    assert sorted(fetched) == [1, 2, 3, 4]
+    assert [r[0] for r in rows] == ["/result/50", "/result/49", "/result/48", "/result/9", "/result/8", "/result/7"]
+
+    # Assertions: existing URLs count as known even above min_result_num.
+    known = {scrape.BASE_URL + "/result/50", scrape.BASE_URL + "/result/49"}
+    _, summary = scrape._walk_survey_pages(None, known)
+    assert summary["stop_page"] == 1
+
+    # Assertions: an empty page ends the walk (end of data or fetch failure).
+    pages[3] = []
+    _, summary = scrape._walk_survey_pages(1, set())
+    assert summary == {"pages_fetched": 4, "stop_page": 3, "stop_reason": "empty_page"}
+
+    # Assertions: the hard page cap ends the walk when every page is new.
+    monkeypatch.setattr(scrape, "NUM_PAGES_OF_DATA", 2)
+    _, summary = scrape._walk_survey_pages(1, set())
+    assert summary == {"pages_fetched": 2, "stop_page": 2, "stop_reason": "page_cap"}
+
+    # Assertions: the async keyed worker tags rows with the page number too.
+    async def fake_async_table(page_num):
+        return pages.get(page_num, [])
+
+    monkeypatch.setattr(scrape, "_async_fetch_table_page", fake_async_table)
+    assert asyncio.run(scrape._async_fetch_table_page_keyed(1)) == [(1, pages[1])]
+
+    # Assertions: the public page API drops blank rows and orders each page newest first.
+    pages[9] = [row(3), [], row(5)]
+    assert scrape.fetch_survey_pages("async", [9]) == [(9, [row(5), row(3)])]
+
+    # scrape_data(incremental=True) filters walked rows and reports the stop reason.
+    monkeypatch.setattr(scrape, "NUM_PAGES_OF_DATA", 2000)
+    pages[3] = [row(8), row(7)]
+    monkeypatch.setattr(scrape, "_get_raw_payloads", lambda rows_in, **kwargs: rows_in)
+    kept = scrape.scrape_data(min_result_num=10, incremental=True, **OFFLINE)
+    assert [r[0] for r in kept] == ["/result/50", "/result/49", "/result/48"]
+    assert "Survey walk stopped at page 3 (known_page) after 4 pages" in capsys.readouterr().out
+
+    # Without any filter, incremental falls back to the full page range.
+    monkeypatch.setattr(scrape, "_concurrent_scraper", lambda *args, **kwargs: [row(1)])
+    assert scrape.scrape_data(incremental=True, **OFFLINE) == [row(1)]
+    assert "Survey walk" not in capsys.readouterr().out
+
+
+def test_scrape_known_results_confirms_filter_hits_per_window(monkeypatch, capsys):
+    """Validate Bloom-filter hits are confirmed once per survey window, not per row."""
+    import scrape
+    from seen_filter import KnownResults, ResultIdFilter
+
+    def row(result_id):
+        return [f"/result/{result_id}", "a", "b", "Jan 1", "x", "y", "Fall 2026"]
+
+    pages = {1: [row(50), row(49)], 2: [row(48), row(47)], 3: [row(46), row(45)]}
+    monkeypatch.setattr(scrape, "_fetch_table_page", lambda page_num: pages.get(page_num, []))
+    monkeypatch.setattr(scrape, "_get_raw_payloads", lambda rows_in, **kwargs: rows_in)
+    monkeypatch.setattr(scrape, "MAX_WORKERS", 2)
+    monkeypatch.setattr(scrape, "NUM_PAGES_OF_DATA", 3)
+
+    # 48 is a filter hit the database does not hold (a false positive).
+    bloom = ResultIdFilter(capacity=100)
+    for result_id in (48, 47, 46, 45):
+        bloom.add(result_id)
+    stored = {scrape.BASE_URL + f"/result/{i}" for i in (47, 46, 45)}
+    lookups = []
+
+    def lookup(urls):
+        lookups.append(sorted(u.rsplit("/", 1)[-1] for u in urls))
+        return stored & set(urls)
+
+    known = KnownResults(bloom, lookup)
+    kept = scrape.scrape_data(existing_urls=known, incremental=True, **OFFLINE)
+    # Assertions: one lookup for window 1-2, one for page 3; 48 survives as new.
+    assert [r[0] for r in kept] == ["/result/50", "/result/49", "/result/48"]
+    assert lookups == [["47", "48"], ["45", "46"]]
+    assert known.stats == {"lookups": 2, "maybe": 4, "false_positives": 1}
+
+    # Assertions: a full streaming crawl confirms each window before filtering it.
+    lookups.clear()
+    monkeypatch.setattr(scrape, "_fetch_result_page", lambda url, payload: payload)
+    streamed = list(scrape.iter_scrape_data(existing_urls=KnownResults(bloom, lookup), **OFFLINE))
+    assert sorted(p["url"].rsplit("/", 1)[-1] for p in streamed) == ["48", "49", "50"]
+    assert lookups == [["47", "48"], ["45", "46"]]
+    capsys.readouterr()
+
+
+def test_scrape_queues_newest_results_first(monkeypatch, capsys):
+    """Validate result pages are fetched highest result id first in batch and stream modes."""
+    import scrape
+
+    def row(result_id):
+        return [f"/result/{result_id}", "a", "b", "Jan 1", "x", "y", "Fall 2026"]
+
+    # Survey pages complete out of order and rows arrive unsorted.
+    pages = {1: [row(60), row(58)], 2: [row(59), ["bad"], []], 3: [row(40), row(45)]}
+    fetched = []
+
+    def fake_result(url, payload):
+        fetched.append(url.rsplit("/", 1)[-1])
+        return payload
+
+    monkeypatch.setattr(scrape, "_fetch_table_page", lambda page_num: pages.get(page_num, []))
+    monkeypatch.setattr(scrape, "_fetch_result_page", fake_result)
+    monkeypatch.setattr(scrape, "NUM_PAGES_OF_DATA", 3)
+    # One worker makes service order equal to queue order.
+    monkeypatch.setattr(scrape, "MAX_WORKERS", 1)
+
+    scrape.scrape_data(**OFFLINE)
+    # Assertions: the whole crawl queues results newest first; malformed rows are dropped.
+    assert fetched == ["60", "59", "58", "45", "40"]
+
+    # Assertions: streaming orders each survey window (here two pages) newest first.
+    monkeypatch.setattr(scrape, "MAX_WORKERS", 2)
+    fetched.clear()
+    list(scrape.iter_scrape_data(window=1, **OFFLINE))
+    assert fetched == ["60", "59", "58", "45", "40"]
+    capsys.readouterr()
+
+
+def test_iter_scrape_data_streams_with_bounded_window(monkeypatch, capsys):
+    """Validate streaming payloads, the in-flight window, filtering, and early close."""
+    import threading
+
+    import scrape
+
+    def row(result_id):
+        return [f"/result/{result_id}", "a", "b", "Jan 1", "x", "y", "Fall 2026"]
+
+    pages = {1: [row(30), row(29), ["bad"]], 2: [row(28), row(27)], 3: [row(26), row(5)]}
+    monkeypatch.setattr(scrape, "_fetch_table_page", lambda page_num: pages.get(page_num, []))
+    monkeypatch.setattr(scrape, "NUM_PAGES_OF_DATA", 3)
+    monkeypatch.setattr(scrape, "MAX_WORKERS", 2)
+
+    lock = threading.Lock()
+    in_flight = {"now": 0, "peak": 0}
+
+    def fake_result(url, payload):
+        with lock:
+            in_flight["now"] += 1
+            in_flight["peak"] = max(in_flight["peak"], in_flight["now"])
+        try:
+            if url.endswith("/27"):
+                raise TimeoutError("slow")
+            if url.endswith("/28"):
+                return {}
+            payload["university"] = "MIT"
+            return payload
+        finally:
+            with lock:
+                in_flight["now"] -= 1
+
+    monkeypatch.setattr(scrape, "_fetch_result_page", fake_result)
+
+    stream = scrape.iter_scrape_data(window=2, **OFFLINE)
+    # Assertions: the API is lazy -- nothing is fetched until the consumer iterates.
+    assert in_flight["peak"] == 0
+    payloads = list(stream)
+    urls = sorted(p["url"].rsplit("/", 1)[-1] for p in payloads)
+    # Assertions: malformed rows, empty payloads, and failed fetches are skipped.
+    assert urls == ["26", "29", "30", "5"]
+    assert all(p["university"] == "MIT" and p["term"] == "Fall 2026" for p in payloads)
+    assert in_flight["peak"] <= 2
+    out = capsys.readouterr().out
+    assert "failed with: slow" in out
+    assert "Streamed 4 raw payloads" in out
+
+    # Assertions: filters and the incremental walk apply to the stream as well.
+    filtered = list(scrape.iter_scrape_data(min_result_num=26, incremental=True, **OFFLINE))
+    assert sorted(p["url"].rsplit("/", 1)[-1] for p in filtered) == ["26", "29", "30"]
+    assert "Survey walk stopped at page 3 (page_cap)" in capsys.readouterr().out
+
+    # Assertions: closing the generator early cancels queued work without error.
+    monkeypatch.setattr(scrape, "MAX_WORKERS", 1)
+    stream = scrape.iter_scrape_data(window=3, **OFFLINE)
+    first = next(stream)
+    assert first["university"] == "MIT"
+    stream.close()
+
+
+def test_concurrent_scraper_bounded_window_and_completion_order(monkeypatch):
+    """Validate as-completed collection, the in-flight cap, and lazy task reads."""
+    import threading
+
+    import scrape
+
+    release_slow = threading.Event()
+
+    def worker(x):
+        if x == 1:
+            # Slow first task: later tasks must still be collected before it.
+            release_slow.wait(timeout=5)
+        return [x]
+
+    monkeypatch.setattr(scrape, "MAX_WORKERS", 2)
+    stream = scrape._iter_completed(worker, ((x,) for x in [1, 2, 3, 4]), max_in_flight=2)
+    first_args, first = next(stream)
+    # Assertions: a fast later task is yielded while task 1 is still running.
+    assert first_args != (1,) and first != [1]
+    release_slow.set()
+    rest = [data for _, data in stream]
+    assert sorted([first] + rest) == [[1], [2], [3], [4]]
+
+    # Assertions: submissions never exceed max_in_flight and tasks are read lazily.
+    lock = threading.Lock()
+    state = {"submitted": 0, "running": 0, "peak": 0}
+
+    def counted_tasks():
+        for x in range(20):
+            state["submitted"] += 1
+            yield (x,)
+
+    def tracked(x):
+        with lock:
+            state["running"] += 1
+            state["peak"] = max(state["peak"], state["running"])
+        with lock:
+            state["running"] -= 1
+        return {"x": x}
+
+    stream = scrape._iter_completed(tracked, counted_tasks(), max_in_flight=3)
+    next(stream)
+    # Backpressure: only the window (plus the task waiting for a slot) has been read.
+    assert state["submitted"] <= 4
+    assert len(list(stream)) == 19
+    assert state["peak"] <= 2
+
+    # _concurrent_scraper forwards the window and still aggregates lists/dicts.
+    out = scrape._concurrent_scraper(tracked, range(5), max_in_flight=1)
+    assert sorted(d["x"] for d in out) == [0, 1, 2, 3, 4]
+
+
+def test_scrape_process_pool_parsing_matches_in_thread(monkeypatch):
+    """Validate process-pool parsing yields the same output as in-thread parsing."""
+    import asyncio
+
+    import scrape
+    import scrape_http
+    import scrape_services
+
+    table_html = b"""
+    <html><body><table>
+      <tr><th>h</th></tr>
+      <tr><td><a href="/result/11">L</a></td><td>a</td><td>b</td><td>January 1, 2026</td><td>x</td><td>y</td><td>Fall 2026</td></tr>
+    </table></body></html>
+    """
+    result_html = b"<html><body><dl><div><dd>MIT</dd></div><div><dd>CS</dd></div></dl></body></html>"
+    url = scrape.BASE_URL + "/result/11"
+    monkeypatch.setattr(scrape, "http_get", lambda u: table_html if "/survey/" in u else result_html)
+
+    async def fake_async_get(u, headers=None, timeout=10):
+        return table_html if "/survey/" in u else result_html
+
+    monkeypatch.setattr(scrape_http, "async_http_fetch", _with_status(fake_async_get))
+
+    in_thread_rows = scrape._fetch_table_page(1)
+    in_thread_payload = scrape._fetch_result_page(url, {"term": "Fall 2026"})
+
+    # Assertions: the pool only exists inside the context and parsing results match.
+    with scrape_services.use_parse_pool("process", workers=1):
+        assert scrape_services.RUN_STATE["parse_pool"] is not None
+        assert scrape._fetch_table_page(1) == in_thread_rows
+        assert scrape._fetch_result_page(url, {"term": "Fall 2026"}) == in_thread_payload
+        assert asyncio.run(scrape._async_fetch_table_page(1)) == in_thread_rows
+        assert asyncio.run(scrape._async_fetch_result_page(url, {"term": "Fall 2026"})) == in_thread_payload
+        # Parse errors raised in the worker process are re-raised and handled as before.
+        monkeypatch.setattr(scrape, "http_get", lambda u: b"<html></html>")
+        assert scrape._fetch_result_page(url, {}) == {}
+    assert scrape_services.RUN_STATE["parse_pool"] is None
+
+    with scrape_services.use_parse_pool("thread"):
+        assert scrape_services.RUN_STATE["parse_pool"] is None
+
+    # scrape_data/iter_scrape_data open the pool for the run and validate options.
+    seen_modes = []
+
+    def fake_scrape(*args):
+        seen_modes.append(scrape_services.RUN_STATE["parse_pool"] is not None)
+        return []
+
+    monkeypatch.setattr(scrape, "_scrape", fake_scrape)
+    monkeypatch.setattr(scrape_services, "PARSE_WORKERS", 1)
+    assert scrape.scrape_data(parse_mode="process") == []
+    assert scrape.scrape_data() == []
+    assert seen_modes == [True, False]
+
+    with pytest.raises(ValueError):
+        scrape.scrape_data(parse_mode="gpu")
+    with pytest.raises(TypeError):
+        scrape.scrape_data(turbo=True)
+    with pytest.raises(ValueError):
+        next(scrape.iter_scrape_data(engine="async"))
+
+
+def test_scrape_response_cache_integration(tmp_path, monkeypatch, capsys):
+    """Validate thread/async fetches read through the run-scoped response cache."""
+    import asyncio
+
+    import scrape
+    import scrape_http
+    import scrape_services
+
+    url = scrape.BASE_URL + "/result/990001"
+    network = []
+
+    def fake_fetch(u, headers):
+        network.append(("pool", u, headers))
+        return 200, {"etag": '"v1"'}, b"pooled"
+
+    async def fake_async_get(u, headers=None, timeout=10):
+        network.append(("async", u))
+        return b"async"
+
+    monkeypatch.setattr(scrape_http, "HTTP_CLIENT", types.SimpleNamespace(fetch=fake_fetch))
+    monkeypatch.setattr(scrape_http, "async_http_fetch", _with_status(fake_async_get))
+
+    with scrape_services.use_response_cache(tmp_path / "cache"):
+        # Assertions: first read hits the network, the second is served from disk.
+        assert scrape.http_get(url) == b"pooled"
+        assert scrape.http_get(url) == b"pooled"
+        assert asyncio.run(scrape.async_get(url)) == b"pooled"
+        assert asyncio.run(scrape.async_get(scrape.BASE_URL + "/result/2")) == b"async"
+        assert asyncio.run(scrape.async_get(scrape.BASE_URL + "/result/2")) == b"async"
+    assert network == [("pool", url, {}), ("async", scrape.BASE_URL + "/result/2")]
+    assert "Response cache: 3 hits, 2 misses, 0 revalidated" in capsys.readouterr().out
+    assert scrape_services.RUN_STATE["cache"] is None
+
+    # Assertions: without a cache, the async helper goes straight to the network.
+    assert asyncio.run(scrape.async_get(url)) == b"async"
+
+    # scrape_data(cache_dir=...) enables the cache for the run only.
+    active = []
+    monkeypatch.setattr(scrape, "_scrape", lambda *args: active.append(scrape_services.RUN_STATE["cache"]) or [])
+    scrape.scrape_data(cache_dir=str(tmp_path / "cache"))
+    assert active[0] is not None and scrape_services.RUN_STATE["cache"] is None
+
+
+def test_scrape_adaptive_concurrency_run(monkeypatch, capsys):
+    """Validate adaptive mode gates requests, widens the pool, and reports its level."""
+    import scrape
+    import scrape_http
+    import scrape_services
+
+    seen = {}
+
+    def fake_fetch(url, headers=None):
+        seen["controller"] = scrape_services.RUN_STATE["concurrency"]
+        if url.endswith("/result/3"):
+            raise error.HTTPError(url, 503, "busy", hdrs=None, fp=None)
+        return 200, {}, b"<dl></dl>"
+
+    monkeypatch.setattr(scrape_http, "HTTP_CLIENT", types.SimpleNamespace(fetch=fake_fetch))
+    monkeypatch.setattr(scrape, "PROGRESS_INTERVAL", 2)
+
+    def scrape_results(*args):
+        urls = [scrape.BASE_URL + f"/result/{i}" for i in range(1, 5)]
+        return scrape._concurrent_scraper(scrape._fetch_result_page, urls, True, dict.fromkeys(urls, {}))
+
+    monkeypatch.setattr(scrape, "_scrape", scrape_results)
+    scrape.scrape_data(adaptive=True, retry=False)
+    out = capsys.readouterr().out
+    # Assertions: requests ran under the controller, which backed off once on the 503.
+    assert seen["controller"] is not None
+    assert scrape_services.RUN_STATE["concurrency"] is None
+    assert "Progress: 2 tasks done, concurrency" in out
+    assert "Progress: 4 tasks done, concurrency" in out
+    assert "Adaptive concurrency: final 5, peak 10, 1 backoffs" in out
+
+    # Assertions: the fixed-size default prints no progress lines.
+    scrape.scrape_data(retry=False)
+    assert "Progress:" not in capsys.readouterr().out
+
+    with pytest.raises(ValueError):
+        scrape.scrape_data(engine="async", adaptive=True)
+
+
+def test_scrape_retries_and_failed_task_journal_replay(tmp_path, monkeypatch, capsys):
+    """Validate transient failures are retried, journaled, and replayed on the next run."""
+    import asyncio
+
+    import retry_queue
+    import scrape
+    import scrape_http
+    import scrape_services
+
+    fixtures = Path(__file__).resolve().parent / "fixtures"
+    survey_html = (fixtures / "survey_page.html").read_bytes()
+    result_html = (fixtures / "result_page.html").read_bytes()
+    monkeypatch.setattr(retry_queue, "backoff_delay", lambda attempt, base, cap: 0)
+    monkeypatch.setattr(scrape, "NUM_PAGES_OF_DATA", 1)
+
+    calls = []
+    down = {scrape.BASE_URL + "/result/990002"}
+
+    def fake_fetch(url, headers=None):
+        calls.append(url)
+        if url.endswith("/result/990003") and calls.count(url) == 1:
+            raise TimeoutError("slow")
+        if url in down:
+            raise error.HTTPError(url, 503, "busy", hdrs=None, fp=None)
+        return 200, {}, survey_html if "/survey/" in url else result_html
+
+    pool_stats = lambda: {"requests": 0, "connections_opened": 0, "connections_reused": 0}
+    monkeypatch.setattr(
+        scrape_http, "HTTP_CLIENT", types.SimpleNamespace(fetch=fake_fetch, connection_stats=pool_stats)
+    )
+    journal_path = tmp_path / "failed.jsonl"
+
+    payloads = scrape.scrape_data(retry_journal=journal_path)
+    out = capsys.readouterr().out
+    # Assertions: the timed-out page recovered on retry; the 503 page was journaled.
+    assert sorted(p["url"].rsplit("/", 1)[-1] for p in payloads) == ["990001", "990003"]
+    assert calls.count(scrape.BASE_URL + "/result/990002") == 4
+    assert "Retries: 4 retried, 1 recovered, 1 gave up" in out
+    assert f"Failed-task journal: 1 tasks written to {journal_path}" in out
+    journaled = [json.loads(line) for line in journal_path.read_text().splitlines()]
+    assert journaled[0]["kind"] == "result"
+    assert journaled[0]["payload"]["term"].strip().startswith("Spring 2026")
+
+    # Assertions: a replay interrupted mid-run keeps every journaled task on disk.
+    def interrupted(*args, **kwargs):
+        raise KeyboardInterrupt
+
+    with monkeypatch.context() as patch:
+        patch.setattr(scrape, "fetch_result_pages", interrupted)
+        with pytest.raises(KeyboardInterrupt):
+            scrape.scrape_data(retry_journal=journal_path)
+    assert [t["url"] for t in retry_queue.FailedTaskJournal(journal_path).take()] == [
+        scrape.BASE_URL + "/result/990002"
+    ]
+
+    # Assertions: the next run re-fetches only the journaled page and clears the journal.
+    down.clear()
+    calls.clear()
+    replayed = scrape.scrape_data(retry_journal=journal_path)
+    assert calls == [scrape.BASE_URL + "/result/990002"]
+    assert [p["url"] for p in replayed] == [scrape.BASE_URL + "/result/990002"]
+    assert replayed[0]["university"] == "Massachusetts Institute of Technology"
+    assert "Replayed 1 journaled tasks: 1 raw payloads" in capsys.readouterr().out
+    assert not journal_path.exists()
+    assert not retry_queue.FailedTaskJournal(journal_path).replay_path.exists()
+
+    # Assertions: journaled survey pages are re-walked with the caller's filters applied.
+    journal_path.write_text(json.dumps({"kind": "survey", "page": 1}) + "\n")
+    replayed = scrape.scrape_data(min_result_num=990002, retry_journal=journal_path)
+    assert sorted(p["url"].rsplit("/", 1)[-1] for p in replayed) == ["990002", "990003"]
+
+    # Assertions: permanent failures are never journaled, and nothing runs outside a journal.
+    with scrape_services.use_retries(False, journal_path):
+        scrape._journal_failure({"kind": "survey", "page": 2}, error.HTTPError("u", 404, "x", None, None))
+    scrape._journal_failure({"kind": "survey", "page": 2}, TimeoutError())
+    assert not journal_path.exists()
+
+    async def flaky_async_get(url, headers=None, timeout=10):
+        calls.append(url)
+        if calls.count(url) == 1:
+            raise TimeoutError("slow")
+        return b"async"
+
+    # Assertions: the async transport is retried the same way.
+    monkeypatch.setattr(scrape_http, "async_http_fetch", _with_status(flaky_async_get))
+    with scrape_services.use_retries(True, None):
+        assert asyncio.run(scrape.async_get("https://x/result/5")) == b"async"
+
+
+def test_scrape_checkpointed_crawl_resumes_after_crash(tmp_path, monkeypatch, capsys):
+    """Validate an interrupted full crawl resumes without repeating saved work."""
+    import scrape
+
+    fixtures = Path(__file__).resolve().parent / "fixtures"
+    survey_html = (fixtures / "survey_page.html").read_bytes()
+    result_html = (fixtures / "result_page.html").read_bytes()
+    monkeypatch.setattr(scrape, "NUM_PAGES_OF_DATA", 3)
+    monkeypatch.setattr(scrape, "CHECKPOINT_WINDOW", 1)
+
+    calls = []
+    crash = {"url": scrape.BASE_URL + "/result/990001"}
+
+    def fake_get(url):
+        calls.append(url)
+        if url == crash["url"]:
+            raise KeyError("process killed")
+        if url.endswith("page=1"):
+            return survey_html
+        return b"<table></table>" if "/survey/" in url else result_html
+
+    monkeypatch.setattr(scrape, "http_get", fake_get)
+    checkpoint = tmp_path / "crawl.sqlite3"
+
+    # The crash aborts the run after page 1 and two result windows were committed.
+    with pytest.raises(KeyError):
+        scrape.scrape_data(checkpoint=checkpoint, **OFFLINE)
+    assert "Checkpoint: 1 survey pages and 2 results" in capsys.readouterr().out
+
+    # Assertions: resuming fetches only unsaved pages and merges saved payloads.
+    calls.clear()
+    crash["url"] = None
+    payloads = scrape.scrape_data(checkpoint=checkpoint, resume=True, retry=False,
+                                  discover_pages=False)
+    out = capsys.readouterr().out
+    assert "Resuming crawl: 1 survey pages and 2 results saved" in out
+    assert sorted(calls) == sorted([
+        scrape.BASE_URL + "/survey/?page=2",
+        scrape.BASE_URL + "/survey/?page=3",
+        scrape.BASE_URL + "/result/990001",
+    ])
+    assert sorted(p["url"].rsplit("/", 1)[-1] for p in payloads) == ["990001", "990002", "990003"]
+
+    # Assertions: without resume the checkpoint is reset and everything is fetched again.
+    calls.clear()
+    assert len(scrape.scrape_data(checkpoint=checkpoint, **OFFLINE)) == 3
+    assert len(calls) == 6
+
+    # Assertions: checkpoint options are validated up front.
+    with pytest.raises(ValueError):
+        scrape.scrape_data(resume=True)
+    with pytest.raises(ValueError):
+        scrape.scrape_data(checkpoint=checkpoint, incremental=True)
+    with pytest.raises(ValueError):
+        next(scrape.iter_scrape_data(checkpoint=checkpoint))
+
+
+def test_scrape_summary_reports_this_runs_pool_traffic(monkeypatch, capsys):
+    """Validate the HTTP pool line counts only the run's requests, not the process lifetime's."""
+    import scrape
+    import scrape_http
+
+    fixtures = Path(__file__).resolve().parent / "fixtures"
+    survey_html = (fixtures / "survey_page.html").read_bytes()
+    result_html = (fixtures / "result_page.html").read_bytes()
+    monkeypatch.setattr(scrape, "NUM_PAGES_OF_DATA", 1)
+    # One socket for the whole process; every request after the first reuses it.
+    lifetime = {"requests": 0}
+
+    def fake_fetch(url, headers=None):
+        lifetime["requests"] += 1
+        return 200, {}, survey_html if "/survey/" in url else result_html
+
+    def pool_stats():
+        opened = min(lifetime["requests"], 1)
+        return {"requests": lifetime["requests"], "connections_opened": opened,
+                "connections_reused": lifetime["requests"] - opened}
+
+    monkeypatch.setattr(scrape_http, "HTTP_CLIENT", types.SimpleNamespace(
+        fetch=fake_fetch, connection_stats=pool_stats))
+    scrape.scrape_data(**OFFLINE)
+    scrape.scrape_data(**OFFLINE)
+    lines = [line for line in capsys.readouterr().out.splitlines() if line.startswith("HTTP pool")]
+
+    # Assertions: both runs made 4 requests; the second opened no connection of its own.
+    assert lines == [
+        "HTTP pool: 4 requests, 1 connections opened, 3 reused",
+        "HTTP pool: 4 requests, 0 connections opened, 4 reused",
+    ]
+    assert lifetime["requests"] == 8
+    # Assertions: a snapshot taken before pools were evicted never yields negative counts.
+    assert scrape_http.connection_stats({"requests": 99, "connections_opened": 9}) == {
+        "requests": 0, "connections_opened": 0, "connections_reused": 0}
+
+
+def test_scrape_html_archive_and_offline_reparse(tmp_path, monkeypatch, capsys):
+    """Validate a crawl archives fetched pages and reparse_archive rebuilds its payloads."""
+    import asyncio
+
+    import scrape
+    import scrape_http
+    import scrape_services
+
+    fixtures = Path(__file__).resolve().parent / "fixtures"
+    survey_html = (fixtures / "survey_page.html").read_bytes()
+    result_html = (fixtures / "result_page.html").read_bytes()
+    monkeypatch.setattr(scrape, "NUM_PAGES_OF_DATA", 2)
+
+    def fake_fetch(url, headers):
+        if "/survey/" in url:
+            return 200, {}, survey_html if url.endswith("page=1") else b"<table></table>"
+        return 200, {}, result_html
+
+    monkeypatch.setattr(scrape_http, "HTTP_CLIENT", types.SimpleNamespace(
+        fetch=fake_fetch,
+        connection_stats=lambda: {"requests": 0, "connections_opened": 0, "connections_reused": 0},
+    ))
+    archive_dir = tmp_path / "archive"
+    crawled = scrape.scrape_data(archive_dir=archive_dir, **OFFLINE)
+    assert "HTML archive: 5 pages" in capsys.readouterr().out
+    assert scrape_services.RUN_STATE["archive"] is None
+
+    # Assertions: the offline re-parse needs no network and reproduces the crawl.
+    monkeypatch.setattr(scrape_http, "HTTP_CLIENT", None)
+    rebuilt = scrape.reparse_archive(archive_dir, workers=1, parser="full")
+    assert "Re-parsed 3 archived payloads" in capsys.readouterr().out
+    by_url = lambda payloads: sorted(payloads, key=lambda p: p["url"])
+    assert by_url(rebuilt) == by_url(crawled)
+    with pytest.raises(ValueError):
+        scrape.reparse_archive(archive_dir, parser="regex")
+
+    # Assertions: a rerun served by a warm response cache adds no copies to the archive.
+    monkeypatch.setattr(scrape_http, "HTTP_CLIENT", types.SimpleNamespace(
+        fetch=fake_fetch,
+        connection_stats=lambda: {"requests": 0, "connections_opened": 0, "connections_reused": 0},
+    ))
+    cached_dir = tmp_path / "cached"
+    for _ in range(2):
+        scrape.scrape_data(archive_dir=cached_dir, cache_dir=tmp_path / "http", **OFFLINE)
+    assert "HTML archive: 0 pages" in capsys.readouterr().out
+    assert len((cached_dir / "index.tsv").read_text().splitlines()) == 5
+
+    # Assertions: async downloads are archived; a later cache hit for the same page is not.
+    async def fake_async_get(u, headers=None, timeout=10):
+        return result_html
+
+    monkeypatch.setattr(scrape_http, "async_http_fetch", _with_status(fake_async_get))
+    url = scrape.BASE_URL + "/result/42"
+    with scrape_services.use_html_archive(tmp_path / "async"), \
+            scrape_services.use_response_cache(tmp_path / "cache"):
+        asyncio.run(scrape.async_get(url))
+        asyncio.run(scrape.async_get(url))
+        assert scrape_services.RUN_STATE["archive"].stats()["pages"] == 1
+
+
+def test_scrape_metrics_report_covers_retries_and_both_engines(tmp_path, monkeypatch, capsys):
+    """Validate a scrape run times every attempt and parse and writes a JSON report."""
+    import retry_queue
+    import scrape
+    import scrape_http
+    import scrape_services
+
+    fixtures = Path(__file__).resolve().parent / "fixtures"
+    survey_html = (fixtures / "survey_page.html").read_bytes()
+    result_html = (fixtures / "result_page.html").read_bytes()
+    monkeypatch.setattr(retry_queue, "backoff_delay", lambda attempt, base, cap: 0)
+    monkeypatch.setattr(scrape, "NUM_PAGES_OF_DATA", 1)
+    calls = []
+
+    def fake_fetch(url, headers=None):
+        calls.append(url)
+        if url.endswith("/result/990003") and calls.count(url) == 1:
+            raise TimeoutError("slow")
+        return 200, {}, survey_html if "/survey/" in url else result_html
+
+    monkeypatch.setattr(scrape_http, "HTTP_CLIENT", types.SimpleNamespace(
+        fetch=fake_fetch,
+        connection_stats=lambda: {"requests": 0, "connections_opened": 0, "connections_reused": 0},
+    ))
+    report_path = tmp_path / "reports" / "run.json"
+    payloads = scrape.scrape_data(metrics_report=report_path, live_progress=True,
+                                  discover_pages=False)
+    out = capsys.readouterr().out
+    report = json.loads(report_path.read_text())
+    # Assertions: the failed attempt and its retry are both counted, with retry totals.
+    assert len(payloads) == 3
+    assert report["requests"]["total"] == 5
+    assert report["requests"]["status_codes"] == {"200": 4, "timeout": 1}
+    assert report["requests"]["bytes"] == len(survey_html) + 3 * len(result_html)
+    assert report["retries"]["retries"] == 1 and report["retries"]["recovered"] == 1
+    assert report["latency"]["result"]["count"] == 4 and report["latency"]["survey"]["count"] == 1
+    assert report["time"]["parses"] == 4
+    # Assertions: the faked client decodes nothing, so no wire traffic is attributed to the run.
+    assert report["compression"]["responses"] == 0 and report["compression"]["ratio"] is None
+    assert "Run metrics: 5 requests" in out and f"report written to {report_path}" in out
+    assert scrape_services.RUN_STATE["metrics"] is None
+
+    # Assertions: the async engine is measured too; progress alone writes no file.
+    async def fake_async_get(u, headers=None, timeout=10):
+        return survey_html if "/survey/" in u else result_html
+
+    monkeypatch.setattr(scrape_http, "async_http_fetch", _with_status(fake_async_get))
+    scrape.scrape_data(engine="async", live_progress=True, **OFFLINE)
+    out = capsys.readouterr().out
+    assert "Run metrics: 4 requests" in out and "report written" not in out
+
+    # Assertions: async attempts record the status the server actually sent.
+    monkeypatch.setattr(scrape_http, "async_http_fetch", _with_status(fake_async_get, 203))
+    scrape.scrape_data(engine="async", metrics_report=report_path, retry=False,
+                       discover_pages=False)
+    assert json.loads(report_path.read_text())["requests"]["status_codes"] == {"203": 4}
+
+
+def test_probe_new_results_fetches_ids_then_seeds_from_survey(monkeypatch, capsys):
+    """Validate result-id probing end to end on both engines."""
+    import scrape
+    import scrape_http
+    from seen_filter import KnownResults, ResultIdFilter
+
+    fixtures = Path(__file__).resolve().parent / "fixtures"
+    survey_html = (fixtures / "survey_page.html").read_bytes()
+    result_html = (fixtures / "result_page.html").read_bytes()
+    requested = []
+
+    def fake_get(url):
+        requested.append(url)
+        if "/survey/" in url:
+            return survey_html
+        if int(url.rsplit("/", 1)[-1]) in (990002, 990003):
+            return result_html
+        raise error.HTTPError(url, 404, "Not Found", {}, None)
+
+    async def fake_async_get(url, headers=None, timeout=10):
+        return fake_get(url)
+
+    monkeypatch.setattr(scrape, "http_get", fake_get)
+    monkeypatch.setattr(scrape_http, "async_http_fetch", _with_status(fake_async_get))
+    # A Bloom-filter check works like a URL set; its hits are confirmed in one lookup.
+    bloom = ResultIdFilter(capacity=10)
+    bloom.add(990003)
+    lookups = []
+    known = KnownResults(bloom, lambda urls: lookups.append(urls) or set(urls))
+    payloads = scrape.probe_new_results(990001, existing_urls=known, miss_limit=3, retry=False)
+    assert lookups == [[scrape.BASE_URL + "/result/990003"]]
+
+    # Assertions: two probe batches and one survey page were enough.
+    assert len(requested) == 7
+    assert "Probed 6 result ids from 990001: 1 new records, 1 survey pages read" in capsys.readouterr().out
+    assert [p["url"] for p in payloads] == [scrape.BASE_URL + "/result/990002"]
+    assert payloads[0]["term"] and payloads[0]["date added"]
+    assert set(payloads[0]) == set(scrape.empty_payload())
+
+    # Assertions: the async engine finds the same records; checkpoints are rejected.
+    assert scrape.probe_new_results(990001, miss_limit=3, engine="async", retry=False)[0] == payloads[0]
+    with pytest.raises(ValueError):
+        scrape.probe_new_results(1, checkpoint="x.sqlite3")
+
+
 def test_run_module_main_guard(monkeypatch):
     """Validate ``run.py`` script guard boots app and calls ``app.run``."""
     # Setup: replace `board.create_app` with a fake app that records `.run()` calls.
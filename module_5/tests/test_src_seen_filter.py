@@ -0,0 +1,85 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+# Exercises the result-id Bloom filter, its file format, and the confirming URL check.
+pytestmark = [pytest.mark.web, pytest.mark.integration]
+
+MODULE_5_ROOT = Path(__file__).resolve().parents[1]
+SRC_ROOT = MODULE_5_ROOT / "src"
+if str(SRC_ROOT) not in sys.path:
+    sys.path.insert(0, str(SRC_ROOT))
+
+
+def test_filter_has_no_false_negatives_and_bounded_false_positives(tmp_path):
+    """Validate membership, sizing, saturation, and a save/load round trip."""
+    from seen_filter import ResultIdFilter
+
+    bloom = ResultIdFilter(capacity=2000, error_rate=0.01)
+    for result_id in range(1, 2001):
+        bloom.add(result_id)
+    # Assertions: every added id is found; unseen ids rarely collide at capacity.
+    assert all(str(i) in bloom for i in range(1, 2001))
+    false_positives = sum(i in bloom for i in range(10_001, 20_001))
+    assert false_positives < 300
+    assert len(bloom._bits) < 2500 and bloom.hashes == 7
+    assert not bloom.saturated
+    bloom.add(2001)
+    assert bloom.saturated
+
+    path = tmp_path / "seen.bloom"
+    bloom.save(path)
+    loaded = ResultIdFilter.load(path)
+    # Assertions: the file restores bits, sizing, and the row count.
+    assert (loaded.count, loaded.capacity, loaded.hashes) == (2001, 2000, 7)
+    assert all(i in loaded for i in range(1, 2002))
+    assert not (tmp_path / "seen.bloom.tmp").exists()
+
+
+def test_filter_load_rejects_missing_or_foreign_files(tmp_path):
+    """Validate unreadable files load as ``None`` so callers rebuild."""
+    from seen_filter import ResultIdFilter
+
+    assert ResultIdFilter.load(tmp_path / "missing.bloom") is None
+    short = tmp_path / "short.bloom"
+    short.write_bytes(b"RIDB")
+    assert ResultIdFilter.load(short) is None
+    foreign = tmp_path / "foreign.bloom"
+    ResultIdFilter(capacity=10).save(foreign)
+    foreign.write_bytes(b"XXXX" + foreign.read_bytes()[4:])
+    assert ResultIdFilter.load(foreign) is None
+    truncated = tmp_path / "truncated.bloom"
+    ResultIdFilter(capacity=10).save(truncated)
+    truncated.write_bytes(truncated.read_bytes()[:-1])
+    assert ResultIdFilter.load(truncated) is None
+
+
+def test_known_results_confirms_hits_in_batches_and_caches():
+    """Validate misses stay local, hits cost one lookup per batch, and answers are cached."""
+    from seen_filter import KnownResults, ResultIdFilter, result_key
+
+    bloom = ResultIdFilter(capacity=100)
+    for result_id in (1, 2, 3):
+        bloom.add(result_id)
+    lookups = []
+
+    def lookup(urls):
+        lookups.append(list(urls))
+        return {"https://x/result/1", "https://x/result/2"}
+
+    known = KnownResults(bloom, lookup)
+    urls = [f"https://x/result/{i}" for i in (1, 2, 3, 3, 99)]
+    known.confirm(urls)
+    # Assertions: one lookup covered the three distinct hits; the miss never reached it.
+    assert lookups == [urls[:3]]
+    assert [url in known for url in urls] == [True, True, False, False, False]
+    known.confirm(urls)
+    assert len(lookups) == 1
+    assert known.stats == {"lookups": 1, "maybe": 3, "false_positives": 1}
+
+    # Assertions: an unconfirmed hit is looked up on demand; emptiness follows the filter.
+    bloom.add(4)
+    assert "https://x/result/4/" not in known and lookups[-1] == ["https://x/result/4/"]
+    assert result_key("/result/4/") == "4"
+    assert known and not KnownResults(ResultIdFilter(capacity=1), lookup)